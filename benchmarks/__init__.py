@@ -0,0 +1,3 @@
+"""Скрипты для измерения производительности отдельных этапов обработки запросов.
+Скрипты запускаются из корня проекта командой python -m benchmarks.<имя модуля>.
+"""
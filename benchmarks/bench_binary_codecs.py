@@ -0,0 +1,75 @@
+"""Сравнивает разбор входных данных и сериализацию результатов алгоритма в
+форматах JSON, MessagePack и CBOR для больших матриц и списков: время и
+размер тела запроса."""
+
+import json
+import random
+import timeit
+
+from pydantic_core import to_json
+
+from src.internal.schemas.data_element_schema import DataElementsSchema
+from src.routers.codecs import decode, encode, is_available
+from src.routers.media_type_enum import MediaTypeEnum
+
+REPEAT = 5
+
+
+def parse_json(body: bytes) -> DataElementsSchema:
+    """Разбирает тело запроса в формате JSON так же, как FastAPI."""
+    return DataElementsSchema.model_validate(json.loads(body))
+
+
+def make_parser(media_type: MediaTypeEnum):
+    """Создает функцию разбора тела запроса в двоичном формате."""
+    return lambda body: DataElementsSchema.model_validate(decode(body, media_type))
+
+
+def make_cases() -> dict[str, list[dict]]:
+    """Создает наборы данных разной размерности."""
+    rnd = random.Random(0)
+    return {
+        "matrix 500x500 float": [
+            {
+                "name": "matrix",
+                "value": [[rnd.random() for _ in range(500)] for _ in range(500)],
+            }
+        ],
+        "list 200000 int": [
+            {"name": "items", "value": [rnd.randrange(10**9) for _ in range(200_000)]}
+        ],
+    }
+
+
+def measure(method, *args) -> float:
+    """Возвращает наименьшее время выполнения в миллисекундах."""
+    return min(timeit.repeat(lambda: method(*args), number=1, repeat=REPEAT)) * 1000
+
+
+def main() -> None:
+    binary = [
+        media_type for media_type in MediaTypeEnum if media_type != "application/json"
+    ]
+    binary = [media_type for media_type in binary if is_available(media_type)]
+    for case_name, content in make_cases().items():
+        print(case_name)
+        json_body = to_json(content)
+        print(
+            f"  {'json':<16} parse: {measure(parse_json, json_body):8.2f} ms  "
+            f"serialize: {measure(to_json, content):8.2f} ms  "
+            f"size: {len(json_body) / 1024:8.1f} KiB"
+        )
+        for media_type in binary:
+            body = encode(content, media_type)
+            parser = make_parser(media_type)
+            assert parser(body) == parse_json(json_body)
+            print(
+                f"  {media_type.split('/')[1]:<16} "
+                f"parse: {measure(parser, body):8.2f} ms  "
+                f"serialize: {measure(encode, content, media_type):8.2f} ms  "
+                f"size: {len(body) / 1024:8.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
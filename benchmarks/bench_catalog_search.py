@@ -0,0 +1,79 @@
+"""Измеряет время поиска по индексу CatalogIndex для каталога из большого
+числа алгоритмов и время инкрементального обновления индекса."""
+
+import random
+import timeit
+
+from src.internal.catalog_index import CatalogIndex
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+
+CATALOG_SIZE = 10_000
+REPEAT = 1000
+WORDS = [
+    "сумма",
+    "число",
+    "матрица",
+    "список",
+    "фибоначчи",
+    "сортировка",
+    "поиск",
+    "граф",
+    "строка",
+    "уравнение",
+]
+DEFAULT_VALUES = {
+    DataShapeEnum.SCALAR: 1,
+    DataShapeEnum.LIST: [1],
+    DataShapeEnum.MATRIX: [[1]],
+}
+
+
+def make_definition(idx: int, rnd: random.Random) -> AlgorithmDefinitionSchema:
+    """Создает описание алгоритма со случайными словами и входными данными."""
+    shape = rnd.choice(list(DataShapeEnum))
+    data = {
+        "title": "x",
+        "description": "x",
+        "data_type": DataTypeEnum.INT,
+        "data_shape": shape,
+        "default_value": DEFAULT_VALUES[shape],
+    }
+    return AlgorithmDefinitionSchema(
+        name=f"algorithm_{idx}",
+        title=" ".join(rnd.sample(WORDS, 2)),
+        description=" ".join(rnd.sample(WORDS, 4)) + f" вариант{idx}",
+        parameters=[{"name": "x", **data}],
+        outputs=[{"name": "y", **data}],
+    )
+
+
+def main() -> None:
+    rnd = random.Random(0)
+    definitions = [make_definition(idx, rnd) for idx in range(CATALOG_SIZE)]
+    index = CatalogIndex()
+    build_time = timeit.timeit(lambda: index.update(definitions), number=1)
+    print(f"build {CATALOG_SIZE} algorithms: {build_time * 1000:8.2f} ms")
+
+    changed = definitions[:-10] + [make_definition(idx, rnd) for idx in range(10)]
+    update_time = timeit.timeit(lambda: index.update(changed), number=1)
+    print(f"update 10 algorithms:      {update_time * 1000:8.2f} ms")
+
+    cursor = index.search(size=50)["next_cursor"]
+    cases = {
+        "first page": lambda: index.search(size=50),
+        "cursor page": lambda: index.search(size=50, cursor=cursor),
+        "query 'сумма'": lambda: index.search("сумма", size=50),
+        "query 'вариант99'": lambda: index.search("вариант99", size=50),
+        "query + facet": lambda: index.search(
+            "граф поиск", data_shape=DataShapeEnum.MATRIX, size=50
+        ),
+    }
+    for case_name, search in cases.items():
+        search_time = min(timeit.repeat(search, number=REPEAT, repeat=3)) / REPEAT
+        print(f"{case_name:<22} {search_time * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
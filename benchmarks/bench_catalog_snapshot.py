@@ -0,0 +1,77 @@
+"""Измеряет время сборки набора алгоритмов при запуске приложения в
+зависимости от размера каталога: сканированием каталога с результатами тестов
+из кэша, как при запуске образа Docker без снимка, и загрузкой снимка каталога
+чтением файла и через отображение файла в память. Каталоги создаются во
+временном каталоге копированием алгоритма fibonacci с разными именами; кэш
+результатов тестов заполняется хэшами каталогов без выполнения тестов."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.algorithm_verifier import (
+    AlgorithmVerifier,
+    get_algorithm_digest,
+    get_algorithm_paths,
+)
+from src.internal.catalog_snapshot import create_snapshot
+
+SOURCE_PATH = "src/algorithms/fibonacci"
+
+
+def make_catalog(catalog_path: str, count: int) -> None:
+    """Создает каталог с заданным количеством алгоритмов."""
+    for idx in range(count):
+        path = os.path.join(catalog_path, f"algorithm_{idx}")
+        shutil.copytree(SOURCE_PATH, path, ignore=shutil.ignore_patterns("__pycache__"))
+        definition_path = os.path.join(path, "definition.json")
+        with open(definition_path, "r", encoding="utf-8") as definition_file:
+            definition = json.load(definition_file)
+        definition["name"] = f"algorithm_{idx}"
+        with open(definition_path, "w", encoding="utf-8") as definition_file:
+            json.dump(definition, definition_file)
+
+
+def measure(catalog_path: str, verifier: AlgorithmVerifier, **kwargs) -> float:
+    """Возвращает время (мс) создания набора алгоритмов."""
+    started = time.perf_counter()
+    AlgorithmCollection(catalog_path, verifier=verifier, **kwargs)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or [10, 100, 500]
+    for count in counts:
+        with tempfile.TemporaryDirectory() as temp_path:
+            catalog_path = os.path.join(temp_path, "algorithms")
+            os.mkdir(catalog_path)
+            make_catalog(catalog_path, count)
+            cache_path = os.path.join(temp_path, "tests.json")
+            with open(cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump(
+                    [
+                        get_algorithm_digest(path)
+                        for path in get_algorithm_paths(catalog_path)
+                    ],
+                    cache_file,
+                )
+            verifier = AlgorithmVerifier(cache_path)
+            snapshot_path = os.path.join(temp_path, "catalog.pickle")
+            create_snapshot(catalog_path, verifier).write(snapshot_path)
+            scan = measure(catalog_path, verifier)
+            snapshot = measure(catalog_path, verifier, snapshot_path=snapshot_path)
+            mapped = measure(
+                catalog_path, verifier, snapshot_path=snapshot_path, snapshot_mmap=True
+            )
+        print(
+            f"{count:>5} algorithms  scan: {scan:8.1f} ms  "
+            f"snapshot: {snapshot:7.1f} ms  mmap: {mapped:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Измеряет время проверки каталога алгоритмов тестами в отдельных процессах
+при последовательном и параллельном выполнении. Каталог из заданного
+количества алгоритмов (по умолчанию 50) создается во временном каталоге
+копированием алгоритма fibonacci; алгоритмы отличаются комментарием в файле с
+тестами, поэтому их результаты не берутся из кэша."""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from src.internal.algorithm_verifier import AlgorithmVerifier, verify_catalog
+
+SOURCE_PATH = "src/algorithms/fibonacci"
+
+
+def make_catalog(catalog_path: str, count: int, label: str) -> None:
+    """Создает каталог с заданным количеством алгоритмов."""
+    for idx in range(count):
+        path = os.path.join(catalog_path, f"algorithm_{idx}")
+        shutil.copytree(SOURCE_PATH, path, ignore=shutil.ignore_patterns("__pycache__"))
+        with open(os.path.join(path, "tests.py"), "a") as tests_file:
+            tests_file.write(f"\n# {label} {idx}\n")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for workers in sorted({1, os.cpu_count() or 1}):
+        with tempfile.TemporaryDirectory() as catalog_path:
+            make_catalog(catalog_path, count, f"workers {workers} {time.time()}")
+            started = time.perf_counter()
+            failed = verify_catalog(catalog_path, AlgorithmVerifier(workers=workers))
+            elapsed = time.perf_counter() - started
+        print(
+            f"{count} algorithms  workers: {workers:>3}  failed: {len(failed)}  "
+            f"time: {elapsed:6.2f} s  per algorithm: {elapsed / count * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Сравнивает способы сжатия ответов с результатами алгоритмов: размер
+сжатого тела и процессорное время сжатия для разных уровней."""
+
+import random
+import timeit
+
+from pydantic_core import to_json
+
+from src.middleware.compression_enum import CompressionEnum
+from src.middleware.compressors import (
+    COMPRESSION_LEVEL_RANGES,
+    create_compressor,
+    is_available,
+)
+
+REPEAT = 5
+
+
+def make_cases() -> dict[str, bytes]:
+    """Создает тела ответов с результатами разной размерности."""
+    rnd = random.Random(0)
+    fibonacci = [1, 1]
+    while len(fibonacci) < 2000:
+        fibonacci.append(fibonacci[-1] + fibonacci[-2])
+    return {
+        "fibonacci_list 2000": to_json([{"name": "result", "value": fibonacci}]),
+        "matrix 300x300 int": to_json(
+            [
+                {
+                    "name": "result",
+                    "value": [
+                        [rnd.randrange(100) for _ in range(300)] for _ in range(300)
+                    ],
+                }
+            ]
+        ),
+    }
+
+
+def compress(encoding: CompressionEnum, level: int, body: bytes) -> bytes:
+    """Сжимает тело ответа целиком."""
+    compressor = create_compressor(encoding, level)
+    return compressor.compress(body) + compressor.finish()
+
+
+def main() -> None:
+    encodings = [encoding for encoding in CompressionEnum if is_available(encoding)]
+    for case_name, body in make_cases().items():
+        print(f"{case_name}: {len(body) / 1024:.1f} KiB")
+        for encoding in encodings:
+            low, high = COMPRESSION_LEVEL_RANGES[encoding]
+            for level in sorted({max(low, 1), (low + high) // 3, high}):
+                size = len(compress(encoding, level, body))
+                elapsed = min(
+                    timeit.repeat(
+                        lambda: compress(encoding, level, body), number=1, repeat=REPEAT
+                    )
+                )
+                print(
+                    f"  {encoding:<5} level {level:>2}: "
+                    f"ratio {size / len(body):6.3f}  time {elapsed * 1000:8.2f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
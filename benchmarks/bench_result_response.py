@@ -0,0 +1,68 @@
+"""Сравнивает сериализацию результатов выполнения алгоритма стандартным путем
+FastAPI (валидация по response_model, jsonable_encoder, json.dumps) и классом
+AlgorithmResultResponse для больших списков и матриц."""
+
+import timeit
+import warnings
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.internal.schemas.data_element_schema import (
+    DataElementSchema,
+    DataElementsSchema,
+)
+from src.routers.responses import AlgorithmResultResponse
+
+REPEAT = 5
+
+
+def default_render(outputs: list[DataElementSchema]) -> bytes:
+    """Повторяет обработку возвращаемого значения в FastAPI."""
+    validated = DataElementsSchema.model_validate(outputs)
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def fast_render(outputs: list[DataElementSchema]) -> bytes:
+    """Сериализует результаты классом AlgorithmResultResponse."""
+    return AlgorithmResultResponse(outputs).body
+
+
+def make_cases() -> dict[str, list[DataElementSchema]]:
+    """Создает наборы выходных данных разной размерности."""
+    return {
+        "list 100000 int": [
+            DataElementSchema(name="result", value=list(range(100_000)))
+        ],
+        "list 100000 float": [
+            DataElementSchema(name="result", value=[i / 3 for i in range(100_000)])
+        ],
+        "matrix 300x300 float": [
+            DataElementSchema(
+                name="result",
+                value=[[i * j / 7 for j in range(300)] for i in range(300)],
+            )
+        ],
+    }
+
+
+def main() -> None:
+    # стандартный путь выводит предупреждения сериализатора для матриц
+    warnings.filterwarnings("ignore", category=UserWarning)
+    for case_name, outputs in make_cases().items():
+        assert default_render(outputs) == fast_render(outputs)
+        default_time = min(
+            timeit.repeat(lambda: default_render(outputs), number=1, repeat=REPEAT)
+        )
+        fast_time = min(
+            timeit.repeat(lambda: fast_render(outputs), number=1, repeat=REPEAT)
+        )
+        print(
+            f"{case_name:<22} default: {default_time * 1000:8.2f} ms  "
+            f"fast: {fast_time * 1000:8.2f} ms  "
+            f"speedup: {default_time / fast_time:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
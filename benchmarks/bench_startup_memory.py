@@ -0,0 +1,77 @@
+"""Сравнивает память и время создания экземпляра приложения в трех
+вариантах проверки алгоритмов тестами: в процессе приложения функцией
+pytest.main, как до переноса проверки в отдельный процесс; в отдельных
+процессах; без выполнения тестов, по результатам из файла кэша, заполненного
+на этапе проверки каталога. Каждый вариант запускается в новом
+интерпретаторе."""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from src.internal.algorithm_verifier import AlgorithmVerifier, verify_catalog
+from src.internal.constants import DEFAULT_ALGORITHMS_CATALOG_PATH
+
+SCRIPT = """
+import os
+import resource
+import sys
+import time
+
+started = time.perf_counter()
+if {in_process}:
+    import pytest
+
+    catalog = "{catalog}"
+    for name in sorted(os.listdir(catalog)):
+        path = os.path.join(catalog, name)
+        if name != "__pycache__" and os.path.isdir(path):
+            pytest.main(["-q", "-p", "no:cacheprovider", path + "/tests.py"])
+from src.config import Settings
+from src.main import create_app
+
+create_app(Settings(USE_LOGGER=False, ALGORITHM_TESTS_CACHE_PATH="{cache_path}"))
+elapsed = time.perf_counter() - started
+with open("/proc/self/statm") as statm:
+    rss = int(statm.read().split()[1]) * resource.getpagesize()
+print(rss, len(sys.modules), "pytest" in sys.modules, elapsed)
+"""
+
+MEGABYTE = 1024 * 1024
+
+
+def measure(in_process: bool, cache_path: str) -> list[str]:
+    """Создает экземпляр приложения в новом интерпретаторе и возвращает
+    измерения."""
+    script = SCRIPT.format(
+        in_process=in_process,
+        catalog=DEFAULT_ALGORITHMS_CATALOG_PATH,
+        cache_path=cache_path,
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip().splitlines()[-1].split()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = os.path.join(temp_dir, "algorithm_tests.json")
+        verify_catalog(DEFAULT_ALGORITHMS_CATALOG_PATH, AlgorithmVerifier(cache_path))
+        cases = (
+            ("pytest.main", True, cache_path),
+            ("subprocess", False, ""),
+            ("cached", False, cache_path),
+        )
+        for title, in_process, case_cache_path in cases:
+            rss, modules, pytest_loaded, elapsed = measure(in_process, case_cache_path)
+            print(
+                f"{title:<12} rss: {int(rss) / MEGABYTE:6.1f} MB  "
+                f"modules: {modules:>4}  pytest loaded: {pytest_loaded:<5}  "
+                f"startup: {float(elapsed) * 1000:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Сравнивает накладные расходы выполнения алгоритма методом
+AlgorithmExecutor.execute, который повторно проверяет входные данные схемой
+DataElementsSchema, и методом AlgorithmExecutor.execute_trusted для значений,
+уже проверенных при разборе тела запроса. Алгоритм возвращает входные данные
+без изменений, поэтому измеряются только накладные расходы проверок."""
+
+import timeit
+
+from src.internal.algorithm_executor import AlgorithmExecutor
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from src.internal.schemas.data_definition_schema import DataDefinitionSchema
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+REPEAT = 5
+
+
+def make_executor(data_type: str, data_shape: str, default_value) -> AlgorithmExecutor:
+    """Создает алгоритм, возвращающий входные данные без изменений."""
+    data = {
+        "title": "Data",
+        "description": "Data description",
+        "data_type": data_type,
+        "data_shape": data_shape,
+        "default_value": default_value,
+    }
+    definition = AlgorithmDefinitionSchema(
+        name="identity",
+        title="Identity",
+        description="Returns its input",
+        parameters=[DataDefinitionSchema(name="data", **data)],
+        outputs=[DataDefinitionSchema(name="result", **data)],
+    )
+    return AlgorithmExecutor(definition, lambda data: {"result": data})
+
+
+def make_cases() -> dict[str, tuple[AlgorithmExecutor, object]]:
+    """Создает алгоритмы и входные данные разной размерности."""
+    return {
+        "list 100000 int": (
+            make_executor("INT", "LIST", [1]),
+            list(range(100_000)),
+        ),
+        "list 100000 float": (
+            make_executor("FLOAT", "LIST", [1.0]),
+            [i / 3 for i in range(100_000)],
+        ),
+        "matrix 300x300 float": (
+            make_executor("FLOAT", "MATRIX", [[1.0]]),
+            [[i * j / 7 for j in range(300)] for i in range(300)],
+        ),
+    }
+
+
+def main() -> None:
+    for case_name, (executor, value) in make_cases().items():
+        params = [DataElementSchema(name="data", value=value)]
+        values = {param.name: param.value for param in params}
+        assert executor.execute(params) == executor.execute_trusted(values)
+        full_time = min(
+            timeit.repeat(lambda: executor.execute(params), number=1, repeat=REPEAT)
+        )
+        trusted_time = min(
+            timeit.repeat(
+                lambda: executor.execute_trusted(values), number=1, repeat=REPEAT
+            )
+        )
+        print(
+            f"{case_name:<22} execute: {full_time * 1000:8.2f} ms  "
+            f"trusted: {trusted_time * 1000:8.2f} ms  "
+            f"removed: {(full_time - trusted_time) * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+from src import algoscalc
+
+
+@algoscalc.memoize
 def fibonacci(n: int) -> int:
     if n == 1 or n == 2:
         return 1
@@ -0,0 +1,13 @@
+"""Модуль с функциями приложения для авторов алгоритмов. Импортируется в
+function.py алгоритма:
+
+    from src import algoscalc
+
+    @algoscalc.memoize
+    def fibonacci(n: int) -> int:
+        ...
+"""
+
+from src.internal.memoize import memoize
+
+__all__ = ["memoize"]
@@ -1,7 +1,48 @@
-from pydantic import AnyHttpUrl
+import copy
+from typing import Annotated
+
+from pydantic import AnyHttpUrl, BaseModel, StringConstraints
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from src.internal.constants import DEFAULT_ALGORITHMS_CATALOG_PATH
+from src.internal.constants import (
+    DEFAULT_ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    DEFAULT_ALGORITHMS_CATALOG_PATH,
+    DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP,
+    DEFAULT_BROTLI_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_MIN_SIZE,
+    DEFAULT_COMPRESSION_STREAMING_SIZE,
+    DEFAULT_EWMA_ALPHA,
+    DEFAULT_EXECUTION_LOG_BATCH_SIZE,
+    DEFAULT_EXECUTION_LOG_MAX_BYTES,
+    DEFAULT_EXECUTION_LOG_SAMPLE_RATE,
+    DEFAULT_EXECUTION_LOG_SLOW_THRESHOLD,
+    DEFAULT_FAST_LANE_THRESHOLD,
+    DEFAULT_FAST_LANE_WORKERS,
+    DEFAULT_GZIP_COMPRESSION_LEVEL,
+    DEFAULT_LOG_QUEUE_SIZE,
+    DEFAULT_MAX_REQUEST_BODY_SIZE,
+    DEFAULT_RESULT_CACHE_MAX_ITEM_SIZE,
+    DEFAULT_RESULT_CACHE_SIZE,
+    DEFAULT_RUNTIME_PROFILE_SAMPLES,
+    DEFAULT_SLOW_LANE_WORKERS,
+    DEFAULT_TEST_TIMEOUT,
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
+    TENANT_NAME_PATTERN,
+)
+from src.internal.execution.execution_backend_enum import ExecutionBackendEnum
+from src.internal.log_format_enum import LogFormatEnum
+from src.internal.result_cache.result_cache_backend_enum import ResultCacheBackendEnum
+from src.middleware.compression_enum import CompressionEnum
+
+
+class TenantSettings(BaseModel):
+    """Класс параметров арендатора: каталог алгоритмов и ограничения
+    параллельности выполнения алгоритмов арендатора."""
+
+    CATALOG_PATH: str
+    CATALOG_SNAPSHOT_PATH: str = ""
+    FAST_LANE_WORKERS: int = DEFAULT_FAST_LANE_WORKERS
+    SLOW_LANE_WORKERS: int = DEFAULT_SLOW_LANE_WORKERS
 
 
 class Settings(BaseSettings):
@@ -10,10 +51,51 @@ class Settings(BaseSettings):
 
     EXECUTE_TIMEOUT: int = 0
     ALGORITHMS_CATALOG_PATH: str = DEFAULT_ALGORITHMS_CATALOG_PATH
+    ALGORITHM_TESTS_CACHE_PATH: str = ""
+    ALGORITHM_TESTS_WORKERS: int = 0
+    ALGORITHM_TESTS_TIMEOUT: float = DEFAULT_TEST_TIMEOUT
+    ALGORITHM_TESTS_REPORT_DIR: str = ""
+    CATALOG_SNAPSHOT_PATH: str = ""
+    CATALOG_SNAPSHOT_MMAP: bool = False
+    ALGORITHMS_ENTRY_POINT_GROUP: str = DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP
+    TENANTS: dict[
+        Annotated[str, StringConstraints(pattern=TENANT_NAME_PATTERN)], TenantSettings
+    ] = {}
     BACKEND_CORS_ORIGINS: list[str | AnyHttpUrl] = ["*"]
     USE_LOGGER: bool = True
     LOG_LEVEL: str = "WARNING"
+    LOG_FORMAT: LogFormatEnum = LogFormatEnum.TEXT
+    LOG_QUEUE_SIZE: int = DEFAULT_LOG_QUEUE_SIZE
+    EXECUTION_LOG_PATH: str = ""
+    EXECUTION_LOG_SAMPLE_RATE: float = DEFAULT_EXECUTION_LOG_SAMPLE_RATE
+    EXECUTION_LOG_SLOW_THRESHOLD: float = DEFAULT_EXECUTION_LOG_SLOW_THRESHOLD
+    EXECUTION_LOG_BATCH_SIZE: int = DEFAULT_EXECUTION_LOG_BATCH_SIZE
+    EXECUTION_LOG_MAX_BYTES: int = DEFAULT_EXECUTION_LOG_MAX_BYTES
     VERSION: str = "local-build"
+    FAST_LANE_WORKERS: int = DEFAULT_FAST_LANE_WORKERS
+    SLOW_LANE_WORKERS: int = DEFAULT_SLOW_LANE_WORKERS
+    FAST_LANE_THRESHOLD: float = DEFAULT_FAST_LANE_THRESHOLD
+    RUNTIME_EWMA_ALPHA: float = DEFAULT_EWMA_ALPHA
+    RUNTIME_PROFILE_SAMPLES: int = DEFAULT_RUNTIME_PROFILE_SAMPLES
+    ADAPTIVE_TIMEOUT_FACTOR: float = 0.0
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = DEFAULT_ADAPTIVE_TIMEOUT_MIN_SAMPLES
+    EXECUTION_BACKEND: ExecutionBackendEnum = ExecutionBackendEnum.THREAD
+    WORKER_MEMORY_LIMIT: int = 0
+    WORKER_CPU_LIMIT: int = 0
+    WORKER_MAX_EXECUTIONS: int = 0
+    MAX_REQUEST_BODY_SIZE: int = DEFAULT_MAX_REQUEST_BODY_SIZE
+    RESULT_CACHE_BACKEND: ResultCacheBackendEnum | None = None
+    RESULT_CACHE_SIZE: int = DEFAULT_RESULT_CACHE_SIZE
+    RESULT_CACHE_TTL: float = 0.0
+    RESULT_CACHE_MAX_ITEM_SIZE: int = DEFAULT_RESULT_CACHE_MAX_ITEM_SIZE
+    RESULT_CACHE_PATH: str = ""
+    RESULT_CACHE_URL: str = ""
+    COMPRESSION_ENCODINGS: list[CompressionEnum] = [CompressionEnum.GZIP]
+    COMPRESSION_MIN_SIZE: int = DEFAULT_COMPRESSION_MIN_SIZE
+    COMPRESSION_STREAMING_SIZE: int = DEFAULT_COMPRESSION_STREAMING_SIZE
+    GZIP_COMPRESSION_LEVEL: int = DEFAULT_GZIP_COMPRESSION_LEVEL
+    BROTLI_COMPRESSION_LEVEL: int = DEFAULT_BROTLI_COMPRESSION_LEVEL
+    ZSTD_COMPRESSION_LEVEL: int = DEFAULT_ZSTD_COMPRESSION_LEVEL
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True
@@ -26,7 +108,8 @@ LOGGING_CONFIG = {
     "formatters": {
         "standard": {
             "format": "%(asctime)s [%(levelname)s] %(name)s %(funcName)s: %(message)s"
-        }
+        },
+        "json": {"()": "src.internal.log_queue.JsonFormatter"},
     },
     "handlers": {
         "default": {
@@ -52,3 +135,12 @@ LOGGING_CONFIG = {
         }
     },
 }
+
+
+def get_logging_config(log_format: LogFormatEnum = LogFormatEnum.TEXT) -> dict:
+    """Возвращает конфигурацию логирования с заданным форматом записей."""
+    config = copy.deepcopy(LOGGING_CONFIG)
+    if log_format == LogFormatEnum.JSON:
+        for handler in config["handlers"].values():
+            handler["formatter"] = "json"
+    return config
@@ -1,10 +1,19 @@
+import importlib
 import importlib.util
 import json
+import os
+import threading
+import weakref
+from types import CodeType
 from typing import Callable
 
-import pytest
-
 from src.internal.algorithm_executor import AlgorithmExecutor
+from src.internal.algorithm_plugins import get_package_path
+from src.internal.algorithm_verifier import (
+    AlgorithmVerifier,
+    algorithm_verifier,
+    get_algorithm_digest,
+)
 from src.internal.constants import (
     DEFAULT_DEFINITION_FILE_NAME,
     DEFAULT_FUNCTION_FILE_NAME,
@@ -15,10 +24,22 @@ from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
+from src.internal.startup_profiler import startup_profiler
+from src.internal.startup_stage_enum import StartupStageEnum
 
 
 class AlgorithmBuilder:
-    """Класс создает экземпляры класса AlgorithmExecutor из пакетов с исходным кодом."""
+    """Класс создает экземпляры класса AlgorithmExecutor из пакетов с исходным кодом.
+
+    Экземпляры AlgorithmExecutor для каталогов и пакетов алгоритмов с
+    одинаковым содержимым общие для всех экземпляров класса в процессе, пока
+    они используются, поэтому одинаковые алгоритмы разных каталогов
+    загружаются один раз."""
+
+    __shared: "weakref.WeakValueDictionary[tuple, AlgorithmExecutor]" = (
+        weakref.WeakValueDictionary()
+    )
+    __shared_lock = threading.Lock()
 
     def __init__(
         self,
@@ -26,6 +47,7 @@ class AlgorithmBuilder:
         function_file_name: str = DEFAULT_FUNCTION_FILE_NAME,
         test_file_name: str = DEFAULT_TEST_FILE_NAME,
         execute_timeout: int = DEFAULT_TIMEOUT,
+        verifier: AlgorithmVerifier | None = None,
     ):
         """Конструктор класса
 
@@ -37,12 +59,16 @@ class AlgorithmBuilder:
         :type test_file_name: str
         :param execute_timeout: таймаут выполнения алгоритма;
         :type execute_timeout: int
+        :param verifier: проверка алгоритмов тестами, по умолчанию общая для
+            приложения проверка с кэшем в памяти;
+        :type verifier: AlgorithmVerifier or None
         :raises ValueError: при несоответствии типов данных для параметров.
         """
         self.__definition_file_name: str = definition_file_name
         self.__function_file_name: str = function_file_name
         self.__test_file_name: str = test_file_name
         self.__execute_timeout: int = execute_timeout
+        self.__verifier: AlgorithmVerifier = verifier or algorithm_verifier
         self.__validate()
 
     def build_algorithm(self, path: str) -> AlgorithmExecutor:
@@ -57,33 +83,172 @@ class AlgorithmBuilder:
         :raises RuntimeError: при ошибке выполнения авто тестов для алгоритма;
         :raises FileNotFoundError: при отсутствии файлов с исходным кодом;
         """
-        with open(
-            path + "/" + self.__definition_file_name, "r", encoding="utf-8"
-        ) as def_file:
-            definition_json = json.load(def_file)
+        digest = get_algorithm_digest(path)
+        key = self.__get_shared_key(digest)
+        algorithm = self.__get_shared(key)
+        if algorithm is not None:
+            return algorithm
 
-        algo_definition = AlgorithmDefinitionSchema.model_validate(definition_json)
+        algo_definition = self.__get_definition(path)
 
         if not self.__test_function(path):
             raise RuntimeError(ErrMsg.UNIT_TEST_FAILED)
 
-        return AlgorithmExecutor(
-            algo_definition, self.__get_function(path), self.__execute_timeout
+        return self.__share(
+            key,
+            AlgorithmExecutor(
+                algo_definition,
+                self.__get_function(path),
+                self.__execute_timeout,
+                digest,
+            ),
+        )
+
+    def build_package_algorithm(self, package: str) -> AlgorithmExecutor:
+        """Создает экземпляр класса AlgorithmExecutor на основе установленного
+        пакета алгоритма. Модуль с методом алгоритма импортируется обычным
+        образом как модуль пакета.
+
+        :param package: имя пакета алгоритма;
+        :type package: str
+        :return: экземпляр класса AlgorithmExecutor;
+        :rtype: AlgorithmExecutor
+        :raises ValueError: при несоответствии описания алгоритма или если
+            модуль не является пакетом;
+        :raises RuntimeError: при ошибке выполнения авто тестов для алгоритма;
+        :raises ImportError: при отсутствии модуля с методом алгоритма;
+        """
+        path = get_package_path(package)
+        digest = get_algorithm_digest(path)
+        key = self.__get_shared_key(digest)
+        algorithm = self.__get_shared(key)
+        if algorithm is not None:
+            return algorithm
+
+        algo_definition = self.__get_definition(path)
+
+        if not self.__test_function(path):
+            raise RuntimeError(ErrMsg.UNIT_TEST_FAILED)
+
+        module_name = package + "." + os.path.splitext(self.__function_file_name)[0]
+        with startup_profiler.span(StartupStageEnum.IMPORT, module_name):
+            module = importlib.import_module(module_name)
+        return self.__share(
+            key,
+            AlgorithmExecutor(
+                algo_definition, module.main, self.__execute_timeout, digest
+            ),
+        )
+
+    def build_compiled_algorithm(
+        self,
+        path: str,
+        definition: AlgorithmDefinitionSchema,
+        code: Callable[[], CodeType],
+        digest: str,
+    ) -> AlgorithmExecutor:
+        """Создает экземпляр класса AlgorithmExecutor по проверенному описанию
+        алгоритма и байт-коду модуля с методом алгоритма. Описание не
+        проверяется повторно, а тесты не выполняются. Экземпляр общий с
+        алгоритмами того же содержимого, собранными из каталога или другого
+        снимка; для общего экземпляра байт-код не загружается.
+
+        :param path: путь к каталогу алгоритма;
+        :type path: str
+        :param definition: проверенное описание алгоритма;
+        :type definition: AlgorithmDefinitionSchema
+        :param code: функция, возвращающая объект кода модуля с методом
+            алгоритма;
+        :type code: Callable[[], CodeType]
+        :param digest: хэш содержимого каталога алгоритма на момент создания
+            снимка;
+        :type digest: str
+        :return: экземпляр класса AlgorithmExecutor;
+        :rtype: AlgorithmExecutor
+        """
+        key = self.__get_shared_key(digest)
+        algorithm = self.__get_shared(key)
+        if algorithm is not None:
+            return algorithm
+
+        return self.__share(
+            key,
+            AlgorithmExecutor(
+                definition,
+                self.__get_function(path, code()),
+                self.__execute_timeout,
+                digest,
+            ),
         )
 
-    def __get_function(self, path: str) -> Callable:
-        """Импортирует метод алгоритма из файла с исходным кодом."""
+    def verify_algorithms(self, paths: list[str]) -> dict[str, bool]:
+        """Проверяет алгоритмы их тестами. Тесты алгоритмов выполняются
+        параллельно в отдельных процессах, результаты успешных проверок
+        используются при последующей сборке алгоритмов.
+
+        :param paths: пути к каталогам алгоритмов;
+        :type paths: list[str]
+        :return: результаты проверки по путям к каталогам алгоритмов.
+        :rtype: dict[str, bool]
+        """
+        with startup_profiler.span(StartupStageEnum.TESTS):
+            return self.__verifier.verify_all(paths, self.__test_file_name)
+
+    def __get_shared_key(self, digest: str) -> tuple:
+        """Возвращает ключ общего экземпляра AlgorithmExecutor: хэш
+        содержимого каталога алгоритма и параметры сборки."""
+        return (
+            digest,
+            self.__definition_file_name,
+            self.__function_file_name,
+            self.__test_file_name,
+            self.__execute_timeout,
+        )
+
+    @classmethod
+    def __get_shared(cls, key: tuple) -> AlgorithmExecutor | None:
+        """Возвращает общий экземпляр AlgorithmExecutor, если он есть."""
+        with cls.__shared_lock:
+            return cls.__shared.get(key)
+
+    @classmethod
+    def __share(cls, key: tuple, algorithm: AlgorithmExecutor) -> AlgorithmExecutor:
+        """Сохраняет экземпляр AlgorithmExecutor как общий и возвращает общий
+        экземпляр: ранее сохраненный, если алгоритм собран одновременно в
+        нескольких потоках."""
+        with cls.__shared_lock:
+            return cls.__shared.setdefault(key, algorithm)
+
+    def __get_definition(self, path: str) -> AlgorithmDefinitionSchema:
+        """Читает описание алгоритма из файла и проверяет его схемой."""
+        definition_path = path + "/" + self.__definition_file_name
+        with startup_profiler.span(StartupStageEnum.DEFINITION, definition_path):
+            with open(definition_path, "r", encoding="utf-8") as def_file:
+                definition_json = json.load(def_file)
+
+            return AlgorithmDefinitionSchema.model_validate(definition_json)
+
+    def __get_function(self, path: str, code: CodeType | None = None) -> Callable:
+        """Импортирует метод алгоритма из файла с исходным кодом или, если он
+        задан, из объекта кода модуля."""
         file_name = self.__function_file_name
-        spec = importlib.util.spec_from_file_location(file_name, path + "/" + file_name)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        file_path = path + "/" + file_name
+        with startup_profiler.span(StartupStageEnum.IMPORT, file_path):
+            spec = importlib.util.spec_from_file_location(file_name, file_path)
+            module = importlib.util.module_from_spec(spec)
+            if code is None:
+                spec.loader.exec_module(module)
+            else:
+                exec(code, module.__dict__)
         return module.main
 
     def __test_function(self, path: str) -> bool:
-        """Выполняет тесты для алгоритма"""
+        """Выполняет тесты для алгоритма в отдельном процессе, если алгоритм
+        с тем же содержимым еще не проходил проверку."""
         test_file_path = path + "/" + self.__test_file_name
 
-        return pytest.main(["-q", test_file_path]) == 0
+        with startup_profiler.span(StartupStageEnum.TESTS, test_file_path):
+            return self.__verifier.verify(path, self.__test_file_name)
 
     def __validate(self) -> None:
         """Проверяет валидность созданного экземпляра класса."""
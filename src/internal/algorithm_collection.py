@@ -1,7 +1,16 @@
+import logging
 import os
+import threading
+import time
+from typing import Any, Callable
 
 from src.internal.algorithm_builder import AlgorithmBuilder
 from src.internal.algorithm_executor import AlgorithmExecutor
+from src.internal.algorithm_plugins import get_algorithm_packages, get_package_path
+from src.internal.algorithm_verifier import AlgorithmVerifier
+from src.internal.catalog_cache import CatalogCache, CatalogPage
+from src.internal.catalog_index import CatalogIndex
+from src.internal.catalog_snapshot import CatalogSnapshot
 from src.internal.constants import (
     DEFAULT_DEFINITION_FILE_NAME,
     DEFAULT_FUNCTION_FILE_NAME,
@@ -9,10 +18,17 @@ from src.internal.constants import (
     DEFAULT_TIMEOUT,
 )
 from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.errors.exceptions import AlgorithmNotFoundError
+from src.internal.execution.progress_reporter import ProgressListener
+from src.internal.execution_log import SUCCESS_OUTCOME, ExecutionLog, get_input_size
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
+from src.internal.startup_profiler import startup_profiler
+from src.internal.startup_stage_enum import StartupStageEnum
+
+logger = logging.getLogger(__name__)
 
 
 class AlgorithmCollection:
@@ -28,6 +44,11 @@ class AlgorithmCollection:
         function_file_name: str = DEFAULT_FUNCTION_FILE_NAME,
         test_file_name: str = DEFAULT_TEST_FILE_NAME,
         execute_timeout: int = DEFAULT_TIMEOUT,
+        execution_log: ExecutionLog | None = None,
+        verifier: AlgorithmVerifier | None = None,
+        snapshot_path: str | None = None,
+        snapshot_mmap: bool = False,
+        entry_point_group: str | None = None,
     ):
         """Конструктор класса
 
@@ -42,22 +63,93 @@ class AlgorithmCollection:
         :type test_file_name: str
         :param execute_timeout: таймаут выполнения алгоритма;
         :type execute_timeout: int
+        :param execution_log: журнал выполнения алгоритмов;
+        :type execution_log: ExecutionLog or None
+        :param verifier: проверка алгоритмов тестами;
+        :type verifier: AlgorithmVerifier or None
+        :param snapshot_path: путь к файлу снимка каталога алгоритмов; если
+            снимок не устарел, алгоритмы загружаются из него;
+        :type snapshot_path: str or None
+        :param snapshot_mmap: отображать файл снимка в память вместо чтения;
+        :type snapshot_mmap: bool
+        :param entry_point_group: группа точек входа, через которую
+            установленные пакеты регистрируют алгоритмы, None - алгоритмы
+            собираются только из каталога;
+        :type entry_point_group: str or None
         """
-        self.__algorithms: dict[str, AlgorithmExecutor] = {}
-        builder = AlgorithmBuilder(
+        self.__builder = AlgorithmBuilder(
             definition_file_name,
             function_file_name,
             test_file_name,
             execute_timeout,
+            verifier,
         )
-        catalog_path = algorithms_catalog_path
-        for dir in [dir for dir in os.listdir(catalog_path) if dir != "__pycache__"]:
-            alg_path = catalog_path + "/" + dir
-            if os.path.isdir(alg_path):
-                alg = builder.build_algorithm(alg_path)
-                self.__algorithms[alg.definition.name] = alg
-        if len(self.__algorithms) == 0:
-            raise RuntimeError(ErrMsg.NO_ALGORITHMS)
+        self.__file_names: tuple[str, str, str] = (
+            definition_file_name,
+            function_file_name,
+            test_file_name,
+        )
+        self.__snapshot_path: str | None = snapshot_path
+        self.__snapshot_mmap: bool = snapshot_mmap
+        self.__entry_point_group: str | None = entry_point_group
+        self.__catalog_path: str = algorithms_catalog_path
+        self.__algorithms: dict[str, AlgorithmExecutor] = self.__build_algorithms()
+        self.__version: int = 0
+        self.__catalog_cache: CatalogCache | None = None
+        self.__catalog_index = CatalogIndex()
+        self.__catalog_index.update(self.get_algorithm_list())
+        self.__lock = threading.Lock()
+        self.__execution_log: ExecutionLog | None = execution_log
+
+    @property
+    def execution_log(self) -> ExecutionLog | None:
+        """Возвращает журнал выполнения алгоритмов, если он ведется.
+
+        :return: журнал выполнения алгоритмов.
+        :rtype: ExecutionLog or None
+        """
+        return self.__execution_log
+
+    @property
+    def version(self) -> int:
+        """Возвращает версию набора алгоритмов. Версия увеличивается при
+        перезагрузке, если изменились описания алгоритмов или содержимое их
+        каталогов (хэш файлов алгоритма).
+
+        :return: версия набора алгоритмов.
+        :rtype: int
+        """
+        return self.__version
+
+    @property
+    def catalog_index(self) -> CatalogIndex:
+        """Возвращает индекс для поиска алгоритмов. Индекс обновляется при
+        перезагрузке набора алгоритмов.
+
+        :return: индекс для поиска алгоритмов.
+        :rtype: CatalogIndex
+        """
+        return self.__catalog_index
+
+    def reload(self) -> int:
+        """Пересобирает алгоритмы из каталога. При ошибке сборки набор
+        алгоритмов не изменяется.
+
+        :return: версия набора алгоритмов после перезагрузки.
+        :rtype: int
+        :raises RuntimeError: если в каталоге нет алгоритмов.
+        """
+        algorithms = self.__build_algorithms()
+        with self.__lock:
+            old = [(alg.definition, alg.digest) for alg in self.__algorithms.values()]
+            new = [(alg.definition, alg.digest) for alg in algorithms.values()]
+            changed = new != old
+            self.__algorithms = algorithms
+            if changed:
+                self.__version += 1
+                self.__catalog_cache = None
+                self.__catalog_index.update(self.get_algorithm_list())
+            return self.__version
 
     def has_algorithm(self, algorithm_name: str) -> bool:
         """Проверяет наличие алгоритма с указанным именем.
@@ -77,6 +169,25 @@ class AlgorithmCollection:
         """
         return [alg.definition for alg in self.__algorithms.values()]
 
+    def get_catalog_page(self, page: int, size: int) -> CatalogPage:
+        """Возвращает отрендеренную страницу каталога алгоритмов. Каталог
+        сериализуется один раз для каждой версии набора алгоритмов.
+
+        :param page: номер страницы, начиная с 1;
+        :type page: int
+        :param size: количество алгоритмов на странице;
+        :type size: int
+        :return: страница каталога в формате JSON с ETag.
+        :rtype: CatalogPage
+        """
+        with self.__lock:
+            if self.__catalog_cache is None:
+                self.__catalog_cache = CatalogCache(
+                    self.get_algorithm_list(), self.__version
+                )
+            catalog_cache = self.__catalog_cache
+        return catalog_cache.get_page(page, size)
+
     def get_algorithm_definition(
         self, algorithm_name: str
     ) -> AlgorithmDefinitionSchema:
@@ -92,6 +203,52 @@ class AlgorithmCollection:
             raise AlgorithmNotFoundError(algorithm_name)
         return self.__algorithms[algorithm_name].definition
 
+    def check_input_size(self, algorithm_name: str, values: dict[str, Any]) -> None:
+        """Проверяет, что значения входных данных не превышают ограничений
+        размера из описания алгоритма с указанным именем. Используется для
+        отклонения слишком больших входных данных до их полной проверки.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :raises AlgorithmNotFoundError: если алгоритм с указанным именем
+            отсутствует;
+        :raises AlgorithmInputTooLargeError: при превышении ограничения.
+        """
+        if algorithm_name not in self.__algorithms:
+            raise AlgorithmNotFoundError(algorithm_name)
+        self.__algorithms[algorithm_name].check_input_size(values)
+
+    def get_algorithm_timeout(self, algorithm_name: str) -> int:
+        """Возвращает время (с), отведенное для выполнения алгоритма с
+        указанным именем.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :return: таймаут выполнения алгоритма, 0 - без ограничения.
+        :rtype: int
+        :raises AlgorithmNotFoundError: если алгоритм с указанным именем
+            отсутствует.
+        """
+        if algorithm_name not in self.__algorithms:
+            raise AlgorithmNotFoundError(algorithm_name)
+        return self.__algorithms[algorithm_name].execute_timeout
+
+    def get_algorithm_digest(self, algorithm_name: str) -> str:
+        """Возвращает хэш содержимого каталога алгоритма с указанным именем.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :return: хэш содержимого каталога алгоритма.
+        :rtype: str
+        :raises AlgorithmNotFoundError: если алгоритм с указанным именем
+            отсутствует.
+        """
+        if algorithm_name not in self.__algorithms:
+            raise AlgorithmNotFoundError(algorithm_name)
+        return self.__algorithms[algorithm_name].digest
+
     def get_algorithm_result(
         self, algorithm_name: str, params: list[DataElementSchema]
     ) -> list[DataElementSchema]:
@@ -106,7 +263,144 @@ class AlgorithmCollection:
         """
         if algorithm_name not in self.__algorithms:
             raise AlgorithmNotFoundError(algorithm_name)
-        return self.__algorithms[algorithm_name].execute(params)
+        executor = self.__algorithms[algorithm_name]
+        if self.__execution_log is None:
+            return executor.execute(params)
+        try:
+            values = {param.name: param.value for param in params}
+        except (AttributeError, TypeError):
+            values = {}
+        return self.__execute_logged(
+            algorithm_name,
+            values,
+            lambda timings: executor.execute(params, timings),
+        )
+
+    def get_trusted_algorithm_result(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        progress: ProgressListener | None = None,
+        timeout: int | None = None,
+    ) -> list[DataElementSchema]:
+        """Возвращает результат выполнения алгоритма с указанным именем для
+        значений входных данных, уже прошедших проверку схемой
+        DataElementsSchema.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :param progress: получатель сведений о ходе выполнения алгоритма;
+        :type progress: ProgressListener or None
+        :param timeout: время (с), отведенное на это выполнение, вместо
+            таймаута алгоритма;
+        :type timeout: int or None
+        :return: результат выполнения алгоритма.
+        :rtype: list[DataElementSchema]
+        """
+        if algorithm_name not in self.__algorithms:
+            raise AlgorithmNotFoundError(algorithm_name)
+        executor = self.__algorithms[algorithm_name]
+        if self.__execution_log is None:
+            return executor.execute_trusted(values, progress, None, timeout)
+        return self.__execute_logged(
+            algorithm_name,
+            values,
+            lambda timings: executor.execute_trusted(
+                values, progress, timings, timeout
+            ),
+        )
+
+    def __execute_logged(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        execute: Callable[[dict[str, float]], list[DataElementSchema]],
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм и добавляет запись о выполнении в журнал.
+        Временем проверки считается время выполнения метода исполнителя за
+        вычетом времени выполнения функции алгоритма."""
+        sampled = self.__execution_log.is_sampled()
+        timings: dict[str, float] = {}
+        outcome = SUCCESS_OUTCOME
+        started = time.perf_counter()
+        try:
+            return execute(timings)
+        except BaseException as ex:
+            outcome = type(ex).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            execution_time = timings.get("execution", 0.0)
+            self.__execution_log.record(
+                algorithm_name,
+                get_input_size(values),
+                elapsed - execution_time,
+                execution_time,
+                outcome,
+                sampled,
+            )
+
+    def __build_algorithms(self) -> dict[str, AlgorithmExecutor]:
+        """Собирает алгоритмы из снимка каталога, если он задан и не устарел,
+        иначе из каталога, а также алгоритмы установленных пакетов, если
+        задана группа точек входа. Тесты алгоритмов выполняются параллельно до
+        сборки."""
+        algorithms: dict[str, AlgorithmExecutor] = {}
+        catalog_path = self.__catalog_path
+        packages = []
+        if self.__entry_point_group is not None:
+            packages = get_algorithm_packages(self.__entry_point_group)
+        package_paths = [get_package_path(package) for package in packages]
+        snapshot = self.__load_snapshot()
+        alg_paths = []
+        if snapshot is None:
+            alg_paths = [
+                catalog_path + "/" + dir
+                for dir in os.listdir(catalog_path)
+                if dir != "__pycache__" and os.path.isdir(catalog_path + "/" + dir)
+            ]
+        verified = self.__builder.verify_algorithms(alg_paths + package_paths)
+        if not all(verified.values()):
+            raise RuntimeError(ErrMsg.UNIT_TEST_FAILED)
+        if snapshot is not None:
+            executors = [
+                self.__builder.build_compiled_algorithm(
+                    catalog_path + "/" + entry.dir_name,
+                    entry.definition,
+                    entry.get_code,
+                    entry.digest,
+                )
+                for entry in snapshot.entries
+            ]
+        else:
+            executors = [self.__builder.build_algorithm(path) for path in alg_paths]
+        for package in packages:
+            executors.append(self.__builder.build_package_algorithm(package))
+        for alg in executors:
+            if alg.definition.name in algorithms:
+                raise RuntimeError(
+                    ErrMsgTmpl.DUPLICATE_ALGORITHM.format(alg.definition.name)
+                )
+            algorithms[alg.definition.name] = alg
+        if len(algorithms) == 0:
+            raise RuntimeError(ErrMsg.NO_ALGORITHMS)
+        return algorithms
+
+    def __load_snapshot(self) -> CatalogSnapshot | None:
+        """Загружает снимок каталога алгоритмов, если он задан и не
+        устарел."""
+        if self.__snapshot_path is None:
+            return None
+        with startup_profiler.span(StartupStageEnum.DEFINITION, self.__snapshot_path):
+            snapshot = CatalogSnapshot.load(self.__snapshot_path, self.__snapshot_mmap)
+            if snapshot is not None and snapshot.is_fresh(
+                self.__catalog_path, self.__file_names
+            ):
+                return snapshot
+        logger.warning(ErrMsgTmpl.STALE_SNAPSHOT.format(self.__snapshot_path))
+        return None
 
 
 if __name__ == "__main__":
@@ -114,3 +408,4 @@ if __name__ == "__main__":
         "src/algorithms",
     )
     print(algo_collection.get_algorithm_list())
+    print(algo_collection.get_catalog_page(1, 2).body)
@@ -1,25 +1,36 @@
+import inspect
 import logging
 import signal
+import threading
+import time
 from typing import Any, Callable
 
 from pydantic import ValidationError
 
-from src.internal.constants import DEFAULT_TIMEOUT
+from src.internal.constants import DEFAULT_TIMEOUT, PROGRESS_PARAMETER
+from src.internal.data_dimension.compact_array import CompactArray
 from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
 from src.internal.errors import (
     AlgorithmError,
+    AlgorithmInputTooLargeError,
+    AlgorithmResourceLimitError,
     AlgorithmTimeoutError,
     AlgorithmUnexpectedError,
 )
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.errors.exceptions import AlgorithmTypeError, AlgorithmValueError
+from src.internal.execution.progress_reporter import ProgressListener, ProgressReporter
+from src.internal.execution.watchdog import ExecutionTimeout, execution_watchdog
+from src.internal.memoize import memoize_scope
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_definition_schema import DataDefinitionSchema
 from src.internal.schemas.data_element_schema import (
     DataElementSchema,
     DataElementsSchema,
 )
+from src.internal.startup_profiler import startup_profiler
+from src.internal.startup_stage_enum import StartupStageEnum
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +39,10 @@ class AlgorithmExecutor(object):
     """Класс содержит описание алгоритма, структуры его входных и
     выходных данных, предоставляет возможность выполнения алгоритма согласно
     заданным параметрам.
+
+    Если функция алгоритма принимает параметр progress, не описанный во входных
+    данных, при выполнении в него передается функция progress(fraction,
+    message) для сообщения о ходе выполнения.
     """
 
     def __init__(
@@ -35,6 +50,7 @@ class AlgorithmExecutor(object):
         definition: AlgorithmDefinitionSchema,
         method: Callable,
         execute_timeout: int = DEFAULT_TIMEOUT,
+        digest: str = "",
     ):
         """Конструктор класса
 
@@ -42,15 +58,24 @@ class AlgorithmExecutor(object):
         :type definition: AlgorithmDefinitionSchema
         :param method: метод, обеспечивающий выполнение алгоритма;
         :type method: Callable
-        :param execute_timeout: время отведенное для выполнения алгоритма;
+        :param execute_timeout: время отведенное для выполнения алгоритма,
+            если оно не задано в описании алгоритма (limits.timeout);
         :type execute_timeout: int
+        :param digest: хэш содержимого каталога алгоритма, пустая строка, если
+            он неизвестен;
+        :type digest: str
         :raises ValueError: при несоответствии типов данных для параметров,
             при отрицательных значениях параметра execute_timeout.
         """
         self.__definition: AlgorithmDefinitionSchema = definition
         self.__execute_timeout: int = execute_timeout
         self.__execute_method: Callable = method
+        self.__digest: str = digest
+        self.__accepts_progress: bool = False
         self.__validate()
+        self.__compact_parameters: frozenset[str] = frozenset(
+            param.name for param in definition.parameters if param.compact
+        )
 
     def __str__(self) -> str:
         """Возвращает строковое представление экземпляра класса."""
@@ -67,13 +92,26 @@ class AlgorithmExecutor(object):
 
     @property
     def execute_timeout(self) -> int:
-        """Возвращает время отведенное для выполнения алгоритма.
+        """Возвращает время отведенное для выполнения алгоритма: значение из
+        описания алгоритма (limits.timeout), если оно задано, иначе таймаут,
+        переданный конструктору.
 
         :return: время отведенное для выполнения алгоритма.
         :rtype: int
         """
         return self.__execute_timeout
 
+    @property
+    def digest(self) -> str:
+        """Возвращает хэш содержимого каталога алгоритма, по которому
+        определяется изменение кода алгоритма.
+
+        :return: хэш содержимого каталога алгоритма или пустая строка, если он
+            неизвестен.
+        :rtype: str
+        """
+        return self.__digest
+
     @property
     def parameter_names(self):
         """Возвращает названия для входных данных алгоритма."""
@@ -96,11 +134,18 @@ class AlgorithmExecutor(object):
             raise AlgorithmValueError(ErrMsgTmpl.REDUNDANT_OUTPUT.format(name))
         return [output for output in self.definition.outputs if output.name == name][0]
 
-    def execute(self, params: DataElementsSchema) -> DataElementsSchema:
-        """Выполняет алгоритм с заданными входными данными.
+    def execute(
+        self, params: DataElementsSchema, timings: dict[str, float] | None = None
+    ) -> DataElementsSchema:
+        """Выполняет алгоритм с заданными входными данными. Входные данные
+        проверяются схемой DataElementsSchema, поэтому метод подходит для
+        данных из непроверенных источников.
 
         :param params: значения входных данных для выполнения алгоритма.
         :type params: DataElementsSchema
+        :param timings: словарь, в который записывается время (с) выполнения
+            функции алгоритма (execution);
+        :type timings: dict[str, float] or None
         :return: результаты выполнения алгоритма.
         :rtype: DataElementsSchema
         """
@@ -111,7 +156,7 @@ class AlgorithmExecutor(object):
         params_dict = {param.name: param.value for param in params}
         self.validate_input_values(params_dict)
 
-        output_dict = self.__execute(params_dict)
+        output_dict = self.__execute_timed(params_dict, None, timings)
 
         self.__validate_output_values(output_dict)
         return [
@@ -119,17 +164,119 @@ class AlgorithmExecutor(object):
             for name, value in output_dict.items()
         ]
 
-    def __execute(self, params: dict[str, Any]) -> dict[str, Any]:
+    @property
+    def accepts_progress(self) -> bool:
+        """Возвращает признак того, что алгоритм сообщает о ходе выполнения."""
+        return self.__accepts_progress
+
+    def execute_trusted(
+        self,
+        values: dict[str, Any],
+        progress: ProgressListener | None = None,
+        timings: dict[str, float] | None = None,
+        timeout: int | None = None,
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм со значениями входных данных, которые уже прошли
+        проверку схемой DataElementsSchema (например, при разборе тела запроса).
+        Повторная проверка схемой пропускается, соответствие значений описанию
+        алгоритма проверяется один раз. Выходные данные проверяются на
+        соответствие описанию алгоритма и оборачиваются в DataElementSchema без
+        повторной проверки.
+
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :param progress: получатель сведений о ходе выполнения алгоритма;
+        :type progress: ProgressListener or None
+        :param timings: словарь, в который записывается время (с) выполнения
+            функции алгоритма (execution);
+        :type timings: dict[str, float] or None
+        :param timeout: время (с), отведенное на это выполнение, вместо
+            execute_timeout, 0 - без ограничения;
+        :type timeout: int or None
+        :return: результаты выполнения алгоритма.
+        :rtype: list[DataElementSchema]
+        """
+        self.validate_input_values(values)
+        values = {
+            name: self.__expand_value(value, name in self.__compact_parameters)
+            for name, value in values.items()
+        }
+
+        output_dict = self.__execute_timed(values, progress, timings, timeout)
+
+        self.__validate_output_values(output_dict)
+        return [
+            DataElementSchema.model_construct(
+                name=name, value=self.__expand_value(value)
+            )
+            for name, value in output_dict.items()
+        ]
+
+    @staticmethod
+    def __expand_value(value: Any, compact: bool = False) -> Any:
+        """Преобразует значение из CompactArray во вложенные списки, если
+        функция алгоритма не принимает его в компактном виде."""
+        if isinstance(value, CompactArray) and not compact:
+            return value.tolist()
+        return value
+
+    def __execute_timed(
+        self,
+        params: dict[str, Any],
+        progress: ProgressListener | None,
+        timings: dict[str, float] | None,
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
+        """Выполняет алгоритм и, если передан словарь timings, записывает в
+        него время выполнения функции алгоритма."""
+        if timings is None:
+            return self.__execute(params, progress, timeout)
+        started = time.perf_counter()
+        try:
+            return self.__execute(params, progress, timeout)
+        finally:
+            timings["execution"] = time.perf_counter() - started
+
+    def __execute(
+        self,
+        params: dict[str, Any],
+        progress: ProgressListener | None = None,
+        timeout: int | None = None,
+    ) -> dict[str, Any]:
         """Выполняет алгоритм с заданными входными данными. Устанавливает
-        предельное время выполнения алгоритма."""
-        if self.__execute_timeout > 0:
-            signal.signal(signal.SIGALRM, self.__get_timeout_handler())
-            signal.alarm(self.__execute_timeout)
+        предельное время выполнения алгоритма: в главном потоке с помощью
+        сигнала SIGALRM, в рабочих потоках - с помощью execution_watchdog.
+        Срок снимается внутри обработки исключений, поэтому прерывание по
+        истечении срока, сработавшее после возврата из функции алгоритма,
+        также преобразуется в AlgorithmTimeoutError."""
+        if self.__accepts_progress:
+            params = {**params, PROGRESS_PARAMETER: ProgressReporter(progress)}
+        if timeout is None:
+            timeout = self.__execute_timeout
+        use_signal = threading.current_thread() is threading.main_thread()
+        watchdog_token = None
+        if timeout > 0:
+            if use_signal:
+                signal.signal(signal.SIGALRM, self.__get_timeout_handler(timeout))
+                signal.alarm(timeout)
+            else:
+                watchdog_token = execution_watchdog.arm(timeout)
 
         try:
-            return self.__execute_method(**params)
+            try:
+                with memoize_scope():
+                    return self.__execute_method(**params)
+            finally:
+                if watchdog_token is not None:
+                    execution_watchdog.disarm(watchdog_token)
+                elif timeout > 0:
+                    signal.alarm(0)
         except AlgorithmError:
             raise
+        except ExecutionTimeout:
+            raise AlgorithmTimeoutError(timeout)
+        except MemoryError:
+            raise AlgorithmResourceLimitError(ErrMsg.MEMORY_LIMIT_EXCEEDED)
         except TypeError as ex:
             if "unexpected keyword argument" in str(ex):
                 raise AlgorithmTypeError(ErrMsg.UNEXPECTED_PARAM)
@@ -138,14 +285,16 @@ class AlgorithmExecutor(object):
             logger.error(str(ex))
             raise AlgorithmUnexpectedError()
         finally:
-            if self.__execute_timeout > 0:
-                signal.alarm(0)
+            # прерывание могло сработать до снятия срока во вложенном блоке
+            if watchdog_token is not None:
+                execution_watchdog.disarm(watchdog_token)
 
     def validate_input_values(self, fact_params: dict[str, Any]) -> None:
         """ "Проверяет входные данные для выполнения алгоритма. При наличии
         ошибок вызывает исключения TypeError, ValueError."""
         if not isinstance(fact_params, dict):
             raise AlgorithmTypeError(ErrMsg.INCORRECT_PARAMS)
+        self.check_input_size(fact_params)
         for key in fact_params.keys():
             if key not in self.parameter_names:
                 raise AlgorithmValueError(ErrMsgTmpl.REDUNDANT_PARAMETER.format(key))
@@ -158,6 +307,24 @@ class AlgorithmExecutor(object):
             if errors is not None:
                 raise AlgorithmTypeError(errors)
 
+    def check_input_size(self, fact_params: dict[str, Any]) -> None:
+        """Проверяет, что значения входных данных не превышают ограничений
+        размера из описания алгоритма. Проверяются только значения элементов,
+        описанных во входных данных.
+
+        :param fact_params: словарь значений входных данных по их именам;
+        :type fact_params: dict[str, Any]
+        :raises AlgorithmInputTooLargeError: при превышении ограничения.
+        """
+        for param in self.definition.parameters:
+            if param.name not in fact_params:
+                continue
+            error = DataDimensionChecker.check_size(param, fact_params[param.name])
+            if error is not None:
+                raise AlgorithmInputTooLargeError(
+                    ErrMsgTmpl.INPUT_TOO_LARGE.format(param.name, error)
+                )
+
     def __validate_output_values(self, method_outputs: dict[str, Any]) -> None:
         """ "Проверяет выходные данные для выполнения алгоритма. При наличии
         ошибок вызывает исключения TypeError, ValueError."""
@@ -213,16 +380,33 @@ class AlgorithmExecutor(object):
             raise TypeError(ErrMsg.NON_INT_TIMEOUT)
         if self.execute_timeout < 0:
             raise ValueError(ErrMsg.NEG_INT_TIMEOUT)
+        limits = self.definition.limits
+        if limits is not None and limits.timeout is not None:
+            self.__execute_timeout = limits.timeout
 
         if not callable(self.__execute_method):
             raise TypeError(ErrMsg.METHOD_NOT_CALL)
-        errors = self.__get_test_errors()
+        self.__accepts_progress = self.__is_progress_accepted()
+        with startup_profiler.span(StartupStageEnum.DEFAULTS, self.definition.name):
+            errors = self.__get_test_errors()
         if errors is not None:
             raise RuntimeError(ErrMsgTmpl.ADDING_METHOD_FAILED.format(errors))
 
-    def __get_timeout_handler(self):
+    def __is_progress_accepted(self) -> bool:
+        """Проверяет, принимает ли функция алгоритма параметр progress, не
+        описанный во входных данных."""
+        if PROGRESS_PARAMETER in self.parameter_names:
+            return False
+        try:
+            signature = inspect.signature(self.__execute_method)
+        except (TypeError, ValueError):
+            return False
+        return PROGRESS_PARAMETER in signature.parameters
+
+    @staticmethod
+    def __get_timeout_handler(timeout: int):
         def timeout_handler(signum, frame):
-            raise AlgorithmTimeoutError(self.__execute_timeout)
+            raise AlgorithmTimeoutError(timeout)
 
         return timeout_handler
 
@@ -256,3 +440,4 @@ if __name__ == "__main__":
     algorithm_executor = AlgorithmExecutor(algorithm_definition, lambda p: {"o": p * 2})
     print(algorithm_executor)
     print(algorithm_executor.execute([DataElementSchema(name="p", value=10)]))
+    print(algorithm_executor.execute_trusted({"p": 10}))
@@ -0,0 +1,51 @@
+"""Модуль с поиском алгоритмов, установленных как пакеты Python. Пакет
+регистрирует алгоритмы точками входа (entry points) в группе
+algoscalc.algorithms; значение точки входа - имя пакета алгоритма с теми же
+файлами, что и каталог алгоритма: описанием, модулем с методом и тестами.
+Модули таких алгоритмов импортируются обычным образом, поэтому используют
+байт-код, скомпилированный при установке пакета."""
+
+import importlib
+import importlib.metadata
+
+from src.internal.constants import DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+
+def get_algorithm_packages(
+    group: str = DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP,
+) -> list[str]:
+    """Возвращает имена пакетов алгоритмов, зарегистрированных точками входа
+    установленных пакетов, в порядке имен точек входа.
+
+    :param group: группа точек входа;
+    :type group: str
+    :return: имена пакетов алгоритмов.
+    :rtype: list[str]
+    """
+    entry_points = importlib.metadata.entry_points(group=group)
+    return [
+        entry_point.value
+        for entry_point in sorted(entry_points, key=lambda item: item.name)
+    ]
+
+
+def get_package_path(package: str) -> str:
+    """Импортирует пакет алгоритма и возвращает путь к его каталогу.
+
+    :param package: имя пакета алгоритма;
+    :type package: str
+    :return: путь к каталогу пакета.
+    :rtype: str
+    :raises ValueError: если модуль не является пакетом.
+    """
+    module = importlib.import_module(package)
+    paths = list(getattr(module, "__path__", []))
+    if not paths:
+        raise ValueError(ErrMsgTmpl.NOT_ALGORITHM_PACKAGE.format(package))
+    return paths[0]
+
+
+if __name__ == "__main__":
+    for algorithm_package in get_algorithm_packages():
+        print(algorithm_package, get_package_path(algorithm_package))
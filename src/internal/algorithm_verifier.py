@@ -0,0 +1,307 @@
+"""Модуль с проверкой алгоритмов их тестами. Тесты каждого алгоритма
+выполняются в отдельном процессе, поэтому pytest не загружается в процесс
+приложения, а тесты разных алгоритмов не влияют друг на друга. Процессы для
+алгоритмов каталога запускаются параллельно. Результаты успешных проверок
+кэшируются по содержимому каталога алгоритма; кэш может быть сохранен в файл
+на этапе сборки образа, тогда при запуске приложения тесты не выполняются.
+
+Модуль можно запустить как этап проверки каталога алгоритмов:
+python -m src.internal.algorithm_verifier <каталог> [файл кэша] [--reports
+<каталог отчетов>] [--workers <количество>] [--timeout <секунды>]"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from src.internal.constants import (
+    DEFAULT_ALGORITHMS_CATALOG_PATH,
+    DEFAULT_TEST_FILE_NAME,
+    DEFAULT_TEST_TIMEOUT,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+logger = logging.getLogger(__name__)
+
+
+def get_algorithm_digest(path: str) -> str:
+    """Вычисляет хэш содержимого каталога алгоритма: имен и содержимого всех
+    файлов, кроме кэша байт-кода, и версии интерпретатора.
+
+    :param path: путь к каталогу алгоритма;
+    :type path: str
+    :return: хэш содержимого в шестнадцатеричном виде.
+    :rtype: str
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(sys.version.encode())
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(dir for dir in dirs if dir != "__pycache__")
+        for file_name in sorted(files):
+            file_path = os.path.join(root, file_name)
+            digest.update(os.path.relpath(file_path, path).encode() + b"\0")
+            with open(file_path, "rb") as file:
+                digest.update(file.read())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def write_timeout_report(report_path: str, test_file_path: str, timeout: float) -> None:
+    """Записывает отчет в формате JUnit XML о прерывании тестов по истечении
+    отведенного времени.
+
+    :param report_path: путь к файлу отчета;
+    :type report_path: str
+    :param test_file_path: путь к файлу с тестами;
+    :type test_file_path: str
+    :param timeout: время (с), отведенное на выполнение тестов;
+    :type timeout: float
+    """
+    testsuite = ET.Element(
+        "testsuite",
+        name="pytest",
+        tests="1",
+        errors="1",
+        failures="0",
+        skipped="0",
+        time=str(timeout),
+    )
+    testcase = ET.SubElement(
+        testsuite, "testcase", classname=test_file_path, name="timeout"
+    )
+    ET.SubElement(testcase, "error", message=ErrMsgTmpl.TESTS_TIMEOUT.format(timeout))
+    root = ET.Element("testsuites")
+    root.append(testsuite)
+    ET.ElementTree(root).write(report_path, encoding="utf-8", xml_declaration=True)
+
+
+class AlgorithmVerifier:
+    """Класс выполняет тесты алгоритмов в отдельных процессах интерпретатора и
+    хранит хэши каталогов алгоритмов, прошедших проверку; хэши общие для всех
+    экземпляров класса в процессе. Тесты нескольких алгоритмов выполняются
+    параллельно, время выполнения тестов одного алгоритма ограничено. Если
+    задан каталог отчетов, результаты выполненных тестов каждого алгоритма
+    сохраняются в нем в формате JUnit XML. Если задан путь к файлу кэша, хэши
+    загружаются из него и сохраняются в него после новых успешных проверок.
+    Неуспешные проверки не кэшируются."""
+
+    __verified: set[str] = set()
+    __lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_path: str | None = None,
+        workers: int = 0,
+        timeout: float = DEFAULT_TEST_TIMEOUT,
+        report_dir: str | None = None,
+    ):
+        """Конструктор класса
+
+        :param cache_path: путь к файлу кэша результатов проверки, None -
+            кэш хранится только в памяти;
+        :type cache_path: str or None
+        :param workers: количество одновременно выполняемых процессов с
+            тестами, 0 - по количеству процессоров;
+        :type workers: int
+        :param timeout: время (с) на выполнение тестов одного алгоритма, 0 -
+            без ограничения;
+        :type timeout: float
+        :param report_dir: каталог для отчетов в формате JUnit XML;
+        :type report_dir: str or None
+        :raises ValueError: при отрицательных значениях workers или timeout.
+        """
+        if isinstance(workers, bool) or not isinstance(workers, int):
+            raise TypeError(ErrMsgTmpl.NEGATIVE_PARAM.format("workers"))
+        if workers < 0:
+            raise ValueError(ErrMsgTmpl.NEGATIVE_PARAM.format("workers"))
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            raise TypeError(ErrMsgTmpl.NEGATIVE_NUMBER_PARAM.format("timeout"))
+        if timeout < 0:
+            raise ValueError(ErrMsgTmpl.NEGATIVE_NUMBER_PARAM.format("timeout"))
+        self.__cache_path: str | None = cache_path
+        self.__workers: int = workers or os.cpu_count() or 1
+        self.__timeout: float | None = timeout or None
+        self.__report_dir: str | None = report_dir
+        with AlgorithmVerifier.__lock:
+            AlgorithmVerifier.__verified.update(self.__load())
+
+    @property
+    def cache_path(self) -> str | None:
+        """Возвращает путь к файлу кэша результатов проверки."""
+        return self.__cache_path
+
+    @property
+    def workers(self) -> int:
+        """Возвращает количество одновременно выполняемых процессов с тестами."""
+        return self.__workers
+
+    def verify(self, path: str, test_file_name: str = DEFAULT_TEST_FILE_NAME) -> bool:
+        """Проверяет алгоритм его тестами, если каталог алгоритма с тем же
+        содержимым еще не проходил проверку.
+
+        :param path: путь к каталогу алгоритма;
+        :type path: str
+        :param test_file_name: название файла с тестами;
+        :type test_file_name: str
+        :return: True, если тесты пройдены.
+        :rtype: bool
+        """
+        return self.verify_all([path], test_file_name)[path]
+
+    def verify_all(
+        self, paths: list[str], test_file_name: str = DEFAULT_TEST_FILE_NAME
+    ) -> dict[str, bool]:
+        """Проверяет алгоритмы их тестами. Тесты алгоритмов, не проходивших
+        проверку с тем же содержимым каталога, выполняются параллельно.
+
+        :param paths: пути к каталогам алгоритмов;
+        :type paths: list[str]
+        :param test_file_name: название файла с тестами;
+        :type test_file_name: str
+        :return: результаты проверки по путям к каталогам алгоритмов.
+        :rtype: dict[str, bool]
+        """
+        digests = {path: get_algorithm_digest(path) for path in paths}
+        with AlgorithmVerifier.__lock:
+            verified = AlgorithmVerifier.__verified
+            pending = [path for path in paths if digests[path] not in verified]
+        results = {path: True for path in paths}
+        if not pending:
+            return results
+        if len(pending) == 1:
+            results[pending[0]] = self.__run_tests(pending[0], test_file_name)
+        else:
+            with ThreadPoolExecutor(min(self.__workers, len(pending))) as pool:
+                passed = pool.map(
+                    lambda path: self.__run_tests(path, test_file_name), pending
+                )
+                results.update(zip(pending, passed))
+        with AlgorithmVerifier.__lock:
+            count = len(AlgorithmVerifier.__verified)
+            AlgorithmVerifier.__verified.update(
+                digests[path] for path in pending if results[path]
+            )
+            if len(AlgorithmVerifier.__verified) > count:
+                self.__save()
+        return results
+
+    def __run_tests(self, path: str, test_file_name: str) -> bool:
+        """Выполняет тесты алгоритма в отдельном процессе. Автоматическая
+        загрузка плагинов pytest отключается: тесты алгоритмов их не
+        используют, а загрузка заметно увеличивает время запуска процесса.
+        Вывод pytest записывается в лог при неуспешной проверке."""
+        test_file_path = os.path.join(path, test_file_name)
+        args = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider"]
+        report_path = None
+        if self.__report_dir is not None:
+            os.makedirs(self.__report_dir, exist_ok=True)
+            report_path = os.path.join(
+                self.__report_dir, os.path.basename(os.path.normpath(path)) + ".xml"
+            )
+            args.append(f"--junitxml={report_path}")
+        try:
+            completed = subprocess.run(
+                args + [test_file_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                timeout=self.__timeout,
+                env={**os.environ, "PYTEST_DISABLE_PLUGIN_AUTOLOAD": "1"},
+            )
+        except subprocess.TimeoutExpired:
+            logger.error(
+                f"{test_file_path}: {ErrMsgTmpl.TESTS_TIMEOUT.format(self.__timeout)}"
+            )
+            if report_path is not None:
+                write_timeout_report(report_path, test_file_path, self.__timeout)
+            return False
+        if completed.returncode != 0:
+            logger.error(completed.stdout)
+        return completed.returncode == 0
+
+    def __load(self) -> set[str]:
+        """Загружает хэши проверенных каталогов из файла кэша."""
+        if self.__cache_path is None:
+            return set()
+        try:
+            with open(self.__cache_path, "r", encoding="utf-8") as cache_file:
+                return set(json.load(cache_file))
+        except (OSError, ValueError, TypeError):
+            return set()
+
+    def __save(self) -> None:
+        """Сохраняет хэши проверенных каталогов в файл кэша."""
+        if self.__cache_path is None:
+            return
+        directory = os.path.dirname(self.__cache_path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.__cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(sorted(AlgorithmVerifier.__verified), cache_file)
+            os.replace(temp_path, self.__cache_path)
+        except OSError as ex:
+            logger.error(str(ex))
+
+
+algorithm_verifier = AlgorithmVerifier()
+"""Проверка алгоритмов с параметрами по умолчанию и кэшем в памяти."""
+
+
+def get_algorithm_paths(catalog_path: str) -> list[str]:
+    """Возвращает пути к каталогам алгоритмов в каталоге алгоритмов.
+
+    :param catalog_path: путь к каталогу алгоритмов;
+    :type catalog_path: str
+    :return: пути к каталогам алгоритмов.
+    :rtype: list[str]
+    """
+    return [
+        os.path.join(catalog_path, dir)
+        for dir in sorted(os.listdir(catalog_path))
+        if dir != "__pycache__" and os.path.isdir(os.path.join(catalog_path, dir))
+    ]
+
+
+def verify_catalog(catalog_path: str, verifier: AlgorithmVerifier) -> list[str]:
+    """Проверяет все алгоритмы каталога.
+
+    :param catalog_path: путь к каталогу алгоритмов;
+    :type catalog_path: str
+    :param verifier: проверка алгоритмов;
+    :type verifier: AlgorithmVerifier
+    :return: список каталогов алгоритмов, не прошедших проверку.
+    :rtype: list[str]
+    """
+    results = verifier.verify_all(get_algorithm_paths(catalog_path))
+    return [path for path, passed in results.items() if not passed]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Проверка каталога алгоритмов")
+    parser.add_argument("catalog", nargs="?", default=DEFAULT_ALGORITHMS_CATALOG_PATH)
+    parser.add_argument("cache", nargs="?", default=None)
+    parser.add_argument("--reports", default=None)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TEST_TIMEOUT)
+    arguments = parser.parse_args()
+    started = time.perf_counter()
+    catalog_verifier = AlgorithmVerifier(
+        arguments.cache, arguments.workers, arguments.timeout, arguments.reports
+    )
+    failed_paths = verify_catalog(arguments.catalog, catalog_verifier)
+    for failed_path in failed_paths:
+        print(f"FAILED {failed_path}")
+    print(
+        f"{len(failed_paths)} failed, {catalog_verifier.workers} workers, "
+        f"{time.perf_counter() - started:.2f} s"
+    )
+    sys.exit(1 if failed_paths else 0)
@@ -0,0 +1,110 @@
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+
+from pydantic_core import to_json
+
+from src.internal.constants import DEFAULT_CATALOG_CACHE_PAGES
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from src.internal.schemas.definition_schema import DefinitionSchema
+
+
+class CatalogPage:
+    """Класс представляет отрендеренную страницу каталога алгоритмов: тело
+    ответа в формате JSON и его строгий ETag."""
+
+    def __init__(self, body: bytes):
+        """Конструктор класса
+
+        :param body: страница каталога в формате JSON;
+        :type body: bytes
+        """
+        self.__body: bytes = body
+        self.__etag: str = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    @property
+    def body(self) -> bytes:
+        """Возвращает страницу каталога в формате JSON."""
+        return self.__body
+
+    @property
+    def etag(self) -> str:
+        """Возвращает строгий ETag страницы, вычисленный по ее содержимому."""
+        return self.__etag
+
+
+class CatalogCache:
+    """Класс хранит каталог алгоритмов одной версии набора: краткие описания
+    алгоритмов, сериализованные один раз при создании, и отрендеренные
+    страницы каталога. Страницы рендерятся при первом запросе и хранятся до
+    вытеснения из кэша ограниченного размера. При изменении набора алгоритмов
+    создается новый экземпляр класса."""
+
+    def __init__(
+        self,
+        definitions: list[AlgorithmDefinitionSchema],
+        version: int,
+        max_pages: int = DEFAULT_CATALOG_CACHE_PAGES,
+    ):
+        """Конструктор класса
+
+        :param definitions: описания алгоритмов;
+        :type definitions: list[AlgorithmDefinitionSchema]
+        :param version: версия набора алгоритмов;
+        :type version: int
+        :param max_pages: количество хранимых страниц;
+        :type max_pages: int
+        """
+        fields = set(DefinitionSchema.model_fields)
+        self.__items: list[dict] = [
+            definition.model_dump(mode="json", include=fields)
+            for definition in definitions
+        ]
+        self.__version: int = version
+        self.__max_pages: int = max_pages
+        self.__pages: OrderedDict[tuple[int, int], CatalogPage] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Возвращает версию набора алгоритмов, для которой создан каталог."""
+        return self.__version
+
+    def get_page(self, page: int, size: int) -> CatalogPage:
+        """Возвращает страницу каталога алгоритмов.
+
+        :param page: номер страницы, начиная с 1;
+        :type page: int
+        :param size: количество алгоритмов на странице;
+        :type size: int
+        :return: отрендеренная страница каталога.
+        :rtype: CatalogPage
+        """
+        key = (page, size)
+        with self.__lock:
+            catalog_page = self.__pages.get(key)
+            if catalog_page is not None:
+                self.__pages.move_to_end(key)
+                return catalog_page
+        catalog_page = self.__render(page, size)
+        with self.__lock:
+            self.__pages[key] = catalog_page
+            while len(self.__pages) > self.__max_pages:
+                self.__pages.popitem(last=False)
+        return catalog_page
+
+    def __render(self, page: int, size: int) -> CatalogPage:
+        """Рендерит страницу каталога."""
+        total = len(self.__items)
+        return CatalogPage(
+            to_json(
+                {
+                    "items": self.__items[(page - 1) * size : page * size],
+                    "total": total,
+                    "page": page,
+                    "size": size,
+                    "pages": math.ceil(total / size),
+                }
+            )
+        )
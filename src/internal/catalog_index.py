@@ -0,0 +1,331 @@
+import base64
+import binascii
+import bisect
+import heapq
+import itertools
+import json
+import re
+import threading
+
+from src.internal.catalog_sort_enum import CatalogSortEnum
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors.exceptions import AlgorithmValueError
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from src.internal.schemas.definition_schema import DefinitionSchema
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+"""Шаблон слова для разбиения текста на токены; символ подчеркивания
+разделяет слова в именах алгоритмов."""
+SPARSE_RATIO = 32
+"""Если найдено меньше 1/SPARSE_RATIO алгоритмов индекса, страница выбирается
+из найденных алгоритмов, иначе - просмотром всех алгоритмов по порядку
+сортировки."""
+
+
+def tokenize(text: str) -> set[str]:
+    """Разбивает текст на токены в нижнем регистре.
+
+    :param text: текст;
+    :type text: str
+    :return: множество токенов.
+    :rtype: set[str]
+    """
+    return {token.casefold() for token in TOKEN_PATTERN.findall(text)}
+
+
+def encode_cursor(key: tuple[str, str]) -> str:
+    """Кодирует позицию последнего выданного алгоритма в курсор."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Декодирует курсор в позицию последнего выданного алгоритма.
+
+    :raises AlgorithmValueError: при некорректном курсоре.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise AlgorithmValueError(ErrMsg.INVALID_CURSOR)
+    if (
+        not isinstance(key, list)
+        or len(key) != 2
+        or not all(isinstance(item, str) for item in key)
+    ):
+        raise AlgorithmValueError(ErrMsg.INVALID_CURSOR)
+    return key[0], key[1]
+
+
+class CatalogIndex:
+    """Класс реализует индекс для поиска алгоритмов: инвертированный индекс
+    токенов из имени, заголовка и описания алгоритма и фасеты по типам и
+    размерностям входных данных. Каждому алгоритму выделяется позиция в
+    битовых масках, поэтому пересечение условий поиска и подсчет фасетов
+    выполняются побитовыми операциями над целыми числами. Результаты поиска
+    выдаются в заданном порядке с постраничным выводом по курсору. При
+    обновлении индекс изменяется только для добавленных, измененных и
+    удаленных алгоритмов."""
+
+    def __init__(self):
+        """Конструктор класса"""
+        self.__definitions: dict[str, AlgorithmDefinitionSchema] = {}
+        self.__items: dict[str, dict] = {}
+        self.__slots: dict[str, int] = {}
+        self.__names: list[str | None] = []
+        self.__free_slots: list[int] = []
+        self.__postings: dict[str, int] = {}
+        self.__vocabulary: list[str] = []
+        self.__data_types: dict[DataTypeEnum, int] = {}
+        self.__data_shapes: dict[DataShapeEnum, int] = {}
+        self.__sort_keys: dict[CatalogSortEnum, list[tuple[str, str]]] = {
+            sort: [] for sort in CatalogSortEnum
+        }
+        self.__keys_by_name: dict[CatalogSortEnum, dict[str, tuple[str, str]]] = {
+            sort: {} for sort in CatalogSortEnum
+        }
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Возвращает количество алгоритмов в индексе."""
+        return len(self.__definitions)
+
+    def update(self, definitions: list[AlgorithmDefinitionSchema]) -> None:
+        """Приводит индекс в соответствие с описаниями алгоритмов: удаляет
+        отсутствующие и измененные алгоритмы, добавляет новые и измененные.
+
+        :param definitions: описания алгоритмов;
+        :type definitions: list[AlgorithmDefinitionSchema]
+        """
+        actual = {definition.name: definition for definition in definitions}
+        with self.__lock:
+            for name, definition in list(self.__definitions.items()):
+                if actual.get(name) != definition:
+                    self.__remove(definition)
+            for name, definition in actual.items():
+                if name not in self.__definitions:
+                    self.__add(definition)
+
+    def search(
+        self,
+        query: str | None = None,
+        data_type: DataTypeEnum | None = None,
+        data_shape: DataShapeEnum | None = None,
+        sort: CatalogSortEnum = CatalogSortEnum.NAME,
+        size: int = 50,
+        cursor: str | None = None,
+    ) -> dict:
+        """Ищет алгоритмы, в имени, заголовке или описании которых есть слова,
+        начинающиеся с каждого слова запроса, и у которых есть входные данные
+        заданного типа и размерности.
+
+        :param query: поисковый запрос, None - без отбора по словам;
+        :type query: str or None
+        :param data_type: тип входных данных, None - без отбора по типу;
+        :type data_type: DataTypeEnum or None
+        :param data_shape: размерность входных данных, None - без отбора по
+            размерности;
+        :type data_shape: DataShapeEnum or None
+        :param sort: поле для сортировки результатов;
+        :type sort: CatalogSortEnum
+        :param size: количество алгоритмов на странице;
+        :type size: int
+        :param cursor: курсор из предыдущей страницы результатов;
+        :type cursor: str or None
+        :return: словарь с краткими описаниями найденных алгоритмов (items),
+            их общим количеством (total), размером страницы (size), курсором
+            следующей страницы (next_cursor) и количеством найденных
+            алгоритмов по типам и размерностям входных данных (facets).
+        :rtype: dict
+        :raises AlgorithmValueError: при некорректном курсоре.
+        """
+        start = decode_cursor(cursor) if cursor is not None else None
+        with self.__lock:
+            matched = self.__match(query, data_type, data_shape)
+            total = matched.bit_count()
+            if total * SPARSE_RATIO < len(self.__definitions):
+                page, has_next = self.__get_sparse_page(matched, sort, size, start)
+            else:
+                page, has_next = self.__get_dense_page(matched, sort, size, start)
+            return {
+                "items": [self.__items[name] for _, name in page],
+                "total": total,
+                "size": size,
+                "next_cursor": encode_cursor(page[-1]) if has_next else None,
+                "facets": {
+                    "data_type": self.__count_facet(self.__data_types, matched),
+                    "data_shape": self.__count_facet(self.__data_shapes, matched),
+                },
+            }
+
+    def __match(
+        self,
+        query: str | None,
+        data_type: DataTypeEnum | None,
+        data_shape: DataShapeEnum | None,
+    ) -> int:
+        """Возвращает битовую маску алгоритмов, удовлетворяющих условиям
+        поиска."""
+        matched = self.__get_all_mask()
+        for token in tokenize(query or ""):
+            matched &= self.__match_prefix(token)
+        if data_type is not None:
+            matched &= self.__data_types.get(data_type, 0)
+        if data_shape is not None:
+            matched &= self.__data_shapes.get(data_shape, 0)
+        return matched
+
+    def __match_prefix(self, prefix: str) -> int:
+        """Возвращает битовую маску алгоритмов, содержащих токены с заданным
+        началом."""
+        mask = 0
+        position = bisect.bisect_left(self.__vocabulary, prefix)
+        while position < len(self.__vocabulary) and self.__vocabulary[
+            position
+        ].startswith(prefix):
+            mask |= self.__postings[self.__vocabulary[position]]
+            position += 1
+        return mask
+
+    def __get_all_mask(self) -> int:
+        """Возвращает битовую маску всех алгоритмов индекса."""
+        mask = (1 << len(self.__names)) - 1
+        for slot in self.__free_slots:
+            mask &= ~(1 << slot)
+        return mask
+
+    def __get_dense_page(
+        self,
+        matched: int,
+        sort: CatalogSortEnum,
+        size: int,
+        start: tuple[str, str] | None,
+    ) -> tuple[list[tuple[str, str]], bool]:
+        """Возвращает страницу ключей сортировки найденных алгоритмов после
+        заданной позиции и признак наличия следующей страницы. Ключи
+        просматриваются по порядку сортировки, что выгодно, когда найдена
+        значительная часть алгоритмов."""
+        keys = self.__sort_keys[sort]
+        position = bisect.bisect_right(keys, start) if start is not None else 0
+        page = []
+        for key in itertools.islice(keys, position, None):
+            if matched >> self.__slots[key[1]] & 1:
+                if len(page) == size:
+                    return page, True
+                page.append(key)
+        return page, False
+
+    def __get_sparse_page(
+        self,
+        matched: int,
+        sort: CatalogSortEnum,
+        size: int,
+        start: tuple[str, str] | None,
+    ) -> tuple[list[tuple[str, str]], bool]:
+        """Возвращает страницу ключей сортировки найденных алгоритмов после
+        заданной позиции и признак наличия следующей страницы. Ключи
+        найденных алгоритмов не сортируются полностью: выбираются только
+        size + 1 наименьших ключей."""
+        keys = []
+        keys_by_name = self.__keys_by_name[sort]
+        while matched:
+            lowest = matched & -matched
+            key = keys_by_name[self.__names[lowest.bit_length() - 1]]
+            if start is None or key > start:
+                keys.append(key)
+            matched ^= lowest
+        page = heapq.nsmallest(size + 1, keys)
+        return page[:size], len(page) > size
+
+    @staticmethod
+    def __count_facet(facet: dict, matched: int) -> dict[str, int]:
+        """Подсчитывает количество найденных алгоритмов для каждого значения
+        фасета."""
+        counts = {
+            str(value.value): (matched & mask).bit_count()
+            for value, mask in facet.items()
+        }
+        return {value: count for value, count in counts.items() if count > 0}
+
+    def __add(self, definition: AlgorithmDefinitionSchema) -> None:
+        """Добавляет алгоритм в индекс."""
+        name = definition.name
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+            self.__names[slot] = name
+        else:
+            slot = len(self.__names)
+            self.__names.append(name)
+        bit = 1 << slot
+        self.__slots[name] = slot
+        self.__definitions[name] = definition
+        self.__items[name] = definition.model_dump(
+            mode="json", include=set(DefinitionSchema.model_fields)
+        )
+        for token in self.__get_tokens(definition):
+            if token not in self.__postings:
+                self.__postings[token] = 0
+                bisect.insort(self.__vocabulary, token)
+            self.__postings[token] |= bit
+        for param in definition.parameters:
+            self.__data_types[param.data_type] = (
+                self.__data_types.get(param.data_type, 0) | bit
+            )
+            self.__data_shapes[param.data_shape] = (
+                self.__data_shapes.get(param.data_shape, 0) | bit
+            )
+        for sort, keys in self.__sort_keys.items():
+            key = self.__get_sort_key(definition, sort)
+            self.__keys_by_name[sort][name] = key
+            bisect.insort(keys, key)
+
+    def __remove(self, definition: AlgorithmDefinitionSchema) -> None:
+        """Удаляет алгоритм из индекса."""
+        name = definition.name
+        slot = self.__slots.pop(name)
+        mask = ~(1 << slot)
+        self.__names[slot] = None
+        self.__free_slots.append(slot)
+        del self.__definitions[name]
+        del self.__items[name]
+        for token in self.__get_tokens(definition):
+            self.__postings[token] &= mask
+            if not self.__postings[token]:
+                del self.__postings[token]
+                del self.__vocabulary[bisect.bisect_left(self.__vocabulary, token)]
+        for facet in (self.__data_types, self.__data_shapes):
+            for value in list(facet):
+                facet[value] &= mask
+                if not facet[value]:
+                    del facet[value]
+        for sort, keys in self.__sort_keys.items():
+            key = self.__keys_by_name[sort].pop(name)
+            del keys[bisect.bisect_left(keys, key)]
+
+    @staticmethod
+    def __get_tokens(definition: AlgorithmDefinitionSchema) -> set[str]:
+        """Возвращает токены имени, заголовка и описания алгоритма."""
+        return (
+            tokenize(definition.name)
+            | tokenize(definition.title)
+            | tokenize(definition.description)
+        )
+
+    @staticmethod
+    def __get_sort_key(
+        definition: AlgorithmDefinitionSchema, sort: CatalogSortEnum
+    ) -> tuple[str, str]:
+        """Возвращает ключ сортировки алгоритма: значение поля сортировки и
+        имя алгоритма для однозначного порядка."""
+        if sort == CatalogSortEnum.TITLE:
+            return definition.title.casefold(), definition.name
+        return definition.name.casefold(), definition.name
+
+
+if __name__ == "__main__":
+    from src.internal.algorithm_collection import AlgorithmCollection
+
+    index = CatalogIndex()
+    index.update(AlgorithmCollection("src/algorithms").get_algorithm_list())
+    print(index.search("числа", size=2))
@@ -0,0 +1,334 @@
+"""Модуль со снимком каталога алгоритмов. Снимок создается на этапе сборки
+после проверки алгоритмов тестами и содержит в одном файле проверенные схемой
+описания всех алгоритмов и байт-код их модулей. При запуске приложения снимок
+загружается одним чтением файла, поэтому описания не читаются и не проверяются
+повторно, исходный код не компилируется, а тесты не выполняются. Снимок
+считается устаревшим, если изменился состав, размер или время изменения
+файлов каталога, версия интерпретатора или формата снимка; тогда алгоритмы
+собираются из каталога.
+
+Снимок сериализуется модулями pickle и marshal, поэтому загружать можно только
+снимки, созданные на этапе сборки приложения, как и файлы байт-кода.
+
+Модуль можно запустить как этап сборки снимка:
+python -m src.internal.catalog_snapshot <каталог> <файл снимка> [--tests-cache
+<файл кэша>] [--workers <количество>] [--timeout <секунды>]"""
+
+import argparse
+import logging
+import marshal
+import mmap
+import os
+import pickle
+import sys
+import time
+from types import CodeType
+
+from src.internal.algorithm_builder import AlgorithmBuilder
+from src.internal.algorithm_verifier import (
+    AlgorithmVerifier,
+    get_algorithm_digest,
+    get_algorithm_paths,
+)
+from src.internal.constants import (
+    CATALOG_SNAPSHOT_FORMAT,
+    DEFAULT_DEFINITION_FILE_NAME,
+    DEFAULT_FUNCTION_FILE_NAME,
+    DEFAULT_TEST_FILE_NAME,
+    DEFAULT_TEST_TIMEOUT,
+)
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+
+logger = logging.getLogger(__name__)
+
+
+def get_catalog_fingerprint(catalog_path: str) -> tuple:
+    """Возвращает отпечаток каталога алгоритмов: относительные пути, размеры
+    и время изменения всех файлов, кроме кэша байт-кода. Содержимое файлов не
+    читается.
+
+    :param catalog_path: путь к каталогу алгоритмов;
+    :type catalog_path: str
+    :return: отпечаток каталога.
+    :rtype: tuple
+    """
+    fingerprint = []
+    pending = [
+        (path, os.path.basename(path)) for path in get_algorithm_paths(catalog_path)
+    ]
+    while pending:
+        path, relative_path = pending.pop()
+        with os.scandir(path) as dir_entries:
+            for dir_entry in sorted(dir_entries, key=lambda item: item.name):
+                name = relative_path + "/" + dir_entry.name
+                if dir_entry.is_dir():
+                    if dir_entry.name != "__pycache__":
+                        pending.append((dir_entry.path, name))
+                    continue
+                stat = dir_entry.stat()
+                fingerprint.append((name, stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+class SnapshotEntry:
+    """Класс представляет алгоритм в снимке каталога: имя каталога алгоритма,
+    проверенное описание, байт-код модуля с методом алгоритма и хэш
+    содержимого каталога алгоритма."""
+
+    def __init__(
+        self,
+        dir_name: str,
+        definition: AlgorithmDefinitionSchema,
+        bytecode: bytes,
+        digest: str,
+    ):
+        """Конструктор класса
+
+        :param dir_name: имя каталога алгоритма в каталоге алгоритмов;
+        :type dir_name: str
+        :param definition: проверенное описание алгоритма;
+        :type definition: AlgorithmDefinitionSchema
+        :param bytecode: байт-код модуля, сериализованный модулем marshal;
+        :type bytecode: bytes
+        :param digest: хэш содержимого каталога алгоритма;
+        :type digest: str
+        """
+        self.__dir_name: str = dir_name
+        self.__definition: AlgorithmDefinitionSchema = definition
+        self.__bytecode: bytes = bytecode
+        self.__digest: str = digest
+
+    @property
+    def dir_name(self) -> str:
+        """Возвращает имя каталога алгоритма в каталоге алгоритмов."""
+        return self.__dir_name
+
+    @property
+    def definition(self) -> AlgorithmDefinitionSchema:
+        """Возвращает проверенное описание алгоритма."""
+        return self.__definition
+
+    @property
+    def bytecode(self) -> bytes:
+        """Возвращает байт-код модуля, сериализованный модулем marshal."""
+        return self.__bytecode
+
+    @property
+    def digest(self) -> str:
+        """Возвращает хэш содержимого каталога алгоритма."""
+        return self.__digest
+
+    def get_code(self) -> CodeType:
+        """Возвращает объект кода модуля с методом алгоритма.
+
+        :return: объект кода модуля.
+        :rtype: CodeType
+        """
+        return marshal.loads(self.__bytecode)
+
+
+class CatalogSnapshot:
+    """Класс представляет снимок каталога алгоритмов: отпечаток каталога на
+    момент создания снимка, названия файлов алгоритмов и записи алгоритмов."""
+
+    def __init__(
+        self,
+        fingerprint: tuple,
+        file_names: tuple[str, str, str],
+        entries: list[SnapshotEntry],
+    ):
+        """Конструктор класса
+
+        :param fingerprint: отпечаток каталога алгоритмов;
+        :type fingerprint: tuple
+        :param file_names: названия файлов с описанием, методом и тестами
+            алгоритма;
+        :type file_names: tuple[str, str, str]
+        :param entries: записи алгоритмов;
+        :type entries: list[SnapshotEntry]
+        """
+        self.__fingerprint: tuple = fingerprint
+        self.__file_names: tuple[str, str, str] = file_names
+        self.__entries: list[SnapshotEntry] = entries
+
+    @property
+    def entries(self) -> list[SnapshotEntry]:
+        """Возвращает записи алгоритмов."""
+        return self.__entries
+
+    def is_fresh(self, catalog_path: str, file_names: tuple[str, str, str]) -> bool:
+        """Проверяет, что снимок соответствует каталогу алгоритмов и
+        названиям файлов алгоритмов.
+
+        :param catalog_path: путь к каталогу алгоритмов;
+        :type catalog_path: str
+        :param file_names: названия файлов с описанием, методом и тестами
+            алгоритма;
+        :type file_names: tuple[str, str, str]
+        :return: True, если снимок не устарел.
+        :rtype: bool
+        """
+        if self.__file_names != tuple(file_names):
+            return False
+        try:
+            return self.__fingerprint == get_catalog_fingerprint(catalog_path)
+        except OSError:
+            return False
+
+    def write(self, path: str) -> None:
+        """Сохраняет снимок в файл вместе с версиями формата снимка и
+        интерпретатора. В файл записываются только встроенные типы и описания
+        алгоритмов, поэтому снимок не зависит от того, как запущен модуль.
+        Файл заменяется целиком, поэтому запускаемые одновременно процессы не
+        прочитают его частично.
+
+        :param path: путь к файлу снимка;
+        :type path: str
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as snapshot_file:
+            pickle.dump(
+                {
+                    "format": CATALOG_SNAPSHOT_FORMAT,
+                    "python": sys.version,
+                    "file_names": self.__file_names,
+                    "fingerprint": self.__fingerprint,
+                    "entries": [
+                        (
+                            entry.dir_name,
+                            entry.definition,
+                            entry.bytecode,
+                            entry.digest,
+                        )
+                        for entry in self.__entries
+                    ],
+                },
+                snapshot_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = False) -> "CatalogSnapshot | None":
+        """Загружает снимок из файла одним чтением или через отображение файла
+        в память.
+
+        :param path: путь к файлу снимка;
+        :type path: str
+        :param use_mmap: отображать файл в память вместо чтения;
+        :type use_mmap: bool
+        :return: снимок или None, если файла нет, он поврежден или создан
+            для другой версии формата снимка или интерпретатора.
+        :rtype: CatalogSnapshot or None
+        """
+        try:
+            with open(path, "rb") as snapshot_file:
+                if use_mmap:
+                    with mmap.mmap(
+                        snapshot_file.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as data:
+                        data = pickle.loads(data)
+                else:
+                    data = pickle.loads(snapshot_file.read())
+            if (
+                data["format"] != CATALOG_SNAPSHOT_FORMAT
+                or data["python"] != sys.version
+            ):
+                return None
+            return cls(
+                data["fingerprint"],
+                data["file_names"],
+                [SnapshotEntry(*entry) for entry in data["entries"]],
+            )
+        except (
+            OSError,
+            ValueError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            IndexError,
+            KeyError,
+            TypeError,
+        ) as ex:
+            logger.debug(str(ex))
+            return None
+
+
+def create_snapshot(
+    catalog_path: str,
+    verifier: AlgorithmVerifier | None = None,
+    definition_file_name: str = DEFAULT_DEFINITION_FILE_NAME,
+    function_file_name: str = DEFAULT_FUNCTION_FILE_NAME,
+    test_file_name: str = DEFAULT_TEST_FILE_NAME,
+) -> CatalogSnapshot:
+    """Создает снимок каталога алгоритмов. Алгоритмы проверяются тестами и
+    собираются так же, как при запуске приложения, поэтому в снимок попадают
+    только алгоритмы, готовые к выполнению.
+
+    :param catalog_path: путь к каталогу алгоритмов;
+    :type catalog_path: str
+    :param verifier: проверка алгоритмов тестами;
+    :type verifier: AlgorithmVerifier or None
+    :param definition_file_name: название файла с описанием алгоритма;
+    :type definition_file_name: str
+    :param function_file_name: название файла с методом для алгоритма;
+    :type function_file_name: str
+    :param test_file_name: название файла с тестами для метода алгоритма;
+    :type test_file_name: str
+    :return: снимок каталога алгоритмов.
+    :rtype: CatalogSnapshot
+    :raises RuntimeError: при ошибке выполнения тестов или отсутствии
+        алгоритмов в каталоге.
+    """
+    fingerprint = get_catalog_fingerprint(catalog_path)
+    builder = AlgorithmBuilder(
+        definition_file_name, function_file_name, test_file_name, 0, verifier
+    )
+    alg_paths = get_algorithm_paths(catalog_path)
+    if not all(builder.verify_algorithms(alg_paths).values()):
+        raise RuntimeError(ErrMsg.UNIT_TEST_FAILED)
+    entries = []
+    for alg_path in alg_paths:
+        definition = builder.build_algorithm(alg_path).definition
+        function_path = os.path.join(alg_path, function_file_name)
+        with open(function_path, "rb") as function_file:
+            code = compile(function_file.read(), function_path, "exec")
+        entries.append(
+            SnapshotEntry(
+                os.path.basename(alg_path),
+                definition,
+                marshal.dumps(code),
+                get_algorithm_digest(alg_path),
+            )
+        )
+    if not entries:
+        raise RuntimeError(ErrMsg.NO_ALGORITHMS)
+    return CatalogSnapshot(
+        fingerprint, (definition_file_name, function_file_name, test_file_name), entries
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сборка снимка каталога алгоритмов")
+    parser.add_argument("catalog")
+    parser.add_argument("snapshot")
+    parser.add_argument("--tests-cache", default=None)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TEST_TIMEOUT)
+    arguments = parser.parse_args()
+    started = time.perf_counter()
+    catalog_verifier = AlgorithmVerifier(
+        arguments.tests_cache, arguments.workers, arguments.timeout
+    )
+    catalog_snapshot = create_snapshot(arguments.catalog, catalog_verifier)
+    catalog_snapshot.write(arguments.snapshot)
+    print(
+        f"{len(catalog_snapshot.entries)} algorithms, "
+        f"{os.path.getsize(arguments.snapshot)} bytes, "
+        f"{time.perf_counter() - started:.2f} s"
+    )
@@ -0,0 +1,14 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class CatalogSortEnum(LowercaseStrEnum):
+    """Перечисление полей для сортировки результатов поиска алгоритмов.
+    Значения NAME и TITLE соответствуют сортировке по имени и по заголовку
+    алгоритма.
+
+    """
+
+    NAME = auto()
+    TITLE = auto()
@@ -12,3 +12,113 @@ DEFAULT_ALGORITHMS_CATALOG_PATH = "src/algorithms"
 """Имя каталога с алгоритмами по умолчанию."""
 ALGORITHMS_ENDPOINT = "/api/algorithms"
 """Конечная точка для API"""
+DEFAULT_FAST_LANE_WORKERS = 4
+"""Количество рабочих потоков быстрой полосы планировщика по умолчанию."""
+DEFAULT_SLOW_LANE_WORKERS = 2
+"""Количество рабочих потоков медленной полосы планировщика по умолчанию."""
+DEFAULT_FAST_LANE_THRESHOLD = 0.1
+"""Оценка времени выполнения алгоритма (с), до которой вызов направляется
+в быструю полосу планировщика."""
+DEFAULT_EWMA_ALPHA = 0.2
+"""Коэффициент сглаживания скользящей оценки времени выполнения алгоритма."""
+PRIORITY_HEADER = "X-Priority"
+"""Заголовок запроса с приоритетом выполнения алгоритма."""
+METRICS_ENDPOINT = "/api/metrics"
+"""Конечная точка для метрик приложения"""
+CLIENT_CLOSED_REQUEST = 499
+"""Код ответа для запроса, клиент которого разорвал соединение."""
+WORKER_POLL_INTERVAL = 0.05
+"""Интервал (с) проверки готовности результата рабочего процесса."""
+DEFAULT_CATALOG_CACHE_PAGES = 256
+"""Количество отрендеренных страниц каталога алгоритмов, хранимых в кэше."""
+CATALOG_CACHE_CONTROL = "no-cache"
+"""Значение заголовка Cache-Control для каталога алгоритмов: клиент может
+хранить ответ, но должен проверять его актуальность по ETag."""
+SEARCH_ENDPOINT = "/api/search"
+"""Конечная точка для поиска алгоритмов"""
+DEFAULT_COMPRESSION_MIN_SIZE = 1024
+"""Размер тела ответа (байт), начиная с которого ответ сжимается."""
+DEFAULT_COMPRESSION_STREAMING_SIZE = 1024 * 1024
+"""Размер тела ответа (байт), начиная с которого ответ сжимается и
+передается частями без заголовка Content-Length."""
+COMPRESSION_CHUNK_SIZE = 64 * 1024
+"""Размер части тела ответа (байт) при потоковом сжатии."""
+COMPRESSION_THREAD_SIZE = 16 * 1024
+"""Объем несжатых данных (байт), начиная с которого сжатие выполняется в пуле
+потоков, а не в цикле событий."""
+DEFAULT_GZIP_COMPRESSION_LEVEL = 6
+"""Уровень сжатия gzip по умолчанию."""
+DEFAULT_BROTLI_COMPRESSION_LEVEL = 4
+"""Уровень сжатия brotli по умолчанию."""
+DEFAULT_ZSTD_COMPRESSION_LEVEL = 3
+"""Уровень сжатия zstd по умолчанию."""
+WS_ALGORITHMS_ENDPOINT = "/ws/algorithms"
+"""Конечная точка для сессий выполнения алгоритмов через WebSocket"""
+DEFAULT_PROGRESS_INTERVAL = 0.1
+"""Минимальный интервал (с) между событиями о ходе выполнения алгоритма."""
+PROGRESS_PARAMETER = "progress"
+"""Имя параметра функции main, через который алгоритм сообщает о ходе
+выполнения."""
+DEFAULT_LOG_QUEUE_SIZE = 10000
+"""Максимальное количество записей лога, ожидающих записи в отдельном
+потоке; при переполнении очереди новые записи отбрасываются."""
+DEFAULT_EXECUTION_LOG_SAMPLE_RATE = 0.01
+"""Доля выполнений алгоритмов, отбираемых в журнал выполнения до их начала."""
+DEFAULT_EXECUTION_LOG_SLOW_THRESHOLD = 1.0
+"""Время выполнения алгоритма (с), начиная с которого запись о выполнении
+сохраняется в журнале всегда."""
+DEFAULT_EXECUTION_LOG_BATCH_SIZE = 100
+"""Количество записей журнала выполнения, записываемых в файл одной
+операцией."""
+DEFAULT_EXECUTION_LOG_FLUSH_INTERVAL = 1.0
+"""Наибольшее время (с) хранения записи журнала выполнения в памяти."""
+DEFAULT_EXECUTION_LOG_MAX_BYTES = 10240000
+"""Размер файла журнала выполнения (байт), при достижении которого файл
+ротируется."""
+DEFAULT_EXECUTION_LOG_BACKUP_COUNT = 5
+"""Количество файлов журнала выполнения, хранимых после ротации."""
+DEFAULT_STARTUP_TRACE_PATH = "startup_trace.json"
+"""Путь к файлу с отчетом о времени запуска приложения по умолчанию."""
+DEFAULT_TEST_TIMEOUT = 60
+"""Время (с) на выполнение тестов одного алгоритма при его проверке."""
+CATALOG_SNAPSHOT_FORMAT = 4
+"""Версия формата снимка каталога алгоритмов. Снимок другой версии считается
+устаревшим."""
+DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP = "algoscalc.algorithms"
+"""Группа точек входа (entry points), через которую установленные пакеты
+регистрируют алгоритмы."""
+TENANTS_ENDPOINT = "/tenants"
+"""Префикс маршрутов арендаторов: запросы /tenants/<арендатор>/... выполняются
+с каталогом алгоритмов арендатора."""
+TENANT_HEADER = "X-Tenant"
+"""Заголовок запроса с именем арендатора."""
+DEFAULT_TENANT = ""
+"""Имя арендатора по умолчанию с каталогом ALGORITHMS_CATALOG_PATH."""
+TENANT_NAME_PATTERN = r"^[A-Za-z0-9_-]+$"
+"""Шаблон имени арендатора."""
+DEFAULT_RUNTIME_PROFILE_SAMPLES = 1000
+"""Количество последних измерений времени выполнения, хранимых для каждого
+алгоритма и диапазона размера входных данных."""
+DEFAULT_ADAPTIVE_TIMEOUT_MIN_SAMPLES = 100
+"""Количество измерений времени выполнения, после которого таймаут алгоритма
+может быть сокращен по наблюдаемому 99-му процентилю."""
+DEFAULT_MEMOIZE_MAX_SIZE = 4096
+"""Наибольшее количество результатов в кэше мемоизированной функции по
+умолчанию."""
+DEFAULT_MAX_REQUEST_BODY_SIZE = 16 * 1024 * 1024
+"""Наибольший размер тела запроса (байт) по умолчанию; запросы большего
+размера отклоняются с кодом 413 до чтения тела целиком."""
+DEFAULT_RESULT_CACHE_SIZE = 10000
+"""Наибольшее количество результатов выполнения алгоритмов в кэше результатов
+по умолчанию."""
+DEFAULT_RESULT_CACHE_MAX_ITEM_SIZE = 1024 * 1024
+"""Наибольший размер (байт) сериализованного результата, сохраняемого в кэше
+результатов, по умолчанию."""
+DEFAULT_RESULT_CACHE_TIMEOUT = 1.0
+"""Время (с) ожидания ответа сервера кэша результатов."""
+DEFAULT_RESULT_CACHE_TOUCH_INTERVAL = 60.0
+"""Время (с), через которое обновляется время последнего использования
+значения в файле кэша результатов при его чтении."""
+DEFAULT_RESULT_CACHE_EVICTION_INTERVAL = 100
+"""Количество сохранений значений в файл кэша результатов, через которое
+вытесняются лишние и устаревшие значения."""
@@ -0,0 +1,200 @@
+from array import array
+from typing import Any, Iterator
+
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+
+TYPECODES = {DataTypeEnum.INT: "q", DataTypeEnum.FLOAT: "d", DataTypeEnum.BOOL: "b"}
+"""Коды типов array.array для типов данных, значения которых хранятся
+компактно."""
+
+
+class CompactArray:
+    """Класс хранит список или матрицу чисел или логических значений в
+    непрерывном массиве array.array: 8 байт на элемент вместо объекта Python
+    и ссылки на него в списке. Элементы строк матрицы хранятся в одном массиве
+    подряд, начало каждой строки - в массиве смещений offsets, поэтому строки
+    могут иметь разную длину.
+
+    Значение поддерживает len, индексацию и итерацию: для списка - по
+    элементам, для матрицы - по строкам, которые преобразуются в списки при
+    обращении. Метод tolist возвращает значение во вложенных списках.
+    """
+
+    __slots__ = ("data_type", "data", "offsets")
+
+    def __init__(
+        self, data_type: DataTypeEnum, data: array, offsets: array | None = None
+    ):
+        """Конструктор класса
+
+        :param data_type: тип данных элементов;
+        :type data_type: DataTypeEnum
+        :param data: элементы списка или строк матрицы;
+        :type data: array
+        :param offsets: смещения начала строк матрицы в data и длина data,
+            None для списка;
+        :type offsets: array or None
+        """
+        self.data_type: DataTypeEnum = data_type
+        self.data: array = data
+        self.offsets: array | None = offsets
+
+    @property
+    def data_shape(self) -> DataShapeEnum:
+        """Возвращает размерность значения."""
+        if self.offsets is None:
+            return DataShapeEnum.LIST
+        return DataShapeEnum.MATRIX
+
+    @property
+    def size(self) -> int:
+        """Возвращает количество элементов списка или ячеек матрицы."""
+        return len(self.data)
+
+    def get_row_size(self, row_idx: int) -> int:
+        """Возвращает количество элементов строки матрицы.
+
+        :param row_idx: индекс строки;
+        :type row_idx: int
+        :return: количество элементов строки.
+        :rtype: int
+        """
+        return self.offsets[row_idx + 1] - self.offsets[row_idx]
+
+    def tolist(self) -> list:
+        """Возвращает значение в виде списка или списка строк матрицы.
+
+        :return: значение во вложенных списках.
+        :rtype: list
+        """
+        if self.offsets is None:
+            return self.__convert(self.data)
+        return [self[row_idx] for row_idx in range(len(self))]
+
+    def __len__(self) -> int:
+        if self.offsets is None:
+            return len(self.data)
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> Any:
+        if self.offsets is None:
+            item = self.data[idx]
+            return bool(item) if self.data_type == DataTypeEnum.BOOL else item
+        row_idx = range(len(self))[idx]
+        start, end = self.offsets[row_idx], self.offsets[row_idx + 1]
+        return self.__convert(self.data[start:end])
+
+    def __iter__(self) -> Iterator:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactArray):
+            return NotImplemented
+        return (
+            self.data_type == other.data_type
+            and self.data == other.data
+            and self.offsets == other.offsets
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactArray({self.data_type}, {self.tolist()})"
+
+    def __convert(self, data: array) -> list:
+        """Преобразует часть массива в список значений типа данных."""
+        if self.data_type == DataTypeEnum.BOOL:
+            return [bool(item) for item in data]
+        return data.tolist()
+
+
+class CompactArrayBuilder:
+    """Класс собирает значение списка или матрицы по частям. Значения типов
+    INT, FLOAT и BOOL собираются в CompactArray; если часть значения нельзя
+    хранить компактно (значение None, целое число вне диапазона int64 или
+    целое число для типа FLOAT), собранные элементы преобразуются в списки и
+    сборка продолжается в списки. Целые числа значений типа FLOAT не
+    преобразуются в float, чтобы алгоритм получал те же значения, что и при
+    передаче данных в других форматах. Значения типа STRING всегда собираются
+    в списки.
+
+    Элементы должны быть заранее проверены на соответствие типу данных.
+    """
+
+    def __init__(self, data_type: DataTypeEnum, data_shape: DataShapeEnum):
+        """Конструктор класса
+
+        :param data_type: тип данных элементов;
+        :type data_type: DataTypeEnum
+        :param data_shape: размерность значения: LIST или MATRIX;
+        :type data_shape: DataShapeEnum
+        """
+        typecode = TYPECODES.get(data_type)
+        is_matrix = data_shape == DataShapeEnum.MATRIX
+        self.__data_type: DataTypeEnum = data_type
+        self.__data: array | None = array(typecode) if typecode else None
+        self.__offsets: array | None = array("q", [0]) if is_matrix else None
+        self.__is_matrix: bool = is_matrix
+        self.__rows: list[list] = []
+        self.__items: list = []
+
+    def extend(self, items: list) -> None:
+        """Добавляет элементы в конец списка или текущей строки матрицы.
+
+        :param items: элементы;
+        :type items: list
+        """
+        if self.__data is not None:
+            if self.__is_compact(items):
+                try:
+                    self.__data.extend(array(self.__data.typecode, items))
+                    return
+                except OverflowError:
+                    pass
+            self.__expand()
+        self.__items.extend(items)
+
+    def end_row(self) -> None:
+        """Завершает текущую строку матрицы."""
+        if self.__data is not None:
+            self.__offsets.append(len(self.__data))
+        else:
+            self.__rows.append(self.__items)
+            self.__items = []
+
+    def build(self) -> CompactArray | list:
+        """Возвращает собранное значение.
+
+        :return: значение в CompactArray или во вложенных списках.
+        :rtype: CompactArray or list
+        """
+        if self.__data is not None:
+            return CompactArray(self.__data_type, self.__data, self.__offsets)
+        return self.__rows if self.__is_matrix else self.__items
+
+    def __is_compact(self, items: list) -> bool:
+        """Проверяет, что элементы можно хранить компактно."""
+        if self.__data_type == DataTypeEnum.FLOAT:
+            return all(isinstance(item, float) for item in items)
+        return None not in items
+
+    def __expand(self) -> None:
+        """Преобразует собранные элементы в списки."""
+        if self.__is_matrix:
+            value = CompactArray(self.__data_type, self.__data, self.__offsets)
+            self.__rows = value.tolist()
+            tail = self.__data[self.__offsets[-1] :]
+            self.__items = CompactArray(self.__data_type, tail).tolist()
+        else:
+            self.__items = CompactArray(self.__data_type, self.__data).tolist()
+        self.__data = None
+        self.__offsets = None
+
+
+if __name__ == "__main__":
+    builder = CompactArrayBuilder(DataTypeEnum.INT, DataShapeEnum.MATRIX)
+    for row in [[1, 2, 3], [4, 5]]:
+        builder.extend(row)
+        builder.end_row()
+    matrix = builder.build()
+    print(matrix, len(matrix), matrix.size, matrix[1])
@@ -1,8 +1,10 @@
 from typing import Any
 
+from src.internal.data_dimension.compact_array import CompactArray
 from src.internal.data_dimension.data_dimension import DataDimension
 from src.internal.data_dimension.data_shape_enum import DataShapeEnum
 from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 
 
@@ -20,6 +22,8 @@ class DataDimensionChecker:
         :return: текст сообщения об ошибке проверки типа и размерности.
         :rtype: str or None
         """
+        if isinstance(value, CompactArray):
+            return cls.__check_compact_value(data_dimension, value)
         shape_errors = data_dimension.data_shape.get_shape_errors(value)
         if shape_errors is not None:
             return shape_errors
@@ -31,31 +35,154 @@ class DataDimensionChecker:
             return cls.__check_matrix_value(data_dimension, value)
         return None
 
+    @classmethod
+    def check_size(cls, data_dimension: DataDimension, value: Any) -> str | None:
+        """Проверяет, что размер значения не превышает ограничений элемента
+        данных: количества элементов списка (max_length), строк и элементов
+        строк матрицы (max_rows, max_cols) и длины строк (max_str_len).
+        Проверяются только длины значений, поэтому проверка выполняется до
+        проверки типов данных; несоответствие размерности сообщается методом
+        check_value.
+
+        :param data_dimension: описание элемента данных;
+        :param value: значение для проверки;
+        :type value: Any
+        :return: текст сообщения о превышении ограничения.
+        :rtype: str or None
+        """
+        max_length = getattr(data_dimension, "max_length", None)
+        max_rows = getattr(data_dimension, "max_rows", None)
+        max_cols = getattr(data_dimension, "max_cols", None)
+        max_str_len = getattr(data_dimension, "max_str_len", None)
+        if isinstance(value, CompactArray):
+            return cls.__check_compact_size(value, max_length, max_rows, max_cols)
+        if data_dimension.data_shape == DataShapeEnum.SCALAR or not isinstance(
+            value, list
+        ):
+            rows = [[value]]
+        elif data_dimension.data_shape == DataShapeEnum.LIST:
+            if max_length is not None and len(value) > max_length:
+                return ErrMsgTmpl.TOO_LONG_LIST.format(len(value), max_length)
+            rows = [value]
+        else:
+            if max_rows is not None and len(value) > max_rows:
+                return ErrMsgTmpl.TOO_MANY_ROWS.format(len(value), max_rows)
+            rows = [row for row in value if isinstance(row, list)]
+            if max_cols is not None:
+                for row_idx, row in enumerate(value):
+                    if isinstance(row, list) and len(row) > max_cols:
+                        return ErrMsgTmpl.TOO_MANY_COLS.format(
+                            row_idx, len(row), max_cols
+                        )
+        if max_str_len is not None:
+            for row in rows:
+                for item in row:
+                    if isinstance(item, str) and len(item) > max_str_len:
+                        return ErrMsgTmpl.TOO_LONG_STRING.format(len(item), max_str_len)
+        return None
+
+    @staticmethod
+    def __check_compact_size(
+        value: CompactArray,
+        max_length: int | None,
+        max_rows: int | None,
+        max_cols: int | None,
+    ) -> str | None:
+        """Проверяет ограничения размера для значения в CompactArray без
+        преобразования в списки."""
+        if value.data_shape == DataShapeEnum.LIST:
+            if max_length is not None and len(value) > max_length:
+                return ErrMsgTmpl.TOO_LONG_LIST.format(len(value), max_length)
+            return None
+        if max_rows is not None and len(value) > max_rows:
+            return ErrMsgTmpl.TOO_MANY_ROWS.format(len(value), max_rows)
+        if max_cols is not None:
+            for row_idx in range(len(value)):
+                row_size = value.get_row_size(row_idx)
+                if row_size > max_cols:
+                    return ErrMsgTmpl.TOO_MANY_COLS.format(row_idx, row_size, max_cols)
+        return None
+
+    @staticmethod
+    def __check_compact_value(
+        data_dimension: DataDimension, value: CompactArray
+    ) -> str | None:
+        """Проверяет размерность и тип данных значения в CompactArray. Тип
+        элементов задан типом массива, поэтому элементы не проверяются."""
+        if data_dimension.data_shape == DataShapeEnum.SCALAR:
+            return ErrMsg.NOT_SCALAR_VALUE
+        if data_dimension.data_shape != value.data_shape:
+            if data_dimension.data_shape == DataShapeEnum.LIST:
+                return ErrMsg.NOT_LIST_VALUE
+            return ErrMsg.NOT_MATRIX_VALUE
+        if data_dimension.data_shape == DataShapeEnum.MATRIX and len(value) == 0:
+            return ErrMsg.NOT_MATRIX_VALUE
+        if data_dimension.data_type == value.data_type or (
+            data_dimension.data_type == DataTypeEnum.FLOAT
+            and value.data_type == DataTypeEnum.INT
+        ):
+            return None
+        return ErrMsgTmpl.MISMATCH_VALUE_TYPE.format(data_dimension.data_type)
+
     @classmethod
     def __check_scalar_value(
         cls, data_dimension: DataDimension, value: Any
     ) -> str | None:
         """Проверяет тип данных для скалярного значения."""
-        err_msg = ErrMsgTmpl.MISMATCH_VALUE_TYPE.format(data_dimension.data_type)
-        if data_dimension.data_type.type == float:
-            if not isinstance(value, (int, float)) or isinstance(value, bool):
-                return err_msg
-        elif data_dimension.data_type.type == int:
-            if not isinstance(value, int) or isinstance(value, bool):
-                return err_msg
-        elif not isinstance(value, data_dimension.data_type.type):
-            return err_msg
+        if not cls.__is_valid_scalar(data_dimension.data_type.type, value):
+            return ErrMsgTmpl.MISMATCH_VALUE_TYPE.format(data_dimension.data_type)
+
+    @staticmethod
+    def __is_valid_scalar(value_type: type, value: Any) -> bool:
+        """Проверяет соответствие скалярного значения типу данных. Сообщение
+        об ошибке формируется вызывающим методом только при несоответствии,
+        так как проверка выполняется для каждого элемента списков и матриц."""
+        if value_type is float:
+            return isinstance(value, (int, float)) and not isinstance(value, bool)
+        if value_type is int:
+            return isinstance(value, int) and not isinstance(value, bool)
+        return isinstance(value, value_type)
+
+    @classmethod
+    def check_items(
+        cls,
+        data_dimension: DataDimension,
+        items: list,
+        offset: int = 0,
+        row_idx: int | None = None,
+    ) -> str | None:
+        """Проверяет тип данных элементов списка или строки матрицы. Индексы
+        элементов в сообщении об ошибке отсчитываются от offset, поэтому
+        длинный список можно проверять частями по мере получения.
+
+        :param data_dimension: описание элемента данных;
+        :param items: элементы списка или строки матрицы;
+        :type items: list
+        :param offset: индекс первого из проверяемых элементов;
+        :type offset: int
+        :param row_idx: индекс строки матрицы, None для списка;
+        :type row_idx: int or None
+        :return: текст сообщения об ошибке проверки типа.
+        :rtype: str or None
+        """
+        value_type = data_dimension.data_type.type
+        for idx, item in enumerate(items, offset):
+            if item is not None and not cls.__is_valid_scalar(value_type, item):
+                if row_idx is None:
+                    return ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(
+                        idx, data_dimension.data_type
+                    )
+                return ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(
+                    idx, row_idx, data_dimension.data_type
+                )
+        return None
 
     @classmethod
     def __check_list_value(
         cls, data_dimension: DataDimension, value: Any
     ) -> str | None:
         """Проверяет тип данных для элементов списка."""
-        for idx, item in enumerate(value):
-            if item is not None and cls.__check_scalar_value(data_dimension, item):
-                return ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(
-                    idx, data_dimension.data_type
-                )
+        return cls.check_items(data_dimension, value)
 
     @classmethod
     def __check_matrix_value(
@@ -63,11 +190,10 @@ class DataDimensionChecker:
     ) -> str | None:
         """Проверяет тип данных для элементов матрицы."""
         for row_idx, row in enumerate(value):
-            for item_idx, item in enumerate(row):
-                if item is not None and cls.__check_scalar_value(data_dimension, item):
-                    return ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(
-                        item_idx, row_idx, data_dimension.data_type
-                    )
+            error = cls.check_items(data_dimension, row, 0, row_idx)
+            if error is not None:
+                return error
+        return None
 
 
 if __name__ == "__main__":
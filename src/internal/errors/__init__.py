@@ -4,7 +4,9 @@ from .error_message_enum import ErrorMessageEnum
 from .error_message_template_enum import ErrorMessageTemplateEnum
 from .exceptions import (
     AlgorithmError,
+    AlgorithmInputTooLargeError,
     AlgorithmNotFoundError,
+    AlgorithmResourceLimitError,
     AlgorithmRuntimeError,
     AlgorithmTimeoutError,
     AlgorithmTypeError,
@@ -17,9 +19,11 @@ __all__ = [
     "ErrorMessageTemplateEnum",
     "AlgorithmError",
     "AlgorithmValueError",
+    "AlgorithmInputTooLargeError",
     "AlgorithmTypeError",
     "AlgorithmTimeoutError",
     "AlgorithmRuntimeError",
     "AlgorithmNotFoundError",
     "AlgorithmUnexpectedError",
+    "AlgorithmResourceLimitError",
 ]
@@ -31,3 +31,9 @@ class ErrorMessageEnum(StrEnum):
     NO_ALGORITHMS = "Алгоритмов не найдено"
     TIME_OVER = "Время для выполнения алгоритма истекло"
     UNEXPECTED_ERROR = "Что-то пошло не так..."
+    INVALID_EWMA_ALPHA = "Коэффициент сглаживания должен быть в интервале (0, 1]"
+    LANE_STOPPED = "Полоса выполнения алгоритмов остановлена"
+    MEMORY_LIMIT_EXCEEDED = "Превышен лимит памяти для выполнения алгоритма"
+    CPU_LIMIT_EXCEEDED = "Превышен лимит процессорного времени для выполнения алгоритма"
+    WORKER_CRASHED = "Процесс выполнения алгоритма аварийно завершился"
+    INVALID_CURSOR = "Некорректный курсор постраничного вывода"
@@ -6,6 +6,17 @@ class ErrorMessageTemplateEnum(StrEnum):
 
     NON_STRING_PARAM = "Параметр [{0}] не является строкой"
     EMPTY_STRING_PARAM = "Параметр [{0}] пуст"
+    NON_POSITIVE_PARAM = "Значение параметра [{0}] должно быть больше нуля"
+    NEGATIVE_PARAM = "Значение параметра [{0}] должно быть целым неотрицательным"
+    NEGATIVE_NUMBER_PARAM = (
+        "Значение параметра [{0}] должно быть неотрицательным числом"
+    )
+    INVALID_FRACTION_PARAM = (
+        "Значение параметра [{0}] должно быть в диапазоне от 0 до 1"
+    )
+    INVALID_FACTOR_PARAM = (
+        "Значение параметра [{0}] должно быть равно 0 или не меньше 1"
+    )
     NOT_LIST_ROW = "Строка [{0}] в матрице не является списком"
     MISMATCH_VALUE_TYPE = "Тип данных для значения не соответствует типу [{0}]"
     MISMATCH_LIST_VALUE_TYPE = (
@@ -15,6 +26,22 @@ class ErrorMessageTemplateEnum(StrEnum):
         "Тип данных элемента с индексом [{0}] в строке матрицы с индексом [{1}] "
         "не соответствует типу [{2}]"
     )
+    TOO_LONG_LIST = "Количество элементов списка ({0}) превышает допустимое ({1})"
+    TOO_MANY_ROWS = "Количество строк матрицы ({0}) превышает допустимое ({1})"
+    TOO_MANY_COLS = (
+        "Количество элементов в строке матрицы с индексом [{0}] ({1}) превышает "
+        "допустимое ({2})"
+    )
+    TOO_LONG_STRING = "Длина строки ({0}) превышает допустимую ({1})"
+    TOO_LONG_STRING_PART = "Длина строки (не менее {0}) превышает допустимую ({1})"
+    INAPPLICABLE_SIZE_LIMIT = (
+        "Ограничение [{0}] не применимо к данным с типом [{1}] и размерностью [{2}]"
+    )
+    INAPPLICABLE_COMPACT = (
+        "Признак [compact] не применим к данным с типом [{0}] и размерностью [{1}]"
+    )
+    REQUEST_TOO_LARGE = "Размер тела запроса превышает допустимый ({0} байт)"
+    INPUT_TOO_LARGE = "Значение элемента входных данных [{0}] слишком велико: {1}"
     PARAM_EXISTS = "Элемент входных данных с именем [{0}] уже существует"
     OUTPUT_EXISTS = "Элемент выходных данных с именем [{0}] уже существует"
     ADDING_METHOD_FAILED = "В процессе добавления метода произошла ошибка: [{0}]"
@@ -24,6 +51,14 @@ class ErrorMessageTemplateEnum(StrEnum):
         "значению [{2}]"
     )
     TIME_OVER = "Время для выполнения алгоритма ({0} с) истекло"
+    TESTS_TIMEOUT = "Время для выполнения тестов алгоритма ({0} с) истекло"
+    NOT_ALGORITHM_PACKAGE = "Модуль [{0}] не является пакетом алгоритма"
+    TENANT_NOT_EXISTS = "Арендатор [{0}] не найден"
+    DUPLICATE_ALGORITHM = "Алгоритм с именем [{0}] уже существует"
+    STALE_SNAPSHOT = (
+        "Снимок каталога алгоритмов [{0}] устарел или поврежден, алгоритмы "
+        "собираются из каталога"
+    )
     EXECUTION_FAILED = "Во время выполнения алгоритма произошла ошибка: {0}"
     REDUNDANT_PARAMETER = (
         "Переданный элемент [{0}] отсутствует в структуре входных данных алгоритма"
@@ -34,3 +69,17 @@ class ErrorMessageTemplateEnum(StrEnum):
     )
     MISSED_OUTPUT = "Алгоритм не вернул значение для элемента выходных данных [{0}]"
     ALGORITHM_NOT_EXISTS = "Алгоритм с именем [{0}] не существует"
+    UNSUPPORTED_MEDIA_TYPE = "Формат данных [{0}] не поддерживается"
+    NOT_ACCEPTABLE_MEDIA_TYPE = (
+        "Ни один из запрошенных форматов [{0}] не поддерживается"
+    )
+    UNREPRESENTABLE_RESULT = "Результат не может быть представлен в формате [{0}]"
+    INVALID_COMPRESSION_LEVEL = (
+        "Уровень сжатия {0} должен быть целым числом в диапазоне от {1} до {2}"
+    )
+    INVALID_SESSION_MESSAGE = "Некорректное сообщение с входными данными: {0}"
+    RESULT_CACHE_SETTING_REQUIRED = (
+        "Для кэша результатов [{0}] не задано значение параметра [{1}]"
+    )
+    INVALID_RESULT_CACHE_URL = "Некорректный адрес сервера кэша результатов: {0}"
+    RESULT_CACHE_SERVER_ERROR = "Ошибка сервера кэша результатов: {0}"
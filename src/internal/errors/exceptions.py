@@ -2,6 +2,15 @@ from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 
 
+def restore_error(error_class: type, message: str) -> "AlgorithmError":
+    """Восстанавливает ошибку выполнения алгоритма с указанным сообщением, не
+    вызывая конструктор класса ошибки. Используется при передаче ошибок между
+    процессами."""
+    error = error_class.__new__(error_class)
+    AlgorithmError.__init__(error, message)
+    return error
+
+
 class AlgorithmError(Exception):
     """Базовый класс ошибок выполнения алгоритмов."""
 
@@ -11,6 +20,11 @@ class AlgorithmError(Exception):
         super().__init__(message)
         self.message = message
 
+    def __reduce__(self):
+        """Сериализует ошибку с итоговым сообщением, так как конструкторы
+        наследников принимают различные параметры."""
+        return restore_error, (type(self), self.message)
+
 
 class AlgorithmValueError(AlgorithmError):
     """Ошибка некорректного значения параметра при выполнении алгоритма."""
@@ -20,6 +34,14 @@ class AlgorithmValueError(AlgorithmError):
         self.message = message
 
 
+class AlgorithmInputTooLargeError(AlgorithmValueError):
+    """Ошибка превышения допустимого размера входных данных алгоритма."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
 class AlgorithmTypeError(AlgorithmError):
     """Ошибка некорректного типа данных параметра при выполнении алгоритма."""
 
@@ -54,3 +76,12 @@ class AlgorithmNotFoundError(AlgorithmError):
 
     def __init__(self, algorithm_name: str):
         super().__init__(ErrMsgTmpl.ALGORITHM_NOT_EXISTS.format(algorithm_name))
+
+
+class AlgorithmResourceLimitError(AlgorithmError):
+    """Ошибка превышения лимита ресурсов (памяти, процессорного времени) при
+    выполнении алгоритма."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
@@ -0,0 +1,3 @@
+"""Пакет реализует выполнение алгоритмов вне цикла событий приложения:
+планировщик с полосами выполнения, оценку времени выполнения алгоритмов и
+контроль времени выполнения в рабочих потоках."""
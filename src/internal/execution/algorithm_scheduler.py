@@ -0,0 +1,250 @@
+import asyncio
+import time
+from typing import Any
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.constants import (
+    DEFAULT_EWMA_ALPHA,
+    DEFAULT_FAST_LANE_THRESHOLD,
+    DEFAULT_FAST_LANE_WORKERS,
+    DEFAULT_SLOW_LANE_WORKERS,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import AlgorithmNotFoundError
+from src.internal.execution.execution_backend import ExecutionBackend
+from src.internal.execution.execution_lane import ExecutionLane
+from src.internal.execution.priority_enum import PriorityEnum
+from src.internal.execution.progress_reporter import ProgressListener
+from src.internal.execution.runtime_estimator import RuntimeEstimator
+from src.internal.execution.runtime_profile import RuntimeProfile
+from src.internal.execution.watchdog import ExecutionCancelled
+from src.internal.execution_log import get_input_size
+from src.internal.memoize import memoize_stats
+from src.internal.metrics import MetricsRegistry
+from src.internal.result_cache.result_cache import ResultCache
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+
+class AlgorithmScheduler:
+    """Класс планирует выполнение алгоритмов из набора AlgorithmCollection вне
+    цикла событий приложения. Вызовы алгоритмов, оценка времени выполнения
+    которых не превышает порога, направляются в быструю полосу, остальные - в
+    медленную, поэтому быстрые вызовы не ждут завершения долгих алгоритмов.
+    Алгоритмы, которые еще не выполнялись, направляются в медленную полосу.
+    Если ожидание результата отменено (например, клиент разорвал соединение),
+    выполнение алгоритма прерывается и рабочий поток освобождается.
+
+    Время успешных выполнений учитывается в профиле RuntimeProfile по
+    диапазонам размера входных данных; профиль может сокращать таймаут
+    выполнения алгоритмов по истории выполнений.
+
+    Если задан кэш результатов ResultCache, результат выполнения алгоритма с
+    теми же входными данными возвращается из кэша без выполнения алгоритма.
+    """
+
+    def __init__(
+        self,
+        algorithms: AlgorithmCollection,
+        fast_lane_workers: int = DEFAULT_FAST_LANE_WORKERS,
+        slow_lane_workers: int = DEFAULT_SLOW_LANE_WORKERS,
+        fast_lane_threshold: float = DEFAULT_FAST_LANE_THRESHOLD,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+        metrics: MetricsRegistry | None = None,
+        backend: ExecutionBackend | None = None,
+        runtime_profile: RuntimeProfile | None = None,
+        result_cache: ResultCache | None = None,
+    ):
+        """Конструктор класса
+
+        :param algorithms: набор алгоритмов;
+        :type algorithms: AlgorithmCollection
+        :param fast_lane_workers: количество рабочих потоков быстрой полосы;
+        :type fast_lane_workers: int
+        :param slow_lane_workers: количество рабочих потоков медленной полосы;
+        :type slow_lane_workers: int
+        :param fast_lane_threshold: оценка времени выполнения (с), до которой
+            вызов направляется в быструю полосу;
+        :type fast_lane_threshold: float
+        :param ewma_alpha: коэффициент сглаживания оценки времени выполнения;
+        :type ewma_alpha: float
+        :param metrics: реестр метрик, по умолчанию создается новый;
+        :type metrics: MetricsRegistry or None
+        :param backend: способ выполнения алгоритмов, по умолчанию выполнение
+            в рабочих потоках планировщика;
+        :type backend: ExecutionBackend or None
+        :param runtime_profile: профиль времени выполнения алгоритмов, по
+            умолчанию создается новый без сокращения таймаутов;
+        :type runtime_profile: RuntimeProfile or None
+        :param result_cache: кэш результатов выполнения алгоритмов, None - без
+            кэширования;
+        :type result_cache: ResultCache or None
+        :raises ValueError: при некорректных значениях параметров.
+        """
+        if isinstance(fast_lane_threshold, bool) or not isinstance(
+            fast_lane_threshold, (int, float)
+        ):
+            raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("fast_lane_threshold"))
+        if fast_lane_threshold <= 0:
+            raise ValueError(
+                ErrMsgTmpl.NON_POSITIVE_PARAM.format("fast_lane_threshold")
+            )
+        self.__algorithms: AlgorithmCollection = algorithms
+        self.__fast_lane_threshold: float = fast_lane_threshold
+        self.__estimator = RuntimeEstimator(ewma_alpha)
+        self.__profile: RuntimeProfile = runtime_profile or RuntimeProfile()
+        self.__metrics: MetricsRegistry = metrics or MetricsRegistry()
+        self.__backend: ExecutionBackend = backend or ExecutionBackend(algorithms)
+        self.__fast_lane = ExecutionLane("fast", fast_lane_workers)
+        self.__slow_lane = ExecutionLane("slow", slow_lane_workers)
+        self.__result_cache: ResultCache | None = result_cache
+
+    @property
+    def fast_lane(self) -> ExecutionLane:
+        """Возвращает быструю полосу выполнения."""
+        return self.__fast_lane
+
+    @property
+    def slow_lane(self) -> ExecutionLane:
+        """Возвращает медленную полосу выполнения."""
+        return self.__slow_lane
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Возвращает реестр метрик планировщика."""
+        return self.__metrics
+
+    @property
+    def estimator(self) -> RuntimeEstimator:
+        """Возвращает оценку времени выполнения алгоритмов."""
+        return self.__estimator
+
+    @property
+    def profile(self) -> RuntimeProfile:
+        """Возвращает профиль времени выполнения алгоритмов."""
+        return self.__profile
+
+    def select_lane(
+        self, algorithm_name: str, priority: PriorityEnum = PriorityEnum.NORMAL
+    ) -> ExecutionLane:
+        """Выбирает полосу для выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param priority: приоритет выполнения;
+        :type priority: PriorityEnum
+        :return: полоса выполнения.
+        :rtype: ExecutionLane
+        """
+        if priority == PriorityEnum.LOW:
+            return self.__slow_lane
+        estimate = self.__estimator.get_estimate(algorithm_name)
+        if estimate is None or estimate > self.__fast_lane_threshold:
+            return self.__slow_lane
+        return self.__fast_lane
+
+    async def execute(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        priority: PriorityEnum = PriorityEnum.NORMAL,
+        progress: ProgressListener | None = None,
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм с указанным именем в одной из полос.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param values: словарь значений входных данных по их именам, уже
+            проверенных схемой DataElementsSchema;
+        :type values: dict[str, Any]
+        :param priority: приоритет выполнения;
+        :type priority: PriorityEnum
+        :param progress: получатель сведений о ходе выполнения алгоритма,
+            вызывается из рабочего потока полосы;
+        :type progress: ProgressListener or None
+        :return: результат выполнения алгоритма.
+        :rtype: list[DataElementSchema]
+        :raises AlgorithmNotFoundError: если алгоритм с указанным именем
+            отсутствует.
+        """
+        if not self.__algorithms.has_algorithm(algorithm_name):
+            raise AlgorithmNotFoundError(algorithm_name)
+        lane = self.select_lane(algorithm_name, priority)
+        future = lane.submit(
+            priority.rank, self.__run, algorithm_name, values, progress
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if lane.cancel(future):
+                self.__metrics.increment("scheduler.cancelled")
+                self.__metrics.increment(f"scheduler.{lane.name}_lane.cancelled")
+            raise
+
+    def shutdown(self) -> None:
+        """Останавливает полосы выполнения и освобождает ресурсы для
+        выполнения алгоритмов."""
+        self.__fast_lane.shutdown()
+        self.__slow_lane.shutdown()
+        self.__backend.shutdown()
+
+    def __run(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        progress: ProgressListener | None = None,
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм и учитывает время его выполнения. Время
+        прерванного выполнения не учитывается, в профиль времени выполнения
+        попадают только успешные выполнения. Результат, найденный в кэше
+        результатов, возвращается без выполнения и без учета времени.
+        Результаты алгоритмов, отмеченных как недетерминированные, не
+        кэшируются."""
+        cache_key = None
+        if self.__result_cache is not None:
+            definition = self.__algorithms.get_algorithm_definition(algorithm_name)
+            if definition.deterministic is not False:
+                cache_key = self.__result_cache.get_key(
+                    algorithm_name,
+                    self.__algorithms.get_algorithm_digest(algorithm_name),
+                    values,
+                )
+        if cache_key is not None:
+            result = self.__result_cache.get(cache_key)
+            if result is not None:
+                self.__metrics.increment("result_cache.hits")
+                return result
+            self.__metrics.increment("result_cache.misses")
+        input_size = get_input_size(values)
+        algorithm_timeout = self.__algorithms.get_algorithm_timeout(algorithm_name)
+        timeout = self.__profile.get_timeout(
+            algorithm_name, input_size, algorithm_timeout
+        )
+        if timeout < algorithm_timeout:
+            self.__metrics.increment("scheduler.adaptive_timeout")
+        else:
+            timeout = None
+        start = time.perf_counter()
+        cancelled = False
+        try:
+            result = self.__backend.execute(algorithm_name, values, progress, timeout)
+        except ExecutionCancelled:
+            cancelled = True
+            raise
+        finally:
+            runtime = time.perf_counter() - start
+            if not cancelled:
+                self.__estimator.update(algorithm_name, runtime)
+            self.__record_memoize_stats()
+        self.__profile.record(algorithm_name, input_size, runtime)
+        if cache_key is not None:
+            self.__result_cache.put(cache_key, result)
+        return result
+
+    def __record_memoize_stats(self) -> None:
+        """Переносит в метрики статистику мемоизированных функций, накопленную
+        в процессе приложения и полученную от рабочих процессов."""
+        for name, (hits, misses) in memoize_stats.collect().items():
+            self.__metrics.increment("memoize.hits", hits)
+            self.__metrics.increment("memoize.misses", misses)
+            self.__metrics.increment(f"memoize.{name}.hits", hits)
+            self.__metrics.increment(f"memoize.{name}.misses", misses)
@@ -0,0 +1,49 @@
+from typing import Any
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.execution.progress_reporter import ProgressListener
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+
+class ExecutionBackend:
+    """Класс выполняет алгоритмы из набора AlgorithmCollection в рабочем потоке
+    планировщика. Наследники могут переносить выполнение в другие процессы."""
+
+    def __init__(self, algorithms: AlgorithmCollection):
+        """Конструктор класса
+
+        :param algorithms: набор алгоритмов;
+        :type algorithms: AlgorithmCollection
+        """
+        self._algorithms: AlgorithmCollection = algorithms
+
+    def execute(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        progress: ProgressListener | None = None,
+        timeout: int | None = None,
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм с указанным именем. Вызывается из рабочего потока
+        планировщика. Значения входных данных должны быть уже проверены схемой
+        DataElementsSchema.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :param progress: получатель сведений о ходе выполнения алгоритма,
+            вызывается из рабочего потока;
+        :type progress: ProgressListener or None
+        :param timeout: время (с), отведенное на выполнение, вместо таймаута
+            алгоритма;
+        :type timeout: int or None
+        :return: результат выполнения алгоритма.
+        :rtype: list[DataElementSchema]
+        """
+        return self._algorithms.get_trusted_algorithm_result(
+            algorithm_name, values, progress, timeout
+        )
+
+    def shutdown(self) -> None:
+        """Освобождает ресурсы, занятые для выполнения алгоритмов."""
@@ -0,0 +1,14 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class ExecutionBackendEnum(LowercaseStrEnum):
+    """Перечисление способов выполнения алгоритмов. Значение THREAD
+    соответствует выполнению в рабочих потоках приложения, PROCESS - выполнению
+    в отдельных рабочих процессах с ограничением ресурсов.
+
+    """
+
+    THREAD = auto()
+    PROCESS = auto()
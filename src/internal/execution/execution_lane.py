@@ -0,0 +1,144 @@
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.watchdog import (
+    ExecutionCancelled,
+    ExecutionInterrupt,
+    interrupt_thread,
+)
+
+
+class ExecutionLane:
+    """Класс представляет полосу выполнения: очередь вызовов с приоритетами и
+    набор рабочих потоков, которые выполняют вызовы в порядке приоритета, а при
+    равном приоритете - в порядке поступления."""
+
+    def __init__(self, name: str, workers: int):
+        """Конструктор класса
+
+        :param name: название полосы, используется в именах рабочих потоков;
+        :type name: str
+        :param workers: количество рабочих потоков;
+        :type workers: int
+        :raises ValueError: при неположительном количестве рабочих потоков.
+        """
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("workers"))
+        if workers <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("workers"))
+        self.__name: str = name
+        self.__workers: int = workers
+        self.__queue: queue.PriorityQueue = queue.PriorityQueue()
+        self.__counter = itertools.count()
+        self.__threads: list[threading.Thread] = []
+        self.__running: dict[Future, int] = {}
+        self.__lock = threading.Lock()
+        self.__stopped: bool = False
+
+    @property
+    def name(self) -> str:
+        """Возвращает название полосы."""
+        return self.__name
+
+    @property
+    def workers(self) -> int:
+        """Возвращает количество рабочих потоков полосы."""
+        return self.__workers
+
+    @property
+    def queue_size(self) -> int:
+        """Возвращает количество вызовов, ожидающих выполнения."""
+        return self.__queue.qsize()
+
+    def submit(self, rank: int, method: Callable, *args: Any) -> Future:
+        """Ставит вызов в очередь полосы.
+
+        :param rank: порядковый номер приоритета вызова;
+        :type rank: int
+        :param method: вызываемый метод;
+        :type method: Callable
+        :param args: аргументы для вызова метода;
+        :return: объект Future с результатом вызова.
+        :rtype: Future
+        :raises RuntimeError: если полоса остановлена.
+        """
+        future = Future()
+        with self.__lock:
+            if self.__stopped:
+                raise RuntimeError(ErrMsg.LANE_STOPPED)
+            self.__start_workers()
+            self.__queue.put((rank, next(self.__counter), (future, method, args)))
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """Отменяет вызов. Вызов, ожидающий в очереди, не будет выполнен;
+        выполняющийся вызов прерывается исключением ExecutionCancelled в рабочем
+        потоке, после чего поток переходит к следующему вызову.
+
+        :param future: объект Future, полученный от метода submit;
+        :type future: Future
+        :return: True, если вызов был отменен.
+        :rtype: bool
+        """
+        if future.cancel():
+            return True
+        with self.__lock:
+            thread_id = self.__running.get(future)
+            if thread_id is None:
+                return False
+            return interrupt_thread(thread_id, ExecutionCancelled)
+
+    def shutdown(self) -> None:
+        """Останавливает рабочие потоки после выполнения вызовов из очереди."""
+        with self.__lock:
+            if self.__stopped:
+                return
+            self.__stopped = True
+            for _ in self.__threads:
+                self.__queue.put((float("inf"), next(self.__counter), None))
+
+    def __start_workers(self) -> None:
+        """Запускает рабочие потоки при первом вызове."""
+        if self.__threads:
+            return
+        for idx in range(self.__workers):
+            thread = threading.Thread(
+                target=self.__work, name=f"{self.__name}-lane-{idx}", daemon=True
+            )
+            thread.start()
+            self.__threads.append(thread)
+
+    def __work(self) -> None:
+        """Выполняет вызовы из очереди до остановки полосы."""
+        while True:
+            _, _, item = self.__queue.get()
+            if item is None:
+                return
+            future, method, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self.__execute(future, method, args)
+            except ExecutionInterrupt:
+                # прерывание отмененного вызова сработало после его завершения
+                pass
+
+    def __execute(self, future: Future, method: Callable, args: tuple) -> None:
+        """Выполняет вызов в текущем потоке и передает результат в Future."""
+        with self.__lock:
+            self.__running[future] = threading.get_ident()
+        try:
+            try:
+                result = method(*args)
+            finally:
+                with self.__lock:
+                    self.__running.pop(future, None)
+        except BaseException as ex:
+            future.set_exception(ex)
+        else:
+            future.set_result(result)
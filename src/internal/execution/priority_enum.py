@@ -0,0 +1,25 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class PriorityEnum(LowercaseStrEnum):
+    """Перечисление приоритетов выполнения алгоритма. Значения HIGH, NORMAL, LOW
+    соответствуют высокому, обычному и низкому приоритету. Вызовы с низким
+    приоритетом всегда направляются в медленную полосу планировщика.
+
+    """
+
+    HIGH = auto()
+    NORMAL = auto()
+    LOW = auto()
+
+    @property
+    def rank(self) -> int:
+        """Возвращает порядковый номер приоритета в очереди: чем меньше номер,
+        тем раньше выполняется вызов.
+
+        :return: порядковый номер приоритета.
+        :rtype: int
+        """
+        return list(PriorityEnum).index(self)
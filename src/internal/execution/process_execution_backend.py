@@ -0,0 +1,106 @@
+import threading
+from typing import Any
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.execution_backend import ExecutionBackend
+from src.internal.execution.process_worker import ProcessWorker, WorkerFactory
+from src.internal.execution.progress_reporter import ProgressListener
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+
+class ProcessExecutionBackend(ExecutionBackend):
+    """Класс выполняет алгоритмы в изолированных рабочих процессах с
+    ограничениями памяти (RLIMIT_AS) и процессорного времени (RLIMIT_CPU).
+    Каждый рабочий поток планировщика использует собственный рабочий процесс.
+    Рабочие процессы создаются из шаблонного процесса (WorkerFactory), который
+    запускается в конструкторе, поэтому объект нужно создавать до запуска
+    потоков приложения - в create_tenant.
+    Ограничения, указанные в описании алгоритма (limits), имеют приоритет над
+    ограничениями по умолчанию."""
+
+    def __init__(
+        self,
+        algorithms: AlgorithmCollection,
+        memory_limit: int = 0,
+        cpu_limit: int = 0,
+        max_executions: int = 0,
+    ):
+        """Конструктор класса
+
+        :param algorithms: набор алгоритмов;
+        :type algorithms: AlgorithmCollection
+        :param memory_limit: лимит памяти по умолчанию в МБ, 0 - без ограничения;
+        :type memory_limit: int
+        :param cpu_limit: лимит процессорного времени по умолчанию в секундах,
+            0 - без ограничения;
+        :type cpu_limit: int
+        :param max_executions: количество выполнений, после которого рабочий
+            процесс пересоздается, 0 - без пересоздания;
+        :type max_executions: int
+        :raises ValueError: при отрицательных значениях параметров.
+        """
+        super().__init__(algorithms)
+        for name, value in [
+            ("memory_limit", memory_limit),
+            ("cpu_limit", cpu_limit),
+            ("max_executions", max_executions),
+        ]:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(ErrMsgTmpl.NEGATIVE_PARAM.format(name))
+            if value < 0:
+                raise ValueError(ErrMsgTmpl.NEGATIVE_PARAM.format(name))
+        self.__memory_limit: int = memory_limit
+        self.__cpu_limit: int = cpu_limit
+        self.__max_executions: int = max_executions
+        self.__factory: WorkerFactory = WorkerFactory(algorithms)
+        self.__local = threading.local()
+        self.__workers: list[ProcessWorker] = []
+        self.__lock = threading.Lock()
+
+    def execute(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        progress: ProgressListener | None = None,
+        timeout: int | None = None,
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм в рабочем процессе текущего потока.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :param progress: получатель сведений о ходе выполнения алгоритма;
+        :type progress: ProgressListener or None
+        :param timeout: время (с), отведенное на выполнение, вместо таймаута
+            алгоритма;
+        :type timeout: int or None
+        :return: результат выполнения алгоритма.
+        :rtype: list[DataElementSchema]
+        """
+        memory_limit, cpu_limit = self.__memory_limit, self.__cpu_limit
+        limits = self._algorithms.get_algorithm_definition(algorithm_name).limits
+        if limits is not None:
+            memory_limit = limits.memory_limit or memory_limit
+            cpu_limit = limits.cpu_limit or cpu_limit
+        return self.__get_worker().execute(
+            algorithm_name, values, memory_limit, cpu_limit, progress, timeout
+        )
+
+    def shutdown(self) -> None:
+        """Завершает все рабочие процессы и шаблонный процесс."""
+        with self.__lock:
+            for worker in self.__workers:
+                worker.close()
+            self.__factory.close()
+
+    def __get_worker(self) -> ProcessWorker:
+        """Возвращает рабочий процесс текущего потока."""
+        worker = getattr(self.__local, "worker", None)
+        if worker is None:
+            worker = ProcessWorker(self.__factory, self.__max_executions)
+            self.__local.worker = worker
+            with self.__lock:
+                self.__workers.append(worker)
+        return worker
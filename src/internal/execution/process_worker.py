@@ -0,0 +1,419 @@
+import logging
+import math
+import multiprocessing
+import os
+import resource
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import recv_handle, send_handle
+from typing import Any, Callable
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.constants import WORKER_POLL_INTERVAL
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors.exceptions import (
+    AlgorithmResourceLimitError,
+    AlgorithmUnexpectedError,
+)
+from src.internal.execution.progress_reporter import ProgressListener
+from src.internal.execution.watchdog import ExecutionInterrupt
+from src.internal.memoize import memoize_stats
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+logger = logging.getLogger(__name__)
+
+MEGABYTE = 1024 * 1024
+
+
+def get_address_space_size() -> int:
+    """Возвращает размер адресного пространства текущего процесса в байтах.
+
+    :return: размер адресного пространства или 0, если он недоступен.
+    :rtype: int
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def set_execution_limits(memory_limit: int, cpu_limit: int) -> Callable[[], None]:
+    """Устанавливает мягкие ограничения RLIMIT_AS и RLIMIT_CPU на время одного
+    выполнения алгоритма. Лимит памяти отсчитывается от текущего размера
+    адресного пространства процесса, лимит процессорного времени - от уже
+    израсходованного процессом времени.
+
+    :param memory_limit: лимит памяти в МБ, 0 - без ограничения;
+    :type memory_limit: int
+    :param cpu_limit: лимит процессорного времени в секундах, 0 - без ограничения;
+    :type cpu_limit: int
+    :return: функция, восстанавливающая прежние ограничения.
+    :rtype: Callable[[], None]
+    """
+    previous = {}
+    if memory_limit > 0:
+        previous[resource.RLIMIT_AS] = resource.getrlimit(resource.RLIMIT_AS)
+        soft = get_address_space_size() + memory_limit * MEGABYTE
+        hard = previous[resource.RLIMIT_AS][1]
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+    if cpu_limit > 0:
+        previous[resource.RLIMIT_CPU] = resource.getrlimit(resource.RLIMIT_CPU)
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime) + cpu_limit
+        hard = previous[resource.RLIMIT_CPU][1]
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+    def restore() -> None:
+        for limit, value in previous.items():
+            resource.setrlimit(limit, value)
+
+    return restore
+
+
+def cpu_limit_handler(signum, frame):
+    """Обработчик сигнала SIGXCPU о превышении лимита процессорного времени."""
+    raise AlgorithmResourceLimitError(ErrMsg.CPU_LIMIT_EXCEEDED)
+
+
+def serve(connection: Connection, algorithms: AlgorithmCollection) -> None:
+    """Цикл рабочего процесса: получает задания на выполнение алгоритмов,
+    выполняет их с установленными ограничениями и возвращает результаты.
+    Сведения о ходе выполнения передаются сообщениями (None, (fraction,
+    message), None) до результата; результат передается сообщением (success,
+    result, stats) со статистикой мемоизированных функций за выполнение.
+    Накопленные записи журнала выполнения записываются в файл, когда нет
+    ожидающих заданий. Завершается при закрытии соединения с родительским
+    процессом."""
+
+    def send_progress(fraction: float, message: str | None) -> None:
+        connection.send((None, (fraction, message), None))
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGXCPU, cpu_limit_handler)
+    while True:
+        try:
+            if algorithms.execution_log is not None and not connection.poll():
+                algorithms.execution_log.flush()
+            task = connection.recv()
+        except (EOFError, OSError):
+            return
+        algorithm_name, values, memory_limit, cpu_limit, report_progress, timeout = task
+        restore_limits = set_execution_limits(memory_limit, cpu_limit)
+        try:
+            result = algorithms.get_trusted_algorithm_result(
+                algorithm_name,
+                values,
+                send_progress if report_progress else None,
+                timeout,
+            )
+            success, payload = True, result
+        except MemoryError:
+            success = False
+            payload = AlgorithmResourceLimitError(ErrMsg.MEMORY_LIMIT_EXCEEDED)
+        except Exception as ex:
+            success, payload = False, ex
+        finally:
+            restore_limits()
+        stats = memoize_stats.collect()
+        try:
+            connection.send((success, payload, stats))
+        except Exception as ex:
+            logger.error(str(ex))
+            connection.send((False, AlgorithmUnexpectedError(), stats))
+
+
+def wait_worker(pid: int, timeout: float | None) -> int | None:
+    """Ожидает завершения дочернего процесса и освобождает его запись в
+    таблице процессов.
+
+    :param pid: идентификатор процесса;
+    :type pid: int
+    :param timeout: время ожидания (с), None - без ограничения;
+    :type timeout: float or None
+    :return: код завершения (для завершения сигналом - номер сигнала со знаком
+        минус) или None, если процесс не завершился за время ожидания.
+    :rtype: int or None
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while True:
+            options = 0 if deadline is None else os.WNOHANG
+            done, status = os.waitpid(pid, options)
+            if done:
+                return os.waitstatus_to_exitcode(status)
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(WORKER_POLL_INTERVAL / 10)
+    except ChildProcessError:
+        return None
+
+
+def serve_zygote(control: Connection, algorithms: AlgorithmCollection) -> None:
+    """Цикл шаблонного процесса: по запросам родительского процесса создает
+    рабочие процессы копированием (fork) самого себя, ожидает их завершения и
+    перезагружает набор алгоритмов. Шаблонный процесс однопоточный, поэтому
+    рабочие процессы не наследуют блокировки, захваченные другими потоками.
+    Соединение с рабочим процессом передается родительскому процессу как
+    дескриптор файла. Завершается при закрытии соединения с родительским
+    процессом."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    while True:
+        try:
+            command, *args = control.recv()
+        except (EOFError, OSError):
+            return
+        if command == "start":
+            parent_connection, child_connection = multiprocessing.Pipe()
+            pid = os.fork()
+            if pid == 0:
+                exitcode = 0
+                try:
+                    control.close()
+                    parent_connection.close()
+                    serve(child_connection, algorithms)
+                except BaseException:
+                    exitcode = 1
+                finally:
+                    os._exit(exitcode)
+            child_connection.close()
+            control.send(pid)
+            send_handle(control, parent_connection.fileno(), os.getppid())
+            parent_connection.close()
+        elif command == "wait":
+            control.send(wait_worker(*args))
+        elif command == "reload":
+            try:
+                control.send((True, algorithms.reload()))
+            except Exception as ex:
+                control.send((False, ex))
+
+
+class WorkerFactory:
+    """Класс создает рабочие процессы для выполнения алгоритмов. При создании
+    объекта запускается шаблонный процесс - копия (fork) текущего процесса с
+    собранным набором алгоритмов, - а рабочие процессы создаются копированием
+    шаблонного процесса. Объект нужно создавать до запуска потоков
+    приложения (полос выполнения, журналов, клиентов кэша): тогда ни
+    шаблонный, ни рабочие процессы не копируются из многопоточного процесса
+    и не наследуют блокировки, захваченные другими потоками. При изменении
+    версии набора алгоритмов шаблонный процесс перезагружает набор сам, без
+    повторного копирования родительского процесса."""
+
+    def __init__(self, algorithms: AlgorithmCollection):
+        """Конструктор класса
+
+        :param algorithms: набор алгоритмов;
+        :type algorithms: AlgorithmCollection
+        """
+        self.__algorithms: AlgorithmCollection = algorithms
+        self.__version: int = algorithms.version
+        self.__lock = threading.Lock()
+        context = multiprocessing.get_context("fork")
+        parent_connection, child_connection = context.Pipe()
+        self.__process: multiprocessing.Process | None = context.Process(
+            target=serve_zygote,
+            args=(child_connection, algorithms),
+            name=f"algorithm-zygote-{os.getpid()}",
+            daemon=True,
+        )
+        self.__process.start()
+        child_connection.close()
+        self.__connection: Connection | None = parent_connection
+
+    @property
+    def algorithms(self) -> AlgorithmCollection:
+        """Возвращает набор алгоритмов."""
+        return self.__algorithms
+
+    def start_worker(self) -> tuple[int, int, Connection]:
+        """Создает рабочий процесс с текущей версией набора алгоритмов.
+
+        :return: идентификатор рабочего процесса, версия набора алгоритмов и
+            соединение с рабочим процессом.
+        :rtype: tuple[int, int, Connection]
+        :raises AlgorithmResourceLimitError: если шаблонный процесс не
+            отвечает.
+        """
+        with self.__lock:
+            try:
+                version = self.__algorithms.version
+                if version != self.__version:
+                    self.__connection.send(("reload",))
+                    success, payload = self.__connection.recv()
+                    if not success:
+                        raise payload
+                    self.__version = version
+                self.__connection.send(("start",))
+                pid = self.__connection.recv()
+                fd = recv_handle(self.__connection)
+            except (EOFError, OSError, AttributeError):
+                logger.error(ErrMsg.WORKER_CRASHED)
+                raise AlgorithmResourceLimitError(ErrMsg.WORKER_CRASHED)
+        return pid, version, Connection(fd)
+
+    def wait_worker(self, pid: int, timeout: float | None = None) -> int | None:
+        """Ожидает завершения рабочего процесса.
+
+        :param pid: идентификатор рабочего процесса;
+        :type pid: int
+        :param timeout: время ожидания (с), None - без ограничения;
+        :type timeout: float or None
+        :return: код завершения или None, если процесс не завершился за время
+            ожидания.
+        :rtype: int or None
+        """
+        with self.__lock:
+            try:
+                self.__connection.send(("wait", pid, timeout))
+                return self.__connection.recv()
+            except (EOFError, OSError, AttributeError):
+                return None
+
+    def close(self) -> None:
+        """Завершает шаблонный процесс. Запущенные рабочие процессы
+        завершаются при закрытии соединений с ними."""
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+            if self.__process is not None:
+                self.__process.join(WORKER_POLL_INTERVAL * 10)
+                if self.__process.is_alive():
+                    self.__process.kill()
+                    self.__process.join()
+                self.__process.close()
+                self.__process = None
+
+
+class ProcessWorker:
+    """Класс управляет рабочим процессом, в котором выполняются алгоритмы.
+    Процесс создается фабрикой WorkerFactory копированием однопоточного
+    шаблонного процесса и наследует собранный набор алгоритмов. Процесс
+    пересоздается после заданного числа выполнений, после превышения лимитов
+    ресурсов, при отмене выполнения и при изменении версии набора
+    алгоритмов."""
+
+    def __init__(self, factory: WorkerFactory, max_executions: int = 0):
+        """Конструктор класса
+
+        :param factory: фабрика рабочих процессов;
+        :type factory: WorkerFactory
+        :param max_executions: количество выполнений, после которого процесс
+            пересоздается, 0 - без пересоздания;
+        :type max_executions: int
+        """
+        self.__factory: WorkerFactory = factory
+        self.__algorithms: AlgorithmCollection = factory.algorithms
+        self.__max_executions: int = max_executions
+        self.__pid: int | None = None
+        self.__connection: Connection | None = None
+        self.__executions: int = 0
+        self.__version: int = self.__algorithms.version
+
+    @property
+    def pid(self) -> int | None:
+        """Возвращает идентификатор рабочего процесса, если он запущен."""
+        return self.__pid
+
+    def execute(
+        self,
+        algorithm_name: str,
+        values: dict[str, Any],
+        memory_limit: int = 0,
+        cpu_limit: int = 0,
+        progress: ProgressListener | None = None,
+        timeout: int | None = None,
+    ) -> list[DataElementSchema]:
+        """Выполняет алгоритм в рабочем процессе. При прерывании вызывающего
+        потока (отмене выполнения) рабочий процесс завершается.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :param memory_limit: лимит памяти в МБ, 0 - без ограничения;
+        :type memory_limit: int
+        :param cpu_limit: лимит процессорного времени в секундах, 0 - без
+            ограничения;
+        :type cpu_limit: int
+        :param progress: получатель сведений о ходе выполнения алгоритма;
+        :type progress: ProgressListener or None
+        :param timeout: время (с), отведенное на выполнение, вместо таймаута
+            алгоритма;
+        :type timeout: int or None
+        :return: результат выполнения алгоритма.
+        :rtype: list[DataElementSchema]
+        :raises AlgorithmResourceLimitError: при превышении лимитов ресурсов.
+        """
+        if self.__version != self.__algorithms.version:
+            self.close()
+        self.__ensure_started()
+        try:
+            self.__connection.send(
+                (
+                    algorithm_name,
+                    values,
+                    memory_limit,
+                    cpu_limit,
+                    progress is not None,
+                    timeout,
+                )
+            )
+            while True:
+                while not self.__connection.poll(WORKER_POLL_INTERVAL):
+                    pass
+                success, payload, stats = self.__connection.recv()
+                if success is not None:
+                    break
+                progress(*payload)
+            memoize_stats.merge(stats)
+        except ExecutionInterrupt:
+            self.close()
+            raise
+        except (EOFError, OSError):
+            exitcode = self.__factory.wait_worker(self.__pid, WORKER_POLL_INTERVAL)
+            if exitcode is not None:
+                self.__pid = None
+            self.close()
+            logger.error(f"{ErrMsg.WORKER_CRASHED}: exitcode {exitcode}")
+            if exitcode is not None and -exitcode == signal.SIGXCPU:
+                raise AlgorithmResourceLimitError(ErrMsg.CPU_LIMIT_EXCEEDED)
+            raise AlgorithmResourceLimitError(ErrMsg.WORKER_CRASHED)
+
+        self.__executions += 1
+        if isinstance(payload, AlgorithmResourceLimitError) or (
+            0 < self.__max_executions <= self.__executions
+        ):
+            self.close()
+        if not success:
+            raise payload
+        return payload
+
+    def close(self) -> None:
+        """Завершает рабочий процесс."""
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+        if self.__pid is not None:
+            try:
+                os.kill(self.__pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self.__factory.wait_worker(self.__pid)
+            self.__pid = None
+        self.__executions = 0
+
+    def __ensure_started(self) -> None:
+        """Запускает рабочий процесс, если он не запущен."""
+        if self.__pid is not None:
+            return
+        self.__pid, self.__version, self.__connection = self.__factory.start_worker()
@@ -0,0 +1,58 @@
+import time
+from typing import Callable
+
+from src.internal.constants import DEFAULT_PROGRESS_INTERVAL
+
+ProgressListener = Callable[[float, str | None], None]
+"""Получатель сведений о ходе выполнения алгоритма: доля выполненной работы
+от 0 до 1 и необязательное сообщение."""
+
+
+class ProgressReporter:
+    """Класс передается алгоритму как функция progress(fraction, message) и
+    передает получателю сведения о ходе выполнения не чаще заданного
+    интервала. Лишние вызовы отбрасываются после одного сравнения времени,
+    поэтому алгоритм может сообщать о ходе выполнения на каждой итерации.
+    Сообщение о завершении (fraction >= 1) передается всегда."""
+
+    def __init__(
+        self,
+        listener: ProgressListener | None,
+        interval: float = DEFAULT_PROGRESS_INTERVAL,
+    ):
+        """Конструктор класса
+
+        :param listener: получатель сведений о ходе выполнения, None - сведения
+            отбрасываются;
+        :type listener: ProgressListener or None
+        :param interval: минимальный интервал (с) между передачами сведений;
+        :type interval: float
+        """
+        self.__listener: ProgressListener | None = listener
+        self.__interval: float = interval
+        self.__next_time: float = 0.0
+
+    def __call__(self, fraction: float, message: str | None = None) -> None:
+        """Сообщает о ходе выполнения алгоритма.
+
+        :param fraction: доля выполненной работы от 0 до 1, значения вне
+            диапазона приводятся к его границам;
+        :type fraction: float
+        :param message: необязательное сообщение;
+        :type message: str or None
+        """
+        if self.__listener is None:
+            return
+        now = time.monotonic()
+        if now < self.__next_time and fraction < 1:
+            return
+        self.__next_time = now + self.__interval
+        fraction = min(max(float(fraction), 0.0), 1.0)
+        self.__listener(fraction, None if message is None else str(message))
+
+
+if __name__ == "__main__":
+    reporter = ProgressReporter(lambda fraction, message: print(fraction, message))
+    for idx in range(1_000_000):
+        reporter(idx / 1_000_000, f"step {idx}")
+    reporter(1, "done")
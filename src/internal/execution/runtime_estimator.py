@@ -0,0 +1,60 @@
+import threading
+
+from src.internal.constants import DEFAULT_EWMA_ALPHA
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+
+
+class RuntimeEstimator:
+    """Класс хранит скользящую (экспоненциально взвешенную) оценку времени
+    выполнения алгоритмов по результатам прошлых вызовов."""
+
+    def __init__(self, alpha: float = DEFAULT_EWMA_ALPHA):
+        """Конструктор класса
+
+        :param alpha: коэффициент сглаживания, вес последнего измерения;
+        :type alpha: float
+        :raises ValueError: при значении коэффициента вне интервала (0, 1].
+        """
+        if isinstance(alpha, bool) or not isinstance(alpha, (int, float)):
+            raise TypeError(ErrMsg.INVALID_EWMA_ALPHA)
+        if not 0 < alpha <= 1:
+            raise ValueError(ErrMsg.INVALID_EWMA_ALPHA)
+        self.__alpha: float = alpha
+        self.__estimates: dict[str, float] = {}
+        self.__lock = threading.Lock()
+
+    def update(self, algorithm_name: str, runtime: float) -> float:
+        """Учитывает очередное измерение времени выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param runtime: время выполнения алгоритма в секундах;
+        :type runtime: float
+        :return: обновленная оценка времени выполнения.
+        :rtype: float
+        """
+        with self.__lock:
+            previous = self.__estimates.get(algorithm_name)
+            if previous is None:
+                estimate = runtime
+            else:
+                estimate = self.__alpha * runtime + (1 - self.__alpha) * previous
+            self.__estimates[algorithm_name] = estimate
+            return estimate
+
+    def get_estimate(self, algorithm_name: str) -> float | None:
+        """Возвращает оценку времени выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :return: оценка времени выполнения в секундах или None, если алгоритм
+            еще не выполнялся.
+        :rtype: float or None
+        """
+        return self.__estimates.get(algorithm_name)
+
+
+if __name__ == "__main__":
+    estimator = RuntimeEstimator(0.5)
+    estimator.update("fibonacci", 1.0)
+    print(estimator.update("fibonacci", 0.0))
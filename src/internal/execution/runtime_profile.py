@@ -0,0 +1,185 @@
+import math
+import threading
+from collections import deque
+
+from src.internal.constants import (
+    DEFAULT_ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    DEFAULT_RUNTIME_PROFILE_SAMPLES,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+PROFILE_PERCENTILES = (50, 90, 99)
+"""Процентили времени выполнения, выводимые в статистике профиля."""
+
+
+def get_size_bucket(input_size: int) -> int:
+    """Возвращает диапазон размера входных данных: наименьшую степень двойки,
+    не меньшую размера. В диапазон 2**k попадают размеры от 2**(k-1) + 1 до
+    2**k, в диапазон 1 - размеры 0 и 1.
+
+    :param input_size: размер входных данных;
+    :type input_size: int
+    :return: верхняя граница диапазона.
+    :rtype: int
+    """
+    return 1 << max(input_size - 1, 0).bit_length()
+
+
+def get_percentile(samples: list[float], percentile: float) -> float:
+    """Возвращает процентиль упорядоченной выборки методом ближайшего ранга.
+
+    :param samples: непустая выборка, упорядоченная по возрастанию;
+    :type samples: list[float]
+    :param percentile: процентиль от 0 до 100;
+    :type percentile: float
+    :return: значение процентиля.
+    :rtype: float
+    """
+    rank = math.ceil(percentile / 100 * len(samples))
+    return samples[max(rank, 1) - 1]
+
+
+class RuntimeProfile:
+    """Класс хранит распределения времени выполнения алгоритмов по диапазонам
+    размера входных данных (см. get_size_bucket). Для каждого алгоритма и
+    диапазона хранятся последние max_samples измерений.
+
+    Если задан коэффициент timeout_factor, таймаут выполнения сокращается до
+    timeout_factor * p99 (с округлением вверх до целых секунд), когда для
+    диапазона размера входных данных накоплено не меньше min_samples измерений
+    и сокращенное значение меньше таймаута алгоритма. Для входных данных из
+    диапазонов без достаточной истории используется таймаут алгоритма.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = DEFAULT_RUNTIME_PROFILE_SAMPLES,
+        timeout_factor: float = 0,
+        min_samples: int = DEFAULT_ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+    ):
+        """Конструктор класса
+
+        :param max_samples: количество хранимых измерений для каждого
+            алгоритма и диапазона;
+        :type max_samples: int
+        :param timeout_factor: коэффициент запаса сокращенного таймаута
+            относительно p99, 0 - таймаут не сокращается;
+        :type timeout_factor: float
+        :param min_samples: количество измерений, после которого таймаут
+            может быть сокращен;
+        :type min_samples: int
+        :raises ValueError: при некорректных значениях параметров.
+        """
+        for name, value in [("max_samples", max_samples), ("min_samples", min_samples)]:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format(name))
+            if value <= 0:
+                raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format(name))
+        if isinstance(timeout_factor, bool) or not isinstance(
+            timeout_factor, (int, float)
+        ):
+            raise TypeError(ErrMsgTmpl.INVALID_FACTOR_PARAM.format("timeout_factor"))
+        if timeout_factor != 0 and timeout_factor < 1:
+            raise ValueError(ErrMsgTmpl.INVALID_FACTOR_PARAM.format("timeout_factor"))
+        self.__max_samples: int = max_samples
+        self.__timeout_factor: float = timeout_factor
+        self.__min_samples: int = min(min_samples, max_samples)
+        self.__samples: dict[str, dict[int, deque[float]]] = {}
+        self.__lock = threading.Lock()
+
+    def record(self, algorithm_name: str, input_size: int, runtime: float) -> None:
+        """Учитывает измерение времени выполнения алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param input_size: размер входных данных;
+        :type input_size: int
+        :param runtime: время выполнения алгоритма в секундах;
+        :type runtime: float
+        """
+        bucket = get_size_bucket(input_size)
+        with self.__lock:
+            buckets = self.__samples.setdefault(algorithm_name, {})
+            samples = buckets.get(bucket)
+            if samples is None:
+                samples = buckets[bucket] = deque(maxlen=self.__max_samples)
+            samples.append(runtime)
+
+    def get_percentile(
+        self, algorithm_name: str, input_size: int, percentile: float
+    ) -> float | None:
+        """Возвращает процентиль времени выполнения алгоритма для диапазона,
+        в который попадает размер входных данных.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param input_size: размер входных данных;
+        :type input_size: int
+        :param percentile: процентиль от 0 до 100;
+        :type percentile: float
+        :return: значение процентиля в секундах или None, если измерений нет.
+        :rtype: float or None
+        """
+        samples = self.__get_samples(algorithm_name, get_size_bucket(input_size))
+        if not samples:
+            return None
+        return get_percentile(sorted(samples), percentile)
+
+    def get_timeout(self, algorithm_name: str, input_size: int, timeout: int) -> int:
+        """Возвращает таймаут для выполнения алгоритма с входными данными
+        указанного размера: сокращенный по истории выполнений или таймаут
+        алгоритма.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param input_size: размер входных данных;
+        :type input_size: int
+        :param timeout: таймаут алгоритма в секундах, 0 - без ограничения;
+        :type timeout: int
+        :return: таймаут выполнения в секундах.
+        :rtype: int
+        """
+        if self.__timeout_factor == 0 or timeout <= 0:
+            return timeout
+        samples = self.__get_samples(algorithm_name, get_size_bucket(input_size))
+        if len(samples) < self.__min_samples:
+            return timeout
+        p99 = get_percentile(sorted(samples), 99)
+        return min(timeout, max(math.ceil(self.__timeout_factor * p99), 1))
+
+    def snapshot(self) -> dict[str, dict[int, dict[str, float]]]:
+        """Возвращает статистику времени выполнения алгоритмов.
+
+        :return: словарь по именам алгоритмов и верхним границам диапазонов
+            размера входных данных с количеством измерений (count),
+            процентилями (p50, p90, p99) и максимумом (max).
+        :rtype: dict[str, dict[int, dict[str, float]]]
+        """
+        with self.__lock:
+            copies = {
+                name: {bucket: sorted(samples) for bucket, samples in buckets.items()}
+                for name, buckets in self.__samples.items()
+            }
+        result = {}
+        for name, buckets in copies.items():
+            result[name] = {}
+            for bucket, samples in sorted(buckets.items()):
+                stats = {"count": len(samples)}
+                for percentile in PROFILE_PERCENTILES:
+                    stats[f"p{percentile}"] = get_percentile(samples, percentile)
+                stats["max"] = samples[-1]
+                result[name][bucket] = stats
+        return result
+
+    def __get_samples(self, algorithm_name: str, bucket: int) -> list[float]:
+        """Возвращает копию измерений алгоритма для диапазона."""
+        with self.__lock:
+            return list(self.__samples.get(algorithm_name, {}).get(bucket, ()))
+
+
+if __name__ == "__main__":
+    profile = RuntimeProfile(timeout_factor=4, min_samples=10)
+    for size in range(1, 101):
+        profile.record("fibonacci", size, size / 1000)
+    print(profile.snapshot())
+    print(profile.get_timeout("fibonacci", 100, 10))
@@ -0,0 +1,139 @@
+import ctypes
+import heapq
+import itertools
+import threading
+import time
+
+
+class ExecutionInterrupt(BaseException):
+    """Базовый класс прерываний выполнения алгоритма в рабочем потоке.
+    Наследуется от BaseException, чтобы код алгоритма не мог перехватить
+    прерывание конструкцией except Exception."""
+
+
+class ExecutionTimeout(ExecutionInterrupt):
+    """Прерывание выполнения алгоритма по истечении отведенного времени."""
+
+
+class ExecutionCancelled(ExecutionInterrupt):
+    """Прерывание выполнения алгоритма, результат которого больше не нужен."""
+
+
+def interrupt_thread(
+    thread_id: int, interrupt: type[ExecutionInterrupt] | None
+) -> bool:
+    """Асинхронно возбуждает прерывание в указанном потоке. Прерывание
+    срабатывает при выполнении потоком очередной инструкции байт-кода, поэтому
+    блокирующие системные вызовы (например, time.sleep) не прерываются.
+
+    :param thread_id: идентификатор потока;
+    :type thread_id: int
+    :param interrupt: класс прерывания или None для отмены ожидающего прерывания;
+    :type interrupt: type[ExecutionInterrupt] or None
+    :return: True, если поток найден.
+    :rtype: bool
+    """
+    exc = ctypes.py_object(interrupt) if interrupt is not None else None
+    return (
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), exc) == 1
+    )
+
+
+class ExecutionWatchdog:
+    """Класс контролирует время выполнения алгоритмов в рабочих потоках, где
+    недоступен сигнал SIGALRM. Один фоновый поток отслеживает сроки всех
+    выполнений и прерывает потоки, превысившие отведенное время."""
+
+    def __init__(self):
+        """Конструктор класса"""
+        self.__condition = threading.Condition()
+        self.__deadlines: list[tuple[float, int]] = []
+        self.__armed: dict[int, int] = {}
+        self.__fired: set[int] = set()
+        self.__tokens = itertools.count()
+        self.__thread: threading.Thread | None = None
+
+    def arm(self, timeout: float, thread_id: int | None = None) -> int:
+        """Устанавливает срок выполнения для потока.
+
+        :param timeout: время, отведенное на выполнение, в секундах;
+        :type timeout: float
+        :param thread_id: идентификатор потока, по умолчанию текущий поток;
+        :type thread_id: int or None
+        :return: идентификатор установленного срока.
+        :rtype: int
+        """
+        if thread_id is None:
+            thread_id = threading.get_ident()
+        with self.__condition:
+            self.__ensure_started()
+            token = next(self.__tokens)
+            self.__armed[token] = thread_id
+            heapq.heappush(self.__deadlines, (time.monotonic() + timeout, token))
+            self.__condition.notify()
+            return token
+
+    def disarm(self, token: int) -> bool:
+        """Снимает срок выполнения. Вызывается из контролируемого потока. Если
+        прерывание уже было отправлено, но еще не сработало, оно отменяется.
+        Прерывание, сработавшее во время снятия срока, не оставляет срок
+        установленным: снятие повторяется, прерывание по истечении срока
+        поглощается (о нем сообщает результат), а прерывание отмены
+        возбуждается повторно после снятия срока.
+
+        :param token: идентификатор срока, полученный от метода arm;
+        :type token: int
+        :return: True, если срок истек и поток был прерван.
+        :rtype: bool
+        :raises ExecutionCancelled: если выполнение было отменено во время
+            снятия срока.
+        """
+        fired = False
+        cancelled = None
+        while True:
+            try:
+                with self.__condition:
+                    self.__armed.pop(token, None)
+                    if token in self.__fired:
+                        fired = True
+                        interrupt_thread(threading.get_ident(), None)
+                        self.__fired.discard(token)
+                break
+            except ExecutionTimeout:
+                fired = True
+            except ExecutionCancelled as ex:
+                cancelled = ex
+        if cancelled is not None:
+            raise cancelled
+        return fired
+
+    def __ensure_started(self) -> None:
+        """Запускает фоновый поток контроля сроков."""
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = threading.Thread(
+                target=self.__watch, name="execution-watchdog", daemon=True
+            )
+            self.__thread.start()
+
+    def __watch(self) -> None:
+        """Ожидает ближайший срок и прерывает поток при его истечении."""
+        with self.__condition:
+            while True:
+                while self.__deadlines and self.__deadlines[0][1] not in self.__armed:
+                    heapq.heappop(self.__deadlines)
+                if not self.__deadlines:
+                    self.__condition.wait()
+                    continue
+                deadline, token = self.__deadlines[0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self.__condition.wait(delay)
+                    continue
+                heapq.heappop(self.__deadlines)
+                thread_id = self.__armed.pop(token)
+                self.__fired.add(token)
+                interrupt_thread(thread_id, ExecutionTimeout)
+
+
+execution_watchdog = ExecutionWatchdog()
+"""Общий для приложения контроль времени выполнения в рабочих потоках."""
@@ -0,0 +1,293 @@
+"""Модуль с журналом выполнения алгоритмов: по одной записи в формате NDJSON
+на каждое выполнение с именем алгоритма, размером входных данных, временем
+проверки и выполнения, результатом и идентификатором рабочего процесса или
+потока. Чтобы журнал не замедлял обработку запросов, записи отбираются
+(sampling) и записываются в файл пакетами."""
+
+import fcntl
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Any
+
+from pydantic_core import to_json
+
+from src.internal.constants import (
+    DEFAULT_EXECUTION_LOG_BACKUP_COUNT,
+    DEFAULT_EXECUTION_LOG_BATCH_SIZE,
+    DEFAULT_EXECUTION_LOG_FLUSH_INTERVAL,
+    DEFAULT_EXECUTION_LOG_MAX_BYTES,
+    DEFAULT_EXECUTION_LOG_SAMPLE_RATE,
+    DEFAULT_EXECUTION_LOG_SLOW_THRESHOLD,
+)
+from src.internal.data_dimension.compact_array import CompactArray
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_OUTCOME = "success"
+"""Результат выполнения алгоритма без ошибок."""
+
+
+def get_input_size(values: dict[str, Any]) -> int:
+    """Возвращает размер входных данных: количество скалярных значений, для
+    списков - количество элементов, для матриц - количество ячеек.
+
+    :param values: словарь значений входных данных по их именам;
+    :type values: dict[str, Any]
+    :return: размер входных данных.
+    :rtype: int
+    """
+    size = 0
+    for value in values.values():
+        if isinstance(value, CompactArray):
+            size += value.size
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                size += len(item) if isinstance(item, (list, tuple)) else 1
+        else:
+            size += 1
+    return size
+
+
+class ExecutionLog:
+    """Класс записывает журнал выполнения алгоритмов в файл NDJSON.
+
+    Решение о записи принимается в два этапа. До выполнения алгоритма
+    (head sampling) выполнение отбирается с вероятностью sample_rate. После
+    выполнения (tail sampling) запись сохраняется в любом случае, если
+    выполнение завершилось ошибкой или длилось не меньше slow_threshold
+    секунд. Поле sampling записи указывает причину отбора: head, error или
+    slow.
+
+    Записи накапливаются в памяти и записываются в файл одной операцией, когда
+    их количество достигает batch_size или с момента появления первой из них
+    прошло flush_interval секунд. Файл ротируется при достижении max_bytes
+    байт. Запись и ротация выполняются под блокировкой файла, поэтому журнал
+    может вести несколько процессов одновременно; в дочерних процессах,
+    созданных копированием (fork), накопленные родителем записи сбрасываются.
+    """
+
+    __instances: "weakref.WeakSet[ExecutionLog]" = weakref.WeakSet()
+    __fork_hook_registered: bool = False
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: float = DEFAULT_EXECUTION_LOG_SAMPLE_RATE,
+        slow_threshold: float = DEFAULT_EXECUTION_LOG_SLOW_THRESHOLD,
+        batch_size: int = DEFAULT_EXECUTION_LOG_BATCH_SIZE,
+        flush_interval: float = DEFAULT_EXECUTION_LOG_FLUSH_INTERVAL,
+        max_bytes: int = DEFAULT_EXECUTION_LOG_MAX_BYTES,
+        backup_count: int = DEFAULT_EXECUTION_LOG_BACKUP_COUNT,
+    ):
+        """Конструктор класса
+
+        :param path: путь к файлу журнала;
+        :type path: str
+        :param sample_rate: доля выполнений, отбираемых до выполнения, от 0 до 1;
+        :type sample_rate: float
+        :param slow_threshold: время выполнения (с), начиная с которого запись
+            сохраняется всегда;
+        :type slow_threshold: float
+        :param batch_size: количество записей, записываемых в файл одной
+            операцией;
+        :type batch_size: int
+        :param flush_interval: наибольшее время (с) хранения записи в памяти;
+        :type flush_interval: float
+        :param max_bytes: размер файла (байт), при достижении которого файл
+            ротируется, 0 - без ротации;
+        :type max_bytes: int
+        :param backup_count: количество хранимых файлов после ротации;
+        :type backup_count: int
+        :raises ValueError: при некорректных значениях параметров.
+        """
+        if isinstance(sample_rate, bool) or not isinstance(sample_rate, (int, float)):
+            raise TypeError(ErrMsgTmpl.INVALID_FRACTION_PARAM.format("sample_rate"))
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(ErrMsgTmpl.INVALID_FRACTION_PARAM.format("sample_rate"))
+        for name, value in (("batch_size", batch_size), ("backup_count", backup_count)):
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format(name))
+        if batch_size <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("batch_size"))
+        if backup_count <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("backup_count"))
+        self.__path: str = path
+        self.__sample_rate: float = sample_rate
+        self.__slow_threshold: float = slow_threshold
+        self.__batch_size: int = batch_size
+        self.__flush_interval: float = flush_interval
+        self.__max_bytes: int = max_bytes
+        self.__backup_count: int = backup_count
+        self.__worker: str = ""
+        self.__buffer: list[bytes] = []
+        self.__buffer_started: float = 0.0
+        self.__lock = threading.Lock()
+        ExecutionLog.__register_fork_hook(self)
+
+    @property
+    def path(self) -> str:
+        """Возвращает путь к файлу журнала."""
+        return self.__path
+
+    @property
+    def pending(self) -> int:
+        """Возвращает количество записей, ожидающих записи в файл."""
+        return len(self.__buffer)
+
+    def is_sampled(self) -> bool:
+        """Принимает решение об отборе выполнения до его начала.
+
+        :return: True, если запись о выполнении сохраняется независимо от
+            его результата.
+        :rtype: bool
+        """
+        return self.__sample_rate >= 1 or random.random() < self.__sample_rate
+
+    def record(
+        self,
+        algorithm_name: str,
+        input_size: int,
+        validation_time: float,
+        execution_time: float,
+        outcome: str = SUCCESS_OUTCOME,
+        sampled: bool = True,
+    ) -> bool:
+        """Добавляет запись о выполнении алгоритма, если выполнение отобрано до
+        начала, завершилось ошибкой или было медленным.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param input_size: размер входных данных;
+        :type input_size: int
+        :param validation_time: время (с) проверки входных и выходных данных;
+        :type validation_time: float
+        :param execution_time: время (с) выполнения функции алгоритма;
+        :type execution_time: float
+        :param outcome: success или имя класса исключения;
+        :type outcome: str
+        :param sampled: результат отбора до выполнения (is_sampled);
+        :type sampled: bool
+        :return: True, если запись сохранена.
+        :rtype: bool
+        """
+        if outcome != SUCCESS_OUTCOME:
+            sampling = "error"
+        elif execution_time >= self.__slow_threshold:
+            sampling = "slow"
+        elif sampled:
+            sampling = "head"
+        else:
+            return False
+        line = to_json(
+            {
+                "time": time.time(),
+                "algorithm": algorithm_name,
+                "input_size": input_size,
+                "validation_time": validation_time,
+                "execution_time": execution_time,
+                "outcome": outcome,
+                "worker": self.__get_worker(),
+                "sampling": sampling,
+            }
+        )
+        now = time.monotonic()
+        with self.__lock:
+            if not self.__buffer:
+                self.__buffer_started = now
+            self.__buffer.append(line + b"\n")
+            if (
+                len(self.__buffer) < self.__batch_size
+                and now - self.__buffer_started < self.__flush_interval
+            ):
+                return True
+            batch, self.__buffer = self.__buffer, []
+        self.__write(b"".join(batch))
+        return True
+
+    def flush(self) -> None:
+        """Записывает в файл накопленные записи."""
+        with self.__lock:
+            batch, self.__buffer = self.__buffer, []
+        if batch:
+            self.__write(b"".join(batch))
+
+    def __get_worker(self) -> str:
+        """Возвращает идентификатор процесса и имя потока, выполнившего
+        алгоритм."""
+        if not self.__worker:
+            self.__worker = str(os.getpid())
+        return f"{self.__worker}/{threading.current_thread().name}"
+
+    def __write(self, data: bytes) -> None:
+        """Дописывает данные в файл журнала одной операцией записи, при
+        необходимости ротируя файл. При ошибке записи данные отбрасываются,
+        чтобы ошибка журнала не влияла на выполнение алгоритма."""
+        try:
+            directory = os.path.dirname(self.__path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.__path + ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self.__rotate(len(data))
+                    fd = os.open(self.__path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+                    try:
+                        os.write(fd, data)
+                    finally:
+                        os.close(fd)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        except OSError as ex:
+            logger.error(str(ex))
+
+    def __rotate(self, incoming: int) -> None:
+        """Ротирует файл журнала, если после дописывания данных его размер
+        превысит max_bytes."""
+        if self.__max_bytes <= 0:
+            return
+        try:
+            size = os.path.getsize(self.__path)
+        except OSError:
+            return
+        if size == 0 or size + incoming <= self.__max_bytes:
+            return
+        for idx in range(self.__backup_count - 1, 0, -1):
+            source = f"{self.__path}.{idx}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.__path}.{idx + 1}")
+        os.replace(self.__path, f"{self.__path}.1")
+
+    def __after_fork(self) -> None:
+        """Сбрасывает записи родительского процесса в дочернем процессе."""
+        self.__lock = threading.Lock()
+        self.__buffer = []
+        self.__worker = ""
+
+    @classmethod
+    def __register_fork_hook(cls, instance: "ExecutionLog") -> None:
+        """Регистрирует сброс записей в дочерних процессах."""
+        cls.__instances.add(instance)
+        if cls.__fork_hook_registered:
+            return
+        os.register_at_fork(after_in_child=cls.__reset_after_fork)
+        cls.__fork_hook_registered = True
+
+    @classmethod
+    def __reset_after_fork(cls) -> None:
+        for instance in list(cls.__instances):
+            instance.__after_fork()
+
+
+if __name__ == "__main__":
+    execution_log = ExecutionLog("logs/executions.ndjson", sample_rate=0.5)
+    for idx in range(10):
+        sampled = execution_log.is_sampled()
+        execution_log.record("fibonacci", 1, 1e-5, 1e-4, sampled=sampled)
+    execution_log.record("fibonacci", 1, 1e-5, 1e-4, "AlgorithmValueError", False)
+    execution_log.flush()
+    print(execution_log.path)
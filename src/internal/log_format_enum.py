@@ -0,0 +1,13 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class LogFormatEnum(LowercaseStrEnum):
+    """Перечисление форматов записей лога. Значение TEXT соответствует
+    текстовому формату, JSON - одной строке JSON на запись.
+
+    """
+
+    TEXT = auto()
+    JSON = auto()
@@ -0,0 +1,223 @@
+"""Модуль переносит запись логов из потоков, обрабатывающих запросы, в
+отдельный поток. Записи помещаются в ограниченную очередь обработчиком
+BoundedQueueHandler и записываются в файл и поток вывода слушателем
+QueueListener. При переполнении очереди новые записи отбрасываются, а
+количество отброшенных записей учитывается в метриках."""
+
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from pydantic_core import to_json
+
+from src.internal.constants import DEFAULT_LOG_QUEUE_SIZE
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.metrics import MetricsRegistry
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Обработчик помещает записи в очередь ограниченного размера, не
+    блокируя вызывающий поток. Если очередь заполнена, запись отбрасывается.
+    Учитываются количество отброшенных записей (dropped) и количество
+    переполнений очереди (overflows) - переходов очереди в заполненное
+    состояние."""
+
+    def __init__(self, capacity: int, metrics: MetricsRegistry | None = None):
+        """Конструктор класса
+
+        :param capacity: максимальное количество записей в очереди;
+        :type capacity: int
+        :param metrics: реестр метрик для счетчиков logging.dropped и
+            logging.overflows;
+        :type metrics: MetricsRegistry or None
+        :raises ValueError: при неположительном размере очереди.
+        """
+        if isinstance(capacity, bool) or not isinstance(capacity, int):
+            raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("capacity"))
+        if capacity <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("capacity"))
+        super().__init__(queue.Queue(capacity))
+        self.__metrics: MetricsRegistry | None = metrics
+        self.__dropped: int = 0
+        self.__overflows: int = 0
+        self.__overflowed: bool = False
+
+    @property
+    def dropped(self) -> int:
+        """Возвращает количество отброшенных записей."""
+        return self.__dropped
+
+    @property
+    def overflows(self) -> int:
+        """Возвращает количество переполнений очереди."""
+        return self.__overflows
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Подготавливает запись для передачи в очередь. В отличие от
+        QueueHandler.prepare, трассировка исключения не форматируется в
+        вызывающем потоке: это делают обработчики слушателя."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Помещает запись в очередь или отбрасывает ее, если очередь
+        заполнена."""
+        try:
+            self.queue.put_nowait(record)
+            self.__overflowed = False
+        except queue.Full:
+            self.__dropped += 1
+            if self.__metrics is not None:
+                self.__metrics.increment("logging.dropped")
+            if not self.__overflowed:
+                self.__overflowed = True
+                self.__overflows += 1
+                if self.__metrics is not None:
+                    self.__metrics.increment("logging.overflows")
+
+
+class JsonFormatter(logging.Formatter):
+    """Форматирует запись лога в одну строку JSON с полями time, level,
+    logger, function, message и, при наличии, exception."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Форматирует запись лога.
+
+        :param record: запись лога;
+        :type record: logging.LogRecord
+        :return: запись в формате JSON.
+        :rtype: str
+        """
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return to_json(data).decode()
+
+
+class LogQueueListener(QueueListener):
+    """Слушатель очереди записей лога. При остановке ожидает освобождения
+    места для служебной записи, если очередь заполнена."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class LogQueue:
+    """Класс переключает обработчики логгера на запись через очередь: к
+    логгеру подключается BoundedQueueHandler, а прежние обработчики
+    вызываются слушателем QueueListener в отдельном потоке. В дочерних
+    процессах, созданных копированием (fork), прежние обработчики
+    восстанавливаются, так как поток слушателя в них не копируется."""
+
+    __active: "LogQueue | None" = None
+    __fork_hook_lock = threading.Lock()
+    __fork_hook_registered: bool = False
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_LOG_QUEUE_SIZE,
+        metrics: MetricsRegistry | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        """Конструктор класса
+
+        :param capacity: максимальное количество записей в очереди;
+        :type capacity: int
+        :param metrics: реестр метрик;
+        :type metrics: MetricsRegistry or None
+        :param logger: логгер, по умолчанию корневой;
+        :type logger: logging.Logger or None
+        """
+        self.__logger: logging.Logger = logger or logging.getLogger()
+        self.__handler = BoundedQueueHandler(capacity, metrics)
+        self.__handlers: list[logging.Handler] = []
+        self.__listener: LogQueueListener | None = None
+
+    @property
+    def handler(self) -> BoundedQueueHandler:
+        """Возвращает обработчик, помещающий записи в очередь."""
+        return self.__handler
+
+    def start(self) -> None:
+        """Переключает обработчики логгера на запись через очередь. Ранее
+        запущенная очередь останавливается."""
+        LogQueue.__register_fork_hook()
+        LogQueue.stop_active()
+        self.__handlers = list(self.__logger.handlers)
+        for handler in self.__handlers:
+            self.__logger.removeHandler(handler)
+        self.__listener = LogQueueListener(
+            self.__handler.queue, *self.__handlers, respect_handler_level=True
+        )
+        self.__listener.start()
+        self.__logger.addHandler(self.__handler)
+        LogQueue.__active = self
+
+    def stop(self) -> None:
+        """Записывает оставшиеся в очереди записи, останавливает поток
+        слушателя и восстанавливает прежние обработчики логгера."""
+        if self.__listener is None:
+            return
+        self.__logger.removeHandler(self.__handler)
+        self.__listener.stop()
+        self.__listener = None
+        self.__restore_handlers()
+
+    @classmethod
+    def stop_active(cls) -> None:
+        """Останавливает запущенную очередь, если она есть. Вызывается перед
+        изменением конфигурации логирования."""
+        if cls.__active is not None:
+            cls.__active.stop()
+
+    def __restore_handlers(self) -> None:
+        """Подключает прежние обработчики к логгеру."""
+        for handler in self.__handlers:
+            self.__logger.addHandler(handler)
+        if LogQueue.__active is self:
+            LogQueue.__active = None
+
+    def __after_fork(self) -> None:
+        """Восстанавливает прежние обработчики в дочернем процессе."""
+        self.__logger.removeHandler(self.__handler)
+        self.__listener = None
+        self.__restore_handlers()
+
+    @classmethod
+    def __register_fork_hook(cls) -> None:
+        """Регистрирует восстановление обработчиков в дочерних процессах."""
+        with cls.__fork_hook_lock:
+            if cls.__fork_hook_registered:
+                return
+            os.register_at_fork(after_in_child=cls.__reset_after_fork)
+            cls.__fork_hook_registered = True
+
+    @classmethod
+    def __reset_after_fork(cls) -> None:
+        if cls.__active is not None:
+            cls.__active.__after_fork()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger().handlers[0].setFormatter(JsonFormatter())
+    log_queue = LogQueue(capacity=100)
+    log_queue.start()
+    for idx in range(1000):
+        logging.getLogger(__name__).info("record %d", idx)
+    log_queue.stop()
+    print(f"dropped: {log_queue.handler.dropped}")
@@ -0,0 +1,235 @@
+import contextlib
+import functools
+import os
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+from src.internal.constants import DEFAULT_MEMOIZE_MAX_SIZE
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+MISSING = object()
+"""Признак отсутствия значения в кэше."""
+
+memoize_caches: ContextVar[dict[object, "LruCache"] | None] = ContextVar(
+    "memoize_caches", default=None
+)
+"""Кэши мемоизированных функций текущего выполнения алгоритма."""
+
+
+class LruCache:
+    """Класс представляет кэш ограниченного размера, из которого вытесняются
+    давно не использованные значения. Кэш не использует блокировок: каждая
+    операция со словарем OrderedDict выполняется атомарно, а значение,
+    вытесненное другим потоком между операциями, считается отсутствующим.
+    Поэтому кэш безопасно наследуется рабочими процессами, созданными
+    копированием (fork)."""
+
+    def __init__(self, max_size: int):
+        """Конструктор класса
+
+        :param max_size: наибольшее количество значений в кэше;
+        :type max_size: int
+        """
+        self.__max_size: int = max_size
+        self.__values: OrderedDict = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        """Возвращает значение из кэша и отмечает его как использованное.
+
+        :param key: ключ значения;
+        :type key: Any
+        :return: значение или MISSING, если значения нет в кэше.
+        :rtype: Any
+        """
+        try:
+            value = self.__values[key]
+            self.__values.move_to_end(key)
+        except KeyError:
+            return MISSING
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Добавляет значение в кэш, вытесняя давно не использованные
+        значения сверх наибольшего количества.
+
+        :param key: ключ значения;
+        :type key: Any
+        :param value: значение;
+        :type value: Any
+        """
+        self.__values[key] = value
+        while len(self.__values) > self.__max_size:
+            try:
+                self.__values.popitem(last=False)
+            except KeyError:
+                break
+
+    def clear(self) -> None:
+        """Удаляет все значения из кэша."""
+        self.__values.clear()
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+
+class MemoizeStats:
+    """Класс накапливает количество попаданий в кэш и промахов мемоизированных
+    функций до их сбора методом collect. В рабочем процессе, созданном
+    копированием (fork), накопленные значения сбрасываются, так как они уже
+    учтены родительским процессом."""
+
+    def __init__(self):
+        """Конструктор класса"""
+        self.__counts: dict[str, list[int]] = {}
+        self.__lock = threading.Lock()
+        os.register_at_fork(after_in_child=self.__reset)
+
+    def record(self, name: str, hits: int, misses: int) -> None:
+        """Учитывает попадания и промахи функции.
+
+        :param name: имя функции;
+        :type name: str
+        :param hits: количество попаданий;
+        :type hits: int
+        :param misses: количество промахов;
+        :type misses: int
+        """
+        with self.__lock:
+            counts = self.__counts.setdefault(name, [0, 0])
+            counts[0] += hits
+            counts[1] += misses
+
+    def merge(self, stats: dict[str, tuple[int, int]]) -> None:
+        """Учитывает статистику, собранную в другом процессе.
+
+        :param stats: количество попаданий и промахов по именам функций;
+        :type stats: dict[str, tuple[int, int]]
+        """
+        for name, (hits, misses) in stats.items():
+            self.record(name, hits, misses)
+
+    def collect(self) -> dict[str, tuple[int, int]]:
+        """Возвращает накопленную статистику и сбрасывает ее.
+
+        :return: количество попаданий и промахов по именам функций.
+        :rtype: dict[str, tuple[int, int]]
+        """
+        with self.__lock:
+            counts, self.__counts = self.__counts, {}
+        return {name: (hits, misses) for name, (hits, misses) in counts.items()}
+
+    def __reset(self) -> None:
+        """Сбрасывает статистику и блокировку в рабочем процессе."""
+        self.__counts = {}
+        self.__lock = threading.Lock()
+
+
+memoize_stats = MemoizeStats()
+"""Статистика мемоизированных функций процесса."""
+
+
+@contextlib.contextmanager
+def memoize_scope() -> Iterator[None]:
+    """Контекст выполнения алгоритма: кэши непостоянных мемоизированных
+    функций создаются в нем заново и удаляются при выходе из него."""
+    token = memoize_caches.set({})
+    try:
+        yield
+    finally:
+        memoize_caches.reset(token)
+
+
+def memoize(
+    func: Callable | None = None,
+    *,
+    max_size: int = DEFAULT_MEMOIZE_MAX_SIZE,
+    persistent: bool = False,
+) -> Callable:
+    """Декоратор кэширует результаты функции по значениям ее аргументов.
+    Применяется без параметров (@memoize) или с параметрами
+    (@memoize(max_size=100, persistent=True)).
+
+    Кэш хранит не больше max_size результатов и вытесняет давно не
+    использованные. По умолчанию кэш создается для каждого выполнения
+    алгоритма; вне выполнения алгоритма - для внешнего вызова функции.
+    Постоянный кэш (persistent=True) сохраняется между выполнениями в течение
+    жизни процесса, выполняющего алгоритмы, поэтому подходит только для
+    функций, результат которых зависит лишь от аргументов. Вызовы с
+    нехешируемыми аргументами (например, списками) не кэшируются.
+
+    Количество попаданий в кэш и промахов учитывается в метриках приложения
+    (memoize.hits, memoize.misses и счетчики функций
+    memoize.<модуль>.<функция>.hits и .misses).
+
+    :param func: декорируемая функция;
+    :type func: Callable or None
+    :param max_size: наибольшее количество результатов в кэше;
+    :type max_size: int
+    :param persistent: признак сохранения кэша между выполнениями алгоритма;
+    :type persistent: bool
+    :return: функция с кэшированием результатов или декоратор.
+    :rtype: Callable
+    :raises TypeError: если max_size не является целым числом;
+    :raises ValueError: если max_size не больше нуля.
+    """
+    if not isinstance(max_size, int) or isinstance(max_size, bool):
+        raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size"))
+    if max_size <= 0:
+        raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size"))
+    if func is None:
+        return functools.partial(memoize, max_size=max_size, persistent=persistent)
+
+    name = f"{func.__module__}.{func.__qualname__}"
+    shared = LruCache(max_size) if persistent else None
+    scope_key = object()
+
+    def get_cache() -> LruCache | None:
+        if shared is not None:
+            return shared
+        caches = memoize_caches.get()
+        if caches is None:
+            return None
+        cache = caches.get(scope_key)
+        if cache is None:
+            cache = caches[scope_key] = LruCache(max_size)
+        return cache
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        cache = get_cache()
+        if cache is None:
+            with memoize_scope():
+                return wrapper(*args, **kwargs)
+        value = cache.get(key)
+        if value is not MISSING:
+            memoize_stats.record(name, 1, 0)
+            return value
+        value = func(*args, **kwargs)
+        cache.put(key, value)
+        memoize_stats.record(name, 0, 1)
+        return value
+
+    def cache_clear() -> None:
+        """Удаляет результаты из кэша функции."""
+        cache = get_cache()
+        if cache is not None:
+            cache.clear()
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+
+if __name__ == "__main__":
+
+    @memoize
+    def fibonacci(n: int) -> int:
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(fibonacci(90), memoize_stats.collect())
@@ -0,0 +1,79 @@
+import threading
+
+
+class MetricsRegistry:
+    """Класс хранит метрики работы приложения: счетчики событий и
+    статистику наблюдаемых значений (количество, сумма, минимум, максимум).
+    Методы класса потокобезопасны."""
+
+    def __init__(self):
+        """Конструктор класса"""
+        self.__counters: dict[str, float] = {}
+        self.__observations: dict[str, dict[str, float]] = {}
+        self.__lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Увеличивает значение счетчика.
+
+        :param name: название счетчика;
+        :type name: str
+        :param value: величина увеличения;
+        :type value: float
+        """
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Учитывает наблюдаемое значение.
+
+        :param name: название наблюдаемой величины;
+        :type name: str
+        :param value: наблюдаемое значение;
+        :type value: float
+        """
+        with self.__lock:
+            stats = self.__observations.get(name)
+            if stats is None:
+                self.__observations[name] = {
+                    "count": 1,
+                    "sum": value,
+                    "min": value,
+                    "max": value,
+                }
+                return
+            stats["count"] += 1
+            stats["sum"] += value
+            stats["min"] = min(stats["min"], value)
+            stats["max"] = max(stats["max"], value)
+
+    def get_counter(self, name: str) -> float:
+        """Возвращает значение счетчика.
+
+        :param name: название счетчика;
+        :type name: str
+        :return: значение счетчика, 0 для отсутствующего счетчика.
+        :rtype: float
+        """
+        return self.__counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Возвращает копию текущих значений метрик.
+
+        :return: словарь со счетчиками (counters) и статистикой наблюдаемых
+            значений (observations).
+        :rtype: dict[str, dict]
+        """
+        with self.__lock:
+            return {
+                "counters": dict(self.__counters),
+                "observations": {
+                    name: dict(stats) for name, stats in self.__observations.items()
+                },
+            }
+
+
+if __name__ == "__main__":
+    metrics = MetricsRegistry()
+    metrics.increment("requests")
+    metrics.observe("latency", 0.5)
+    print(metrics.snapshot())
@@ -0,0 +1,3 @@
+"""Пакет реализует кэш результатов выполнения алгоритмов с хранением в памяти
+процесса или в хранилище, общем для рабочих процессов приложения: файле
+SQLite или сервере с протоколом Redis (RESP)."""
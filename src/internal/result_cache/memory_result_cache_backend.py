@@ -0,0 +1,41 @@
+import time
+
+from src.internal.constants import DEFAULT_RESULT_CACHE_SIZE
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.memoize import MISSING, LruCache
+from src.internal.result_cache.result_cache_backend import ResultCacheBackend
+
+
+class MemoryResultCacheBackend(ResultCacheBackend):
+    """Хранилище кэша результатов в памяти процесса приложения. Хранит не
+    больше max_size значений и вытесняет давно не использованные. Каждый
+    процесс приложения имеет собственное хранилище."""
+
+    def __init__(self, max_size: int = DEFAULT_RESULT_CACHE_SIZE):
+        """Конструктор класса
+
+        :param max_size: наибольшее количество значений;
+        :type max_size: int
+        :raises ValueError: если max_size не больше нуля.
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size"))
+        if max_size <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size"))
+        self.__values: LruCache = LruCache(max_size)
+
+    def get(self, key: str) -> bytes | None:
+        item = self.__values.get(key)
+        if item is MISSING:
+            return None
+        expires, value = item
+        if expires and expires <= time.monotonic():
+            return None
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float = 0) -> None:
+        expires = time.monotonic() + ttl if ttl > 0 else 0
+        self.__values.put(key, (expires, value))
+
+    def __len__(self) -> int:
+        return len(self.__values)
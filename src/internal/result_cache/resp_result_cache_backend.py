@@ -0,0 +1,165 @@
+import os
+import socket
+import threading
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from src.internal.constants import DEFAULT_RESULT_CACHE_TIMEOUT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.result_cache.result_cache_backend import ResultCacheBackend
+
+DEFAULT_RESP_PORT = 6379
+"""Порт сервера с протоколом Redis по умолчанию."""
+
+
+class RespServerError(ConnectionError):
+    """Исключение для ответа сервера кэша результатов с ошибкой."""
+
+
+class RespResultCacheBackend(ResultCacheBackend):
+    """Хранилище кэша результатов на сервере, совместимом с протоколом Redis
+    (RESP): Redis, Valkey, KeyDB и т.п. Хранилище общее для всех процессов и
+    узлов приложения, подключенных к серверу; количество значений и их
+    вытеснение определяются настройками сервера (maxmemory-policy).
+
+    Клиент протокола встроен в класс и использует команды GET и SET, поэтому
+    пакет redis не требуется. Процесс использует одно соединение; после
+    ошибки соединения оно открывается заново при следующем обращении."""
+
+    def __init__(self, url: str, timeout: float = DEFAULT_RESULT_CACHE_TIMEOUT):
+        """Конструктор класса
+
+        :param url: адрес сервера вида redis://[[user]:password@]host[:port][/db];
+        :type url: str
+        :param timeout: время (с) ожидания соединения и ответа сервера;
+        :type timeout: float
+        :raises ValueError: при некорректном адресе сервера.
+        """
+        try:
+            parts = urlsplit(url)
+            port = parts.port or DEFAULT_RESP_PORT
+            db = int(parts.path.strip("/") or 0)
+        except ValueError:
+            raise ValueError(ErrMsgTmpl.INVALID_RESULT_CACHE_URL.format(url))
+        if parts.scheme != "redis" or not parts.hostname:
+            raise ValueError(ErrMsgTmpl.INVALID_RESULT_CACHE_URL.format(url))
+        self.__address: tuple[str, int] = (parts.hostname, port)
+        self.__username: str | None = unquote(parts.username or "") or None
+        self.__password: str | None = (
+            unquote(parts.password) if parts.password is not None else None
+        )
+        self.__db: int = db
+        self.__timeout: float = timeout
+        self.__socket: socket.socket | None = None
+        self.__reader = None
+        self.__pid: int | None = None
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        return self.__execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float = 0) -> None:
+        if ttl > 0:
+            self.__execute("SET", key, value, "PX", max(1, int(ttl * 1000)))
+        else:
+            self.__execute("SET", key, value)
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__disconnect()
+
+    def __execute(self, *args: Any) -> Any:
+        """Отправляет команду серверу и возвращает ответ, открывая соединение
+        при необходимости."""
+        with self.__lock:
+            if self.__socket is None or self.__pid != os.getpid():
+                try:
+                    self.__connect()
+                except OSError:
+                    self.__disconnect()
+                    raise
+            try:
+                return self.__command(*args)
+            except RespServerError:
+                raise
+            except (OSError, ValueError):
+                self.__disconnect()
+                raise
+
+    def __connect(self) -> None:
+        """Открывает соединение с сервером и выбирает базу данных."""
+        self.__socket = socket.create_connection(self.__address, self.__timeout)
+        self.__reader = self.__socket.makefile("rb")
+        self.__pid = os.getpid()
+        if self.__password is not None:
+            if self.__username is not None:
+                self.__command("AUTH", self.__username, self.__password)
+            else:
+                self.__command("AUTH", self.__password)
+        if self.__db:
+            self.__command("SELECT", self.__db)
+
+    def __disconnect(self) -> None:
+        """Закрывает соединение с сервером. Соединение, унаследованное от
+        родительского процесса, не закрывается, чтобы не нарушить его работу
+        в родительском процессе."""
+        if self.__socket is not None and self.__pid == os.getpid():
+            self.__reader.close()
+            self.__socket.close()
+        self.__socket = None
+        self.__reader = None
+
+    def __command(self, *args: Any) -> Any:
+        """Отправляет команду и читает ответ сервера."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode()
+            elif isinstance(arg, int):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self.__socket.sendall(b"".join(parts))
+        reply = self.__read_reply()
+        if isinstance(reply, RespServerError):
+            raise reply
+        return reply
+
+    def __read_reply(self) -> Any:
+        """Читает ответ сервера. Ответ с ошибкой возвращается исключением
+        RespServerError, чтобы прочитать ответ целиком."""
+        line = self.__reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError(ErrMsgTmpl.RESULT_CACHE_SERVER_ERROR.format(line))
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode()
+        if prefix == b"-":
+            return RespServerError(
+                ErrMsgTmpl.RESULT_CACHE_SERVER_ERROR.format(payload.decode())
+            )
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self.__reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError(ErrMsgTmpl.RESULT_CACHE_SERVER_ERROR.format(data))
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self.__read_reply() for _ in range(length)]
+        raise ConnectionError(ErrMsgTmpl.RESULT_CACHE_SERVER_ERROR.format(line))
+
+
+if __name__ == "__main__":
+    backend = RespResultCacheBackend("redis://localhost:6379/0")
+    try:
+        backend.set("algoscalc:example", b"value", ttl=10)
+        print(backend.get("algoscalc:example"))
+    except OSError as ex:
+        print(ex)
+    backend.close()
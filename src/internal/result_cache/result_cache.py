@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from src.internal.constants import DEFAULT_RESULT_CACHE_MAX_ITEM_SIZE
+from src.internal.data_dimension.compact_array import CompactArray
+from src.internal.result_cache.result_cache_backend import ResultCacheBackend
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+logger = logging.getLogger(__name__)
+
+
+def get_values_digest(values: dict[str, Any]) -> str | None:
+    """Возвращает хеш значений входных данных по их представлению в JSON,
+    поэтому значения разных типов (1 и 1.0, true и 1) имеют разные хеши.
+    Значения в CompactArray хешируются так же, как те же значения в списках,
+    поэтому хеш не зависит от формата запроса; строки матрицы преобразуются
+    в JSON по одной.
+
+    :param values: словарь значений входных данных по их именам;
+    :type values: dict[str, Any]
+    :return: хеш значений или None, если значения нельзя представить в JSON.
+    :rtype: str or None
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for name in sorted(values):
+        value = values[name]
+        digest.update(json.dumps(name).encode())
+        if isinstance(value, CompactArray) and value.offsets is not None:
+            digest.update(b"J[")
+            for row_idx, row in enumerate(value):
+                if row_idx:
+                    digest.update(b",")
+                digest.update(json.dumps(row, separators=(",", ":")).encode())
+            digest.update(b"]\n")
+            continue
+        if isinstance(value, CompactArray):
+            value = value.tolist()
+        try:
+            data = json.dumps(value, separators=(",", ":")).encode()
+        except (TypeError, ValueError):
+            return None
+        digest.update(b"J" + data + b"\n")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Класс кэширует результаты выполнения алгоритмов в хранилище
+    ResultCacheBackend по имени алгоритма, хэшу его кода и значениям входных
+    данных.
+    Результаты хранятся в формате JSON (значения NaN и бесконечности - как
+    NaN и Infinity) и при чтении проверяются схемой DataElementSchema, поэтому
+    содержимое хранилища не может выполнить код в приложении. Ошибки
+    хранилища не прерывают выполнение алгоритмов: результат считается
+    отсутствующим в кэше, а ошибка записывается в лог."""
+
+    def __init__(
+        self,
+        backend: ResultCacheBackend,
+        namespace: str = "",
+        ttl: float = 0,
+        max_item_size: int = DEFAULT_RESULT_CACHE_MAX_ITEM_SIZE,
+    ):
+        """Конструктор класса
+
+        :param backend: хранилище кэша;
+        :type backend: ResultCacheBackend
+        :param namespace: пространство имен ключей, например версия приложения
+            и имя арендатора;
+        :type namespace: str
+        :param ttl: срок хранения результата (с), 0 - без ограничения;
+        :type ttl: float
+        :param max_item_size: наибольший размер сериализованного результата
+            (байт), результаты большего размера не кэшируются;
+        :type max_item_size: int
+        """
+        self.__backend: ResultCacheBackend = backend
+        self.__namespace: str = namespace
+        self.__ttl: float = ttl
+        self.__max_item_size: int = max_item_size
+
+    @property
+    def backend(self) -> ResultCacheBackend:
+        """Возвращает хранилище кэша."""
+        return self.__backend
+
+    def get_key(
+        self, algorithm_name: str, algorithm_digest: str, values: dict[str, Any]
+    ) -> str | None:
+        """Возвращает ключ результата выполнения алгоритма. Ключ включает хэш
+        содержимого каталога алгоритма, поэтому после изменения кода алгоритма
+        сохраненные ранее результаты не используются.
+
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param algorithm_digest: хэш содержимого каталога алгоритма;
+        :type algorithm_digest: str
+        :param values: словарь значений входных данных по их именам;
+        :type values: dict[str, Any]
+        :return: ключ или None, если результат нельзя кэшировать.
+        :rtype: str or None
+        """
+        digest = get_values_digest(values)
+        if digest is None:
+            return None
+        return (
+            f"algoscalc:{self.__namespace}:{algorithm_name}:"
+            f"{algorithm_digest}:{digest}"
+        )
+
+    def get(self, key: str) -> list[DataElementSchema] | None:
+        """Возвращает результат из кэша.
+
+        :param key: ключ результата;
+        :type key: str
+        :return: результат или None, если его нет в кэше.
+        :rtype: list[DataElementSchema] or None
+        """
+        try:
+            data = self.__backend.get(key)
+            if data is None:
+                return None
+            return [DataElementSchema.model_validate(item) for item in from_json(data)]
+        except Exception as ex:
+            logger.warning(str(ex))
+            return None
+
+    def put(self, key: str, result: list[DataElementSchema]) -> None:
+        """Сохраняет результат в кэше.
+
+        :param key: ключ результата;
+        :type key: str
+        :param result: результат выполнения алгоритма;
+        :type result: list[DataElementSchema]
+        """
+        try:
+            data = to_json(
+                [{"name": item.name, "value": item.value} for item in result],
+                inf_nan_mode="constants",
+            )
+            if len(data) > self.__max_item_size:
+                return
+            self.__backend.set(key, data, self.__ttl)
+        except Exception as ex:
+            logger.warning(str(ex))
@@ -0,0 +1,32 @@
+class ResultCacheBackend:
+    """Базовый класс хранилища кэша результатов. Хранилище сохраняет
+    сериализованные результаты по строковым ключам; методы вызываются из
+    рабочих потоков планировщика и должны быть потокобезопасны. Ошибки
+    доступа к хранилищу передаются вызывающему коду исключениями OSError или
+    sqlite3.Error."""
+
+    def get(self, key: str) -> bytes | None:
+        """Возвращает значение по ключу.
+
+        :param key: ключ значения;
+        :type key: str
+        :return: значение или None, если значения нет или срок его хранения
+            истек.
+        :rtype: bytes or None
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: float = 0) -> None:
+        """Сохраняет значение по ключу.
+
+        :param key: ключ значения;
+        :type key: str
+        :param value: значение;
+        :type value: bytes
+        :param ttl: срок хранения значения (с), 0 - без ограничения;
+        :type ttl: float
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
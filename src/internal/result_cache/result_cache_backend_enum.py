@@ -0,0 +1,16 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class ResultCacheBackendEnum(LowercaseStrEnum):
+    """Перечисление хранилищ кэша результатов. Значение MEMORY соответствует
+    хранению в памяти процесса приложения, SQLITE - в файле SQLite, общем для
+    процессов приложения на одном узле, RESP - на сервере, совместимом с
+    протоколом Redis.
+
+    """
+
+    MEMORY = auto()
+    SQLITE = auto()
+    RESP = auto()
@@ -0,0 +1,174 @@
+import os
+import sqlite3
+import threading
+import time
+
+from src.internal.constants import (
+    DEFAULT_RESULT_CACHE_EVICTION_INTERVAL,
+    DEFAULT_RESULT_CACHE_SIZE,
+    DEFAULT_RESULT_CACHE_TIMEOUT,
+    DEFAULT_RESULT_CACHE_TOUCH_INTERVAL,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.result_cache.result_cache_backend import ResultCacheBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS result_cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS result_cache_accessed ON result_cache (accessed);
+"""
+"""Схема базы данных кэша результатов."""
+
+
+class SqliteResultCacheBackend(ResultCacheBackend):
+    """Хранилище кэша результатов в файле SQLite, общем для всех процессов
+    приложения на одном узле. Хранит около max_size значений и вытесняет
+    давно не использованные. Чтобы чтение и запись не требовали лишних
+    обращений к файлу, время использования значения обновляется при чтении не
+    чаще чем через touch_interval секунд, а лишние и устаревшие значения
+    вытесняются пачкой после каждых eviction_interval сохранений в процессе,
+    поэтому между вытеснениями количество значений может превышать max_size.
+    База данных работает в режиме WAL, поэтому чтение не блокируется записью
+    других процессов. Процесс использует одно соединение; в процессе,
+    созданном копированием (fork), соединение открывается заново."""
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = DEFAULT_RESULT_CACHE_SIZE,
+        timeout: float = DEFAULT_RESULT_CACHE_TIMEOUT,
+        touch_interval: float = DEFAULT_RESULT_CACHE_TOUCH_INTERVAL,
+        eviction_interval: int = DEFAULT_RESULT_CACHE_EVICTION_INTERVAL,
+    ):
+        """Конструктор класса
+
+        :param path: путь к файлу базы данных;
+        :type path: str
+        :param max_size: наибольшее количество значений;
+        :type max_size: int
+        :param timeout: время (с) ожидания блокировки базы данных другим
+            процессом;
+        :type timeout: float
+        :param touch_interval: время (с), через которое обновляется время
+            использования значения при чтении;
+        :type touch_interval: float
+        :param eviction_interval: количество сохранений значений, через
+            которое вытесняются лишние и устаревшие значения;
+        :type eviction_interval: int
+        :raises ValueError: если max_size или eviction_interval не больше
+            нуля.
+        """
+        for name, value in [
+            ("max_size", max_size),
+            ("eviction_interval", eviction_interval),
+        ]:
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format(name))
+            if value <= 0:
+                raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format(name))
+        self.__path: str = path
+        self.__max_size: int = max_size
+        self.__timeout: float = timeout
+        self.__touch_interval: float = touch_interval
+        self.__eviction_interval: int = eviction_interval
+        self.__inserts: int = 0
+        self.__connection: sqlite3.Connection | None = None
+        self.__pid: int | None = None
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self.__lock:
+            connection = self.__connect()
+            row = connection.execute(
+                "SELECT value, expires, accessed FROM result_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires, accessed = row
+            if expires and expires <= now:
+                connection.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+                return None
+            if now - accessed >= self.__touch_interval:
+                connection.execute(
+                    "UPDATE result_cache SET accessed = ? WHERE key = ?", (now, key)
+                )
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float = 0) -> None:
+        now = time.time()
+        expires = now + ttl if ttl > 0 else 0
+        with self.__lock:
+            connection = self.__connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO result_cache VALUES (?, ?, ?, ?)",
+                (key, value, expires, now),
+            )
+            self.__inserts += 1
+            if self.__inserts >= self.__eviction_interval:
+                self.__inserts = 0
+                self.__evict(connection, now)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__connection is not None and self.__pid == os.getpid():
+                self.__connection.close()
+            self.__connection = None
+
+    def __len__(self) -> int:
+        with self.__lock:
+            connection = self.__connect()
+            row = connection.execute("SELECT COUNT(*) FROM result_cache").fetchone()
+        return row[0]
+
+    def __evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Удаляет устаревшие значения и давно не использованные значения
+        сверх max_size."""
+        connection.execute(
+            "DELETE FROM result_cache WHERE expires > 0 AND expires <= ?", (now,)
+        )
+        (count,) = connection.execute("SELECT COUNT(*) FROM result_cache").fetchone()
+        if count > self.__max_size:
+            connection.execute(
+                "DELETE FROM result_cache WHERE key IN "
+                "(SELECT key FROM result_cache ORDER BY accessed LIMIT ?)",
+                (count - self.__max_size,),
+            )
+
+    def __connect(self) -> sqlite3.Connection:
+        """Возвращает соединение текущего процесса с базой данных, открывая
+        его при необходимости."""
+        if self.__connection is not None and self.__pid == os.getpid():
+            return self.__connection
+        connection = sqlite3.connect(
+            self.__path,
+            timeout=self.__timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        self.__connection = connection
+        self.__pid = os.getpid()
+        return connection
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "result_cache.sqlite3")
+    backend = SqliteResultCacheBackend(path, max_size=2, eviction_interval=1)
+    for idx in range(3):
+        backend.set(f"key{idx}", b"value")
+    print(backend.get("key0"), backend.get("key2"), len(backend))
+    backend.close()
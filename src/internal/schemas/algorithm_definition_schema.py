@@ -5,16 +5,21 @@ from pydantic import ConfigDict, model_validator
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.schemas.data_definition_schema import DataDefinitionSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
+from src.internal.schemas.execution_limits_schema import ExecutionLimitsSchema
 
 
 class AlgorithmDefinitionSchema(DefinitionSchema):
     """Класс представляет описание алгоритма, структуры его входных и
-    выходных данных."""
+    выходных данных. Признак deterministic со значением False означает, что
+    результат алгоритма зависит не только от входных данных и не берется из
+    кэша результатов; по умолчанию алгоритм считается детерминированным."""
 
     model_config = ConfigDict(frozen=True)
 
     parameters: list[DataDefinitionSchema]
     outputs: list[DataDefinitionSchema]
+    limits: ExecutionLimitsSchema | None = None
+    deterministic: bool | None = None
 
     def __str__(self) -> str:
         """Возвращает строковое представление экземпляра класса."""
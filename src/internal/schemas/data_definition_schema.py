@@ -1,11 +1,13 @@
 from typing import Self
 
-from pydantic import ConfigDict, model_validator
+from pydantic import ConfigDict, PositiveInt, model_validator
 
+from src.internal.data_dimension.compact_array import TYPECODES
 from src.internal.data_dimension.data_dimension import DataDimension
 from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
 from src.internal.data_dimension.data_shape_enum import DataShapeEnum
 from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.schemas.definition_schema import DefinitionSchema
 
 ValueType = int | float | str | bool
@@ -16,13 +18,24 @@ OptionalValueMatrixType = ValueMatrixType | None
 
 
 class DataDefinitionSchema(DefinitionSchema, DataDimension):
-    """Класс представляет описание элемента входных или выходных данных для алгоритма"""
+    """Класс представляет описание элемента входных или выходных данных для алгоритма.
+    Необязательные ограничения размера: max_length - количество элементов списка,
+    max_rows и max_cols - количество строк и элементов строки матрицы,
+    max_str_len - длина строк. Признак compact означает, что функция алгоритма
+    принимает значение списка или матрицы типа INT, FLOAT или BOOL в
+    компактном виде (CompactArray), если оно так получено, без преобразования
+    во вложенные списки."""
 
     model_config = ConfigDict(frozen=True)
 
     data_type: DataTypeEnum
     data_shape: DataShapeEnum
     default_value: ValueType | ValueListType | ValueMatrixType
+    max_length: PositiveInt | None = None
+    max_rows: PositiveInt | None = None
+    max_cols: PositiveInt | None = None
+    max_str_len: PositiveInt | None = None
+    compact: bool | None = None
 
     def __str__(self) -> str:
         """Возвращает строковое представление экземпляра класса"""
@@ -33,9 +46,30 @@ class DataDefinitionSchema(DefinitionSchema, DataDimension):
 
     @model_validator(mode="after")
     def validate_default_value(self) -> Self:
-        """Проверяет, что значение по умолчанию соответствует указанным типу
-        и размерности данных"""
-        error = DataDimensionChecker.check_value(self, self.default_value)
+        """Проверяет, что ограничения размера и признак compact применимы к
+        типу и размерности данных, а значение по умолчанию соответствует
+        указанным типу, размерности и ограничениям размера данных"""
+        for name, applicable in [
+            ("max_length", self.data_shape == DataShapeEnum.LIST),
+            ("max_rows", self.data_shape == DataShapeEnum.MATRIX),
+            ("max_cols", self.data_shape == DataShapeEnum.MATRIX),
+            ("max_str_len", self.data_type == DataTypeEnum.STRING),
+        ]:
+            if getattr(self, name) is not None and not applicable:
+                raise ValueError(
+                    ErrMsgTmpl.INAPPLICABLE_SIZE_LIMIT.format(
+                        name, self.data_type, self.data_shape
+                    )
+                )
+        if self.compact and (
+            self.data_type not in TYPECODES or self.data_shape == DataShapeEnum.SCALAR
+        ):
+            raise ValueError(
+                ErrMsgTmpl.INAPPLICABLE_COMPACT.format(self.data_type, self.data_shape)
+            )
+        error = DataDimensionChecker.check_value(
+            self, self.default_value
+        ) or DataDimensionChecker.check_size(self, self.default_value)
         if error:
             raise ValueError(error)
         return self
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+
+
+class ExecutionLimitsSchema(BaseModel):
+    """Класс представляет ограничения ресурсов для выполнения алгоритма.
+    Ограничения памяти и процессорного времени применяются при выполнении
+    алгоритмов в отдельных процессах, время выполнения ограничивается всегда."""
+
+    model_config = ConfigDict(frozen=True)
+
+    memory_limit: PositiveInt | None = Field(
+        None,
+        description="Объем памяти (МБ), который алгоритм может выделить сверх "
+        "памяти, занятой рабочим процессом",
+    )
+    cpu_limit: PositiveInt | None = Field(
+        None, description="Процессорное время (с) на одно выполнение алгоритма"
+    )
+    timeout: PositiveInt | None = Field(
+        None,
+        description="Время (с), отведенное на одно выполнение алгоритма, вместо "
+        "общего таймаута выполнения",
+    )
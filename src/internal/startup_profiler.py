@@ -0,0 +1,189 @@
+"""Модуль с профилировщиком запуска приложения. Профилировщик измеряет время
+импорта модулей и этапов сборки приложения и сохраняет их в формате Chrome
+Trace Event (chrome://tracing, Perfetto, speedscope), пригодном для
+построения flame graph. Модуль импортирует только стандартную библиотеку и
+перечисление этапов запуска, чтобы профилировщик можно было запустить до
+импорта остальных модулей приложения."""
+
+import builtins
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Iterator
+
+from src.internal.startup_stage_enum import StartupStageEnum
+
+
+class StartupProfiler:
+    """Класс записывает интервалы времени этапов запуска приложения. Пока
+    профилировщик не запущен, метод span не выполняет измерений. Запущенный
+    профилировщик также измеряет время каждого импорта модуля, подменяя
+    встроенную функцию __import__."""
+
+    def __init__(self):
+        """Конструктор класса"""
+        self.__enabled: bool = False
+        self.__started: float = 0.0
+        self.__events: list[dict[str, Any]] = []
+        self.__totals: dict[str, float] = {}
+        self.__local = threading.local()
+        self.__original_import = None
+        self.__lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Возвращает признак того, что профилировщик запущен."""
+        return self.__enabled
+
+    def start(self) -> None:
+        """Запускает профилировщик и измерение времени импорта модулей."""
+        if self.__enabled:
+            return
+        self.__events = []
+        self.__totals = {}
+        self.__started = time.perf_counter()
+        self.__original_import = builtins.__import__
+        builtins.__import__ = self.__timed_import
+        self.__enabled = True
+
+    def stop(self) -> None:
+        """Останавливает профилировщик и восстанавливает функцию __import__."""
+        if not self.__enabled:
+            return
+        builtins.__import__ = self.__original_import
+        self.__original_import = None
+        self.__enabled = False
+
+    def span(
+        self, stage: StartupStageEnum, name: str | None = None
+    ) -> contextlib.AbstractContextManager:
+        """Возвращает контекстный менеджер, измеряющий время этапа запуска.
+
+        :param stage: этап запуска;
+        :type stage: StartupStageEnum
+        :param name: название интервала, по умолчанию - название этапа;
+        :type name: str or None
+        :return: контекстный менеджер.
+        :rtype: contextlib.AbstractContextManager
+        """
+        if not self.__enabled:
+            return contextlib.nullcontext()
+        return self.__measure(stage, name or str(stage))
+
+    def get_summary(self) -> dict[str, float]:
+        """Возвращает суммарное время (с) каждого этапа запуска. Интервалы,
+        вложенные в интервал того же этапа, не учитываются повторно.
+
+        :return: словарь времени по названиям этапов.
+        :rtype: dict[str, float]
+        """
+        with self.__lock:
+            return dict(self.__totals)
+
+    def get_trace(self) -> dict[str, Any]:
+        """Возвращает записанные интервалы в формате Chrome Trace Event.
+
+        :return: словарь с событиями traceEvents и итогами по этапам.
+        :rtype: dict[str, Any]
+        """
+        with self.__lock:
+            events = list(self.__events)
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"summary": self.get_summary()},
+        }
+
+    def write(self, path: str) -> None:
+        """Сохраняет записанные интервалы в файл в формате Chrome Trace Event.
+
+        :param path: путь к файлу;
+        :type path: str
+        """
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.get_trace(), trace_file)
+
+    @contextlib.contextmanager
+    def __measure(self, stage: StartupStageEnum, name: str) -> Iterator[None]:
+        """Измеряет время выполнения блока кода и записывает интервал."""
+        nested = self.__enter(stage)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__exit(stage, name, start, nested)
+
+    def __timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Заменяет встроенную функцию __import__: измеряет время импорта, если
+        при импорте загружаются новые модули."""
+        original_import = self.__original_import
+        module_name = name
+        if level > 0:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                module_name = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                module_name = name
+        if module_name in sys.modules and not fromlist:
+            return original_import(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        nested = self.__enter(StartupStageEnum.IMPORT)
+        start = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            if len(sys.modules) == loaded:
+                module_name = None
+            self.__exit(StartupStageEnum.IMPORT, module_name, start, nested)
+
+    def __enter(self, stage: StartupStageEnum) -> bool:
+        """Отмечает начало интервала этапа. Возвращает True, если интервал
+        вложен в интервал того же этапа в текущем потоке."""
+        stack = getattr(self.__local, "stack", None)
+        if stack is None:
+            stack = self.__local.stack = []
+        nested = stage in stack
+        stack.append(stage)
+        return nested
+
+    def __exit(
+        self, stage: StartupStageEnum, name: str | None, start: float, nested: bool
+    ) -> None:
+        """Отмечает окончание интервала этапа и записывает его, если задано
+        название интервала."""
+        duration = time.perf_counter() - start
+        self.__local.stack.pop()
+        if name is None:
+            return
+        with self.__lock:
+            self.__events.append(
+                {
+                    "name": name,
+                    "cat": str(stage),
+                    "ph": "X",
+                    "ts": (start - self.__started) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+            if not nested:
+                self.__totals[str(stage)] = (
+                    self.__totals.get(str(stage), 0.0) + duration
+                )
+
+
+startup_profiler = StartupProfiler()
+"""Общий для приложения профилировщик запуска."""
+
+
+if __name__ == "__main__":
+    startup_profiler.start()
+    with startup_profiler.span(StartupStageEnum.APP):
+        import wave  # noqa: F401
+    startup_profiler.stop()
+    print(startup_profiler.get_summary())
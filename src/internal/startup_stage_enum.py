@@ -0,0 +1,18 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class StartupStageEnum(LowercaseStrEnum):
+    """Перечисление этапов запуска приложения. Значение IMPORT соответствует
+    импорту модулей, DEFINITION - разбору файлов описания алгоритмов, TESTS -
+    выполнению тестов алгоритмов, DEFAULTS - тестовому выполнению алгоритмов
+    со значениями по умолчанию, APP - созданию экземпляра приложения.
+
+    """
+
+    IMPORT = auto()
+    DEFINITION = auto()
+    TESTS = auto()
+    DEFAULTS = auto()
+    APP = auto()
@@ -0,0 +1,40 @@
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+
+
+class Tenant:
+    """Класс представляет арендатора приложения (например, учебный курс):
+    собственный набор алгоритмов и планировщик их выполнения с собственными
+    ограничениями параллельности. Одинаковые алгоритмы разных арендаторов
+    загружаются в процесс один раз."""
+
+    def __init__(
+        self, name: str, algorithms: AlgorithmCollection, scheduler: AlgorithmScheduler
+    ):
+        """Конструктор класса
+
+        :param name: имя арендатора;
+        :type name: str
+        :param algorithms: набор алгоритмов арендатора;
+        :type algorithms: AlgorithmCollection
+        :param scheduler: планировщик выполнения алгоритмов арендатора;
+        :type scheduler: AlgorithmScheduler
+        """
+        self.__name: str = name
+        self.__algorithms: AlgorithmCollection = algorithms
+        self.__scheduler: AlgorithmScheduler = scheduler
+
+    @property
+    def name(self) -> str:
+        """Возвращает имя арендатора."""
+        return self.__name
+
+    @property
+    def algorithms(self) -> AlgorithmCollection:
+        """Возвращает набор алгоритмов арендатора."""
+        return self.__algorithms
+
+    @property
+    def scheduler(self) -> AlgorithmScheduler:
+        """Возвращает планировщик выполнения алгоритмов арендатора."""
+        return self.__scheduler
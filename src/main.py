@@ -5,10 +5,123 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.config import LOGGING_CONFIG, Settings
+from src.config import Settings, TenantSettings, get_logging_config
 from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.algorithm_verifier import AlgorithmVerifier
+from src.internal.constants import DEFAULT_TENANT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.execution_backend import ExecutionBackend
+from src.internal.execution.execution_backend_enum import ExecutionBackendEnum
+from src.internal.execution.process_execution_backend import ProcessExecutionBackend
+from src.internal.execution.runtime_profile import RuntimeProfile
+from src.internal.execution_log import ExecutionLog
+from src.internal.log_queue import LogQueue
+from src.internal.metrics import MetricsRegistry
+from src.internal.result_cache.memory_result_cache_backend import (
+    MemoryResultCacheBackend,
+)
+from src.internal.result_cache.resp_result_cache_backend import RespResultCacheBackend
+from src.internal.result_cache.result_cache import ResultCache
+from src.internal.result_cache.result_cache_backend import ResultCacheBackend
+from src.internal.result_cache.result_cache_backend_enum import ResultCacheBackendEnum
+from src.internal.result_cache.sqlite_result_cache_backend import (
+    SqliteResultCacheBackend,
+)
+from src.internal.tenant import Tenant
+from src.middleware.body_size_limit_middleware import BodySizeLimitMiddleware
+from src.middleware.compression_enum import CompressionEnum
+from src.middleware.compression_middleware import CompressionMiddleware
+from src.middleware.tenant_middleware import TenantMiddleware
 from src.routers.algorithms import router as algorithms_router
 from src.routers.error_handlers import init_error_handlers
+from src.routers.metrics import router as metrics_router
+from src.routers.search import router as search_router
+from src.routers.sessions import router as sessions_router
+
+
+def create_result_cache_backend(settings: Settings) -> ResultCacheBackend | None:
+    """Создает хранилище кэша результатов, общее для всех арендаторов. Без
+    указанного хранилища (по умолчанию) результаты не кэшируются."""
+    backend_type = settings.RESULT_CACHE_BACKEND
+    if backend_type == ResultCacheBackendEnum.MEMORY:
+        return MemoryResultCacheBackend(settings.RESULT_CACHE_SIZE)
+    if backend_type == ResultCacheBackendEnum.SQLITE:
+        if not settings.RESULT_CACHE_PATH:
+            raise ValueError(
+                ErrMsgTmpl.RESULT_CACHE_SETTING_REQUIRED.format(
+                    backend_type, "RESULT_CACHE_PATH"
+                )
+            )
+        return SqliteResultCacheBackend(
+            settings.RESULT_CACHE_PATH, settings.RESULT_CACHE_SIZE
+        )
+    if backend_type == ResultCacheBackendEnum.RESP:
+        if not settings.RESULT_CACHE_URL:
+            raise ValueError(
+                ErrMsgTmpl.RESULT_CACHE_SETTING_REQUIRED.format(
+                    backend_type, "RESULT_CACHE_URL"
+                )
+            )
+        return RespResultCacheBackend(settings.RESULT_CACHE_URL)
+    return None
+
+
+def create_tenant(
+    name: str,
+    tenant_settings: TenantSettings,
+    settings: Settings,
+    metrics: MetricsRegistry,
+    execution_log: ExecutionLog | None,
+    verifier: AlgorithmVerifier,
+    entry_point_group: str | None = None,
+    result_cache_backend: ResultCacheBackend | None = None,
+) -> Tenant:
+    """Создает арендатора: набор алгоритмов его каталога и планировщик их
+    выполнения с ограничениями параллельности арендатора. Остальные параметры
+    выполнения общие для всех арендаторов. Ключи кэша результатов арендатора
+    включают версию приложения и имя арендатора."""
+    algorithms = AlgorithmCollection(
+        algorithms_catalog_path=tenant_settings.CATALOG_PATH,
+        execute_timeout=settings.EXECUTE_TIMEOUT,
+        execution_log=execution_log,
+        verifier=verifier,
+        snapshot_path=tenant_settings.CATALOG_SNAPSHOT_PATH or None,
+        snapshot_mmap=settings.CATALOG_SNAPSHOT_MMAP,
+        entry_point_group=entry_point_group,
+    )
+    backend = ExecutionBackend(algorithms)
+    if settings.EXECUTION_BACKEND == ExecutionBackendEnum.PROCESS:
+        backend = ProcessExecutionBackend(
+            algorithms,
+            memory_limit=settings.WORKER_MEMORY_LIMIT,
+            cpu_limit=settings.WORKER_CPU_LIMIT,
+            max_executions=settings.WORKER_MAX_EXECUTIONS,
+        )
+    result_cache = None
+    if result_cache_backend is not None:
+        result_cache = ResultCache(
+            result_cache_backend,
+            namespace=f"{settings.VERSION}:{name}",
+            ttl=settings.RESULT_CACHE_TTL,
+            max_item_size=settings.RESULT_CACHE_MAX_ITEM_SIZE,
+        )
+    scheduler = AlgorithmScheduler(
+        algorithms,
+        fast_lane_workers=tenant_settings.FAST_LANE_WORKERS,
+        slow_lane_workers=tenant_settings.SLOW_LANE_WORKERS,
+        fast_lane_threshold=settings.FAST_LANE_THRESHOLD,
+        ewma_alpha=settings.RUNTIME_EWMA_ALPHA,
+        metrics=metrics,
+        backend=backend,
+        runtime_profile=RuntimeProfile(
+            max_samples=settings.RUNTIME_PROFILE_SAMPLES,
+            timeout_factor=settings.ADAPTIVE_TIMEOUT_FACTOR,
+            min_samples=settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+        ),
+        result_cache=result_cache,
+    )
+    return Tenant(name, algorithms, scheduler)
 
 
 def create_app(settings: Settings = None) -> FastAPI:
@@ -17,9 +130,13 @@ def create_app(settings: Settings = None) -> FastAPI:
     if not settings:
         settings = Settings()
 
+    metrics = MetricsRegistry()
     logger = None
+    log_queue = None
     if settings.USE_LOGGER:
-        logging.config.dictConfig(LOGGING_CONFIG)
+        LogQueue.stop_active()
+        logging.config.dictConfig(get_logging_config(settings.LOG_FORMAT))
+        log_queue = LogQueue(settings.LOG_QUEUE_SIZE, metrics)
         logger = logging.getLogger(__name__)
         logger.setLevel(settings.LOG_LEVEL)
         logger.info("Start app")
@@ -31,11 +148,91 @@ def create_app(settings: Settings = None) -> FastAPI:
         version=settings.VERSION,
     )
     app.include_router(router=algorithms_router)
+    app.include_router(router=metrics_router)
+    app.include_router(router=search_router)
+    app.include_router(router=sessions_router)
     init_error_handlers(app, logger)
-    app.state.algorithms = AlgorithmCollection(
-        algorithms_catalog_path=settings.ALGORITHMS_CATALOG_PATH,
-        execute_timeout=settings.EXECUTE_TIMEOUT,
+    app.state.metrics = metrics
+    execution_log = None
+    if settings.EXECUTION_LOG_PATH:
+        execution_log = ExecutionLog(
+            settings.EXECUTION_LOG_PATH,
+            sample_rate=settings.EXECUTION_LOG_SAMPLE_RATE,
+            slow_threshold=settings.EXECUTION_LOG_SLOW_THRESHOLD,
+            batch_size=settings.EXECUTION_LOG_BATCH_SIZE,
+            max_bytes=settings.EXECUTION_LOG_MAX_BYTES,
+        )
+    verifier = AlgorithmVerifier(
+        settings.ALGORITHM_TESTS_CACHE_PATH or None,
+        workers=settings.ALGORITHM_TESTS_WORKERS,
+        timeout=settings.ALGORITHM_TESTS_TIMEOUT,
+        report_dir=settings.ALGORITHM_TESTS_REPORT_DIR or None,
+    )
+    default_tenant = TenantSettings(
+        CATALOG_PATH=settings.ALGORITHMS_CATALOG_PATH,
+        CATALOG_SNAPSHOT_PATH=settings.CATALOG_SNAPSHOT_PATH,
+        FAST_LANE_WORKERS=settings.FAST_LANE_WORKERS,
+        SLOW_LANE_WORKERS=settings.SLOW_LANE_WORKERS,
     )
+    result_cache_backend = create_result_cache_backend(settings)
+    app.state.tenants = {
+        DEFAULT_TENANT: create_tenant(
+            DEFAULT_TENANT,
+            default_tenant,
+            settings,
+            metrics,
+            execution_log,
+            verifier,
+            settings.ALGORITHMS_ENTRY_POINT_GROUP or None,
+            result_cache_backend,
+        )
+    }
+    for name, tenant_settings in settings.TENANTS.items():
+        app.state.tenants[name] = create_tenant(
+            name,
+            tenant_settings,
+            settings,
+            metrics,
+            execution_log,
+            verifier,
+            result_cache_backend=result_cache_backend,
+        )
+    # Поток журнала запускается после создания арендаторов, чтобы шаблонные
+    # процессы рабочих процессов копировались из однопоточного процесса.
+    if log_queue is not None:
+        log_queue.start()
+    app.state.algorithms = app.state.tenants[DEFAULT_TENANT].algorithms
+    app.state.scheduler = app.state.tenants[DEFAULT_TENANT].scheduler
+    for tenant in app.state.tenants.values():
+        app.add_event_handler("shutdown", tenant.scheduler.shutdown)
+    if result_cache_backend is not None:
+        app.add_event_handler("shutdown", result_cache_backend.close)
+    if execution_log is not None:
+        app.add_event_handler("shutdown", execution_log.flush)
+    if log_queue is not None:
+        app.add_event_handler("shutdown", log_queue.stop)
+
+    if settings.COMPRESSION_ENCODINGS:
+        app.add_middleware(
+            CompressionMiddleware,
+            metrics=app.state.metrics,
+            encodings=settings.COMPRESSION_ENCODINGS,
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            streaming_size=settings.COMPRESSION_STREAMING_SIZE,
+            levels={
+                CompressionEnum.GZIP: settings.GZIP_COMPRESSION_LEVEL,
+                CompressionEnum.BR: settings.BROTLI_COMPRESSION_LEVEL,
+                CompressionEnum.ZSTD: settings.ZSTD_COMPRESSION_LEVEL,
+            },
+        )
+
+    if settings.MAX_REQUEST_BODY_SIZE > 0:
+        app.add_middleware(
+            BodySizeLimitMiddleware, max_size=settings.MAX_REQUEST_BODY_SIZE
+        )
+
+    if settings.TENANTS:
+        app.add_middleware(TenantMiddleware, tenants=settings.TENANTS.keys())
 
     if settings.BACKEND_CORS_ORIGINS:
         app.add_middleware(
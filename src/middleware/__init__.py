@@ -0,0 +1,2 @@
+"""Пакет содержит промежуточные обработчики (middleware) HTTP-запросов
+приложения."""
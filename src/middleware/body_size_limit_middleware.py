@@ -0,0 +1,63 @@
+from starlette import status
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.internal.constants import DEFAULT_MAX_REQUEST_BODY_SIZE
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+
+class BodySizeLimitMiddleware:
+    """Промежуточный обработчик ограничивает размер тела запроса. Запрос с
+    заголовком Content-Length больше ограничения отклоняется с кодом 413 без
+    чтения тела. Тело без заголовка Content-Length (например, при передаче
+    частями) подсчитывается по мере чтения: при превышении ограничения чтение
+    прерывается ошибкой HTTPException с кодом 413, поэтому тело не
+    накапливается в памяти целиком."""
+
+    def __init__(self, app: ASGIApp, max_size: int = DEFAULT_MAX_REQUEST_BODY_SIZE):
+        """Конструктор класса
+
+        :param app: приложение ASGI;
+        :type app: ASGIApp
+        :param max_size: наибольший размер тела запроса в байтах;
+        :type max_size: int
+        :raises ValueError: при неположительном размере.
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool):
+            raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size"))
+        if max_size <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size"))
+        self.app = app
+        self.__max_size: int = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        detail = ErrMsgTmpl.REQUEST_TOO_LARGE.format(self.__max_size)
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.__max_size:
+                response = JSONResponse(
+                    {"detail": detail},
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                )
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.__max_size:
+                    raise HTTPException(
+                        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail
+                    )
+            return message
+
+        await self.app(scope, receive_limited, send)
@@ -0,0 +1,15 @@
+from enum import auto
+
+from strenum import LowercaseStrEnum
+
+
+class CompressionEnum(LowercaseStrEnum):
+    """Перечисление способов сжатия ответов, значения совпадают с кодировками
+    заголовка Accept-Encoding. Способы BR и ZSTD доступны при установленных
+    пакетах brotli и zstandard.
+
+    """
+
+    GZIP = auto()
+    BR = auto()
+    ZSTD = auto()
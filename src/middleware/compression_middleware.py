@@ -0,0 +1,354 @@
+import time
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.internal.constants import (
+    COMPRESSION_CHUNK_SIZE,
+    COMPRESSION_THREAD_SIZE,
+    DEFAULT_BROTLI_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_MIN_SIZE,
+    DEFAULT_COMPRESSION_STREAMING_SIZE,
+    DEFAULT_GZIP_COMPRESSION_LEVEL,
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.metrics import MetricsRegistry
+from src.middleware.compression_enum import CompressionEnum
+from src.middleware.compressors import (
+    Compressor,
+    create_compressor,
+    is_available,
+    validate_level,
+)
+
+DEFAULT_COMPRESSION_LEVELS = {
+    CompressionEnum.GZIP: DEFAULT_GZIP_COMPRESSION_LEVEL,
+    CompressionEnum.BR: DEFAULT_BROTLI_COMPRESSION_LEVEL,
+    CompressionEnum.ZSTD: DEFAULT_ZSTD_COMPRESSION_LEVEL,
+}
+"""Уровни сжатия по умолчанию для каждого способа сжатия."""
+
+UNCOMPRESSED_CONTENT_TYPES = ("text/event-stream",)
+"""Типы содержимого, которые не сжимаются: события должны доходить до
+клиента без задержки в буфере компрессора."""
+
+
+def negotiate_encoding(
+    accept_encoding: str, encodings: list[CompressionEnum]
+) -> CompressionEnum | None:
+    """Выбирает способ сжатия по заголовку Accept-Encoding. Выбирается способ с
+    наибольшим весом q, при равных весах - стоящий раньше в списке сервера.
+
+    :param accept_encoding: значение заголовка Accept-Encoding;
+    :type accept_encoding: str
+    :param encodings: поддерживаемые способы сжатия в порядке предпочтения;
+    :type encodings: list[CompressionEnum]
+    :return: способ сжатия или None, если сжатие не требуется.
+    :rtype: CompressionEnum or None
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Промежуточный обработчик сжимает тело ответа способом, выбранным по
+    заголовку Accept-Encoding запроса. Ответы меньше минимального размера
+    передаются без сжатия. Ответ, переданный одним сообщением, сжимается
+    целиком с указанием Content-Length, а начиная с размера потокового сжатия -
+    частями без Content-Length. Ответ из нескольких сообщений сжимается
+    потоково, каждое сообщение сбрасывается из буфера компрессора. Части тела
+    от COMPRESSION_THREAD_SIZE байт сжимаются в пуле потоков, чтобы не
+    блокировать цикл событий.
+
+    Для каждого сжатого ответа учитываются метрики compression.<способ>.ratio
+    (отношение размера сжатого тела к исходному) и compression.<способ>.cpu_time
+    (процессорное время сжатия, с).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: MetricsRegistry | None = None,
+        encodings: list[CompressionEnum] | None = None,
+        minimum_size: int = DEFAULT_COMPRESSION_MIN_SIZE,
+        streaming_size: int = DEFAULT_COMPRESSION_STREAMING_SIZE,
+        levels: dict[CompressionEnum, int] | None = None,
+    ):
+        """Конструктор класса
+
+        :param app: приложение ASGI;
+        :type app: ASGIApp
+        :param metrics: реестр метрик, по умолчанию создается новый;
+        :type metrics: MetricsRegistry or None
+        :param encodings: способы сжатия в порядке предпочтения, по умолчанию
+            gzip; способы без установленного пакета пропускаются;
+        :type encodings: list[CompressionEnum] or None
+        :param minimum_size: размер тела ответа (байт), начиная с которого
+            ответ сжимается;
+        :type minimum_size: int
+        :param streaming_size: размер тела ответа (байт), начиная с которого
+            ответ сжимается потоково;
+        :type streaming_size: int
+        :param levels: уровни сжатия по способам, для остальных способов
+            используются уровни по умолчанию;
+        :type levels: dict[CompressionEnum, int] or None
+        :raises ValueError: при некорректных значениях параметров.
+        """
+        if isinstance(minimum_size, bool) or not isinstance(minimum_size, int):
+            raise TypeError(ErrMsgTmpl.NEGATIVE_PARAM.format("minimum_size"))
+        if isinstance(streaming_size, bool) or not isinstance(streaming_size, int):
+            raise TypeError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("streaming_size"))
+        if minimum_size < 0:
+            raise ValueError(ErrMsgTmpl.NEGATIVE_PARAM.format("minimum_size"))
+        if streaming_size <= 0:
+            raise ValueError(ErrMsgTmpl.NON_POSITIVE_PARAM.format("streaming_size"))
+        if encodings is None:
+            encodings = [CompressionEnum.GZIP]
+        self.__levels: dict[CompressionEnum, int] = {
+            **DEFAULT_COMPRESSION_LEVELS,
+            **(levels or {}),
+        }
+        for encoding, level in self.__levels.items():
+            validate_level(encoding, level)
+        self.__app: ASGIApp = app
+        self.__metrics: MetricsRegistry = metrics or MetricsRegistry()
+        self.__encodings: list[CompressionEnum] = [
+            CompressionEnum(encoding)
+            for encoding in dict.fromkeys(encodings)
+            if is_available(CompressionEnum(encoding))
+        ]
+        self.__minimum_size: int = minimum_size
+        self.__streaming_size: int = streaming_size
+
+    @property
+    def encodings(self) -> list[CompressionEnum]:
+        """Возвращает доступные способы сжатия в порядке предпочтения."""
+        return list(self.__encodings)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.__encodings:
+            await self.__app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.__encodings
+        )
+        if encoding is None:
+            await self.__app(scope, receive, send)
+            return
+        responder = CompressionResponder(
+            send,
+            encoding,
+            self.__levels[encoding],
+            self.__minimum_size,
+            self.__streaming_size,
+            self.__metrics,
+        )
+        await self.__app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """Класс сжимает сообщения одного ответа и передает их дальше. Заголовки
+    ответа задерживаются до первого сообщения с телом, так как решение о сжатии
+    зависит от размера тела."""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: CompressionEnum,
+        level: int,
+        minimum_size: int,
+        streaming_size: int,
+        metrics: MetricsRegistry,
+    ):
+        """Конструктор класса
+
+        :param send: функция передачи сообщений ответа;
+        :type send: Send
+        :param encoding: способ сжатия;
+        :type encoding: CompressionEnum
+        :param level: уровень сжатия;
+        :type level: int
+        :param minimum_size: размер тела ответа, начиная с которого ответ
+            сжимается;
+        :type minimum_size: int
+        :param streaming_size: размер тела ответа, начиная с которого ответ
+            сжимается потоково;
+        :type streaming_size: int
+        :param metrics: реестр метрик;
+        :type metrics: MetricsRegistry
+        """
+        self.__send: Send = send
+        self.__encoding: CompressionEnum = encoding
+        self.__level: int = level
+        self.__minimum_size: int = minimum_size
+        self.__streaming_size: int = streaming_size
+        self.__metrics: MetricsRegistry = metrics
+        self.__start_message: Message | None = None
+        self.__compressor: Compressor | None = None
+        self.__passthrough: bool = False
+        self.__original_size: int = 0
+        self.__compressed_size: int = 0
+        self.__pending_size: int = 0
+        self.__cpu_time: float = 0.0
+
+    async def send(self, message: Message) -> None:
+        """Принимает очередное сообщение ответа.
+
+        :param message: сообщение ответа ASGI;
+        :type message: Message
+        """
+        if self.__passthrough:
+            await self.__send(message)
+        elif message["type"] == "http.response.start":
+            self.__start_message = message
+            if not self.__is_compressible(message):
+                self.__passthrough = True
+                await self.__send(message)
+        elif message["type"] != "http.response.body":
+            await self.__send(message)
+        elif self.__compressor is not None:
+            await self.__send_stream_part(message)
+        else:
+            await self.__send_first_part(message)
+
+    def __is_compressible(self, message: Message) -> bool:
+        """Проверяет, может ли ответ быть сжат."""
+        if message["status"] in (204, 304) or message["status"] < 200:
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";", 1)[0].strip()
+        return content_type.lower() not in UNCOMPRESSED_CONTENT_TYPES
+
+    async def __send_first_part(self, message: Message) -> None:
+        """Принимает первое сообщение с телом ответа и выбирает способ его
+        передачи: без сжатия, целиком или потоково."""
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body and len(body) < self.__minimum_size:
+            self.__passthrough = True
+            await self.__send(self.__start_message)
+            await self.__send(message)
+            return
+
+        self.__compressor = create_compressor(self.__encoding, self.__level)
+        headers = self.__update_headers()
+        if not more_body and len(body) < self.__streaming_size:
+            compressed = await self.__compress(body, final=True)
+            headers["Content-Length"] = str(len(compressed))
+            await self.__send(self.__start_message)
+            await self.__send({"type": "http.response.body", "body": compressed})
+            self.__observe()
+            return
+
+        del headers["Content-Length"]
+        await self.__send(self.__start_message)
+        if more_body:
+            await self.__send_stream_part(message)
+            return
+        view = memoryview(body)
+        for offset in range(0, len(body), COMPRESSION_CHUNK_SIZE):
+            chunk = await self.__compress(
+                view[offset : offset + COMPRESSION_CHUNK_SIZE]
+            )
+            if chunk:
+                await self.__send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+        await self.__send(
+            {
+                "type": "http.response.body",
+                "body": await self.__compress(b"", final=True),
+                "more_body": False,
+            }
+        )
+        self.__observe()
+
+    async def __send_stream_part(self, message: Message) -> None:
+        """Сжимает очередное сообщение потокового ответа."""
+        more_body = message.get("more_body", False)
+        body = await self.__compress(
+            message.get("body", b""), flush=more_body, final=not more_body
+        )
+        await self.__send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+        if not more_body:
+            self.__observe()
+
+    def __update_headers(self) -> MutableHeaders:
+        """Дополняет заголовки ответа сведениями о сжатии. Строгий ETag
+        заменяется слабым, так как сжатое тело отличается от исходного."""
+        headers = MutableHeaders(raw=self.__start_message["headers"])
+        headers["Content-Encoding"] = self.__encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return headers
+
+    async def __compress(
+        self, data: bytes, flush: bool = False, final: bool = False
+    ) -> bytes:
+        """Сжимает часть тела ответа. Если вместе с данными, еще не сброшенными
+        из буфера компрессора, набирается COMPRESSION_THREAD_SIZE байт, сжатие
+        выполняется в пуле потоков. При flush=True возвращаются все сжатые
+        данные переданных частей, при final=True сжатый поток завершается."""
+        self.__pending_size += len(data)
+        if self.__pending_size >= COMPRESSION_THREAD_SIZE:
+            compressed = await run_in_threadpool(
+                self.__compress_part, data, flush, final
+            )
+        else:
+            compressed = self.__compress_part(data, flush, final)
+        if flush or final:
+            self.__pending_size = 0
+        return compressed
+
+    def __compress_part(self, data: bytes, flush: bool, final: bool) -> bytes:
+        """Сжимает часть тела ответа с учетом размеров и процессорного
+        времени."""
+        start = time.thread_time()
+        compressed = self.__compressor.compress(data)
+        if final:
+            compressed += self.__compressor.finish()
+        elif flush:
+            compressed += self.__compressor.flush()
+        self.__cpu_time += time.thread_time() - start
+        self.__original_size += len(data)
+        self.__compressed_size += len(compressed)
+        return compressed
+
+    def __observe(self) -> None:
+        """Учитывает метрики сжатого ответа."""
+        prefix = f"compression.{self.__encoding}"
+        self.__metrics.increment(f"{prefix}.responses")
+        self.__metrics.increment(f"{prefix}.original_bytes", self.__original_size)
+        self.__metrics.increment(f"{prefix}.compressed_bytes", self.__compressed_size)
+        if self.__original_size > 0:
+            self.__metrics.observe(
+                f"{prefix}.ratio", self.__compressed_size / self.__original_size
+            )
+        self.__metrics.observe(f"{prefix}.cpu_time", self.__cpu_time)
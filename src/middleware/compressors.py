@@ -0,0 +1,175 @@
+"""Модуль с потоковыми компрессорами для сжатия тела ответа способами gzip,
+brotli и zstd. Пакеты brotli и zstandard необязательны: если пакет не
+установлен, соответствующий способ сжатия не поддерживается."""
+
+import zlib
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.middleware.compression_enum import CompressionEnum
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+COMPRESSION_LEVEL_RANGES = {
+    CompressionEnum.GZIP: (0, 9),
+    CompressionEnum.BR: (0, 11),
+    CompressionEnum.ZSTD: (1, 22),
+}
+"""Допустимые уровни сжатия для каждого способа."""
+
+
+class Compressor:
+    """Базовый класс потокового компрессора. Данные передаются частями методом
+    compress, метод flush возвращает сжатые данные, достаточные для распаковки
+    всего переданного, метод finish завершает сжатый поток."""
+
+    def compress(self, data: bytes) -> bytes:
+        """Сжимает очередную часть данных.
+
+        :param data: часть данных;
+        :type data: bytes
+        :return: доступная часть сжатых данных, может быть пустой.
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+    def flush(self) -> bytes:
+        """Возвращает сжатые данные для всех переданных частей без завершения
+        сжатого потока."""
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        """Возвращает оставшиеся сжатые данные и завершает сжатый поток."""
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    """Компрессор в формате gzip на основе модуля zlib."""
+
+    def __init__(self, level: int):
+        """Конструктор класса
+
+        :param level: уровень сжатия;
+        :type level: int
+        """
+        self.__compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self.__compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.__compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    """Компрессор в формате brotli на основе пакета brotli."""
+
+    def __init__(self, level: int):
+        """Конструктор класса
+
+        :param level: уровень сжатия;
+        :type level: int
+        """
+        self.__compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self.__compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.__compressor.finish()
+
+
+class ZstdCompressor(Compressor):
+    """Компрессор в формате zstd на основе пакета zstandard."""
+
+    def __init__(self, level: int):
+        """Конструктор класса
+
+        :param level: уровень сжатия;
+        :type level: int
+        """
+        self.__compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.__compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self.__compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self.__compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+COMPRESSORS = {
+    CompressionEnum.GZIP: GzipCompressor,
+    CompressionEnum.BR: BrotliCompressor,
+    CompressionEnum.ZSTD: ZstdCompressor,
+}
+"""Классы компрессоров для каждого способа сжатия."""
+
+
+def is_available(encoding: CompressionEnum) -> bool:
+    """Проверяет, установлен ли пакет для способа сжатия.
+
+    :param encoding: способ сжатия;
+    :type encoding: CompressionEnum
+    :return: True, если способ сжатия поддерживается.
+    :rtype: bool
+    """
+    if encoding == CompressionEnum.BR:
+        return brotli is not None
+    if encoding == CompressionEnum.ZSTD:
+        return zstandard is not None
+    return True
+
+
+def validate_level(encoding: CompressionEnum, level: int) -> None:
+    """Проверяет уровень сжатия для способа сжатия.
+
+    :param encoding: способ сжатия;
+    :type encoding: CompressionEnum
+    :param level: уровень сжатия;
+    :type level: int
+    :raises ValueError: если уровень сжатия вне допустимого диапазона.
+    """
+    low, high = COMPRESSION_LEVEL_RANGES[encoding]
+    if (
+        isinstance(level, bool)
+        or not isinstance(level, int)
+        or not low <= level <= high
+    ):
+        raise ValueError(
+            ErrMsgTmpl.INVALID_COMPRESSION_LEVEL.format(encoding, low, high)
+        )
+
+
+def create_compressor(encoding: CompressionEnum, level: int) -> Compressor:
+    """Создает компрессор для способа сжатия.
+
+    :param encoding: способ сжатия, пакет для которого установлен;
+    :type encoding: CompressionEnum
+    :param level: уровень сжатия;
+    :type level: int
+    :return: компрессор.
+    :rtype: Compressor
+    """
+    return COMPRESSORS[encoding](level)
+
+
+if __name__ == "__main__":
+    compressor = create_compressor(CompressionEnum.GZIP, 6)
+    data = compressor.compress(b"0123456789" * 1000) + compressor.finish()
+    print(len(data), len(zlib.decompress(data, 16 + zlib.MAX_WBITS)))
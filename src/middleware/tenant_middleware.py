@@ -0,0 +1,66 @@
+from typing import Iterable
+
+from starlette import status
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.websockets import WebSocketClose
+
+from src.internal.constants import TENANT_HEADER, TENANTS_ENDPOINT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+
+
+class TenantMiddleware:
+    """Промежуточный обработчик выбирает арендатора запроса по префиксу пути
+    /tenants/<арендатор> или, без префикса, по заголовку X-Tenant. Префикс
+    переносится в root_path, как при монтировании приложения, поэтому
+    маршруты арендаторов совпадают с маршрутами приложения. Имя арендатора
+    сохраняется в состоянии запроса (request.state.tenant); запросы без
+    арендатора выполняются с каталогом по умолчанию. На запросы к
+    неизвестному арендатору возвращается ответ 404, сессии WebSocket
+    закрываются."""
+
+    def __init__(
+        self, app: ASGIApp, tenants: Iterable[str], header: str = TENANT_HEADER
+    ):
+        """Конструктор класса
+
+        :param app: приложение ASGI;
+        :type app: ASGIApp
+        :param tenants: имена арендаторов;
+        :type tenants: Iterable[str]
+        :param header: заголовок запроса с именем арендатора;
+        :type header: str
+        """
+        self.app = app
+        self.__tenants: frozenset[str] = frozenset(tenants)
+        self.__header: str = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        root_path = scope.get("root_path", "")
+        path = scope["path"]
+        prefix = root_path + TENANTS_ENDPOINT + "/"
+        if path.startswith(prefix):
+            tenant = path[len(prefix) :].partition("/")[0]
+            scope = {**scope, "root_path": prefix + tenant}
+        else:
+            tenant = Headers(scope=scope).get(self.__header)
+        if tenant is not None and tenant not in self.__tenants:
+            await self.__reject(scope, receive, send, tenant)
+            return
+        scope["state"] = {**scope.get("state", {}), "tenant": tenant}
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def __reject(scope: Scope, receive: Receive, send: Send, tenant: str):
+        """Отвечает на запрос к неизвестному арендатору."""
+        if scope["type"] == "websocket":
+            await WebSocketClose(status.WS_1008_POLICY_VIOLATION)(scope, receive, send)
+            return
+        response = JSONResponse(
+            {"detail": ErrMsgTmpl.TENANT_NOT_EXISTS.format(tenant)}, status_code=404
+        )
+        await response(scope, receive, send)
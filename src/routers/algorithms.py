@@ -1,17 +1,218 @@
+import json
 import logging
-import math
+from typing import Any, Callable
 
-from fastapi import APIRouter, Body, Depends, Path, Request
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.requests import HTTPConnection
 
 from src.internal.algorithm_collection import AlgorithmCollection
-from src.internal.constants import ALGORITHMS_ENDPOINT
+from src.internal.constants import (
+    ALGORITHMS_ENDPOINT,
+    CLIENT_CLOSED_REQUEST,
+    DEFAULT_TENANT,
+    PRIORITY_HEADER,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import AlgorithmNotFoundError
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.priority_enum import PriorityEnum
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementsSchema
+from src.internal.tenant import Tenant
+from src.routers.codecs import (
+    decode,
+    is_available,
+    negotiate_media_type,
+    parse_media_type,
+)
+from src.routers.disconnect import run_until_disconnected
+from src.routers.events import EVENT_STREAM_HEADERS, stream_algorithm_events
+from src.routers.media_type_enum import MediaTypeEnum
+from src.routers.parameters_parser import ParametersParser
+from src.routers.responses import AlgorithmResultResponse, get_catalog_page_response
 from src.routers.schemas import AlgorithmsPageSchema, PaginateInputSchema
 
 
-def get_app_algorithms(request: Request) -> AlgorithmCollection:
-    return request.app.state.algorithms
+def get_app_tenant(connection: HTTPConnection) -> Tenant:
+    """Возвращает арендатора запроса, выбранного TenantMiddleware, или
+    арендатора по умолчанию."""
+    tenant = getattr(connection.state, "tenant", None) or DEFAULT_TENANT
+    return connection.app.state.tenants[tenant]
+
+
+def get_app_algorithms(request: HTTPConnection) -> AlgorithmCollection:
+    return get_app_tenant(request).algorithms
+
+
+def get_app_scheduler(request: HTTPConnection) -> AlgorithmScheduler:
+    return get_app_tenant(request).scheduler
+
+
+def get_raw_values(content: Any) -> dict[str, Any]:
+    """Возвращает значения входных данных по их именам из содержимого запроса,
+    еще не проверенного схемой DataElementsSchema. Элементы неожиданной
+    структуры пропускаются: они будут отклонены при проверке схемой.
+
+    :param content: разобранное содержимое запроса;
+    :type content: Any
+    :return: словарь значений входных данных по их именам.
+    :rtype: dict[str, Any]
+    """
+    if not isinstance(content, list):
+        return {}
+    return {
+        item["name"]: item.get("value")
+        for item in content
+        if isinstance(item, dict) and isinstance(item.get("name"), str)
+    }
+
+
+async def get_request_parameters(
+    request: Request,
+    algorithm_name: str = Path(..., description="Название алгоритма"),
+    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
+) -> DataElementsSchema:
+    """Разбирает тело запроса с входными данными алгоритма в формате,
+    указанном в заголовке Content-Type, и проверяет его схемой
+    DataElementsSchema. Без заголовка Content-Type тело разбирается как JSON.
+    Тело в формате JSON разбирается по мере получения (см. ParametersParser):
+    значения списков и матриц проверяются на соответствие типу и
+    ограничениям размера по частям. Ограничения размера входных данных
+    алгоритма проверяются до проверки схемой.
+
+    :param request: запрос;
+    :type request: Request
+    :param algorithm_name: имя алгоритма;
+    :type algorithm_name: str
+    :param algorithms: набор алгоритмов;
+    :type algorithms: AlgorithmCollection
+    :return: входные данные алгоритма.
+    :rtype: DataElementsSchema
+    :raises HTTPException: для неподдерживаемого формата данных;
+    :raises RequestValidationError: при некорректном теле запроса;
+    :raises AlgorithmNotFoundError: если алгоритм не найден;
+    :raises AlgorithmTypeError: при несоответствии значений типу данных;
+    :raises AlgorithmInputTooLargeError: при превышении ограничений размера.
+    """
+    content_type = request.headers.get("content-type")
+    media_type = MediaTypeEnum.JSON
+    if content_type:
+        media_type = parse_media_type(content_type)
+    if media_type is None or not is_available(media_type):
+        raise HTTPException(
+            status_code=415,
+            detail=ErrMsgTmpl.UNSUPPORTED_MEDIA_TYPE.format(content_type),
+        )
+    if media_type == MediaTypeEnum.JSON:
+        definition = algorithms.get_algorithm_definition(algorithm_name)
+        parser = ParametersParser(definition.parameters)
+        try:
+            async for chunk in request.stream():
+                parser.feed(chunk)
+            return DataElementsSchema.model_validate(parser.close())
+        except ValueError as ex:
+            errors = get_validation_errors(ex)
+    else:
+        try:
+            content = decode(await request.body(), media_type)
+            algorithms.check_input_size(algorithm_name, get_raw_values(content))
+            return DataElementsSchema.model_validate(content)
+        except ValueError as ex:
+            errors = get_validation_errors(ex)
+    raise RequestValidationError(
+        [{**error, "loc": ("body", *error["loc"])} for error in errors]
+    )
+
+
+def parse_parameters(
+    data: str | bytes, loc: tuple, check: Callable[[Any], None] | None = None
+) -> DataElementsSchema:
+    """Разбирает входные данные алгоритма в формате JSON и проверяет их схемой
+    DataElementsSchema. Ошибки сообщаются так же, как при разборе тела запроса
+    FastAPI.
+
+    :param data: входные данные в формате JSON;
+    :type data: str or bytes
+    :param loc: расположение входных данных в запросе для сообщений об ошибках;
+    :type loc: tuple
+    :param check: проверка разобранных данных до проверки схемой;
+    :type check: Callable[[Any], None] or None
+    :return: входные данные алгоритма.
+    :rtype: DataElementsSchema
+    :raises RequestValidationError: при некорректных входных данных.
+    """
+    try:
+        content = json.loads(data)
+        if check is not None:
+            check(content)
+        return DataElementsSchema.model_validate(content)
+    except ValueError as ex:
+        errors = get_validation_errors(ex)
+    raise RequestValidationError(
+        [{**error, "loc": (*loc, *error["loc"])} for error in errors]
+    )
+
+
+def get_validation_errors(ex: ValueError) -> list[dict]:
+    """Возвращает описания ошибок разбора или проверки входных данных в
+    формате ошибок проверки запроса FastAPI.
+
+    :param ex: ошибка разбора или проверки схемой;
+    :type ex: ValueError
+    :return: описания ошибок.
+    :rtype: list[dict]
+    """
+    if isinstance(ex, ValidationError):
+        return ex.errors(include_url=False)
+    if isinstance(ex, json.JSONDecodeError):
+        return [
+            {
+                "type": "json_invalid",
+                "loc": (ex.pos,),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": ex.msg},
+            }
+        ]
+    return [{"type": "value_error", "loc": (), "msg": str(ex), "input": None}]
+
+
+def get_stream_parameters(
+    parameters: str = Query(
+        ...,
+        description="Значения параметров для выполнения алгоритма в формате JSON, "
+        'например [{"name": "n", "value": 10}]',
+    ),
+    algorithm_name: str = Path(..., description="Название алгоритма"),
+    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
+) -> DataElementsSchema:
+    """Разбирает входные данные алгоритма из параметра запроса parameters."""
+
+    def check_size(content: Any) -> None:
+        algorithms.check_input_size(algorithm_name, get_raw_values(content))
+
+    return parse_parameters(parameters, ("query", "parameters"), check_size)
+
+
+def get_data_elements_content() -> dict:
+    """Возвращает описание входных данных и результатов алгоритма во всех
+    поддерживаемых форматах для документации API."""
+    return {
+        str(media_type): {"schema": {"$ref": "#/components/schemas/DataElementsSchema"}}
+        for media_type in MediaTypeEnum
+    }
 
 
 router = APIRouter(
@@ -24,29 +225,26 @@ logger = logging.getLogger(__name__)
     "/",
     response_model=AlgorithmsPageSchema,
     summary="Получить алгоритмы",
-    description="Возвращает список имеющихся алгоритмов с постраничным выводом.",
+    description="Возвращает список имеющихся алгоритмов с постраничным выводом. "
+    "Ответ содержит ETag; если он передан в заголовке If-None-Match и каталог "
+    "не изменился, возвращается ответ 304 без тела.",
     response_description="Список алгоритмов с информацией о постраничном выводе.",
 )
 async def get_algorithms(
     paginate: PaginateInputSchema = Depends(),
+    if_none_match: str | None = Header(
+        None, description="ETag ранее полученной страницы каталога"
+    ),
     algorithms: AlgorithmCollection = Depends(get_app_algorithms),
-) -> AlgorithmsPageSchema:
-    offset_min = (paginate.page - 1) * paginate.size
-    offset_max = paginate.page * paginate.size
-    algorithm_list = algorithms.get_algorithm_list()
-
-    return AlgorithmsPageSchema(
-        items=algorithm_list[offset_min:offset_max],
-        total=len(algorithm_list),
-        page=paginate.page,
-        size=paginate.size,
-        pages=math.ceil(len(algorithm_list) / paginate.size),
-    )
+) -> Response:
+    catalog_page = algorithms.get_catalog_page(paginate.page, paginate.size)
+    return get_catalog_page_response(catalog_page, if_none_match)
 
 
 @router.get(
     "/{algorithm_name}",
     response_model=AlgorithmDefinitionSchema,
+    response_model_exclude_none=True,
     summary="Получить описание алгоритма",
     description="Возвращает информацию об алгоритме по его названию.",
     response_description="Информация об алгоритме.",
@@ -61,15 +259,88 @@ async def get_algorithm(
 @router.post(
     "/{algorithm_name}/results",
     response_model=DataElementsSchema,
+    response_class=AlgorithmResultResponse,
     summary="Получить результат выполнения алгоритма",
-    description="Возвращает результат выполнения выбранного алгоритма.",
+    description="Возвращает результат выполнения выбранного алгоритма. Если клиент "
+    "разрывает соединение до получения результата, выполнение алгоритма "
+    "прерывается. Входные данные принимаются, а результаты возвращаются в "
+    "форматах JSON, MessagePack и CBOR согласно заголовкам Content-Type и Accept.",
     response_description="Результаты выполнения алгоритма.",
+    responses={200: {"content": get_data_elements_content()}},
+    openapi_extra={
+        "requestBody": {
+            "description": "Значения параметров для выполнения алгоритма",
+            "required": True,
+            "content": get_data_elements_content(),
+        }
+    },
 )
 async def get_algorithm_result(
-    parameters: DataElementsSchema = Body(
-        ..., description="Значения параметров для выполнения алгоритма"
+    request: Request,
+    parameters: DataElementsSchema = Depends(get_request_parameters),
+    algorithm_name: str = Path(..., description="Название алгоритма"),
+    priority: PriorityEnum = Header(
+        PriorityEnum.NORMAL,
+        alias=PRIORITY_HEADER,
+        description="Приоритет выполнения алгоритма",
     ),
+    accept: str | None = Header(None, description="Формат результатов"),
+    scheduler: AlgorithmScheduler = Depends(get_app_scheduler),
+) -> Response:
+    media_type = negotiate_media_type(accept)
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=ErrMsgTmpl.NOT_ACCEPTABLE_MEDIA_TYPE.format(accept),
+        )
+    # тело запроса уже проверено схемой DataElementsSchema при разборе
+    values = {param.name: param.value for param in parameters}
+    disconnected, result = await run_until_disconnected(
+        request, scheduler.execute(algorithm_name, values, priority)
+    )
+    if disconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    try:
+        return AlgorithmResultResponse(
+            result, media_type=media_type, headers={"Vary": "Accept"}
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=406,
+            detail=ErrMsgTmpl.UNREPRESENTABLE_RESULT.format(media_type),
+        )
+
+
+@router.get(
+    "/{algorithm_name}/results/stream",
+    response_class=StreamingResponse,
+    summary="Получить ход выполнения и результат алгоритма",
+    description="Выполняет алгоритм и передает поток событий Server-Sent Events: "
+    "события progress с долей выполненной работы (fraction) и сообщением "
+    "(message), если алгоритм сообщает о ходе выполнения, затем событие result "
+    "с результатами или error с кодом (status) и описанием (detail) ошибки. "
+    "События progress передаются не чаще чем раз в 0,1 с. Если клиент закрывает "
+    "соединение, выполнение алгоритма прерывается.",
+    response_description="Поток событий о ходе выполнения алгоритма.",
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_algorithm_result(
+    parameters: DataElementsSchema = Depends(get_stream_parameters),
     algorithm_name: str = Path(..., description="Название алгоритма"),
+    priority: PriorityEnum = Header(
+        PriorityEnum.NORMAL,
+        alias=PRIORITY_HEADER,
+        description="Приоритет выполнения алгоритма",
+    ),
     algorithms: AlgorithmCollection = Depends(get_app_algorithms),
-) -> DataElementsSchema:
-    return algorithms.get_algorithm_result(algorithm_name, parameters)
+    scheduler: AlgorithmScheduler = Depends(get_app_scheduler),
+) -> StreamingResponse:
+    if not algorithms.has_algorithm(algorithm_name):
+        raise AlgorithmNotFoundError(algorithm_name)
+    # параметры уже проверены схемой DataElementsSchema при разборе
+    values = {param.name: param.value for param in parameters}
+    return StreamingResponse(
+        stream_algorithm_events(scheduler, algorithm_name, values, priority),
+        media_type="text/event-stream",
+        headers=EVENT_STREAM_HEADERS,
+    )
@@ -0,0 +1,135 @@
+"""Модуль с преобразованием входных данных и результатов выполнения
+алгоритмов в двоичные форматы MessagePack и CBOR и с выбором формата по
+заголовкам Content-Type и Accept. Пакеты msgpack и cbor2 необязательны:
+если пакет не установлен, соответствующий формат не поддерживается."""
+
+from typing import Any
+
+from src.routers.media_type_enum import MediaTypeEnum
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+MEDIA_TYPE_ALIASES = {
+    "application/x-msgpack": MediaTypeEnum.MSGPACK,
+    "application/vnd.msgpack": MediaTypeEnum.MSGPACK,
+}
+"""Распространенные альтернативные названия форматов данных."""
+
+
+def is_available(media_type: MediaTypeEnum) -> bool:
+    """Проверяет, установлен ли пакет для работы с форматом данных.
+
+    :param media_type: формат данных;
+    :type media_type: MediaTypeEnum
+    :return: True, если формат поддерживается.
+    :rtype: bool
+    """
+    if media_type == MediaTypeEnum.MSGPACK:
+        return msgpack is not None
+    if media_type == MediaTypeEnum.CBOR:
+        return cbor2 is not None
+    return True
+
+
+def parse_media_type(value: str) -> MediaTypeEnum | None:
+    """Возвращает формат данных по значению заголовка без параметров.
+
+    :param value: значение заголовка Content-Type или элемента Accept;
+    :type value: str
+    :return: формат данных или None для неизвестного формата.
+    :rtype: MediaTypeEnum or None
+    """
+    media_type = value.split(";", 1)[0].strip().lower()
+    if media_type in MEDIA_TYPE_ALIASES:
+        return MEDIA_TYPE_ALIASES[media_type]
+    if media_type == "application/json" or media_type.endswith("+json"):
+        return MediaTypeEnum.JSON
+    try:
+        return MediaTypeEnum(media_type)
+    except ValueError:
+        return None
+
+
+def negotiate_media_type(accept: str | None) -> MediaTypeEnum | None:
+    """Выбирает формат результатов по заголовку Accept: формат с наибольшим
+    весом q среди поддерживаемых, при равном весе - в порядке перечисления в
+    заголовке. Без заголовка и для */* выбирается JSON.
+
+    :param accept: значение заголовка Accept;
+    :type accept: str or None
+    :return: формат результатов или None, если ни один из запрошенных
+        форматов не поддерживается.
+    :rtype: MediaTypeEnum or None
+    """
+    if not accept:
+        return MediaTypeEnum.JSON
+    candidates = []
+    for idx, item in enumerate(accept.split(",")):
+        media_range, *params = [part.strip() for part in item.split(";")]
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if weight <= 0:
+            continue
+        if media_range in ("*/*", "application/*"):
+            media_type = MediaTypeEnum.JSON
+        else:
+            media_type = parse_media_type(media_range)
+        if media_type is not None and is_available(media_type):
+            candidates.append((-weight, idx, media_type))
+    return min(candidates)[2] if candidates else None
+
+
+def decode(body: bytes, media_type: MediaTypeEnum) -> Any:
+    """Преобразует тело запроса в двоичном формате в объекты Python.
+
+    :param body: тело запроса;
+    :type body: bytes
+    :param media_type: двоичный формат данных;
+    :type media_type: MediaTypeEnum
+    :return: объекты Python.
+    :rtype: Any
+    :raises ValueError: при некорректном теле запроса.
+    """
+    try:
+        if media_type == MediaTypeEnum.MSGPACK:
+            return msgpack.unpackb(body, raw=False)
+        return cbor2.loads(body)
+    except ValueError:
+        raise
+    except Exception as ex:
+        raise ValueError(str(ex)) from ex
+
+
+def encode(content: Any, media_type: MediaTypeEnum) -> bytes:
+    """Преобразует объекты Python в двоичный формат. Значения NaN и
+    бесконечности сохраняются, так как оба формата их поддерживают.
+
+    :param content: объекты Python;
+    :type content: Any
+    :param media_type: двоичный формат данных;
+    :type media_type: MediaTypeEnum
+    :return: данные в двоичном формате.
+    :rtype: bytes
+    :raises ValueError: если значения не могут быть представлены в формате,
+        например целые числа длиннее 64 бит в MessagePack.
+    """
+    try:
+        if media_type == MediaTypeEnum.MSGPACK:
+            return msgpack.packb(content)
+        return cbor2.dumps(content)
+    except (OverflowError, TypeError) as ex:
+        raise ValueError(str(ex)) from ex
@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable
+
+from fastapi import Request
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """Ожидает разрыва соединения клиентом. Вызывается после того, как тело
+    запроса полностью прочитано.
+
+    :param request: запрос;
+    :type request: Request
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def run_until_disconnected(
+    request: Request, awaitable: Awaitable
+) -> tuple[bool, Any]:
+    """Ожидает результат, пока клиент не разорвал соединение. При разрыве
+    соединения ожидание результата отменяется.
+
+    :param request: запрос;
+    :type request: Request
+    :param awaitable: ожидаемый результат;
+    :type awaitable: Awaitable
+    :return: признак разрыва соединения и результат, если соединение
+        не было разорвано.
+    :rtype: tuple[bool, Any]
+    """
+    task = asyncio.ensure_future(awaitable)
+    disconnect_task = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        disconnect_task.cancel()
+    if task.done():
+        return False, task.result()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return True, None
@@ -5,12 +5,34 @@ from fastapi import FastAPI, HTTPException, Request
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors.exceptions import (
     AlgorithmError,
+    AlgorithmInputTooLargeError,
     AlgorithmNotFoundError,
     AlgorithmTypeError,
     AlgorithmValueError,
 )
 
 
+def get_error_status(err: Exception) -> tuple[int, str]:
+    """Возвращает код ответа и сообщение для ошибки так же, как обработчики
+    ошибок приложения. Используется там, где ошибка передается клиенту без
+    HTTP-ответа, например в сессиях WebSocket.
+
+    :param err: ошибка;
+    :type err: Exception
+    :return: код ответа и сообщение об ошибке.
+    :rtype: tuple[int, str]
+    """
+    if isinstance(err, AlgorithmNotFoundError):
+        return 404, err.message
+    if isinstance(err, AlgorithmInputTooLargeError):
+        return 413, err.message
+    if isinstance(err, (AlgorithmValueError, AlgorithmTypeError)):
+        return 400, err.message
+    if isinstance(err, AlgorithmError):
+        return 500, err.message
+    return 500, ErrMsg.UNEXPECTED_ERROR
+
+
 def init_error_handlers(app: FastAPI, logger: Logger):
     @app.exception_handler(AlgorithmNotFoundError)
     def handle_not_found_error(request: Request, err: AlgorithmNotFoundError):
@@ -19,6 +41,15 @@ def init_error_handlers(app: FastAPI, logger: Logger):
             detail=err.message,
         )
 
+    @app.exception_handler(AlgorithmInputTooLargeError)
+    def handle_input_too_large_error(
+        request: Request, err: AlgorithmInputTooLargeError
+    ):
+        raise HTTPException(
+            status_code=413,
+            detail=err.message,
+        )
+
     @app.exception_handler(AlgorithmValueError)
     def handle_value_error(request: Request, err: AlgorithmValueError):
         raise HTTPException(
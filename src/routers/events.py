@@ -0,0 +1,95 @@
+"""Модуль с передачей хода выполнения и результата алгоритма клиенту в
+формате Server-Sent Events (text/event-stream)."""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator
+
+from pydantic_core import to_json
+
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.priority_enum import PriorityEnum
+from src.routers.error_handlers import get_error_status
+
+EVENT_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+"""Заголовки ответа с потоком событий: события не кэшируются и не
+буферизуются прокси-сервером."""
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event: str, data: Any) -> bytes:
+    """Формирует событие Server-Sent Events с данными в формате JSON.
+
+    :param event: тип события;
+    :type event: str
+    :param data: данные события;
+    :type data: Any
+    :return: событие в формате text/event-stream.
+    :rtype: bytes
+    """
+    payload = to_json(data, inf_nan_mode="null")
+    return b"event: " + event.encode() + b"\ndata: " + payload + b"\n\n"
+
+
+async def stream_algorithm_events(
+    scheduler: AlgorithmScheduler,
+    algorithm_name: str,
+    values: dict[str, Any],
+    priority: PriorityEnum = PriorityEnum.NORMAL,
+) -> AsyncIterator[bytes]:
+    """Выполняет алгоритм и передает события progress с ходом выполнения, а
+    затем событие result с результатом или error с ошибкой. Если клиент не
+    успевает получать события, передается только последнее из накопившихся.
+    При закрытии потока до получения результата выполнение отменяется.
+
+    :param scheduler: планировщик выполнения алгоритмов;
+    :type scheduler: AlgorithmScheduler
+    :param algorithm_name: имя алгоритма;
+    :type algorithm_name: str
+    :param values: словарь значений входных данных, уже проверенных схемой
+        DataElementsSchema;
+    :type values: dict[str, Any]
+    :param priority: приоритет выполнения;
+    :type priority: PriorityEnum
+    :return: события в формате text/event-stream.
+    :rtype: AsyncIterator[bytes]
+    """
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def on_progress(fraction: float, message: str | None) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, (fraction, message))
+
+    task = asyncio.ensure_future(
+        scheduler.execute(algorithm_name, values, priority, on_progress)
+    )
+    try:
+        while not task.done():
+            getter = asyncio.ensure_future(events.get())
+            await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                continue
+            fraction, message = getter.result()
+            while not events.empty():
+                fraction, message = events.get_nowait()
+            yield format_event("progress", {"fraction": fraction, "message": message})
+        if not events.empty():
+            while not events.empty():
+                fraction, message = events.get_nowait()
+            yield format_event("progress", {"fraction": fraction, "message": message})
+        try:
+            result = task.result()
+        except Exception as ex:
+            code, detail = get_error_status(ex)
+            if code == 500:
+                logger.error(str(ex))
+            yield format_event("error", {"status": code, "detail": detail})
+            return
+        yield format_event(
+            "result",
+            [{"name": element.name, "value": element.value} for element in result],
+        )
+    finally:
+        task.cancel()
@@ -0,0 +1,13 @@
+from strenum import StrEnum
+
+
+class MediaTypeEnum(StrEnum):
+    """Перечисление форматов данных для входных данных и результатов
+    выполнения алгоритмов. Форматы MSGPACK и CBOR доступны при установленных
+    пакетах msgpack и cbor2.
+
+    """
+
+    JSON = "application/json"
+    MSGPACK = "application/msgpack"
+    CBOR = "application/cbor"
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, Request
+
+from src.internal.constants import METRICS_ENDPOINT
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.metrics import MetricsRegistry
+from src.routers.algorithms import get_app_scheduler
+from src.routers.schemas import MetricsSchema, RuntimeStatsSchema
+
+
+def get_app_metrics(request: Request) -> MetricsRegistry:
+    return request.app.state.metrics
+
+
+router = APIRouter(
+    prefix=METRICS_ENDPOINT,
+)
+
+
+@router.get(
+    "/",
+    response_model=MetricsSchema,
+    summary="Получить метрики",
+    description="Возвращает текущие значения метрик приложения.",
+    response_description="Счетчики событий и статистика наблюдаемых значений.",
+)
+async def get_metrics(
+    metrics: MetricsRegistry = Depends(get_app_metrics),
+) -> MetricsSchema:
+    return MetricsSchema.model_validate(metrics.snapshot())
+
+
+@router.get(
+    "/runtimes",
+    response_model=dict[str, dict[int, RuntimeStatsSchema]],
+    summary="Получить статистику времени выполнения алгоритмов",
+    description="Возвращает распределение времени успешных выполнений "
+    "алгоритмов по диапазонам размера входных данных. Диапазон обозначается "
+    "верхней границей - степенью двойки.",
+    response_description="Статистика по именам алгоритмов и диапазонам размера "
+    "входных данных.",
+)
+async def get_runtimes(
+    scheduler: AlgorithmScheduler = Depends(get_app_scheduler),
+) -> dict[str, dict[int, RuntimeStatsSchema]]:
+    return scheduler.profile.snapshot()
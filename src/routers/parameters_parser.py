@@ -0,0 +1,560 @@
+"""Модуль с потоковым разбором тела запроса с входными данными алгоритма в
+формате JSON: [{"name": ..., "value": ...}, ...]. Тело разбирается по мере
+получения частей, поэтому ни тело целиком, ни его текст не хранятся в памяти.
+Значения списков и матриц, описанных во входных данных алгоритма, разбираются
+частями (для матриц - по строкам): каждая часть сразу проверяется на
+соответствие типу данных и ограничениям размера и добавляется к результату,
+числовые и логические значения - в компактный массив CompactArray.
+Остальные значения разбираются целиком модулем json и проверяются после
+разбора. Строки, не полученные полностью, переносятся из буфера по мере
+получения, поэтому каждый символ тела просматривается один раз, а длина
+строки проверяется до ее окончания."""
+
+import codecs
+import json
+import re
+from typing import Any, Generator
+
+from src.internal.data_dimension.compact_array import CompactArrayBuilder
+from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmInputTooLargeError,
+    AlgorithmTypeError,
+)
+from src.internal.schemas.data_definition_schema import DataDefinitionSchema
+from src.internal.schemas.data_element_schema import DataElementSchema
+
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+"""Пробельные символы JSON."""
+STRING_BODY_RE = re.compile(r'[^"\\]*(?:(?:\\u[0-9a-fA-F]{4}|\\[^u])[^"\\]*)*')
+"""Текст строки JSON до закрывающей кавычки или до экранированного символа,
+который еще не получен полностью."""
+LOW_SURROGATE_RE = re.compile(r"\\u[dD][c-fC-F]")
+"""Экранированная вторая половина суррогатной пары."""
+VALUE_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]')
+"""Строки и скобки составного значения; отдельная кавычка - начало строки,
+которая еще не получена полностью."""
+ROW_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},"]')
+"""Строки, скобки и разделители элементов строки со строковыми значениями."""
+ROW_STOP_RE = re.compile(r'[\[\]{}"]')
+"""Символы, на которых останавливается поиск конца строки без строковых
+значений."""
+SCALAR_END_RE = re.compile(r"[,\]}\s]")
+"""Символы, которыми заканчивается число или литерал JSON."""
+
+Parsing = Generator[None, None, Any]
+"""Генератор разбора, приостанавливаемый до получения следующей части тела."""
+
+
+class ParametersParser:
+    """Класс разбирает входные данные алгоритма в формате JSON по частям.
+    Части передаются методом feed по мере получения, после последней части
+    вызывается метод close, который возвращает элементы входных данных.
+
+    Разбор выполняется генератором, который приостанавливается, когда
+    полученных данных недостаточно. В буфере хранится только еще не
+    разобранный остаток текста: значения списков и матриц разбираются до
+    последнего полученного разделителя элементов.
+    """
+
+    def __init__(self, parameters: list[DataDefinitionSchema]):
+        """Конструктор класса
+
+        :param parameters: описания входных данных алгоритма;
+        :type parameters: list[DataDefinitionSchema]
+        """
+        self.__parameters: dict[str, DataDefinitionSchema] = {
+            param.name: param for param in parameters
+        }
+        self.__decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.__buffer: str = ""
+        self.__pos: int = 0
+        self.__offset: int = 0
+        self.__pending: list[str] = []
+        self.__eof: bool = False
+        self.__content: list[dict[str, Any] | DataElementSchema] = []
+        self.__parsing: Parsing = self.__parse()
+        next(self.__parsing)
+
+    def feed(self, chunk: bytes) -> None:
+        """Разбирает очередную часть тела запроса.
+
+        :param chunk: часть тела запроса;
+        :type chunk: bytes
+        :raises json.JSONDecodeError: при некорректном JSON;
+        :raises AlgorithmTypeError: при несоответствии значения типу или
+            размерности данных;
+        :raises AlgorithmInputTooLargeError: при превышении ограничений
+            размера.
+        """
+        text = self.__decoder.decode(chunk)
+        if text:
+            self.__pending.append(text)
+            next(self.__parsing)
+
+    def close(self) -> list[dict[str, Any] | DataElementSchema]:
+        """Завершает разбор тела запроса. Элементы, значения которых
+        проверены при разборе, возвращаются как DataElementSchema, остальные -
+        как словари для проверки схемой DataElementsSchema.
+
+        :return: элементы входных данных.
+        :rtype: list[dict[str, Any] or DataElementSchema]
+        :raises json.JSONDecodeError: при некорректном или неполном JSON.
+        """
+        self.__pending.append(self.__decoder.decode(b"", final=True))
+        self.__eof = True
+        try:
+            next(self.__parsing)
+        except StopIteration:
+            return self.__content
+        raise self.__error("Expecting value", self.__pos)  # pragma: no cover
+
+    def __parse(self) -> Parsing:
+        """Разбирает список элементов входных данных."""
+        yield
+        self.__load()
+        yield from self.__expect("[")
+        if (yield from self.__peek()) == "]":
+            self.__pos += 1
+        else:
+            while True:
+                yield from self.__parse_element()
+                if (yield from self.__next_delimiter("]")) == "]":
+                    break
+        yield from self.__skip_whitespace()
+        if self.__pos < len(self.__buffer):
+            raise self.__error("Extra data", self.__pos)
+
+    def __parse_element(self) -> Parsing:
+        """Разбирает элемент входных данных. Значение списка или матрицы
+        разбирается по частям, если до него указано имя элемента, описанного
+        во входных данных алгоритма."""
+        yield from self.__expect("{")
+        element: dict[str, Any] = {}
+        streamed_name = None
+        if (yield from self.__peek()) == "}":
+            self.__pos += 1
+        else:
+            while True:
+                if (yield from self.__peek()) != '"':
+                    raise self.__error(
+                        "Expecting property name enclosed in double quotes",
+                        self.__pos,
+                    )
+                key = yield from self.__parse_string()
+                yield from self.__expect(":")
+                param = None
+                if key == "value" and isinstance(element.get("name"), str):
+                    param = self.__parameters.get(element["name"])
+                if (
+                    param is not None
+                    and param.data_shape != DataShapeEnum.SCALAR
+                    and (yield from self.__peek()) == "["
+                ):
+                    element[key] = yield from self.__parse_array(param)
+                    streamed_name = param.name
+                else:
+                    element[key] = yield from self.__parse_value(param)
+                    if key == "value":
+                        streamed_name = None
+                if (yield from self.__next_delimiter("}")) == "}":
+                    break
+        name = element.get("name")
+        if streamed_name is not None and name == streamed_name:
+            self.__content.append(
+                DataElementSchema.model_construct(name=name, value=element["value"])
+            )
+            return
+        param = self.__parameters.get(name) if isinstance(name, str) else None
+        if param is not None and "value" in element:
+            error = DataDimensionChecker.check_size(param, element["value"])
+            if error is not None:
+                self.__raise_too_large(param, error)
+        self.__content.append(element)
+
+    def __parse_array(self, param: DataDefinitionSchema) -> Parsing:
+        """Разбирает по частям значение списка или матрицы, проверяя его на
+        соответствие описанию элемента входных данных. Числовые и логические
+        значения собираются в CompactArray (см. CompactArrayBuilder)."""
+        self.__pos += 1
+        builder = CompactArrayBuilder(param.data_type, param.data_shape)
+        if param.data_shape == DataShapeEnum.LIST:
+            yield from self.__parse_row(param, builder, None)
+            return builder.build()
+        if (yield from self.__peek()) == "]":
+            raise AlgorithmTypeError(ErrMsg.NOT_MATRIX_VALUE)
+        row_idx = 0
+        while True:
+            if param.max_rows is not None and row_idx >= param.max_rows:
+                self.__raise_too_large(
+                    param, ErrMsgTmpl.TOO_MANY_ROWS.format(row_idx + 1, param.max_rows)
+                )
+            if (yield from self.__peek()) != "[":
+                raise AlgorithmTypeError(ErrMsgTmpl.NOT_LIST_ROW.format(row_idx))
+            self.__pos += 1
+            yield from self.__parse_row(param, builder, row_idx)
+            builder.end_row()
+            row_idx += 1
+            if (yield from self.__next_delimiter("]")) == "]":
+                return builder.build()
+
+    def __parse_row(
+        self,
+        param: DataDefinitionSchema,
+        builder: CompactArrayBuilder,
+        row_idx: int | None,
+    ) -> Parsing:
+        """Разбирает по частям элементы списка или строки матрицы с индексом
+        row_idx после открывающей скобки. Полученный текст разбирается до
+        последнего разделителя элементов, остаток ожидает следующей части."""
+        count = 0
+        has_strings = param.data_type == DataTypeEnum.STRING
+        expect_item = False
+        scan = self.__offset + self.__pos
+        while True:
+            quote = None
+            if has_strings:
+                end, cut, quote = self.__scan_string_row(
+                    param, count, row_idx, scan - self.__offset
+                )
+            else:
+                end, cut = self.__scan_row(param, count, row_idx, scan - self.__offset)
+            if end is not None:
+                if expect_item or end > self.__pos:
+                    self.__add_items(param, builder, count, row_idx, end)
+                self.__pos = end + 1
+                return
+            if cut is not None:
+                count = self.__add_items(param, builder, count, row_idx, cut)
+                self.__pos = cut + 1
+                expect_item = True
+            if quote is not None:
+                count = yield from self.__parse_row_string(
+                    param, builder, count, row_idx, quote
+                )
+                if (yield from self.__next_delimiter("]")) == "]":
+                    return
+                expect_item = True
+                scan = self.__offset + self.__pos
+                continue
+            scan = self.__offset + len(self.__buffer)
+            if not (yield from self.__fill()):
+                self.__loads("[" + self.__buffer[self.__pos :], self.__pos - 1)
+
+    def __scan_row(
+        self, param: DataDefinitionSchema, count: int, row_idx: int | None, start: int
+    ) -> tuple[int | None, int | None]:
+        """Ищет в буфере конец строки без строковых значений, начиная с
+        позиции start, до которой текст уже просмотрен. Возвращает позицию
+        закрывающей скобки или, если ее еще нет, позицию последнего
+        разделителя элементов."""
+        match = ROW_STOP_RE.search(self.__buffer, start)
+        if match is None:
+            cut = self.__buffer.rfind(",", start)
+            return None, cut if cut >= 0 else None
+        if match.group() == "]":
+            return match.start(), None
+        if match.group() == "}":
+            self.__loads("[" + self.__buffer[self.__pos : match.end()], self.__pos - 1)
+        idx = count + self.__buffer.count(",", self.__pos, match.start())
+        raise AlgorithmTypeError(self.__get_type_error(param, idx, row_idx))
+
+    def __scan_string_row(
+        self, param: DataDefinitionSchema, count: int, row_idx: int | None, start: int
+    ) -> tuple[int | None, int | None, int | None]:
+        """Ищет в буфере конец строки со строковыми значениями, пропуская
+        строки целиком, начиная с позиции start, до которой текст уже
+        просмотрен. Возвращает позицию закрывающей скобки или, если ее еще
+        нет, позицию последнего разделителя элементов и позицию начала строки,
+        которая еще не получена полностью."""
+        cut = None
+        delimiters = 0
+        for match in ROW_TOKEN_RE.finditer(self.__buffer, start):
+            token = match.group()
+            if token == ",":
+                cut = match.start()
+                delimiters += 1
+            elif token == "]":
+                return match.start(), None, None
+            elif token == '"':
+                return None, cut, match.start()
+            elif token in "[{":
+                idx = count + delimiters
+                raise AlgorithmTypeError(self.__get_type_error(param, idx, row_idx))
+        return None, cut, None
+
+    def __parse_row_string(
+        self,
+        param: DataDefinitionSchema,
+        builder: CompactArrayBuilder,
+        count: int,
+        row_idx: int | None,
+        quote: int,
+    ) -> Parsing:
+        """Разбирает элемент строки, который начинается строкой JSON в
+        позиции quote, еще не полученной полностью, проверяет его и добавляет
+        к значению. Возвращает количество элементов строки."""
+        if WHITESPACE_RE.match(self.__buffer, self.__pos).end() < quote:
+            self.__loads(
+                "[" + self.__buffer[self.__pos : quote] + '""]', self.__pos - 1
+            )
+            raise self.__error("Expecting ',' delimiter", quote)
+        self.__pos = quote
+        item = yield from self.__parse_string(param)
+        return self.__extend(param, builder, count, row_idx, [item])
+
+    def __add_items(
+        self,
+        param: DataDefinitionSchema,
+        builder: CompactArrayBuilder,
+        count: int,
+        row_idx: int | None,
+        end: int,
+    ) -> int:
+        """Разбирает элементы из буфера до позиции end, проверяет их и
+        добавляет к значению. Возвращает количество элементов строки."""
+        start = self.__pos
+        parsed = self.__loads("[" + self.__buffer[start:end] + "]", start - 1)
+        if not parsed:
+            raise self.__error("Expecting value", start)
+        return self.__extend(param, builder, count, row_idx, parsed)
+
+    def __extend(
+        self,
+        param: DataDefinitionSchema,
+        builder: CompactArrayBuilder,
+        count: int,
+        row_idx: int | None,
+        parsed: list,
+    ) -> int:
+        """Проверяет разобранные элементы и добавляет их к значению.
+        Возвращает количество элементов строки."""
+        error = DataDimensionChecker.check_items(param, parsed, count, row_idx)
+        if error is not None:
+            raise AlgorithmTypeError(error)
+        count += len(parsed)
+        if row_idx is None and param.max_length is not None:
+            if count > param.max_length:
+                self.__raise_too_large(
+                    param, ErrMsgTmpl.TOO_LONG_LIST.format(count, param.max_length)
+                )
+        elif row_idx is not None and param.max_cols is not None:
+            if count > param.max_cols:
+                self.__raise_too_large(
+                    param,
+                    ErrMsgTmpl.TOO_MANY_COLS.format(row_idx, count, param.max_cols),
+                )
+        if param.max_str_len is not None:
+            for item in parsed:
+                if isinstance(item, str) and len(item) > param.max_str_len:
+                    self.__raise_too_large(
+                        param,
+                        ErrMsgTmpl.TOO_LONG_STRING.format(len(item), param.max_str_len),
+                    )
+        builder.extend(parsed)
+        return count
+
+    def __parse_value(self, param: DataDefinitionSchema | None = None) -> Parsing:
+        """Разбирает значение JSON целиком. Составное значение собирается из
+        частей по мере получения, парные скобки отслеживаются без разбора
+        значения. Длина строки, указанной значением элемента param, проверяется
+        при разборе."""
+        char = yield from self.__peek()
+        if char == '"':
+            return (yield from self.__parse_string(param))
+        parts = []
+        start = self.__offset + self.__pos
+        if char not in ("[", "{"):
+            while True:
+                match = SCALAR_END_RE.search(self.__buffer, self.__pos)
+                end = len(self.__buffer) if match is None else match.start()
+                parts.append(self.__buffer[self.__pos : end])
+                self.__pos = end
+                if match is not None or not (yield from self.__fill()):
+                    break
+            text = "".join(parts)
+            if not text:
+                raise self.__error("Expecting value", self.__pos)
+            return self.__loads(text, start - self.__offset)
+        depth = 0
+        while True:
+            scan = self.__pos
+            quote = None
+            for match in VALUE_TOKEN_RE.finditer(self.__buffer, scan):
+                token = match.group()
+                if token == '"':
+                    quote = match.start()
+                    break
+                scan = match.end()
+                if token in "[{":
+                    depth += 1
+                elif token in "]}":
+                    depth -= 1
+                    if depth == 0:
+                        parts.append(self.__buffer[self.__pos : scan])
+                        self.__pos = scan
+                        return self.__loads("".join(parts), start - self.__offset)
+            if quote is not None:
+                parts.append(self.__buffer[self.__pos : quote])
+                self.__pos = quote
+                parts.append((yield from self.__scan_string()))
+                continue
+            parts.append(self.__buffer[self.__pos : scan])
+            self.__pos = scan
+            if not (yield from self.__fill()):
+                parts.append(self.__buffer[self.__pos :])
+                self.__loads("".join(parts), start - self.__offset)
+
+    def __parse_string(self, param: DataDefinitionSchema | None = None) -> Parsing:
+        """Разбирает строку JSON. Длина строки, указанной значением элемента
+        param, проверяется при разборе."""
+        text = yield from self.__scan_string(param)
+        return self.__loads(text, self.__pos - len(text))
+
+    def __scan_string(self, param: DataDefinitionSchema | None = None) -> Parsing:
+        """Возвращает текст строки JSON, которая начинается в текущей позиции.
+        Просмотренная часть строки переносится из буфера, а незавершенный
+        экранированный символ ожидает следующей части тела, поэтому каждый
+        символ просматривается один раз. Если строка указана значением
+        элемента param с ограничением max_str_len, длина строки проверяется до
+        ее окончания."""
+        max_len = param.max_str_len if param is not None else None
+        start = self.__offset + self.__pos
+        parts = []
+        scan = self.__pos + 1
+        length = 0
+        while True:
+            buffer = self.__buffer
+            while True:
+                end = STRING_BODY_RE.match(buffer, scan).end()
+                length += self.__get_string_length(buffer[scan:end])
+                scan = end
+                if end < len(buffer) and buffer[end] == '"':
+                    parts.append(buffer[self.__pos : end + 1])
+                    self.__pos = end + 1
+                    return "".join(parts)
+                if len(buffer) - end < 6:
+                    break
+                # Некорректный экранированный символ сообщается при разборе
+                scan += 2
+                length += 1
+            if max_len is not None and length > max_len:
+                self.__raise_too_large(
+                    param, ErrMsgTmpl.TOO_LONG_STRING_PART.format(length, max_len)
+                )
+            parts.append(buffer[self.__pos : scan])
+            self.__pos = scan
+            if not (yield from self.__fill()):
+                raise self.__error(
+                    "Unterminated string starting at", start - self.__offset
+                )
+            scan = self.__pos
+
+    def __next_delimiter(self, closing: str) -> Parsing:
+        """Разбирает разделитель элементов или закрывающую скобку."""
+        char = yield from self.__peek()
+        if char not in (",", closing):
+            raise self.__error("Expecting ',' delimiter", self.__pos)
+        self.__pos += 1
+        return char
+
+    def __expect(self, char: str) -> Parsing:
+        """Разбирает ожидаемый символ."""
+        if (yield from self.__peek()) != char:
+            raise self.__error("Expecting value", self.__pos)
+        self.__pos += 1
+
+    def __peek(self) -> Parsing:
+        """Возвращает следующий символ после пробельных символов, пустую
+        строку в конце данных."""
+        yield from self.__skip_whitespace()
+        return self.__buffer[self.__pos : self.__pos + 1]
+
+    def __skip_whitespace(self) -> Parsing:
+        """Пропускает пробельные символы, ожидая следующие части тела."""
+        while True:
+            self.__pos = WHITESPACE_RE.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer) or not (yield from self.__fill()):
+                return
+
+    def __fill(self) -> Parsing:
+        """Ожидает следующую часть тела запроса. Возвращает False, если тело
+        получено полностью."""
+        if self.__eof:
+            return False
+        yield
+        self.__load()
+        return True
+
+    def __load(self) -> None:
+        """Переносит полученные части в буфер, отбрасывая разобранный текст."""
+        self.__buffer = self.__buffer[self.__pos :] + "".join(self.__pending)
+        self.__offset += self.__pos
+        self.__pos = 0
+        self.__pending.clear()
+
+    def __loads(self, text: str, pos: int) -> Any:
+        """Разбирает текст JSON, начинающийся в буфере с позиции pos."""
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as ex:
+            raise self.__error(ex.msg, pos + ex.pos)
+
+    def __error(self, message: str, pos: int) -> json.JSONDecodeError:
+        """Возвращает ошибку разбора JSON с позицией от начала тела."""
+        error = json.JSONDecodeError(message, "", 0)
+        error.pos = self.__offset + pos
+        return error
+
+    @staticmethod
+    def __get_string_length(text: str) -> int:
+        """Возвращает оценку снизу длины текста строки JSON после замены
+        экранированных символов: \\uXXXX считается одним символом, вторая
+        половина суррогатной пары - нулем символов."""
+        backslashes = text.count("\\")
+        if not backslashes:
+            return len(text)
+        return (
+            len(text)
+            - backslashes
+            + text.count("\\\\")
+            - 4 * text.count("\\u")
+            - len(LOW_SURROGATE_RE.findall(text))
+        )
+
+    @staticmethod
+    def __get_type_error(
+        param: DataDefinitionSchema, idx: int, row_idx: int | None
+    ) -> str:
+        """Возвращает сообщение о несоответствии типа элемента."""
+        if row_idx is None:
+            return ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(idx, param.data_type)
+        return ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(
+            idx, row_idx, param.data_type
+        )
+
+    @staticmethod
+    def __raise_too_large(param: DataDefinitionSchema, error: str) -> None:
+        """Возбуждает ошибку превышения ограничения размера."""
+        raise AlgorithmInputTooLargeError(
+            ErrMsgTmpl.INPUT_TOO_LARGE.format(param.name, error)
+        )
+
+
+if __name__ == "__main__":
+    parameter = DataDefinitionSchema(
+        name="matrix",
+        title="Matrix",
+        description="Matrix",
+        data_type=DataTypeEnum.INT,
+        data_shape=DataShapeEnum.MATRIX,
+        default_value=[[1]],
+    )
+    parser = ParametersParser([parameter])
+    for part in [b'[{"name": "matrix", "value": [[1, 2', b"], [3, 4]]}]"]:
+        parser.feed(part)
+    print(parser.close())
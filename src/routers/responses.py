@@ -0,0 +1,85 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+from src.internal.catalog_cache import CatalogPage
+from src.internal.constants import CATALOG_CACHE_CONTROL
+from src.internal.schemas.data_element_schema import DataElementSchema
+from src.routers.codecs import encode
+from src.routers.media_type_enum import MediaTypeEnum
+
+
+class AlgorithmResultResponse(JSONResponse):
+    """Ответ с результатами выполнения алгоритма. Результаты сериализуются
+    сразу в байты функцией pydantic-core to_json, минуя повторную валидацию по
+    response_model и преобразование jsonable_encoder, которые FastAPI выполняет
+    для возвращаемых из обработчика объектов. Значения уже проверены
+    AlgorithmExecutor, поэтому их тип определяется при сериализации без
+    сопоставления с объединением типов DataElementSchema.value. Значения NaN и
+    бесконечности сериализуются как null. Если при создании ответа указан
+    двоичный формат (MessagePack или CBOR), результаты сериализуются в него."""
+
+    media_type = MediaTypeEnum.JSON
+
+    def render(self, content: Any) -> bytes:
+        """Сериализует результаты выполнения алгоритма.
+
+        :param content: результаты выполнения алгоритма;
+        :type content: list[DataElementSchema]
+        :return: результаты в формате ответа.
+        :rtype: bytes
+        :raises ValueError: если результаты не могут быть представлены в
+            двоичном формате.
+        """
+        outputs = [
+            {"name": element.name, "value": element.value} for element in content
+        ]
+        if self.media_type == MediaTypeEnum.JSON:
+            return to_json(outputs, inf_nan_mode="null")
+        return encode(outputs, MediaTypeEnum(self.media_type))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Проверяет, совпадает ли ETag с одним из значений заголовка
+    If-None-Match. Согласно RFC 9110 для этого заголовка используется слабое
+    сравнение.
+
+    :param if_none_match: значение заголовка If-None-Match;
+    :type if_none_match: str or None
+    :param etag: ETag текущего представления ресурса;
+    :type etag: str
+    :return: True при совпадении.
+    :rtype: bool
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in [
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ]
+
+
+def get_catalog_page_response(
+    catalog_page: CatalogPage, if_none_match: str | None = None
+) -> Response:
+    """Возвращает ответ со страницей каталога алгоритмов. Тело ответа
+    отрендерено заранее, ETag вычислен по его содержимому. Если клиент передал
+    совпадающий ETag в заголовке If-None-Match, возвращается ответ 304 без тела.
+
+    :param catalog_page: страница каталога;
+    :type catalog_page: CatalogPage
+    :param if_none_match: значение заголовка If-None-Match запроса;
+    :type if_none_match: str or None
+    :return: ответ со страницей каталога или ответ 304.
+    :rtype: Response
+    """
+    headers = {"ETag": catalog_page.etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if etag_matches(if_none_match, catalog_page.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(catalog_page.body, headers=headers, media_type=MediaTypeEnum.JSON)
+
+
+if __name__ == "__main__":
+    print(AlgorithmResultResponse([DataElementSchema(name="result", value=1)]).body)
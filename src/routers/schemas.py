@@ -1,5 +1,9 @@
 from pydantic import BaseModel, Field
 
+from src.internal.catalog_sort_enum import CatalogSortEnum
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.schemas.data_element_schema import DataElementsSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
 
 
@@ -27,3 +31,92 @@ class PaginateInputSchema(BaseModel):
         le=100,
         description="Количество объектов на странице, должно быть от 1 до 100",
     )
+
+
+class MetricsSchema(BaseModel):
+    """Класс для вывода метрик приложения."""
+
+    counters: dict[str, float] = Field(..., description="Счетчики событий")
+    observations: dict[str, dict[str, float]] = Field(
+        ...,
+        description="Статистика наблюдаемых значений: количество (count), "
+        "сумма (sum), минимум (min) и максимум (max)",
+    )
+
+
+class RuntimeStatsSchema(BaseModel):
+    """Класс для вывода статистики времени выполнения алгоритма."""
+
+    count: int = Field(..., description="Количество учтенных выполнений")
+    p50: float = Field(..., description="Медиана времени выполнения (с)")
+    p90: float = Field(..., description="90-й процентиль времени выполнения (с)")
+    p99: float = Field(..., description="99-й процентиль времени выполнения (с)")
+    max: float = Field(..., description="Наибольшее время выполнения (с)")
+
+
+class SearchInputSchema(BaseModel):
+    """Класс для параметров поиска алгоритмов."""
+
+    q: str | None = Field(
+        None,
+        max_length=200,
+        description="Поисковый запрос: слова из имени, заголовка или описания "
+        "алгоритма, допускается начало слова",
+    )
+    data_type: DataTypeEnum | None = Field(
+        None, description="Тип данных одного из входных параметров алгоритма"
+    )
+    data_shape: DataShapeEnum | None = Field(
+        None, description="Размерность одного из входных параметров алгоритма"
+    )
+    sort: CatalogSortEnum = Field(
+        CatalogSortEnum.NAME, description="Поле для сортировки результатов"
+    )
+    size: int = Field(
+        50,
+        ge=1,
+        le=100,
+        description="Количество объектов на странице, должно быть от 1 до 100",
+    )
+    cursor: str | None = Field(
+        None, description="Курсор следующей страницы из предыдущего ответа"
+    )
+
+
+class FacetsSchema(BaseModel):
+    """Класс для вывода количества найденных алгоритмов по значениям фасетов."""
+
+    data_type: dict[str, int] = Field(
+        ..., description="Количество алгоритмов по типам данных входных параметров"
+    )
+    data_shape: dict[str, int] = Field(
+        ...,
+        description="Количество алгоритмов по размерностям входных параметров",
+    )
+
+
+class SearchPageSchema(BaseModel):
+    """Класс для вывода результатов поиска с постраничным выводом по курсору."""
+
+    items: list[DefinitionSchema] = Field(
+        ..., description="Список объектов на текущей странице"
+    )
+    total: int = Field(..., description="Общее количество найденных объектов")
+    size: int = Field(..., description="Максимальное количество объектов на странице")
+    next_cursor: str | None = Field(
+        ..., description="Курсор следующей страницы, null для последней страницы"
+    )
+    facets: FacetsSchema = Field(
+        ..., description="Количество найденных объектов по значениям фасетов"
+    )
+
+
+class SessionRequestSchema(BaseModel):
+    """Класс для сообщения с входными данными в сессии выполнения алгоритма."""
+
+    id: int | str | None = Field(
+        None, description="Идентификатор запроса, возвращается в ответе на него"
+    )
+    parameters: DataElementsSchema = Field(
+        ..., description="Значения параметров для выполнения алгоритма"
+    )
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, Response
+from pydantic_core import to_json
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.constants import SEARCH_ENDPOINT
+from src.routers.algorithms import get_app_algorithms
+from src.routers.schemas import SearchInputSchema, SearchPageSchema
+
+router = APIRouter(
+    prefix=SEARCH_ENDPOINT,
+)
+
+
+@router.get(
+    "/",
+    response_model=SearchPageSchema,
+    summary="Найти алгоритмы",
+    description="Возвращает алгоритмы, в имени, заголовке или описании которых "
+    "есть все слова запроса, с отбором по типу и размерности входных данных. "
+    "Для получения следующей страницы передается курсор из предыдущего ответа.",
+    response_description="Найденные алгоритмы, курсор следующей страницы и "
+    "количество найденных алгоритмов по значениям фасетов.",
+)
+async def search_algorithms(
+    search: SearchInputSchema = Depends(),
+    algorithms: AlgorithmCollection = Depends(get_app_algorithms),
+) -> Response:
+    result = algorithms.catalog_index.search(
+        search.q,
+        search.data_type,
+        search.data_shape,
+        search.sort,
+        search.size,
+        search.cursor,
+    )
+    return Response(to_json(result), media_type="application/json")
@@ -0,0 +1,193 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Path, Query, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from src.internal.constants import WS_ALGORITHMS_ENDPOINT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.priority_enum import PriorityEnum
+from src.internal.metrics import MetricsRegistry
+from src.routers.algorithms import get_app_algorithms, get_app_scheduler
+from src.routers.error_handlers import get_error_status
+from src.routers.schemas import SessionRequestSchema
+
+router = APIRouter(
+    prefix=WS_ALGORITHMS_ENDPOINT,
+)
+logger = logging.getLogger(__name__)
+
+
+class AlgorithmSession:
+    """Класс обслуживает сессию выполнения алгоритма через WebSocket. Клиент
+    отправляет сообщения с входными данными, сессия выполняет алгоритм и
+    отправляет результаты. Если новое сообщение приходит до завершения
+    предыдущего выполнения, предыдущее выполнение отменяется: клиенту нужен
+    только результат для последних входных данных.
+
+    Сообщения клиента - JSON-объект {"id": ..., "parameters": [...]} или список
+    значений параметров, как в теле запроса POST .../results. Сообщения
+    сессии - JSON-объекты с полями type ("result", "error" или "superseded") и
+    id запроса; результат передается в поле result, ошибка - в полях status и
+    detail.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        algorithm_name: str,
+        scheduler: AlgorithmScheduler,
+        metrics: MetricsRegistry,
+        priority: PriorityEnum = PriorityEnum.NORMAL,
+    ):
+        """Конструктор класса
+
+        :param websocket: соединение WebSocket;
+        :type websocket: WebSocket
+        :param algorithm_name: имя алгоритма;
+        :type algorithm_name: str
+        :param scheduler: планировщик выполнения алгоритмов;
+        :type scheduler: AlgorithmScheduler
+        :param metrics: реестр метрик;
+        :type metrics: MetricsRegistry
+        :param priority: приоритет выполнения;
+        :type priority: PriorityEnum
+        """
+        self.__websocket: WebSocket = websocket
+        self.__algorithm_name: str = algorithm_name
+        self.__scheduler: AlgorithmScheduler = scheduler
+        self.__metrics: MetricsRegistry = metrics
+        self.__priority: PriorityEnum = priority
+        self.__task: asyncio.Task | None = None
+        self.__request_id: int | str | None = None
+        self.__send_lock = asyncio.Lock()
+
+    async def serve(self) -> None:
+        """Принимает сообщения клиента до закрытия соединения. При закрытии
+        соединения текущее выполнение отменяется."""
+        self.__metrics.increment("websocket.sessions")
+        try:
+            while True:
+                message = await self.__websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                data = message.get("text")
+                if data is None:
+                    data = message.get("bytes")
+                await self.__submit(data)
+        finally:
+            await self.__cancel()
+
+    async def __submit(self, data: str | bytes | None) -> None:
+        """Разбирает сообщение клиента и запускает выполнение алгоритма,
+        отменяя предыдущее выполнение."""
+        try:
+            content = json.loads(data or b"")
+            if isinstance(content, list):
+                content = {"parameters": content}
+            request = SessionRequestSchema.model_validate(content)
+        except ValidationError as ex:
+            await self.__send(
+                {
+                    "type": "error",
+                    "id": content.get("id") if isinstance(content, dict) else None,
+                    "status": 422,
+                    "detail": ex.errors(include_url=False, include_context=False),
+                }
+            )
+            return
+        except ValueError as ex:
+            await self.__send(
+                {
+                    "type": "error",
+                    "id": None,
+                    "status": 422,
+                    "detail": ErrMsgTmpl.INVALID_SESSION_MESSAGE.format(ex),
+                }
+            )
+            return
+        # значения уже проверены схемой DataElementsSchema при разборе
+        values = {param.name: param.value for param in request.parameters}
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__metrics.increment("websocket.superseded")
+            await self.__send({"type": "superseded", "id": self.__request_id})
+        self.__request_id = request.id
+        self.__task = asyncio.create_task(self.__run(values))
+
+    async def __run(self, values: dict[str, Any]) -> None:
+        """Выполняет алгоритм и отправляет клиенту результат или ошибку.
+        Выполнение, получившее результат, больше не может быть отменено новым
+        сообщением клиента."""
+        try:
+            result = await self.__scheduler.execute(
+                self.__algorithm_name, values, self.__priority
+            )
+            message = {
+                "type": "result",
+                "result": [
+                    {"name": element.name, "value": element.value} for element in result
+                ],
+            }
+        except Exception as ex:
+            code, detail = get_error_status(ex)
+            if code == 500:
+                logger.error(str(ex))
+            message = {"type": "error", "status": code, "detail": detail}
+        message["id"] = self.__request_id
+        self.__task = None
+        await self.__send(message)
+
+    async def __cancel(self) -> None:
+        """Отменяет текущее выполнение и дожидается его завершения."""
+        task, self.__task = self.__task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def __send(self, message: dict[str, Any]) -> None:
+        """Отправляет сообщение клиенту, если соединение не закрыто."""
+        payload = to_json(message, inf_nan_mode="null").decode()
+        async with self.__send_lock:
+            try:
+                await self.__websocket.send_text(payload)
+            except (WebSocketDisconnect, RuntimeError):
+                pass
+
+
+@router.websocket("/{algorithm_name}")
+async def algorithm_session(
+    websocket: WebSocket,
+    algorithm_name: str = Path(..., description="Название алгоритма"),
+    priority: PriorityEnum = Query(
+        PriorityEnum.NORMAL, description="Приоритет выполнения алгоритма"
+    ),
+):
+    await websocket.accept()
+    if not get_app_algorithms(websocket).has_algorithm(algorithm_name):
+        await websocket.send_json(
+            {
+                "type": "error",
+                "id": None,
+                "status": 404,
+                "detail": ErrMsgTmpl.ALGORITHM_NOT_EXISTS.format(algorithm_name),
+            }
+        )
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    session = AlgorithmSession(
+        websocket,
+        algorithm_name,
+        get_app_scheduler(websocket),
+        websocket.app.state.metrics,
+        priority,
+    )
+    await session.serve()
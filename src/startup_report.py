@@ -0,0 +1,44 @@
+"""Отчет о времени запуска приложения. Модуль импортирует приложение и создает
+его экземпляр под профилировщиком запуска, сохраняет интервалы в формате
+Chrome Trace Event и выводит суммарное время этапов запуска."""
+
+import sys
+
+from src.internal.constants import DEFAULT_STARTUP_TRACE_PATH
+from src.internal.startup_profiler import startup_profiler
+from src.internal.startup_stage_enum import StartupStageEnum
+
+
+def create_report(path: str) -> dict[str, float]:
+    """Создает экземпляр приложения под профилировщиком запуска и сохраняет
+    отчет в файл.
+
+    :param path: путь к файлу отчета;
+    :type path: str
+    :return: суммарное время (с) этапов запуска.
+    :rtype: dict[str, float]
+    """
+    startup_profiler.start()
+    try:
+        from src.main import create_app
+
+        with startup_profiler.span(StartupStageEnum.APP, "create_app"):
+            create_app()
+    finally:
+        startup_profiler.stop()
+    startup_profiler.write(path)
+    return startup_profiler.get_summary()
+
+
+def start():
+    """Формирует отчет о времени запуска приложения. Путь к файлу отчета можно
+    передать первым аргументом командной строки."""
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_STARTUP_TRACE_PATH
+    summary = create_report(path)
+    for stage in StartupStageEnum:
+        print(f"{stage:<12}{summary.get(stage, 0.0) * 1000:10.1f} ms")
+    print(f"trace: {path}")
+
+
+if __name__ == "__main__":
+    start()
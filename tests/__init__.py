@@ -200,6 +200,128 @@ BOOL_FUNC = """
 def main(x: bool):
     return {'y': x}"""
 
+BUSY_NAME = "busy"
+BUSY_DEF = {
+    "name": BUSY_NAME,
+    "title": BUSY_NAME,
+    "description": BUSY_NAME,
+    "parameters": [
+        {
+            "name": "n",
+            "title": "n",
+            "description": "n",
+            "data_type": "INT",
+            "data_shape": "SCALAR",
+            "default_value": 1,
+        },
+    ],
+    "outputs": [
+        {
+            "name": "result",
+            "title": "result",
+            "description": "result",
+            "data_type": "INT",
+            "data_shape": "SCALAR",
+            "default_value": 1,
+        }
+    ],
+}
+BUSY_FUNC = """
+def main(n: int):
+    i = 0
+    while i < n:
+        i += 1
+    return {'result': n}"""
+
+PROGRESS_NAME = "progress"
+PROGRESS_DEF = {**BUSY_DEF, "name": PROGRESS_NAME, "title": PROGRESS_NAME}
+PROGRESS_FUNC = """
+import time
+def main(n: int, progress):
+    for i in range(n):
+        progress(i / n, f'step {i}')
+        time.sleep(0.01)
+    return {'result': n}"""
+
+ALLOC_NAME = "alloc"
+ALLOC_DEF = {**BUSY_DEF, "name": ALLOC_NAME, "title": ALLOC_NAME}
+ALLOC_FUNC = """
+def main(n: int):
+    data = bytearray(n * 1024 * 1024)
+    return {'result': n if data is not None else 0}"""
+
+LENGTH_NAME = "length"
+LENGTH_DEF = {
+    "name": LENGTH_NAME,
+    "title": "Длина списка",
+    "description": "Количество элементов списка",
+    "parameters": [
+        {
+            "name": "items",
+            "title": "items",
+            "description": "items",
+            "data_type": "INT",
+            "data_shape": "LIST",
+            "default_value": [1, 2],
+            "max_length": 3,
+        },
+    ],
+    "outputs": [
+        {
+            "name": "result",
+            "title": "result",
+            "description": "result",
+            "data_type": "INT",
+            "data_shape": "SCALAR",
+            "default_value": 2,
+        }
+    ],
+}
+LENGTH_FUNC = """
+def main(items: list):
+    return {'result': len(items)}"""
+
+SHIFT_NAME = "shift"
+SHIFT_DEF = {
+    "name": SHIFT_NAME,
+    "title": "Сдвиг матрицы",
+    "description": "Вычитает единицу из каждого элемента матрицы",
+    "parameters": [
+        {
+            "name": "matrix",
+            "title": "matrix",
+            "description": "matrix",
+            "data_type": "FLOAT",
+            "data_shape": "MATRIX",
+            "default_value": [[1.5]],
+        },
+    ],
+    "outputs": [
+        {
+            "name": "result",
+            "title": "result",
+            "description": "result",
+            "data_type": "FLOAT",
+            "data_shape": "MATRIX",
+            "default_value": [[0.5]],
+        }
+    ],
+}
+SHIFT_FUNC = """
+def main(matrix: list):
+    return {'result': [[item - 1 for item in row] for row in matrix]}"""
+
+MEMO_NAME = "memo_fibonacci"
+MEMO_DEF = {**FIB_DEF, "name": MEMO_NAME, "title": MEMO_NAME}
+MEMO_FUNC = """from src import algoscalc
+@algoscalc.memoize(persistent=True)
+def fibonacci(n: int) -> int:
+    if n == 1 or n == 2:
+        return 1
+    return fibonacci(n - 1) + fibonacci(n - 2)
+def main(n: int):
+    return {'result': fibonacci(n)}"""
+
 MOCK_TESTS = """import unittest
 class TestCase(unittest.TestCase):
     def test_func(self):
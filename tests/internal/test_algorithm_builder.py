@@ -1,6 +1,7 @@
 import pytest
 
 from src.internal.algorithm_builder import AlgorithmBuilder
+from src.internal.algorithm_verifier import get_algorithm_digest
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from tests import (
@@ -9,8 +10,10 @@ from tests import (
     FIB_FUNC,
     FIB_NAME,
     FIB_TESTS,
+    MOCK_TESTS,
     NOT_INT_CASES,
     NOT_STRING_CASES,
+    SUM_NAME,
     WRONG_FIB_TESTS,
     Case,
 )
@@ -25,6 +28,7 @@ class TestAlgorithmBuilder:
         algo_executor = builder.build_algorithm(fib_algo_dir)
 
         assert algo_executor.definition.name == FIB_NAME
+        assert algo_executor.digest == get_algorithm_digest(fib_algo_dir)
 
     @pytest.mark.parametrize(
         "test_case",
@@ -189,6 +193,35 @@ class TestAlgorithmBuilder:
 
         assert str(error.value) == ErrMsg.UNIT_TEST_FAILED
 
+    def test_build_shared(self, algo_dir):
+        """Проверяет, что алгоритмы с одинаковым содержимым каталогов и
+        параметрами сборки используют общий экземпляр AlgorithmExecutor"""
+        first = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        second = algo_dir(SUM_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        algo_executor = AlgorithmBuilder().build_algorithm(first)
+
+        assert AlgorithmBuilder().build_algorithm(second) is algo_executor
+        assert (
+            AlgorithmBuilder(execute_timeout=1).build_algorithm(second)
+            is not algo_executor
+        )
+
+    def test_build_compiled_shared(self, algo_dir):
+        """Проверяет, что алгоритм из снимка каталога использует общий
+        экземпляр AlgorithmExecutor без загрузки байт-кода"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        algo_executor = AlgorithmBuilder().build_algorithm(path)
+
+        def get_code():
+            raise AssertionError(path)
+
+        assert (
+            AlgorithmBuilder().build_compiled_algorithm(
+                path, algo_executor.definition, get_code, get_algorithm_digest(path)
+            )
+            is algo_executor
+        )
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestAlgorithmBuilder"])
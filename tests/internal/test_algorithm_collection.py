@@ -1,10 +1,19 @@
+import json
+import os
+
 import pytest
 
+from src.internal.algorithm_builder import AlgorithmBuilder
 from src.internal.algorithm_collection import AlgorithmCollection
-from src.internal.constants import DEFAULT_ALGORITHMS_CATALOG_PATH
+from src.internal.catalog_snapshot import create_snapshot
+from src.internal.constants import (
+    DEFAULT_ALGORITHMS_CATALOG_PATH,
+    DEFAULT_FUNCTION_FILE_NAME,
+)
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
-from src.internal.errors.exceptions import AlgorithmNotFoundError
+from src.internal.errors.exceptions import AlgorithmNotFoundError, AlgorithmValueError
+from src.internal.execution_log import ExecutionLog
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
@@ -104,6 +113,158 @@ class TestAlgorithmCollection:
 
         assert str(error.value) == ErrMsgTmpl.ALGORITHM_NOT_EXISTS.format("not_existed")
 
+    def test_get_trusted_algorithm_result(self, fib_algo_dir, tmp_path):
+        """Проверяет выполнение алгоритма со значениями входных данных,
+        переданными словарем"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+
+        result = algo_collection.get_trusted_algorithm_result(FIB_NAME, {"n": 10})
+
+        assert result == [DataElementSchema(name="result", value=55)]
+
+    def test_get_not_existed_trusted_algorithm_result(self, fib_algo_dir, tmp_path):
+        """Проверяет ошибку выполнения несуществующего алгоритма со значениями
+        входных данных, переданными словарем"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+
+        with pytest.raises(AlgorithmNotFoundError) as error:
+            algo_collection.get_trusted_algorithm_result("not_existed", {"n": 1})
+
+        assert str(error.value) == ErrMsgTmpl.ALGORITHM_NOT_EXISTS.format("not_existed")
+
+    def test_execution_log(self, fib_algo_dir, tmp_path):
+        """Проверяет запись выполнений алгоритма в журнал выполнения"""
+        log_path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(str(log_path), sample_rate=1, batch_size=10)
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), execution_log=execution_log
+        )
+
+        algo_collection.get_algorithm_result(
+            FIB_NAME, [DataElementSchema(name="n", value=1)]
+        )
+        algo_collection.get_trusted_algorithm_result(FIB_NAME, {"n": 10})
+        execution_log.flush()
+        records = [json.loads(line) for line in log_path.read_text().splitlines()]
+
+        assert algo_collection.execution_log is execution_log
+        assert len(records) == 2
+        for record in records:
+            assert record["algorithm"] == FIB_NAME
+            assert record["input_size"] == 1
+            assert record["outcome"] == "success"
+            assert record["sampling"] == "head"
+            assert record["validation_time"] >= 0
+            assert record["execution_time"] > 0
+
+    def test_execution_log_error(self, fib_algo_dir, tmp_path):
+        """Проверяет запись в журнал выполнения, не отобранного до начала и
+        завершившегося ошибкой"""
+        log_path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(str(log_path), sample_rate=0, batch_size=1)
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), execution_log=execution_log
+        )
+
+        algo_collection.get_trusted_algorithm_result(FIB_NAME, {"n": 10})
+        with pytest.raises(AlgorithmValueError):
+            algo_collection.get_trusted_algorithm_result(FIB_NAME, {"m": 10})
+        [record] = [json.loads(line) for line in log_path.read_text().splitlines()]
+
+        assert record["outcome"] == AlgorithmValueError.__name__
+        assert record["sampling"] == "error"
+        assert record["execution_time"] == 0
+
+    def test_get_catalog_page(self, fib_algo_dir, tmp_path):
+        """Проверяет получение страницы каталога, отрендеренной один раз для
+        версии набора алгоритмов"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+
+        catalog_page = algo_collection.get_catalog_page(1, 10)
+
+        assert json.loads(catalog_page.body)["items"] == [
+            DefinitionSchema.model_validate(FIB_DEF).model_dump()
+        ]
+        assert algo_collection.get_catalog_page(1, 10) is catalog_page
+
+    def test_reload_unchanged(self, fib_algo_dir, tmp_path):
+        """Проверяет, что перезагрузка без изменений не меняет версию набора
+        алгоритмов и каталог"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+        catalog_page = algo_collection.get_catalog_page(1, 10)
+
+        assert algo_collection.reload() == 0
+        assert algo_collection.get_catalog_page(1, 10) is catalog_page
+
+    def test_reload_changed(self, fib_algo_dir, tmp_path, algo_dir):
+        """Проверяет, что перезагрузка с новым алгоритмом меняет версию набора
+        алгоритмов и каталог"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+        catalog_page = algo_collection.get_catalog_page(1, 10)
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+
+        assert algo_collection.reload() == 1
+        assert algo_collection.version == 1
+        assert algo_collection.has_algorithm(SUM_NAME)
+        assert algo_collection.get_catalog_page(1, 10).etag != catalog_page.etag
+        assert json.loads(algo_collection.get_catalog_page(1, 10).body)["total"] == 2
+
+    def test_reload_function_changed(self, fib_algo_dir, tmp_path):
+        """Проверяет, что изменение кода алгоритма без изменения описания
+        меняет версию набора алгоритмов"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+        digest = algo_collection.get_algorithm_digest(FIB_NAME)
+        func_file = os.path.join(fib_algo_dir, DEFAULT_FUNCTION_FILE_NAME)
+        with open(func_file, "a", encoding="utf-8") as file:
+            file.write("\n# changed\n")
+
+        assert algo_collection.reload() == 1
+        assert algo_collection.get_algorithm_digest(FIB_NAME) != digest
+
+    def test_reload_failed(self, fib_algo_dir, tmp_path, algo_dir):
+        """Проверяет, что при ошибке перезагрузки набор алгоритмов не
+        изменяется"""
+        algo_collection = AlgorithmCollection(str(tmp_path))
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, WRONG_FIB_TESTS)
+
+        with pytest.raises(RuntimeError):
+            algo_collection.reload()
+        assert algo_collection.version == 0
+        assert not algo_collection.has_algorithm(SUM_NAME)
+
+    def test_load_snapshot(self, algo_dir, tmp_path, monkeypatch):
+        """Проверяет, что алгоритмы загружаются из снимка каталога без сборки
+        из каталога"""
+        algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        snapshot_path = str(tmp_path.parent / "catalog.pickle")
+        create_snapshot(str(tmp_path)).write(snapshot_path)
+
+        def build_algorithm(self, path):
+            raise AssertionError(path)
+
+        monkeypatch.setattr(AlgorithmBuilder, "build_algorithm", build_algorithm)
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), snapshot_path=snapshot_path, snapshot_mmap=True
+        )
+
+        assert algo_collection.get_trusted_algorithm_result(FIB_NAME, {"n": 10}) == [
+            DataElementSchema(name="result", value=55)
+        ]
+
+    def test_stale_snapshot(self, algo_dir, tmp_path):
+        """Проверяет, что при устаревшем снимке каталога алгоритмы собираются
+        из каталога"""
+        algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        snapshot_path = str(tmp_path.parent / "catalog.pickle")
+        create_snapshot(str(tmp_path)).write(snapshot_path)
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), snapshot_path=snapshot_path
+        )
+
+        assert algo_collection.has_algorithm(SUM_NAME)
+
     def test_build_real_algorithms(self):
         """Проверяет создание экземпляра класса со сборкой имеющихся в приложении
         алгоритмов"""
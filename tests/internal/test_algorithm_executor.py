@@ -1,19 +1,30 @@
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
+from src.internal import algorithm_executor
 from src.internal.algorithm_executor import AlgorithmExecutor
 from src.internal.constants import DEFAULT_TIMEOUT
+from src.internal.data_dimension.compact_array import CompactArray
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
 from src.internal.errors import ErrorMessageEnum as ErrMsg
 from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
 from src.internal.errors.exceptions import (
+    AlgorithmInputTooLargeError,
+    AlgorithmResourceLimitError,
     AlgorithmTimeoutError,
     AlgorithmTypeError,
     AlgorithmUnexpectedError,
     AlgorithmValueError,
 )
+from src.internal.execution.watchdog import ExecutionTimeout, ExecutionWatchdog
+from src.internal.schemas.data_definition_schema import DataDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementSchema
-from tests import NOT_INT_CASES, SCALAR_CASES, Case
+from src.internal.schemas.execution_limits_schema import ExecutionLimitsSchema
+from tests import DESCRIPTION, NOT_INT_CASES, SCALAR_CASES, TITLE, Case
 
 
 def default_method(x):
@@ -40,6 +51,16 @@ class TestAlgorithmExecutor:
         assert algo_executor.definition == algo_definition
         assert algo_executor.execute_timeout == timeout
 
+    def test_definition_timeout(self, create_algo_definition):
+        """Проверяет, что таймаут из описания алгоритма имеет приоритет над
+        таймаутом, переданным конструктору"""
+        algo_definition = create_algo_definition().model_copy(
+            update={"limits": ExecutionLimitsSchema(timeout=5)}
+        )
+
+        algo_executor = AlgorithmExecutor(algo_definition, default_method, 1)
+        assert algo_executor.execute_timeout == 5
+
     @pytest.mark.parametrize(
         "test_case",
         NOT_INT_CASES,
@@ -93,6 +114,45 @@ class TestAlgorithmExecutor:
             AlgorithmExecutor(algo_definition, method, timeout)
         assert str(error.value) == ErrMsgTmpl.ADDING_METHOD_FAILED.format(timeout_msg)
 
+    def test_execute_timeout_in_thread(self, create_algo_definition):
+        """Проверяет прерывание исполнения по истечению таймаута в рабочем
+        потоке, где недоступен сигнал SIGALRM"""
+        algo_definition = create_algo_definition()
+        timeout = 1
+        slow = {"enabled": False}
+
+        def method(x):
+            deadline = time.monotonic() + timeout + 1
+            while slow["enabled"] and time.monotonic() < deadline:
+                pass
+            return {"y": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method, timeout)
+        slow["enabled"] = True
+        params = [DataElementSchema(name="x", value=1)]
+        with ThreadPoolExecutor(1) as pool:
+            future = pool.submit(algo_executor.execute, params)
+            with pytest.raises(AlgorithmTimeoutError) as error:
+                future.result()
+        assert str(error.value) == ErrMsgTmpl.TIME_OVER.format(timeout)
+
+    def test_execute_memory_error(self, create_algo_definition):
+        """Проверяет преобразование ошибки нехватки памяти в ошибку превышения
+        лимита ресурсов"""
+        algo_definition = create_algo_definition()
+        fail = {"enabled": False}
+
+        def method(x):
+            if fail["enabled"]:
+                raise MemoryError()
+            return {"y": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+        fail["enabled"] = True
+        with pytest.raises(AlgorithmResourceLimitError) as error:
+            algo_executor.execute([DataElementSchema(name="x", value=1)])
+        assert str(error.value) == ErrMsg.MEMORY_LIMIT_EXCEEDED
+
     def test_zero_execute_timeout(self, create_algo_definition):
         """Проверяет отключение контроля времени выполнения
         при указании 0 таймаута"""
@@ -226,6 +286,94 @@ class TestAlgorithmExecutor:
             DataElementSchema(name="sum", value=30)
         ]
 
+    def test_execute_trusted(self, create_algo_definition):
+        """Проверяет выполнение алгоритма со значениями входных данных,
+        переданными словарем"""
+        algo_definition = create_algo_definition()
+        algo_executor = AlgorithmExecutor(algo_definition, default_method)
+
+        assert algo_executor.execute_trusted({"x": 10}) == [
+            DataElementSchema(name="y", value=10)
+        ]
+
+    def test_execute_trusted_skips_schema_validation(
+        self, create_algo_definition, monkeypatch
+    ):
+        """Проверяет, что значения входных данных не проверяются схемой
+        DataElementsSchema повторно"""
+        algo_definition = create_algo_definition()
+        algo_executor = AlgorithmExecutor(algo_definition, default_method)
+
+        def fail_validation(*args, **kwargs):
+            raise AssertionError("повторная проверка схемой")
+
+        monkeypatch.setattr(
+            "src.internal.algorithm_executor.DataElementsSchema.model_validate",
+            fail_validation,
+        )
+        assert algo_executor.execute_trusted({"x": 1}) == [
+            DataElementSchema(name="y", value=1)
+        ]
+
+    @pytest.mark.parametrize(
+        "values, message",
+        [
+            ({"x": "1"}, None),
+            ({}, ErrMsgTmpl.MISSED_PARAMETER.format("x")),
+            ({"x": 1, "z": 1}, ErrMsgTmpl.REDUNDANT_PARAMETER.format("z")),
+            (1, ErrMsg.INCORRECT_PARAMS),
+        ],
+    )
+    def test_execute_trusted_invalid_values(
+        self, create_algo_definition, values, message
+    ):
+        """Проверяет, что значения входных данных проверяются на соответствие
+        описанию алгоритма"""
+        algo_definition = create_algo_definition()
+        algo_executor = AlgorithmExecutor(algo_definition, default_method)
+
+        with pytest.raises((AlgorithmTypeError, AlgorithmValueError)) as error:
+            algo_executor.execute_trusted(values)
+        if message is not None:
+            assert str(error.value) == message
+
+    def test_execute_trusted_progress(self, create_algo_definition):
+        """Проверяет передачу сведений о ходе выполнения алгоритма, функция
+        которого принимает параметр progress"""
+        algo_definition = create_algo_definition()
+        events = []
+
+        def method(x, progress):
+            progress(0.5, "half")
+            progress(0.6)
+            progress(1, "done")
+            return {"y": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+        result = algo_executor.execute_trusted(
+            {"x": 1}, lambda fraction, message: events.append((fraction, message))
+        )
+
+        assert algo_executor.accepts_progress
+        assert result == [DataElementSchema(name="y", value=1)]
+        assert events == [(0.5, "half"), (1.0, "done")]
+
+    def test_execute_progress_without_listener(self, create_algo_definition):
+        """Проверяет выполнение алгоритма с параметром progress без получателя
+        сведений о ходе выполнения"""
+        algo_definition = create_algo_definition()
+
+        def method(x, progress):
+            progress(0.5)
+            return {"y": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+
+        assert algo_executor.execute_trusted({"x": 2}) == [
+            DataElementSchema(name="y", value=2)
+        ]
+        assert not AlgorithmExecutor(algo_definition, default_method).accepts_progress
+
     def test_execute_non_dict_params(self, create_algo_definition):
         """Проверяет ошибку выполнения алгоритма при передаче параметров
         в некорректном формате"""
@@ -307,6 +455,103 @@ class TestAlgorithmExecutor:
             algo_executor.execute(params)
         assert str(error.value) == ErrMsgTmpl.TIME_OVER.format(timeout, params)
 
+    def test_execute_late_timeout(self, create_algo_definition, monkeypatch):
+        """Проверяет, что прерывание по истечении срока, сработавшее после
+        возврата из функции алгоритма при снятии срока, преобразуется в ошибку
+        таймаута, а срок все равно снимается"""
+        watchdog = ExecutionWatchdog()
+        disarm = watchdog.disarm
+        calls = []
+
+        def late_disarm(token):
+            calls.append(token)
+            if len(calls) == 1:
+                raise ExecutionTimeout()
+            return disarm(token)
+
+        monkeypatch.setattr(watchdog, "disarm", late_disarm)
+        monkeypatch.setattr(algorithm_executor, "execution_watchdog", watchdog)
+        algo_executor = AlgorithmExecutor(create_algo_definition(), default_method, 1)
+
+        def execute():
+            try:
+                algo_executor.execute_trusted({"x": 1})
+            except AlgorithmTimeoutError as ex:
+                time.sleep(1.2)
+                for _ in range(1000):
+                    pass
+                return ex
+
+        with ThreadPoolExecutor(1) as pool:
+            error = pool.submit(execute).result()
+        assert str(error) == ErrMsgTmpl.TIME_OVER.format(1)
+        assert len(calls) == 2
+
+    def test_execute_trusted_timeout(self, create_algo_definition):
+        """Проверяет прерывание выполнения по таймауту, переданному для
+        одного выполнения"""
+        algo_definition = create_algo_definition()
+
+        def method(x):
+            time.sleep(x)
+            return {"y": x}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method, 0)
+
+        with pytest.raises(AlgorithmTimeoutError) as error:
+            algo_executor.execute_trusted({"x": 2}, timeout=1)
+        assert str(error.value) == ErrMsgTmpl.TIME_OVER.format(1)
+
+    def test_execute_input_too_large(self, create_algo_definition):
+        """Проверяет ошибку превышения ограничения размера входных данных"""
+        parameter = DataDefinitionSchema(
+            name="x",
+            title=TITLE,
+            description=DESCRIPTION,
+            data_type=DataTypeEnum.INT,
+            data_shape=DataShapeEnum.LIST,
+            default_value=[1],
+            max_length=2,
+        )
+        algo_definition = create_algo_definition(parameters=[parameter])
+        algo_executor = AlgorithmExecutor(algo_definition, lambda x: {"y": 1})
+
+        with pytest.raises(AlgorithmInputTooLargeError) as error:
+            algo_executor.execute_trusted({"x": [1, 2, 3]})
+        assert str(error.value) == ErrMsgTmpl.INPUT_TOO_LARGE.format(
+            "x", ErrMsgTmpl.TOO_LONG_LIST.format(3, 2)
+        )
+
+    @pytest.mark.parametrize("compact", [None, True])
+    def test_execute_trusted_compact(self, create_algo_definition, compact):
+        """Проверяет, что значение в CompactArray передается функции
+        алгоритма в компактном виде только для элементов с признаком compact"""
+        parameter = DataDefinitionSchema(
+            name="x",
+            title=TITLE,
+            description=DESCRIPTION,
+            data_type=DataTypeEnum.INT,
+            data_shape=DataShapeEnum.LIST,
+            default_value=[1],
+            compact=compact,
+        )
+        algo_definition = create_algo_definition(parameters=[parameter])
+        received = []
+
+        def method(x):
+            received.append(x)
+            return {"y": len(x)}
+
+        algo_executor = AlgorithmExecutor(algo_definition, method)
+        value = CompactArray(DataTypeEnum.INT, array("q", [1, 2, 3]))
+
+        outputs = algo_executor.execute_trusted({"x": value})
+        assert outputs[0].value == 3
+        if compact:
+            assert received[-1] is value
+        else:
+            assert received[-1] == [1, 2, 3]
+
     def test_execute_runtime_error(
         self, create_scalar_float_data_definition, create_algo_definition
     ):
@@ -0,0 +1,146 @@
+import json
+import sys
+
+import pytest
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.algorithm_plugins import get_algorithm_packages, get_package_path
+from src.internal.constants import (
+    DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP,
+    DEFAULT_DEFINITION_FILE_NAME,
+    DEFAULT_FUNCTION_FILE_NAME,
+    DEFAULT_TEST_FILE_NAME,
+)
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import (
+    FIB_DEF,
+    FIB_FUNC,
+    FIB_NAME,
+    MOCK_TESTS,
+    SUM_DEF,
+    SUM_FUNC,
+    SUM_NAME,
+    WRONG_FIB_TESTS,
+)
+
+
+@pytest.fixture()
+def plugin_site(tmp_path_factory, monkeypatch):
+    """Создает установленный пакет с алгоритмами, зарегистрированными точками
+    входа"""
+
+    def _plugin_site(bundle, algorithms):
+        site = tmp_path_factory.mktemp("site")
+        package = site / bundle
+        package.mkdir()
+        (package / "__init__.py").write_text(" ")
+        entry_points = [f"[{DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP}]"]
+        for name, (algo_def, algo_func, algo_test) in algorithms.items():
+            algo_dir = package / name
+            algo_dir.mkdir()
+            (algo_dir / "__init__.py").write_text(" ")
+            def_file = algo_dir / DEFAULT_DEFINITION_FILE_NAME
+            def_file.write_text(json.dumps(algo_def), encoding="utf-8")
+            func_file = algo_dir / DEFAULT_FUNCTION_FILE_NAME
+            func_file.write_text(algo_func, encoding="utf-8")
+            test_file = algo_dir / DEFAULT_TEST_FILE_NAME
+            test_file.write_text(algo_test, encoding="utf-8")
+            entry_points.append(f"{name} = {bundle}.{name}")
+        dist_info = site / f"{bundle}-1.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {bundle}\nVersion: 1.0\n"
+        )
+        (dist_info / "entry_points.txt").write_text("\n".join(entry_points) + "\n")
+        monkeypatch.syspath_prepend(str(site))
+        return str(package)
+
+    return _plugin_site
+
+
+class TestAlgorithmPlugins:
+    """Тесты для поиска алгоритмов, установленных как пакеты."""
+
+    def test_get_algorithm_packages(self, plugin_site):
+        """Проверяет поиск пакетов алгоритмов по точкам входа"""
+        plugin_site(
+            "bundle_packages",
+            {
+                SUM_NAME: (SUM_DEF, SUM_FUNC, MOCK_TESTS),
+                FIB_NAME: (FIB_DEF, FIB_FUNC, MOCK_TESTS),
+            },
+        )
+
+        assert get_algorithm_packages() == [
+            f"bundle_packages.{FIB_NAME}",
+            f"bundle_packages.{SUM_NAME}",
+        ]
+        assert get_algorithm_packages("algoscalc.unknown") == []
+
+    def test_get_package_path(self, plugin_site):
+        """Проверяет путь к каталогу пакета алгоритма"""
+        package = plugin_site(
+            "bundle_path", {SUM_NAME: (SUM_DEF, SUM_FUNC, MOCK_TESTS)}
+        )
+
+        assert get_package_path(f"bundle_path.{SUM_NAME}") == package + "/" + SUM_NAME
+
+    def test_get_package_path_not_package(self):
+        """Проверяет ошибку, если модуль не является пакетом"""
+        with pytest.raises(ValueError) as error:
+            get_package_path("json.decoder")
+
+        assert str(error.value) == ErrMsgTmpl.NOT_ALGORITHM_PACKAGE.format(
+            "json.decoder"
+        )
+
+    def test_collection(self, plugin_site, fib_algo_dir, tmp_path):
+        """Проверяет сборку алгоритмов установленных пакетов вместе с
+        алгоритмами каталога и обычный импорт модуля с методом алгоритма"""
+        plugin_site("bundle_collection", {SUM_NAME: (SUM_DEF, SUM_FUNC, MOCK_TESTS)})
+
+        algo_collection = AlgorithmCollection(
+            str(tmp_path), entry_point_group=DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP
+        )
+
+        assert algo_collection.has_algorithm(FIB_NAME)
+        assert algo_collection.get_trusted_algorithm_result(
+            SUM_NAME, {"a": 1, "b": 2}
+        ) == [DataElementSchema(name="result", value=3)]
+        assert f"bundle_collection.{SUM_NAME}.function" in sys.modules
+
+    def test_collection_without_group(self, plugin_site, fib_algo_dir, tmp_path):
+        """Проверяет, что без группы точек входа пакеты не используются"""
+        plugin_site("bundle_disabled", {SUM_NAME: (SUM_DEF, SUM_FUNC, MOCK_TESTS)})
+
+        algo_collection = AlgorithmCollection(str(tmp_path))
+
+        assert not algo_collection.has_algorithm(SUM_NAME)
+
+    def test_collection_duplicate(self, plugin_site, fib_algo_dir, tmp_path):
+        """Проверяет ошибку при совпадении имен алгоритмов каталога и пакета"""
+        plugin_site("bundle_duplicate", {FIB_NAME: (FIB_DEF, FIB_FUNC, MOCK_TESTS)})
+
+        with pytest.raises(RuntimeError) as error:
+            AlgorithmCollection(
+                str(tmp_path), entry_point_group=DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP
+            )
+
+        assert str(error.value) == ErrMsgTmpl.DUPLICATE_ALGORITHM.format(FIB_NAME)
+
+    def test_collection_failed_tests(self, plugin_site, fib_algo_dir, tmp_path):
+        """Проверяет ошибку, если тесты алгоритма пакета не пройдены"""
+        plugin_site("bundle_failed", {SUM_NAME: (SUM_DEF, SUM_FUNC, WRONG_FIB_TESTS)})
+
+        with pytest.raises(RuntimeError) as error:
+            AlgorithmCollection(
+                str(tmp_path), entry_point_group=DEFAULT_ALGORITHMS_ENTRY_POINT_GROUP
+            )
+
+        assert str(error.value) == ErrMsg.UNIT_TEST_FAILED
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestAlgorithmPlugins"])
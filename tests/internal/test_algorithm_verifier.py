@@ -0,0 +1,180 @@
+import json
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from src.internal import algorithm_verifier as verifier_module
+from src.internal.algorithm_verifier import (
+    AlgorithmVerifier,
+    get_algorithm_digest,
+    verify_catalog,
+)
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from tests import FIB_DEF, FIB_FUNC, FIB_NAME, MOCK_TESTS, SUM_NAME, WRONG_FIB_TESTS
+
+SLOW_TESTS = """import time
+import unittest
+class TestCase(unittest.TestCase):
+    def test_slow(self):
+        time.sleep(30)"""
+
+
+@pytest.fixture()
+def test_runs(monkeypatch):
+    """Подсчитывает запуски тестов в отдельном процессе"""
+    runs = []
+    run = subprocess.run
+
+    def counted_run(args, **kwargs):
+        runs.append(args[-1])
+        return run(args, **kwargs)
+
+    monkeypatch.setattr(verifier_module.subprocess, "run", counted_run)
+    return runs
+
+
+class TestAlgorithmVerifier:
+    """Тесты для класса AlgorithmVerifier."""
+
+    def test_digest(self, algo_dir, tmp_path):
+        """Проверяет, что хэш зависит от содержимого каталога алгоритма, но не
+        от его расположения и кэша байт-кода"""
+        first = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        second = algo_dir(SUM_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        digest = get_algorithm_digest(first)
+
+        assert get_algorithm_digest(second) == digest
+        (tmp_path / FIB_NAME / "__pycache__").mkdir()
+        (tmp_path / FIB_NAME / "__pycache__" / "function.pyc").write_bytes(b"1")
+        assert get_algorithm_digest(first) == digest
+        (tmp_path / FIB_NAME / "tests.py").write_text(WRONG_FIB_TESTS)
+        assert get_algorithm_digest(first) != digest
+
+    def test_verify_cached(self, algo_dir, test_runs):
+        """Проверяет, что успешная проверка выполняется один раз для одного
+        содержимого каталога"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS + "\n# cached")
+        verifier = AlgorithmVerifier()
+
+        assert verifier.verify(path)
+        assert verifier.verify(path)
+        assert len(test_runs) == 1
+
+    def test_verify_failed(self, algo_dir, test_runs):
+        """Проверяет, что неуспешная проверка не кэшируется"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS)
+        verifier = AlgorithmVerifier()
+
+        assert not verifier.verify(path)
+        assert not verifier.verify(path)
+        assert len(test_runs) == 2
+
+    def test_cache_file(self, algo_dir, tmp_path, test_runs):
+        """Проверяет сохранение результатов проверки в файл кэша"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS + "\n# file")
+        cache_path = tmp_path / "cache" / "tests.json"
+
+        assert AlgorithmVerifier(str(cache_path)).verify(path)
+        assert get_algorithm_digest(path) in json.loads(cache_path.read_text())
+        assert len(test_runs) == 1
+
+    def test_load_cache_file(self, algo_dir, tmp_path, test_runs):
+        """Проверяет, что алгоритм из файла кэша не проверяется повторно"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS + "\n# load")
+        cache_path = tmp_path / "tests.json"
+        cache_path.write_text(json.dumps([get_algorithm_digest(path)]))
+
+        assert AlgorithmVerifier(str(cache_path)).verify(path)
+        assert test_runs == []
+
+    def test_broken_cache_file(self, algo_dir, tmp_path):
+        """Проверяет, что поврежденный файл кэша не используется"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        cache_path = tmp_path / "tests.json"
+        cache_path.write_text("{")
+
+        assert AlgorithmVerifier(str(cache_path)).verify(path)
+
+    def test_verify_all(self, algo_dir, tmp_path, test_runs):
+        """Проверяет параллельную проверку алгоритмов с отчетами в формате
+        JUnit XML"""
+        paths = [
+            algo_dir(f"algorithm_{idx}", FIB_DEF, FIB_FUNC, MOCK_TESTS + f"\n# {idx}")
+            for idx in range(3)
+        ]
+        failed = algo_dir(SUM_NAME, FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS)
+        report_dir = tmp_path / "reports"
+        verifier = AlgorithmVerifier(workers=4, report_dir=str(report_dir))
+
+        results = verifier.verify_all(paths + [failed])
+
+        assert results == {**{path: True for path in paths}, failed: False}
+        assert len(test_runs) == 4
+        report = ET.parse(report_dir / f"{SUM_NAME}.xml").getroot()
+        assert report.find("testsuite").get("failures") == "1"
+        report = ET.parse(report_dir / "algorithm_0.xml").getroot()
+        assert report.find("testsuite").get("tests") == "1"
+        assert report.find("testsuite").get("failures") == "0"
+
+    def test_timeout(self, algo_dir, tmp_path):
+        """Проверяет прерывание тестов алгоритма по истечении времени"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, SLOW_TESTS)
+        report_dir = tmp_path / "reports"
+        verifier = AlgorithmVerifier(timeout=0.5, report_dir=str(report_dir))
+
+        assert not verifier.verify(path)
+        report = ET.parse(report_dir / f"{FIB_NAME}.xml").getroot()
+        error = report.find("testsuite/testcase/error")
+        assert error.get("message") == ErrMsgTmpl.TESTS_TIMEOUT.format(0.5)
+
+    @pytest.mark.parametrize(
+        "kwargs, error, message",
+        [
+            ({"workers": -1}, ValueError, ErrMsgTmpl.NEGATIVE_PARAM.format("workers")),
+            ({"workers": 1.5}, TypeError, ErrMsgTmpl.NEGATIVE_PARAM.format("workers")),
+            (
+                {"timeout": -1},
+                ValueError,
+                ErrMsgTmpl.NEGATIVE_NUMBER_PARAM.format("timeout"),
+            ),
+            (
+                {"timeout": "1"},
+                TypeError,
+                ErrMsgTmpl.NEGATIVE_NUMBER_PARAM.format("timeout"),
+            ),
+        ],
+    )
+    def test_invalid_params(self, kwargs, error, message):
+        """Проверяет ошибки при некорректных параметрах проверки"""
+        with pytest.raises(error) as ex:
+            AlgorithmVerifier(**kwargs)
+
+        assert str(ex.value) == message
+
+    def test_verify_catalog(self, algo_dir, tmp_path):
+        """Проверяет проверку всех алгоритмов каталога"""
+        algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        failed = algo_dir(SUM_NAME, FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS)
+
+        assert verify_catalog(str(tmp_path), AlgorithmVerifier()) == [failed]
+
+    def test_pytest_not_imported(self):
+        """Проверяет, что приложение создается без импорта pytest"""
+        code = (
+            "import sys\n"
+            "from src.config import Settings\n"
+            "from src.main import create_app\n"
+            "create_app(Settings(USE_LOGGER=False))\n"
+            "print('pytest' in sys.modules)\n"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert completed.stdout.strip() == "False"
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestAlgorithmVerifier"])
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from src.internal.catalog_cache import CatalogCache, CatalogPage
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from tests import BOOL_DEF, FIB_DEF, SUM_DEF
+
+
+@pytest.fixture()
+def definitions():
+    """Создает описания алгоритмов для каталога"""
+    return [
+        AlgorithmDefinitionSchema.model_validate(definition)
+        for definition in (FIB_DEF, SUM_DEF, BOOL_DEF)
+    ]
+
+
+def get_item(definition):
+    """Возвращает краткое описание алгоритма для каталога"""
+    return {key: definition[key] for key in ("name", "title", "description")}
+
+
+class TestCatalogPage:
+    """Тесты для класса CatalogPage."""
+
+    def test_etag(self):
+        """Проверяет вычисление строгого ETag по содержимому страницы"""
+        page = CatalogPage(b"[]")
+
+        assert page.body == b"[]"
+        assert page.etag.startswith('"') and page.etag.endswith('"')
+        assert page.etag == CatalogPage(b"[]").etag
+        assert page.etag != CatalogPage(b"[1]").etag
+
+
+class TestCatalogCache:
+    """Тесты для класса CatalogCache."""
+
+    def test_get_page(self, definitions):
+        """Проверяет рендеринг страницы каталога"""
+        cache = CatalogCache(definitions, version=3)
+
+        page = json.loads(cache.get_page(1, 2).body)
+
+        assert cache.version == 3
+        assert page == {
+            "items": [get_item(FIB_DEF), get_item(SUM_DEF)],
+            "total": 3,
+            "page": 1,
+            "size": 2,
+            "pages": 2,
+        }
+
+    def test_get_page_out_of_range(self, definitions):
+        """Проверяет рендеринг страницы за пределами каталога"""
+        cache = CatalogCache(definitions, version=0)
+
+        page = json.loads(cache.get_page(5, 2).body)
+
+        assert page["items"] == []
+        assert page["total"] == 3
+
+    def test_cached_page(self, definitions):
+        """Проверяет, что страница рендерится один раз"""
+        cache = CatalogCache(definitions, version=0)
+
+        assert cache.get_page(1, 2) is cache.get_page(1, 2)
+        assert cache.get_page(1, 2) is not cache.get_page(2, 2)
+
+    def test_evict_pages(self, definitions):
+        """Проверяет вытеснение давно запрошенных страниц"""
+        cache = CatalogCache(definitions, version=0, max_pages=2)
+        first = cache.get_page(1, 1)
+        cache.get_page(2, 1)
+        cache.get_page(1, 1)
+        cache.get_page(3, 1)
+
+        assert cache.get_page(1, 1) is first
+        assert cache.get_page(2, 1) is not cache.get_page(3, 1)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCatalogCache"])
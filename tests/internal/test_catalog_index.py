@@ -0,0 +1,161 @@
+import pytest
+
+from src.internal.catalog_index import CatalogIndex, tokenize
+from src.internal.catalog_sort_enum import CatalogSortEnum
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors.exceptions import AlgorithmValueError
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from tests import BOOL_DEF, FIB_DEF, SUM_DEF
+
+LIST_DEF = {
+    **SUM_DEF,
+    "name": "list_sum",
+    "title": "Сумма списка",
+    "description": "Вычисление суммы элементов списка",
+    "parameters": [
+        {
+            **SUM_DEF["parameters"][0],
+            "name": "items",
+            "data_type": "FLOAT",
+            "data_shape": "LIST",
+            "default_value": [1.0],
+        }
+    ],
+}
+
+
+def create_definitions(*definitions):
+    """Создает описания алгоритмов"""
+    return [
+        AlgorithmDefinitionSchema.model_validate(definition)
+        for definition in definitions
+    ]
+
+
+def get_names(result):
+    """Возвращает имена найденных алгоритмов"""
+    return [item["name"] for item in result["items"]]
+
+
+@pytest.fixture()
+def index():
+    """Создает индекс для поиска алгоритмов"""
+    catalog_index = CatalogIndex()
+    catalog_index.update(create_definitions(FIB_DEF, SUM_DEF, BOOL_DEF, LIST_DEF))
+    return catalog_index
+
+
+class TestCatalogIndex:
+    """Тесты для класса CatalogIndex."""
+
+    def test_tokenize(self):
+        """Проверяет разбиение текста на токены"""
+        assert tokenize("Fibonacci_list, Числа-Фибоначчи") == {
+            "fibonacci",
+            "list",
+            "числа",
+            "фибоначчи",
+        }
+
+    def test_search_all(self, index):
+        """Проверяет поиск без условий"""
+        result = index.search()
+
+        assert len(index) == 4
+        assert get_names(result) == ["bool", "fibonacci", "list_sum", "sum"]
+        assert result["total"] == 4
+        assert result["next_cursor"] is None
+        assert result["items"][0] == {
+            "name": "bool",
+            "title": "bool",
+            "description": "bool",
+        }
+
+    @pytest.mark.parametrize(
+        "query, names",
+        [
+            ("сумма", ["list_sum", "sum"]),
+            ("СУММ", ["list_sum", "sum"]),
+            ("сумма списка", ["list_sum"]),
+            ("fibonacci", ["fibonacci"]),
+            ("list_sum", ["list_sum"]),
+            ("фибоначчи сумма", []),
+            ("   ", ["bool", "fibonacci", "list_sum", "sum"]),
+        ],
+    )
+    def test_search_query(self, index, query, names):
+        """Проверяет поиск по словам и началам слов"""
+        assert get_names(index.search(query)) == names
+
+    def test_search_facets(self, index):
+        """Проверяет отбор по типу и размерности входных данных"""
+        result = index.search(data_type=DataTypeEnum.INT)
+        assert get_names(result) == ["fibonacci", "sum"]
+        assert result["facets"] == {
+            "data_type": {"INT": 2},
+            "data_shape": {"SCALAR": 2},
+        }
+
+        result = index.search("сумма", data_shape=DataShapeEnum.LIST)
+        assert get_names(result) == ["list_sum"]
+
+        result = index.search(data_type=DataTypeEnum.STRING)
+        assert result["total"] == 0
+        assert result["facets"] == {"data_type": {}, "data_shape": {}}
+
+    def test_search_facet_counts(self, index):
+        """Проверяет подсчет найденных алгоритмов по значениям фасетов"""
+        assert index.search()["facets"] == {
+            "data_type": {"INT": 2, "BOOL": 1, "FLOAT": 1},
+            "data_shape": {"SCALAR": 3, "LIST": 1},
+        }
+
+    def test_search_sort_title(self, index):
+        """Проверяет сортировку по заголовку"""
+        result = index.search(sort=CatalogSortEnum.TITLE)
+
+        assert get_names(result) == ["bool", "sum", "list_sum", "fibonacci"]
+
+    def test_search_cursor(self, index):
+        """Проверяет постраничный вывод по курсору"""
+        first = index.search(size=3)
+        second = index.search(size=3, cursor=first["next_cursor"])
+
+        assert get_names(first) == ["bool", "fibonacci", "list_sum"]
+        assert get_names(second) == ["sum"]
+        assert second["next_cursor"] is None
+        assert second["total"] == 4
+
+    def test_search_cursor_after_update(self, index):
+        """Проверяет, что курсор остается действительным после удаления
+        выданного алгоритма из индекса"""
+        first = index.search(size=2)
+        index.update(create_definitions(SUM_DEF, BOOL_DEF, LIST_DEF))
+
+        second = index.search(size=2, cursor=first["next_cursor"])
+
+        assert get_names(second) == ["list_sum", "sum"]
+
+    @pytest.mark.parametrize("cursor", ["!", "bm90IGpzb24=", "WzFd"])
+    def test_search_invalid_cursor(self, index, cursor):
+        """Проверяет ошибку при некорректном курсоре"""
+        with pytest.raises(AlgorithmValueError) as error:
+            index.search(cursor=cursor)
+
+        assert str(error.value) == ErrMsg.INVALID_CURSOR
+
+    def test_update(self, index):
+        """Проверяет обновление индекса для измененных и удаленных алгоритмов"""
+        changed_sum = {**SUM_DEF, "title": "Сложение", "description": "Сложение"}
+        index.update(create_definitions(FIB_DEF, changed_sum))
+
+        assert len(index) == 2
+        assert get_names(index.search("сумма")) == []
+        assert get_names(index.search("сложение")) == ["sum"]
+        assert index.search()["facets"]["data_type"] == {"INT": 2}
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCatalogIndex"])
@@ -0,0 +1,115 @@
+import pickle
+
+import pytest
+
+from src.internal.algorithm_verifier import get_algorithm_digest
+from src.internal.catalog_snapshot import (
+    CatalogSnapshot,
+    create_snapshot,
+    get_catalog_fingerprint,
+)
+from src.internal.constants import (
+    DEFAULT_DEFINITION_FILE_NAME,
+    DEFAULT_FUNCTION_FILE_NAME,
+    DEFAULT_TEST_FILE_NAME,
+)
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
+from tests import (
+    FIB_DEF,
+    FIB_FUNC,
+    FIB_NAME,
+    MOCK_TESTS,
+    SUM_DEF,
+    SUM_FUNC,
+    SUM_NAME,
+    WRONG_FIB_TESTS,
+)
+
+FILE_NAMES = (
+    DEFAULT_DEFINITION_FILE_NAME,
+    DEFAULT_FUNCTION_FILE_NAME,
+    DEFAULT_TEST_FILE_NAME,
+)
+
+
+class TestCatalogSnapshot:
+    """Тесты для класса CatalogSnapshot и создания снимка каталога."""
+
+    @pytest.mark.parametrize("use_mmap", [False, True])
+    def test_write_load(self, algo_dir, tmp_path, use_mmap):
+        """Проверяет сохранение и загрузку снимка каталога"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        catalog_path = str(tmp_path)
+        snapshot_path = str(tmp_path.parent / "snapshot" / "catalog.pickle")
+        create_snapshot(catalog_path).write(snapshot_path)
+
+        snapshot = CatalogSnapshot.load(snapshot_path, use_mmap)
+
+        assert snapshot.is_fresh(catalog_path, FILE_NAMES)
+        [entry] = snapshot.entries
+        assert entry.dir_name == FIB_NAME
+        assert entry.definition == AlgorithmDefinitionSchema.model_validate(FIB_DEF)
+        assert entry.digest == get_algorithm_digest(path)
+        namespace = {}
+        exec(entry.get_code(), namespace)
+        assert namespace["main"](10) == {"result": 55}
+
+    def test_stale(self, algo_dir, tmp_path):
+        """Проверяет, что снимок устаревает при изменении каталога"""
+        path = algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        catalog_path = str(tmp_path)
+        snapshot = create_snapshot(catalog_path)
+        fingerprint = get_catalog_fingerprint(catalog_path)
+
+        assert snapshot.is_fresh(catalog_path, FILE_NAMES)
+        assert not snapshot.is_fresh(catalog_path, ("def.json",) + FILE_NAMES[1:])
+        (tmp_path / FIB_NAME / "__pycache__").mkdir()
+        (tmp_path / FIB_NAME / "__pycache__" / "function.pyc").write_bytes(b"1")
+        assert snapshot.is_fresh(catalog_path, FILE_NAMES)
+        with open(path + "/" + DEFAULT_FUNCTION_FILE_NAME, "a") as func_file:
+            func_file.write("\n")
+        assert not snapshot.is_fresh(catalog_path, FILE_NAMES)
+        assert get_catalog_fingerprint(catalog_path) != fingerprint
+
+    def test_stale_new_algorithm(self, algo_dir, tmp_path):
+        """Проверяет, что снимок устаревает при добавлении алгоритма"""
+        algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, MOCK_TESTS)
+        snapshot = create_snapshot(str(tmp_path))
+        algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+
+        assert not snapshot.is_fresh(str(tmp_path), FILE_NAMES)
+
+    def test_load_invalid(self, tmp_path):
+        """Проверяет, что отсутствующий, поврежденный снимок и снимок другой
+        версии не загружаются"""
+        snapshot_path = tmp_path / "catalog.pickle"
+
+        assert CatalogSnapshot.load(str(snapshot_path)) is None
+        snapshot_path.write_bytes(b"")
+        assert CatalogSnapshot.load(str(snapshot_path), use_mmap=True) is None
+        snapshot_path.write_bytes(b"not a snapshot")
+        assert CatalogSnapshot.load(str(snapshot_path)) is None
+        snapshot_path.write_bytes(pickle.dumps({"format": 0, "python": ""}))
+        assert CatalogSnapshot.load(str(snapshot_path)) is None
+
+    def test_create_failed_tests(self, algo_dir, tmp_path):
+        """Проверяет, что снимок не создается, если тесты алгоритма не
+        пройдены"""
+        algo_dir(FIB_NAME, FIB_DEF, FIB_FUNC, WRONG_FIB_TESTS)
+
+        with pytest.raises(RuntimeError) as error:
+            create_snapshot(str(tmp_path))
+
+        assert str(error.value) == ErrMsg.UNIT_TEST_FAILED
+
+    def test_create_empty_catalog(self, tmp_path):
+        """Проверяет ошибку при отсутствии алгоритмов в каталоге"""
+        with pytest.raises(RuntimeError) as error:
+            create_snapshot(str(tmp_path))
+
+        assert str(error.value) == ErrMsg.NO_ALGORITHMS
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCatalogSnapshot"])
@@ -0,0 +1,124 @@
+import pickle
+from array import array
+
+import pytest
+
+from src.internal.data_dimension.compact_array import CompactArray, CompactArrayBuilder
+from src.internal.data_dimension.data_dimension import DataDimension
+from src.internal.data_dimension.data_dimension_checker import DataDimensionChecker
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution_log import get_input_size
+
+
+def build(data_type, data_shape, value):
+    """Собирает значение по строкам"""
+    builder = CompactArrayBuilder(data_type, data_shape)
+    if data_shape == DataShapeEnum.LIST:
+        builder.extend(value)
+    else:
+        for row in value:
+            builder.extend(row)
+            builder.end_row()
+    return builder.build()
+
+
+class TestCompactArray:
+    """Тесты для классов CompactArray и CompactArrayBuilder."""
+
+    @pytest.mark.parametrize(
+        "data_type, data_shape, value",
+        [
+            (DataTypeEnum.INT, DataShapeEnum.LIST, [1, -2, 3]),
+            (DataTypeEnum.FLOAT, DataShapeEnum.LIST, [1.5, -2.0]),
+            (DataTypeEnum.BOOL, DataShapeEnum.LIST, [True, False]),
+            (DataTypeEnum.INT, DataShapeEnum.LIST, []),
+            (DataTypeEnum.INT, DataShapeEnum.MATRIX, [[1, 2], [], [3]]),
+            (DataTypeEnum.BOOL, DataShapeEnum.MATRIX, [[True], [False, True]]),
+        ],
+    )
+    def test_build(self, data_type, data_shape, value):
+        """Проверяет сборку и преобразование значения в списки"""
+        compact = build(data_type, data_shape, value)
+
+        assert isinstance(compact, CompactArray)
+        assert compact.data_shape == data_shape
+        assert compact.tolist() == value
+        assert list(compact) == value
+        assert len(compact) == len(value)
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+    def test_matrix(self):
+        """Проверяет доступ к строкам матрицы"""
+        compact = build(DataTypeEnum.INT, DataShapeEnum.MATRIX, [[1, 2, 3], [4]])
+
+        assert compact[-1] == [4]
+        assert compact.size == 4
+        assert compact.get_row_size(0) == 3
+        with pytest.raises(IndexError):
+            compact[2]
+
+    @pytest.mark.parametrize(
+        "data_type, data_shape, value",
+        [
+            (DataTypeEnum.STRING, DataShapeEnum.LIST, ["a", "b"]),
+            (DataTypeEnum.INT, DataShapeEnum.LIST, [1, None]),
+            (DataTypeEnum.INT, DataShapeEnum.LIST, [1, 2**63]),
+            (DataTypeEnum.FLOAT, DataShapeEnum.LIST, [0.5, 2**53 + 1]),
+            (DataTypeEnum.FLOAT, DataShapeEnum.LIST, [0.5, 1]),
+            (DataTypeEnum.FLOAT, DataShapeEnum.MATRIX, [[0.5], [1, 2.5]]),
+            (DataTypeEnum.INT, DataShapeEnum.MATRIX, [[1], [2, None], [3]]),
+        ],
+    )
+    def test_build_lists(self, data_type, data_shape, value):
+        """Проверяет сборку в списки значений, которые нельзя хранить
+        компактно"""
+        assert build(data_type, data_shape, value) == value
+
+    @pytest.mark.parametrize(
+        "data_type, data_shape, error",
+        [
+            (DataTypeEnum.INT, DataShapeEnum.LIST, None),
+            (DataTypeEnum.FLOAT, DataShapeEnum.LIST, None),
+            (DataTypeEnum.INT, DataShapeEnum.SCALAR, ErrMsg.NOT_SCALAR_VALUE),
+            (DataTypeEnum.INT, DataShapeEnum.MATRIX, ErrMsg.NOT_MATRIX_VALUE),
+            (
+                DataTypeEnum.BOOL,
+                DataShapeEnum.LIST,
+                ErrMsgTmpl.MISMATCH_VALUE_TYPE.format(DataTypeEnum.BOOL),
+            ),
+        ],
+    )
+    def test_check_value(self, data_type, data_shape, error):
+        """Проверяет проверку типа и размерности значения в CompactArray"""
+        compact = build(DataTypeEnum.INT, DataShapeEnum.LIST, [1, 2])
+        data_dimension = DataDimension(data_type, data_shape)
+
+        assert DataDimensionChecker.check_value(data_dimension, compact) == error
+
+    def test_check_size(self):
+        """Проверяет ограничения размера для значения в CompactArray"""
+        compact = build(DataTypeEnum.INT, DataShapeEnum.MATRIX, [[1], [2, 3]])
+        data_dimension = DataDimension(DataTypeEnum.INT, DataShapeEnum.MATRIX)
+        data_dimension.max_cols = 1
+
+        assert DataDimensionChecker.check_size(
+            data_dimension, compact
+        ) == ErrMsgTmpl.TOO_MANY_COLS.format(1, 2, 1)
+        assert get_input_size({"x": compact, "n": 1}) == 4
+
+    def test_empty_matrix(self):
+        """Проверяет, что матрица без строк не соответствует размерности"""
+        compact = CompactArray(DataTypeEnum.INT, array("q"), array("q", [0]))
+        data_dimension = DataDimension(DataTypeEnum.INT, DataShapeEnum.MATRIX)
+
+        assert (
+            DataDimensionChecker.check_value(data_dimension, compact)
+            == ErrMsg.NOT_MATRIX_VALUE
+        )
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCompactArray"])
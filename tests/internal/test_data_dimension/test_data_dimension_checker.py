@@ -275,6 +275,86 @@ class TestDataDimensionChecker:
             data_dimension, [["string", test_case.value]]
         ) == ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(1, 0, DataTypeEnum.STRING)
 
+    @pytest.mark.parametrize(
+        "data_shape, data_type, limits, value, error",
+        [
+            (
+                DataShapeEnum.LIST,
+                DataTypeEnum.INT,
+                {"max_length": 2},
+                [1, 2, 3],
+                ErrMsgTmpl.TOO_LONG_LIST.format(3, 2),
+            ),
+            (
+                DataShapeEnum.MATRIX,
+                DataTypeEnum.INT,
+                {"max_rows": 1},
+                [[1], [2]],
+                ErrMsgTmpl.TOO_MANY_ROWS.format(2, 1),
+            ),
+            (
+                DataShapeEnum.MATRIX,
+                DataTypeEnum.INT,
+                {"max_cols": 2},
+                [[1, 2], [1, 2, 3]],
+                ErrMsgTmpl.TOO_MANY_COLS.format(1, 3, 2),
+            ),
+            (
+                DataShapeEnum.SCALAR,
+                DataTypeEnum.STRING,
+                {"max_str_len": 3},
+                "abcd",
+                ErrMsgTmpl.TOO_LONG_STRING.format(4, 3),
+            ),
+            (
+                DataShapeEnum.MATRIX,
+                DataTypeEnum.STRING,
+                {"max_str_len": 3},
+                [["abc"], ["abcd"]],
+                ErrMsgTmpl.TOO_LONG_STRING.format(4, 3),
+            ),
+        ],
+    )
+    def test_check_size(self, data_shape, data_type, limits, value, error):
+        """Проверка метода check_size при превышении ограничений размера"""
+        data_dimension = DataDimension(data_type=data_type, data_shape=data_shape)
+        for name, limit in limits.items():
+            setattr(data_dimension, name, limit)
+
+        assert DataDimensionChecker.check_size(data_dimension, value) == error
+        assert DataDimensionChecker.check_size(data_dimension, value[:1]) is None
+
+    def test_check_size_without_limits(self):
+        """Проверка метода check_size для элемента данных без ограничений и
+        значения другой размерности"""
+        data_dimension = DataDimension(
+            data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.MATRIX
+        )
+        data_dimension.max_rows = 1
+
+        assert DataDimensionChecker.check_size(data_dimension, 1) is None
+        assert (
+            DataDimensionChecker.check_size(
+                DataDimension(DataTypeEnum.INT, DataShapeEnum.LIST), [1] * 100
+            )
+            is None
+        )
+
+    def test_check_items(self):
+        """Проверка метода check_items для части элементов списка и строки
+        матрицы"""
+        data_dimension = DataDimension(
+            data_type=DataTypeEnum.INT, data_shape=DataShapeEnum.LIST
+        )
+
+        assert DataDimensionChecker.check_items(data_dimension, [1, 2]) is None
+        assert DataDimensionChecker.check_items(
+            data_dimension, [1, 2.5], 10
+        ) == ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(11, DataTypeEnum.INT)
+        assert DataDimensionChecker.check_items(
+            data_dimension, ["1"], 3, 2
+        ) == ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(3, 2, DataTypeEnum.INT)
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestDataDimensionChecker"])
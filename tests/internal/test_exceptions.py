@@ -0,0 +1,47 @@
+import pickle
+
+import pytest
+
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmInputTooLargeError,
+    AlgorithmNotFoundError,
+    AlgorithmResourceLimitError,
+    AlgorithmTimeoutError,
+    AlgorithmUnexpectedError,
+    AlgorithmValueError,
+)
+
+
+class TestExceptions:
+    """Тесты для классов ошибок выполнения алгоритмов."""
+
+    @pytest.mark.parametrize(
+        "error, message",
+        [
+            (AlgorithmValueError("value"), "value"),
+            (AlgorithmInputTooLargeError("size"), "size"),
+            (AlgorithmTimeoutError(5), ErrMsgTmpl.TIME_OVER.format(5)),
+            (AlgorithmUnexpectedError(), ErrMsg.UNEXPECTED_ERROR),
+            (
+                AlgorithmNotFoundError("alg"),
+                ErrMsgTmpl.ALGORITHM_NOT_EXISTS.format("alg"),
+            ),
+            (
+                AlgorithmResourceLimitError(ErrMsg.MEMORY_LIMIT_EXCEEDED),
+                ErrMsg.MEMORY_LIMIT_EXCEEDED,
+            ),
+        ],
+    )
+    def test_pickle(self, error, message):
+        """Проверяет сохранение класса и сообщения ошибки при сериализации"""
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert restored.message == message
+        assert str(restored) == message
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestExceptions"])
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmNotFoundError,
+    AlgorithmTimeoutError,
+    AlgorithmValueError,
+)
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.priority_enum import PriorityEnum
+from src.internal.execution.runtime_profile import RuntimeProfile
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import (
+    BUSY_DEF,
+    BUSY_FUNC,
+    BUSY_NAME,
+    FIB_NAME,
+    MOCK_TESTS,
+    SUM_DEF,
+    SUM_FUNC,
+    SUM_NAME,
+)
+
+
+@pytest.fixture()
+def scheduler(tmp_path, fib_algo_dir, algo_dir):
+    """Создает планировщик для набора из двух алгоритмов"""
+    algo_dir(SUM_NAME, SUM_DEF, SUM_FUNC, MOCK_TESTS)
+    scheduler = AlgorithmScheduler(AlgorithmCollection(str(tmp_path)))
+    yield scheduler
+    scheduler.shutdown()
+
+
+class TestAlgorithmScheduler:
+    """Тесты для класса AlgorithmScheduler."""
+
+    def test_execute(self, scheduler):
+        """Проверяет выполнение алгоритма через планировщик"""
+        values = {"n": 5}
+
+        result = asyncio.run(scheduler.execute(FIB_NAME, values))
+
+        assert result == [DataElementSchema(name="result", value=5)]
+        assert scheduler.estimator.get_estimate(FIB_NAME) is not None
+        assert scheduler.profile.snapshot()[FIB_NAME][1]["count"] == 1
+
+    def test_unknown_algorithm_slow_lane(self, scheduler):
+        """Проверяет, что невыполнявшийся алгоритм направляется в медленную
+        полосу"""
+        assert scheduler.select_lane(SUM_NAME) is scheduler.slow_lane
+
+    def test_cheap_algorithm_fast_lane(self, scheduler):
+        """Проверяет, что быстрый алгоритм направляется в быструю полосу"""
+        scheduler.estimator.update(SUM_NAME, 0.001)
+
+        assert scheduler.select_lane(SUM_NAME) is scheduler.fast_lane
+        assert scheduler.select_lane(SUM_NAME, PriorityEnum.HIGH) is (
+            scheduler.fast_lane
+        )
+
+    def test_heavy_algorithm_slow_lane(self, scheduler):
+        """Проверяет, что долгий алгоритм направляется в медленную полосу даже
+        с высоким приоритетом"""
+        scheduler.estimator.update(FIB_NAME, 10.0)
+
+        assert scheduler.select_lane(FIB_NAME, PriorityEnum.HIGH) is (
+            scheduler.slow_lane
+        )
+
+    def test_low_priority_slow_lane(self, scheduler):
+        """Проверяет, что вызов с низким приоритетом направляется в медленную
+        полосу"""
+        scheduler.estimator.update(SUM_NAME, 0.001)
+
+        assert scheduler.select_lane(SUM_NAME, PriorityEnum.LOW) is (
+            scheduler.slow_lane
+        )
+
+    def test_execute_not_existed(self, scheduler):
+        """Проверяет ошибку выполнения несуществующего алгоритма"""
+        with pytest.raises(AlgorithmNotFoundError) as error:
+            asyncio.run(scheduler.execute("not_existed", []))
+        assert str(error.value) == ErrMsgTmpl.ALGORITHM_NOT_EXISTS.format("not_existed")
+
+    def test_execute_error(self, scheduler):
+        """Проверяет передачу ошибки выполнения алгоритма"""
+        values = {"a": 1}
+
+        with pytest.raises(AlgorithmValueError):
+            asyncio.run(scheduler.execute(SUM_NAME, values))
+
+    def test_cancel_running(self, tmp_path, algo_dir):
+        """Проверяет прерывание выполнения при отмене ожидания результата"""
+        algo_dir(BUSY_NAME, BUSY_DEF, BUSY_FUNC, MOCK_TESTS)
+        scheduler = AlgorithmScheduler(
+            AlgorithmCollection(str(tmp_path)), slow_lane_workers=1
+        )
+
+        async def cancel_and_execute():
+            values = {"n": 10**12}
+            task = asyncio.ensure_future(scheduler.execute(BUSY_NAME, values))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            values = {"n": 1}
+            return await asyncio.wait_for(scheduler.execute(BUSY_NAME, values), 5)
+
+        result = asyncio.run(cancel_and_execute())
+
+        assert result == [DataElementSchema(name="result", value=1)]
+        assert scheduler.metrics.get_counter("scheduler.cancelled") == 1
+        assert scheduler.metrics.get_counter("scheduler.slow_lane.cancelled") == 1
+        scheduler.shutdown()
+
+    def test_adaptive_timeout(self, tmp_path, algo_dir):
+        """Проверяет сокращение таймаута алгоритма по истории выполнений"""
+        algo_dir(BUSY_NAME, BUSY_DEF, BUSY_FUNC, MOCK_TESTS)
+        scheduler = AlgorithmScheduler(
+            AlgorithmCollection(str(tmp_path), execute_timeout=30),
+            runtime_profile=RuntimeProfile(timeout_factor=2, min_samples=1),
+        )
+        asyncio.run(scheduler.execute(BUSY_NAME, {"n": 1}))
+
+        with pytest.raises(AlgorithmTimeoutError) as error:
+            asyncio.run(scheduler.execute(BUSY_NAME, {"n": 10**12}))
+
+        assert str(error.value) == ErrMsgTmpl.TIME_OVER.format(1)
+        assert scheduler.metrics.get_counter("scheduler.adaptive_timeout") == 1
+        assert scheduler.profile.snapshot()[BUSY_NAME][1]["count"] == 1
+        scheduler.shutdown()
+
+    def test_non_positive_threshold(self, fib_algo_dir, tmp_path):
+        """Проверяет ошибку указания неположительного порога быстрой полосы"""
+        with pytest.raises(ValueError) as error:
+            AlgorithmScheduler(
+                AlgorithmCollection(str(tmp_path)), fast_lane_threshold=0
+            )
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format(
+            "fast_lane_threshold"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestAlgorithmScheduler"])
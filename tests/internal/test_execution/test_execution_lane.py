@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.execution_lane import ExecutionLane
+from src.internal.execution.watchdog import ExecutionCancelled
+
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        pass
+    return "finished"
+
+
+class TestExecutionLane:
+    """Тесты для класса ExecutionLane."""
+
+    def test_submit(self):
+        """Проверяет выполнение вызова в рабочем потоке полосы"""
+        lane = ExecutionLane("test", 1)
+        future = lane.submit(
+            0, lambda a, b: (a + b, threading.current_thread().name), 1, 2
+        )
+
+        assert future.result(timeout=5) == (3, "test-lane-0")
+        lane.shutdown()
+
+    def test_exception(self):
+        """Проверяет передачу исключения через объект Future"""
+        lane = ExecutionLane("test", 1)
+
+        def method():
+            raise ValueError("error")
+
+        future = lane.submit(0, method)
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        lane.shutdown()
+
+    def test_priority_order(self):
+        """Проверяет выполнение вызовов в порядке приоритета"""
+        lane = ExecutionLane("test", 1)
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+
+        def block():
+            started.set()
+            release.wait()
+
+        blocker = lane.submit(0, block)
+        started.wait(timeout=5)
+        futures = [lane.submit(rank, order.append, rank) for rank in [2, 1, 0, 1]]
+        assert lane.queue_size == 4
+        release.set()
+        blocker.result(timeout=5)
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == [0, 1, 1, 2]
+        lane.shutdown()
+
+    def test_cancelled_future_skipped(self):
+        """Проверяет, что отмененный до начала выполнения вызов пропускается"""
+        lane = ExecutionLane("test", 1)
+        release = threading.Event()
+        calls = []
+        blocker = lane.submit(0, release.wait)
+        future = lane.submit(0, calls.append, 1)
+        assert future.cancel()
+        release.set()
+        blocker.result(timeout=5)
+        lane.submit(0, calls.append, 2).result(timeout=5)
+
+        assert calls == [2]
+        lane.shutdown()
+
+    def test_cancel_running(self):
+        """Проверяет прерывание выполняющегося вызова и освобождение потока"""
+        lane = ExecutionLane("test", 1)
+        stop = threading.Event()
+        future = lane.submit(0, busy_loop, stop)
+        while not future.running():
+            pass
+
+        assert lane.cancel(future)
+        with pytest.raises(ExecutionCancelled):
+            future.result(timeout=5)
+        assert lane.submit(0, lambda: "next").result(timeout=5) == "next"
+        stop.set()
+        lane.shutdown()
+
+    def test_cancel_finished(self):
+        """Проверяет, что завершенный вызов не отменяется"""
+        lane = ExecutionLane("test", 1)
+        future = lane.submit(0, lambda: 1)
+        future.result(timeout=5)
+
+        assert not lane.cancel(future)
+        lane.shutdown()
+
+    def test_submit_after_shutdown(self):
+        """Проверяет ошибку постановки вызова в остановленную полосу"""
+        lane = ExecutionLane("test", 1)
+        lane.shutdown()
+        with pytest.raises(RuntimeError) as error:
+            lane.submit(0, print)
+        assert str(error.value) == ErrMsg.LANE_STOPPED
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_non_positive_workers(self, workers):
+        """Проверяет ошибку указания неположительного количества потоков"""
+        with pytest.raises(ValueError) as error:
+            ExecutionLane("test", workers)
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format("workers")
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestExecutionLane"])
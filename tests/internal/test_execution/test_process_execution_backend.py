@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import AlgorithmResourceLimitError
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.process_execution_backend import ProcessExecutionBackend
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import ALLOC_DEF, ALLOC_FUNC, ALLOC_NAME, FIB_NAME, MOCK_TESTS
+
+
+class TestProcessExecutionBackend:
+    """Тесты для класса ProcessExecutionBackend."""
+
+    def test_execute_with_scheduler(self, fib_algo_dir, tmp_path):
+        """Проверяет выполнение алгоритма планировщиком в рабочем процессе"""
+        algorithms = AlgorithmCollection(str(tmp_path))
+        scheduler = AlgorithmScheduler(
+            algorithms, backend=ProcessExecutionBackend(algorithms)
+        )
+        values = {"n": 10}
+
+        result = asyncio.run(scheduler.execute(FIB_NAME, values))
+
+        assert result == [DataElementSchema(name="result", value=55)]
+        scheduler.shutdown()
+
+    def test_default_memory_limit(self, algo_dir, tmp_path):
+        """Проверяет применение лимита памяти по умолчанию"""
+        algo_dir(ALLOC_NAME, ALLOC_DEF, ALLOC_FUNC, MOCK_TESTS)
+        backend = ProcessExecutionBackend(
+            AlgorithmCollection(str(tmp_path)), memory_limit=64
+        )
+        values = {"n": 512}
+
+        with pytest.raises(AlgorithmResourceLimitError) as error:
+            backend.execute(ALLOC_NAME, values)
+        assert str(error.value) == ErrMsg.MEMORY_LIMIT_EXCEEDED
+        backend.shutdown()
+
+    def test_definition_memory_limit(self, algo_dir, tmp_path):
+        """Проверяет приоритет лимита памяти из описания алгоритма"""
+        algo_def = {**ALLOC_DEF, "limits": {"memory_limit": 64}}
+        algo_dir(ALLOC_NAME, algo_def, ALLOC_FUNC, MOCK_TESTS)
+        backend = ProcessExecutionBackend(
+            AlgorithmCollection(str(tmp_path)), memory_limit=4096
+        )
+        values = {"n": 512}
+
+        with pytest.raises(AlgorithmResourceLimitError) as error:
+            backend.execute(ALLOC_NAME, values)
+        assert str(error.value) == ErrMsg.MEMORY_LIMIT_EXCEEDED
+        backend.shutdown()
+
+    @pytest.mark.parametrize("name", ["memory_limit", "cpu_limit", "max_executions"])
+    def test_negative_params(self, fib_algo_dir, tmp_path, name):
+        """Проверяет ошибку указания отрицательных значений параметров"""
+        with pytest.raises(ValueError) as error:
+            ProcessExecutionBackend(AlgorithmCollection(str(tmp_path)), **{name: -1})
+        assert str(error.value) == ErrMsgTmpl.NEGATIVE_PARAM.format(name)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestProcessExecutionBackend"])
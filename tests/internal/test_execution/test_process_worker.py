@@ -0,0 +1,183 @@
+import os
+import threading
+
+import pytest
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmResourceLimitError,
+    AlgorithmValueError,
+)
+from src.internal.execution.execution_lane import ExecutionLane
+from src.internal.execution.process_worker import ProcessWorker, WorkerFactory
+from src.internal.execution.watchdog import ExecutionCancelled
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import (
+    ALLOC_DEF,
+    ALLOC_FUNC,
+    ALLOC_NAME,
+    BUSY_DEF,
+    BUSY_FUNC,
+    BUSY_NAME,
+    FIB_NAME,
+    MOCK_TESTS,
+    PROGRESS_DEF,
+    PROGRESS_FUNC,
+    PROGRESS_NAME,
+)
+
+
+@pytest.fixture()
+def algorithms(tmp_path, fib_algo_dir, algo_dir):
+    """Создает набор алгоритмов для выполнения в рабочем процессе"""
+    algo_dir(BUSY_NAME, BUSY_DEF, BUSY_FUNC, MOCK_TESTS)
+    algo_dir(ALLOC_NAME, ALLOC_DEF, ALLOC_FUNC, MOCK_TESTS)
+    algo_dir(PROGRESS_NAME, PROGRESS_DEF, PROGRESS_FUNC, MOCK_TESTS)
+    return AlgorithmCollection(str(tmp_path))
+
+
+@pytest.fixture()
+def factory(algorithms):
+    """Создает фабрику рабочих процессов"""
+    factory = WorkerFactory(algorithms)
+    yield factory
+    factory.close()
+
+
+def get_parent_pid(pid: int) -> int:
+    """Возвращает идентификатор родительского процесса"""
+    with open(f"/proc/{pid}/stat", "r") as stat:
+        return int(stat.read().rsplit(")", 1)[1].split()[1])
+
+
+class TestProcessWorker:
+    """Тесты для класса ProcessWorker."""
+
+    def test_execute(self, factory):
+        """Проверяет выполнение алгоритма в рабочем процессе"""
+        worker = ProcessWorker(factory)
+        result = worker.execute(FIB_NAME, {"n": 10})
+
+        assert result == [DataElementSchema(name="result", value=55)]
+        assert worker.pid is not None
+        assert worker.pid != os.getpid()
+        worker.close()
+
+    def test_progress(self, factory):
+        """Проверяет передачу сведений о ходе выполнения из рабочего процесса"""
+        worker = ProcessWorker(factory)
+        events = []
+        result = worker.execute(
+            PROGRESS_NAME, {"n": 30}, progress=lambda *event: events.append(event)
+        )
+
+        assert result == [DataElementSchema(name="result", value=30)]
+        assert events[0] == (0.0, "step 0")
+        assert 2 <= len(events) < 30
+        worker.close()
+
+    def test_error(self, factory):
+        """Проверяет передачу ошибки выполнения алгоритма из рабочего процесса"""
+        worker = ProcessWorker(factory)
+        values = {"x": 1}
+
+        with pytest.raises(AlgorithmValueError) as error:
+            worker.execute(FIB_NAME, values)
+        assert str(error.value) == ErrMsgTmpl.REDUNDANT_PARAMETER.format("x")
+        worker.close()
+
+    def test_recycle_on_reload(self, tmp_path, fib_algo_dir, algo_dir):
+        """Проверяет пересоздание рабочего процесса при изменении версии набора
+        алгоритмов"""
+        algorithms = AlgorithmCollection(str(tmp_path))
+        factory = WorkerFactory(algorithms)
+        worker = ProcessWorker(factory)
+        worker.execute(FIB_NAME, {"n": 1})
+        pid = worker.pid
+        algo_dir(BUSY_NAME, BUSY_DEF, BUSY_FUNC, MOCK_TESTS)
+        algorithms.reload()
+
+        result = worker.execute(BUSY_NAME, {"n": 1})
+
+        assert worker.pid != pid
+        assert result == [DataElementSchema(name="result", value=1)]
+        worker.close()
+        factory.close()
+
+    def test_factory(self, factory):
+        """Проверяет, что рабочие процессы создаются из шаблонного процесса, а
+        не копированием текущего процесса"""
+        worker = ProcessWorker(factory)
+        worker.execute(FIB_NAME, {"n": 1})
+        parent_pid = get_parent_pid(worker.pid)
+
+        assert parent_pid != os.getpid()
+        assert get_parent_pid(parent_pid) == os.getpid()
+        worker.close()
+
+    def test_recycle(self, factory):
+        """Проверяет пересоздание рабочего процесса после заданного количества
+        выполнений"""
+        worker = ProcessWorker(factory, max_executions=2)
+        values = {"n": 1}
+        worker.execute(FIB_NAME, values)
+        first_pid = worker.pid
+        worker.execute(FIB_NAME, values)
+
+        assert worker.pid is None
+        worker.execute(FIB_NAME, values)
+        assert worker.pid not in (None, first_pid)
+        worker.close()
+
+    def test_memory_limit(self, factory):
+        """Проверяет ошибку превышения лимита памяти"""
+        worker = ProcessWorker(factory)
+        values = {"n": 512}
+
+        with pytest.raises(AlgorithmResourceLimitError) as error:
+            worker.execute(ALLOC_NAME, values, memory_limit=64)
+        assert str(error.value) == ErrMsg.MEMORY_LIMIT_EXCEEDED
+        assert worker.pid is None
+
+        values = {"n": 16}
+        result = worker.execute(ALLOC_NAME, values, memory_limit=64)
+        assert result == [DataElementSchema(name="result", value=16)]
+        worker.close()
+
+    def test_cpu_limit(self, factory):
+        """Проверяет ошибку превышения лимита процессорного времени"""
+        worker = ProcessWorker(factory)
+        values = {"n": 10**12}
+
+        with pytest.raises(AlgorithmResourceLimitError) as error:
+            worker.execute(BUSY_NAME, values, cpu_limit=1)
+        assert str(error.value) == ErrMsg.CPU_LIMIT_EXCEEDED
+        worker.close()
+
+    def test_cancel(self, factory):
+        """Проверяет завершение рабочего процесса при отмене выполнения"""
+        worker = ProcessWorker(factory)
+        lane = ExecutionLane("test", 1)
+        values = {"n": 10**12}
+        started = threading.Event()
+
+        def execute():
+            started.set()
+            return worker.execute(BUSY_NAME, values)
+
+        future = lane.submit(0, execute)
+        started.wait(timeout=5)
+        while worker.pid is None:
+            pass
+
+        assert lane.cancel(future)
+        with pytest.raises(ExecutionCancelled):
+            future.result(timeout=5)
+        assert worker.pid is None
+        lane.shutdown()
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestProcessWorker"])
@@ -0,0 +1,50 @@
+import pytest
+
+from src.internal.execution import progress_reporter
+from src.internal.execution.progress_reporter import ProgressReporter
+
+
+class TestProgressReporter:
+    """Тесты для класса ProgressReporter."""
+
+    def test_rate_limit(self, monkeypatch):
+        """Проверяет передачу сведений не чаще заданного интервала"""
+        now = [100.0]
+        monkeypatch.setattr(progress_reporter.time, "monotonic", lambda: now[0])
+        events = []
+        reporter = ProgressReporter(lambda *event: events.append(event), 0.5)
+
+        reporter(0.1, "first")
+        reporter(0.2, "skipped")
+        now[0] += 0.5
+        reporter(0.3)
+
+        assert events == [(0.1, "first"), (0.3, None)]
+
+    def test_completion_always_reported(self):
+        """Проверяет, что сведения о завершении передаются без ограничения"""
+        events = []
+        reporter = ProgressReporter(lambda *event: events.append(event), 60)
+
+        reporter(0.5)
+        reporter(1, "done")
+
+        assert events == [(0.5, None), (1.0, "done")]
+
+    @pytest.mark.parametrize(
+        "fraction, expected", [(-1, 0.0), (2, 1.0), (0.25, 0.25), (True, 1.0)]
+    )
+    def test_fraction_clamped(self, fraction, expected):
+        """Проверяет приведение доли выполненной работы к диапазону [0, 1]"""
+        events = []
+        ProgressReporter(lambda *event: events.append(event))(fraction, 1)
+
+        assert events == [(expected, "1")]
+
+    def test_without_listener(self):
+        """Проверяет, что без получателя сведения отбрасываются"""
+        ProgressReporter(None)(0.5, "ignored")
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestProgressReporter"])
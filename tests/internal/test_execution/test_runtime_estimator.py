@@ -0,0 +1,44 @@
+import pytest
+
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.execution.runtime_estimator import RuntimeEstimator
+
+
+class TestRuntimeEstimator:
+    """Тесты для класса RuntimeEstimator."""
+
+    def test_unknown_algorithm(self):
+        """Проверяет отсутствие оценки для невыполнявшегося алгоритма"""
+        assert RuntimeEstimator().get_estimate("unknown") is None
+
+    def test_first_measurement(self):
+        """Проверяет, что первое измерение становится оценкой"""
+        estimator = RuntimeEstimator()
+        estimator.update("alg", 2.0)
+
+        assert estimator.get_estimate("alg") == 2.0
+
+    def test_moving_estimate(self):
+        """Проверяет сглаживание оценки последующими измерениями"""
+        estimator = RuntimeEstimator(0.5)
+        estimator.update("alg", 2.0)
+
+        assert estimator.update("alg", 0.0) == 1.0
+        assert estimator.get_estimate("alg") == 1.0
+
+    @pytest.mark.parametrize("alpha", [0, -0.1, 1.5])
+    def test_invalid_alpha(self, alpha):
+        """Проверяет ошибку указания коэффициента вне интервала (0, 1]"""
+        with pytest.raises(ValueError) as error:
+            RuntimeEstimator(alpha)
+        assert str(error.value) == ErrMsg.INVALID_EWMA_ALPHA
+
+    def test_not_number_alpha(self):
+        """Проверяет ошибку указания нечислового коэффициента"""
+        with pytest.raises(TypeError) as error:
+            RuntimeEstimator("0.5")
+        assert str(error.value) == ErrMsg.INVALID_EWMA_ALPHA
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestRuntimeEstimator"])
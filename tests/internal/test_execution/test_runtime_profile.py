@@ -0,0 +1,92 @@
+import pytest
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.runtime_profile import RuntimeProfile, get_size_bucket
+
+
+class TestRuntimeProfile:
+    """Тесты для класса RuntimeProfile."""
+
+    @pytest.mark.parametrize(
+        "input_size, bucket", [(0, 1), (1, 1), (2, 2), (3, 4), (4, 4), (1000, 1024)]
+    )
+    def test_get_size_bucket(self, input_size, bucket):
+        """Проверяет диапазоны размера входных данных"""
+        assert get_size_bucket(input_size) == bucket
+
+    def test_unknown_algorithm(self):
+        """Проверяет отсутствие статистики для невыполнявшегося алгоритма"""
+        profile = RuntimeProfile()
+
+        assert profile.get_percentile("unknown", 1, 99) is None
+        assert profile.snapshot() == {}
+
+    def test_snapshot(self):
+        """Проверяет статистику по диапазонам размера входных данных"""
+        profile = RuntimeProfile()
+        for runtime in range(1, 101):
+            profile.record("alg", 3, runtime / 100)
+        profile.record("alg", 100, 5.0)
+
+        assert profile.snapshot() == {
+            "alg": {
+                4: {"count": 100, "p50": 0.5, "p90": 0.9, "p99": 0.99, "max": 1.0},
+                128: {"count": 1, "p50": 5.0, "p90": 5.0, "p99": 5.0, "max": 5.0},
+            }
+        }
+        assert profile.get_percentile("alg", 4, 50) == 0.5
+
+    def test_max_samples(self):
+        """Проверяет, что хранятся только последние измерения"""
+        profile = RuntimeProfile(max_samples=2)
+        for runtime in [10.0, 1.0, 2.0]:
+            profile.record("alg", 1, runtime)
+
+        assert profile.snapshot()["alg"][1]["count"] == 2
+        assert profile.get_percentile("alg", 1, 100) == 2.0
+
+    def test_get_timeout(self):
+        """Проверяет сокращение таймаута по 99-му процентилю"""
+        profile = RuntimeProfile(timeout_factor=4, min_samples=10)
+        for _ in range(10):
+            profile.record("alg", 1, 0.6)
+
+        assert profile.get_timeout("alg", 1, 30) == 3
+        assert profile.get_timeout("alg", 1, 2) == 2
+        assert profile.get_timeout("alg", 1, 0) == 0
+        assert profile.get_timeout("alg", 100, 30) == 30
+
+    def test_get_timeout_few_samples(self):
+        """Проверяет, что таймаут не сокращается без достаточной истории"""
+        profile = RuntimeProfile(timeout_factor=4, min_samples=10)
+        for _ in range(9):
+            profile.record("alg", 1, 0.001)
+
+        assert profile.get_timeout("alg", 1, 30) == 30
+
+    def test_get_timeout_disabled(self):
+        """Проверяет, что по умолчанию таймаут не сокращается"""
+        profile = RuntimeProfile(min_samples=1)
+        profile.record("alg", 1, 0.001)
+
+        assert profile.get_timeout("alg", 1, 30) == 30
+
+    @pytest.mark.parametrize("timeout_factor", [-1, 0.5])
+    def test_invalid_timeout_factor(self, timeout_factor):
+        """Проверяет ошибку указания коэффициента меньше 1"""
+        with pytest.raises(ValueError) as error:
+            RuntimeProfile(timeout_factor=timeout_factor)
+        assert str(error.value) == ErrMsgTmpl.INVALID_FACTOR_PARAM.format(
+            "timeout_factor"
+        )
+
+    @pytest.mark.parametrize("name", ["max_samples", "min_samples"])
+    def test_invalid_samples(self, name):
+        """Проверяет ошибку указания неположительного количества измерений"""
+        with pytest.raises(ValueError) as error:
+            RuntimeProfile(**{name: 0})
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format(name)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestRuntimeProfile"])
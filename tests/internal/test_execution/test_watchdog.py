@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from src.internal.execution.watchdog import ExecutionTimeout, ExecutionWatchdog
+
+
+def busy_loop(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+class TestExecutionWatchdog:
+    """Тесты для класса ExecutionWatchdog."""
+
+    def run_in_thread(self, method):
+        result = {}
+
+        def target():
+            try:
+                result["value"] = method()
+            except BaseException as ex:
+                result["error"] = ex
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join(timeout=10)
+        return result
+
+    def test_interrupt(self):
+        """Проверяет прерывание потока по истечении срока"""
+        watchdog = ExecutionWatchdog()
+
+        def method():
+            token = watchdog.arm(0.1)
+            try:
+                busy_loop(5)
+            finally:
+                return watchdog.disarm(token)
+
+        assert self.run_in_thread(method) == {"value": True}
+
+    def test_interrupt_exception(self):
+        """Проверяет тип возбуждаемого прерывания"""
+        watchdog = ExecutionWatchdog()
+
+        def method():
+            token = watchdog.arm(0.1)
+            try:
+                busy_loop(5)
+            except Exception:
+                return "caught by algorithm"
+            finally:
+                watchdog.disarm(token)
+
+        result = self.run_in_thread(method)
+        assert isinstance(result["error"], ExecutionTimeout)
+
+    def test_disarm_before_deadline(self):
+        """Проверяет, что снятый срок не прерывает поток"""
+        watchdog = ExecutionWatchdog()
+
+        def method():
+            token = watchdog.arm(0.1)
+            fired = watchdog.disarm(token)
+            busy_loop(0.3)
+            return fired
+
+        assert self.run_in_thread(method) == {"value": False}
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestExecutionWatchdog"])
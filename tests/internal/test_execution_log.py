@@ -0,0 +1,161 @@
+import json
+import os
+
+import pytest
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution_log import ExecutionLog, get_input_size
+
+
+def read_records(path) -> list[dict]:
+    """Читает записи журнала выполнения"""
+    with open(path, "r") as file:
+        return [json.loads(line) for line in file]
+
+
+class TestExecutionLog:
+    """Тесты для класса ExecutionLog."""
+
+    @pytest.mark.parametrize(
+        "values, size",
+        [
+            ({}, 0),
+            ({"n": 1, "s": "text"}, 2),
+            ({"v": [1, 2, 3]}, 3),
+            ({"m": [[1, 2], [3, 4], [5, 6]], "n": 1}, 7),
+        ],
+    )
+    def test_get_input_size(self, values, size):
+        """Проверяет вычисление размера входных данных"""
+        assert get_input_size(values) == size
+
+    def test_record(self, tmp_path):
+        """Проверяет поля записи журнала"""
+        path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(str(path), sample_rate=1, batch_size=1)
+
+        assert execution_log.record("fibonacci", 3, 0.001, 0.002)
+        [record] = read_records(path)
+
+        assert record["algorithm"] == "fibonacci"
+        assert record["input_size"] == 3
+        assert record["validation_time"] == 0.001
+        assert record["execution_time"] == 0.002
+        assert record["outcome"] == "success"
+        assert record["sampling"] == "head"
+        assert record["worker"].startswith(f"{os.getpid()}/")
+        assert record["time"] > 0
+
+    def test_sampling(self, tmp_path):
+        """Проверяет отбор записей: не отобранные до выполнения записи
+        сохраняются только при ошибке или медленном выполнении"""
+        path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(str(path), sample_rate=0, slow_threshold=1)
+
+        assert not execution_log.is_sampled()
+        assert not execution_log.record("fast", 1, 0.1, 0.5, sampled=False)
+        assert execution_log.record("slow", 1, 0.1, 1.5, sampled=False)
+        assert execution_log.record("error", 1, 0.1, 0.0, "ValueError", False)
+        execution_log.flush()
+
+        assert [(rec["algorithm"], rec["sampling"]) for rec in read_records(path)] == [
+            ("slow", "slow"),
+            ("error", "error"),
+        ]
+
+    def test_batching(self, tmp_path):
+        """Проверяет запись в файл пакетами"""
+        path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(
+            str(path), sample_rate=1, batch_size=3, flush_interval=60
+        )
+
+        execution_log.record("fibonacci", 1, 0.0, 0.0)
+        execution_log.record("fibonacci", 1, 0.0, 0.0)
+        assert execution_log.pending == 2
+        assert not path.exists()
+
+        execution_log.record("fibonacci", 1, 0.0, 0.0)
+        assert execution_log.pending == 0
+        assert len(read_records(path)) == 3
+
+    def test_flush_interval(self, tmp_path):
+        """Проверяет запись в файл по истечении интервала хранения записей"""
+        path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(
+            str(path), sample_rate=1, batch_size=100, flush_interval=0
+        )
+
+        execution_log.record("fibonacci", 1, 0.0, 0.0)
+
+        assert execution_log.pending == 0
+        assert len(read_records(path)) == 1
+
+    def test_rotation(self, tmp_path):
+        """Проверяет ротацию файла журнала"""
+        path = tmp_path / "logs" / "executions.ndjson"
+        execution_log = ExecutionLog(
+            str(path), sample_rate=1, batch_size=1, max_bytes=500, backup_count=2
+        )
+
+        for _ in range(20):
+            execution_log.record("fibonacci", 1, 0.0, 0.0)
+
+        assert os.path.getsize(path) <= 500
+        assert os.path.exists(f"{path}.1")
+        assert os.path.exists(f"{path}.2")
+        assert not os.path.exists(f"{path}.3")
+
+    def test_fork(self, tmp_path):
+        """Проверяет, что дочерний процесс не записывает записи, накопленные
+        родительским процессом"""
+        path = tmp_path / "executions.ndjson"
+        execution_log = ExecutionLog(str(path), sample_rate=1, batch_size=100)
+        execution_log.record("parent", 1, 0.0, 0.0)
+        pid = os.fork()
+        if pid == 0:
+            execution_log.record("child", 1, 0.0, 0.0)
+            execution_log.flush()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        execution_log.flush()
+
+        records = read_records(path)
+        assert [record["algorithm"] for record in records] == ["child", "parent"]
+        assert records[0]["worker"].startswith(f"{pid}/")
+
+    @pytest.mark.parametrize(
+        "kwargs, error, message",
+        [
+            (
+                {"sample_rate": 2},
+                ValueError,
+                ErrMsgTmpl.INVALID_FRACTION_PARAM.format("sample_rate"),
+            ),
+            (
+                {"sample_rate": "1"},
+                TypeError,
+                ErrMsgTmpl.INVALID_FRACTION_PARAM.format("sample_rate"),
+            ),
+            (
+                {"batch_size": 0},
+                ValueError,
+                ErrMsgTmpl.NON_POSITIVE_PARAM.format("batch_size"),
+            ),
+            (
+                {"backup_count": 1.5},
+                TypeError,
+                ErrMsgTmpl.NON_POSITIVE_PARAM.format("backup_count"),
+            ),
+        ],
+    )
+    def test_invalid_params(self, tmp_path, kwargs, error, message):
+        """Проверяет ошибки при некорректных параметрах журнала"""
+        with pytest.raises(error) as ex:
+            ExecutionLog(str(tmp_path / "executions.ndjson"), **kwargs)
+
+        assert str(ex.value) == message
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestExecutionLog"])
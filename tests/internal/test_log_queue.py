@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+import sys
+
+import pytest
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.log_queue import BoundedQueueHandler, JsonFormatter, LogQueue
+from src.internal.metrics import MetricsRegistry
+
+
+class ListHandler(logging.Handler):
+    """Обработчик сохраняет записи лога в список"""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture()
+def logger():
+    """Создает логгер с обработчиком, сохраняющим записи в список"""
+    test_logger = logging.getLogger(f"test_log_queue_{os.getpid()}")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    handler = ListHandler()
+    test_logger.addHandler(handler)
+    yield test_logger
+    test_logger.removeHandler(handler)
+
+
+def make_record(message: str, *args, exc_info=None) -> logging.LogRecord:
+    """Создает запись лога"""
+    return logging.LogRecord(
+        "test", logging.ERROR, __file__, 1, message, args, exc_info, "func"
+    )
+
+
+class TestLogQueue:
+    """Тесты для классов BoundedQueueHandler, JsonFormatter и LogQueue."""
+
+    def test_drop_when_full(self):
+        """Проверяет отбрасывание записей и учет переполнений очереди"""
+        metrics = MetricsRegistry()
+        handler = BoundedQueueHandler(2, metrics)
+        for idx in range(5):
+            handler.handle(make_record("record %d", idx))
+        handler.queue.get_nowait()
+        for idx in range(3):
+            handler.handle(make_record("record %d", idx))
+
+        assert handler.dropped == 5
+        assert handler.overflows == 2
+        assert metrics.get_counter("logging.dropped") == 5
+        assert metrics.get_counter("logging.overflows") == 2
+
+    def test_prepare_keeps_exception(self):
+        """Проверяет, что сообщение подставляется в запись, а трассировка
+        исключения не форматируется в вызывающем потоке"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("value %s", 1, exc_info=sys.exc_info())
+        prepared = BoundedQueueHandler(1).prepare(record)
+
+        assert prepared.msg == "value 1"
+        assert prepared.args is None
+        assert prepared.exc_info is not None
+        assert prepared.exc_text is None
+
+    @pytest.mark.parametrize("capacity, error", [(0, ValueError), ("1", TypeError)])
+    def test_invalid_capacity(self, capacity, error):
+        """Проверяет ошибку указания некорректного размера очереди"""
+        with pytest.raises(error) as ex:
+            BoundedQueueHandler(capacity)
+        assert str(ex.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format("capacity")
+
+    def test_json_formatter(self):
+        """Проверяет форматирование записи в одну строку JSON"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("value %s", "x", exc_info=sys.exc_info())
+        line = JsonFormatter().format(record)
+        data = json.loads(line)
+
+        assert "\n" not in line
+        assert data["level"] == "ERROR"
+        assert data["logger"] == "test"
+        assert data["function"] == "func"
+        assert data["message"] == "value x"
+        assert "ValueError: boom" in data["exception"]
+
+    def test_start_stop(self, logger):
+        """Проверяет запись через очередь и восстановление обработчиков"""
+        handlers = list(logger.handlers)
+        [handler] = [item for item in handlers if isinstance(item, ListHandler)]
+        log_queue = LogQueue(100, logger=logger)
+        log_queue.start()
+
+        assert logger.handlers == [log_queue.handler]
+        for idx in range(10):
+            logger.info("record %d", idx)
+        log_queue.stop()
+
+        assert logger.handlers == handlers
+        assert [record.getMessage() for record in handler.records] == [
+            f"record {idx}" for idx in range(10)
+        ]
+
+    def test_start_stops_active(self, logger):
+        """Проверяет остановку ранее запущенной очереди"""
+        handlers = list(logger.handlers)
+        first = LogQueue(10, logger=logger)
+        first.start()
+        first.stop()
+        second = LogQueue(10, logger=logger)
+        second.start()
+        LogQueue.stop_active()
+
+        assert logger.handlers == handlers
+
+    def test_restore_after_fork(self, logger):
+        """Проверяет восстановление обработчиков в дочернем процессе"""
+        handlers = list(logger.handlers)
+        log_queue = LogQueue(10, logger=logger)
+        log_queue.start()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, b"1" if logger.handlers == handlers else b"0")
+            os._exit(0)
+        os.close(write_fd)
+        restored = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        log_queue.stop()
+
+        assert restored == b"1"
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestLogQueue"])
@@ -0,0 +1,212 @@
+import asyncio
+
+import pytest
+
+from src import algoscalc
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.execution.process_execution_backend import ProcessExecutionBackend
+from src.internal.execution.process_worker import ProcessWorker, WorkerFactory
+from src.internal.memoize import (
+    MISSING,
+    LruCache,
+    MemoizeStats,
+    memoize,
+    memoize_scope,
+    memoize_stats,
+)
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import MEMO_DEF, MEMO_FUNC, MEMO_NAME, MOCK_TESTS
+
+
+@pytest.fixture()
+def memo_algorithms(tmp_path, algo_dir):
+    """Создает набор алгоритмов с мемоизированной функцией"""
+    algo_dir(MEMO_NAME, MEMO_DEF, MEMO_FUNC, MOCK_TESTS)
+    algorithms = AlgorithmCollection(str(tmp_path))
+    memoize_stats.collect()
+    return algorithms
+
+
+class TestMemoize:
+    """Тесты для декоратора memoize и классов LruCache и MemoizeStats."""
+
+    def setup_method(self):
+        """Сбрасывает статистику, накопленную другими тестами"""
+        memoize_stats.collect()
+
+    def test_lru_cache(self):
+        """Проверяет вытеснение давно не использованных значений"""
+        cache = LruCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_memoize(self):
+        """Проверяет кэширование результатов и учет попаданий и промахов"""
+        calls = []
+
+        @memoize
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        with memoize_scope():
+            assert [square(2), square(3), square(2)] == [4, 9, 4]
+
+        assert calls == [2, 3]
+        assert square.__name__ == "square"
+        name = f"{__name__}.{square.__qualname__}"
+        assert memoize_stats.collect() == {name: (1, 2)}
+
+    def test_scope(self):
+        """Проверяет, что непостоянный кэш создается для каждого выполнения"""
+        calls = []
+
+        @memoize
+        def identity(x: int) -> int:
+            calls.append(x)
+            return x
+
+        with memoize_scope():
+            identity(1)
+            identity(1)
+        with memoize_scope():
+            identity(1)
+        identity(1)
+
+        assert calls == [1, 1, 1]
+
+    def test_recursion_without_scope(self):
+        """Проверяет, что вне выполнения алгоритма кэш создается для внешнего
+        вызова функции"""
+
+        @memoize
+        def fibonacci(n: int) -> int:
+            return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+        assert fibonacci(90) == 2880067194370816120
+        ((hits, misses),) = memoize_stats.collect().values()
+        assert (hits, misses) == (88, 91)
+
+    def test_persistent(self):
+        """Проверяет сохранение постоянного кэша между выполнениями"""
+        calls = []
+
+        @memoize(persistent=True)
+        def identity(x: int) -> int:
+            calls.append(x)
+            return x
+
+        with memoize_scope():
+            identity(1)
+        with memoize_scope():
+            identity(1)
+        identity.cache_clear()
+        identity(1)
+
+        assert calls == [1, 1]
+
+    def test_max_size(self):
+        """Проверяет ограничение количества результатов в кэше"""
+        calls = []
+
+        @memoize(max_size=1, persistent=True)
+        def identity(x: int) -> int:
+            calls.append(x)
+            return x
+
+        for x in [1, 2, 1]:
+            identity(x)
+
+        assert calls == [1, 2, 1]
+
+    def test_kwargs_and_unhashable(self):
+        """Проверяет ключи с именованными аргументами и вызовы с нехешируемыми
+        аргументами, которые не кэшируются"""
+        calls = []
+
+        @memoize(persistent=True)
+        def total(items, start=0):
+            calls.append(start)
+            return sum(items, start)
+
+        assert total((1, 2), start=1) == 4
+        assert total((1, 2), start=1) == 4
+        assert total((1, 2), start=2) == 5
+        assert total([1, 2]) == 3
+        assert total([1, 2]) == 3
+
+        assert calls == [1, 2, 0, 0]
+        ((hits, misses),) = memoize_stats.collect().values()
+        assert (hits, misses) == (1, 2)
+
+    @pytest.mark.parametrize(
+        "max_size, error_type",
+        [(0, ValueError), (-1, ValueError), (1.5, TypeError), (True, TypeError)],
+    )
+    def test_wrong_max_size(self, max_size, error_type):
+        """Проверяет ошибку при неправильном размере кэша"""
+        with pytest.raises(error_type) as error:
+            memoize(max_size=max_size)
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size")
+
+    def test_stats(self):
+        """Проверяет сбор и объединение статистики"""
+        stats = MemoizeStats()
+        stats.record("f", 1, 0)
+        stats.merge({"f": (2, 3), "g": (0, 1)})
+
+        assert stats.collect() == {"f": (3, 3), "g": (0, 1)}
+        assert stats.collect() == {}
+
+    def test_algoscalc(self):
+        """Проверяет декоратор, доступный авторам алгоритмов"""
+        assert algoscalc.memoize is memoize
+
+    def test_process_worker(self, memo_algorithms):
+        """Проверяет, что постоянный кэш сохраняется в рабочем процессе между
+        выполнениями, а статистика передается в родительский процесс"""
+        factory = WorkerFactory(memo_algorithms)
+        worker = ProcessWorker(factory)
+
+        result = worker.execute(MEMO_NAME, {"n": 30})
+        first = memoize_stats.collect()
+        worker.execute(MEMO_NAME, {"n": 30})
+        second = memoize_stats.collect()
+        worker.close()
+        factory.close()
+
+        assert result == [DataElementSchema(name="result", value=832040)]
+        ((hits, misses),) = first.values()
+        assert misses > 0
+        assert list(second.values()) == [(1, 0)]
+
+    def test_scheduler_metrics(self, memo_algorithms):
+        """Проверяет учет попаданий и промахов в метриках планировщика"""
+        scheduler = AlgorithmScheduler(
+            memo_algorithms,
+            backend=ProcessExecutionBackend(memo_algorithms),
+        )
+        asyncio.run(scheduler.execute(MEMO_NAME, {"n": 10}))
+        metrics = scheduler.metrics
+        scheduler.shutdown()
+
+        counters = metrics.snapshot()["counters"]
+        names = [name for name in counters if name.endswith("fibonacci.misses")]
+        assert len(names) == 1
+        assert counters[names[0]] == counters["memoize.misses"] > 0
+        assert counters["memoize.hits"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestMemoize"])
@@ -0,0 +1,42 @@
+import pytest
+
+from src.internal.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    """Тесты для класса MetricsRegistry."""
+
+    def test_increment(self):
+        """Проверяет увеличение счетчика"""
+        metrics = MetricsRegistry()
+        metrics.increment("events")
+        metrics.increment("events", 2)
+
+        assert metrics.get_counter("events") == 3
+        assert metrics.get_counter("unknown") == 0
+
+    def test_observe(self):
+        """Проверяет статистику наблюдаемых значений"""
+        metrics = MetricsRegistry()
+        for value in [2, 1, 3]:
+            metrics.observe("latency", value)
+
+        assert metrics.snapshot()["observations"]["latency"] == {
+            "count": 3,
+            "sum": 6,
+            "min": 1,
+            "max": 3,
+        }
+
+    def test_snapshot_is_copy(self):
+        """Проверяет, что снимок метрик не изменяется вместе с реестром"""
+        metrics = MetricsRegistry()
+        metrics.increment("events")
+        snapshot = metrics.snapshot()
+        metrics.increment("events")
+
+        assert snapshot["counters"] == {"events": 1}
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestMetricsRegistry"])
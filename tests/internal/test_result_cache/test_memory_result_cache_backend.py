@@ -0,0 +1,59 @@
+import pytest
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.result_cache import memory_result_cache_backend
+from src.internal.result_cache.memory_result_cache_backend import (
+    MemoryResultCacheBackend,
+)
+
+
+class TestMemoryResultCacheBackend:
+    """Тесты для класса MemoryResultCacheBackend."""
+
+    def test_get_set(self):
+        """Проверяет сохранение и получение значений"""
+        backend = MemoryResultCacheBackend()
+        backend.set("a", b"1")
+
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+
+    def test_eviction(self):
+        """Проверяет вытеснение давно не использованных значений"""
+        backend = MemoryResultCacheBackend(2)
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        backend.get("a")
+        backend.set("c", b"3")
+
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1"
+
+    def test_ttl(self, monkeypatch):
+        """Проверяет истечение срока хранения значения"""
+        now = [100.0]
+        monkeypatch.setattr(
+            memory_result_cache_backend.time, "monotonic", lambda: now[0]
+        )
+        backend = MemoryResultCacheBackend()
+        backend.set("a", b"1", ttl=10)
+        backend.set("b", b"2")
+
+        assert backend.get("a") == b"1"
+        now[0] = 110.0
+        assert backend.get("a") is None
+        assert backend.get("b") == b"2"
+
+    @pytest.mark.parametrize(
+        "max_size, error_type", [(0, ValueError), ("1", TypeError)]
+    )
+    def test_wrong_max_size(self, max_size, error_type):
+        """Проверяет ошибку при неправильном размере хранилища"""
+        with pytest.raises(error_type) as error:
+            MemoryResultCacheBackend(max_size)
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size")
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestMemoryResultCacheBackend"])
@@ -0,0 +1,167 @@
+import socketserver
+import threading
+import time
+
+import pytest
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.result_cache.resp_result_cache_backend import (
+    RespResultCacheBackend,
+    RespServerError,
+)
+
+PASSWORD = "secret"
+
+
+class FakeRespHandler(socketserver.StreamRequestHandler):
+    """Обработчик соединения с локальным сервером, который поддерживает
+    команды AUTH, SELECT, GET и SET протокола Redis"""
+
+    def handle(self):
+        authorized = self.server.password is None
+        db = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+            if self.server.drop:
+                self.server.drop = False
+                return
+            command = args[0].decode().upper()
+            self.server.commands.append(command)
+            if command == "AUTH":
+                authorized = args[-1].decode() == self.server.password
+                reply = b"+OK\r\n" if authorized else b"-WRONGPASS invalid\r\n"
+            elif not authorized:
+                reply = b"-NOAUTH Authentication required.\r\n"
+            elif command == "SELECT":
+                db = int(args[1])
+                reply = b"+OK\r\n"
+            elif command == "SET":
+                expires = None
+                if len(args) == 5 and args[3].upper() == b"PX":
+                    expires = time.monotonic() + int(args[4]) / 1000
+                self.server.values[(db, args[1])] = (args[2], expires)
+                reply = b"+OK\r\n"
+            elif command == "GET":
+                value, expires = self.server.values.get((db, args[1]), (None, None))
+                if value is None or (expires and expires <= time.monotonic()):
+                    reply = b"$-1\r\n"
+                else:
+                    reply = b"$%d\r\n%s\r\n" % (len(value), value)
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+class FakeRespServer(socketserver.ThreadingTCPServer):
+    """Локальный сервер, совместимый с протоколом Redis, для тестов. Если
+    установлен признак drop, сервер разрывает соединение вместо ответа на
+    очередную команду"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password: str | None = None):
+        super().__init__(("127.0.0.1", 0), FakeRespHandler)
+        self.password = password
+        self.values = {}
+        self.commands = []
+        self.drop = False
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        if self.password is None:
+            return f"redis://{host}:{port}"
+        return f"redis://:{self.password}@{host}:{port}/2"
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture()
+def resp_server():
+    """Запускает локальный сервер с протоколом Redis"""
+    server = FakeRespServer()
+    yield server
+    server.stop()
+
+
+class TestRespResultCacheBackend:
+    """Тесты для класса RespResultCacheBackend."""
+
+    def test_get_set(self, resp_server):
+        """Проверяет сохранение и получение значений"""
+        backend = RespResultCacheBackend(resp_server.url)
+        backend.set("a", b"1\r\n2")
+
+        assert backend.get("a") == b"1\r\n2"
+        assert backend.get("b") is None
+        backend.close()
+
+    def test_ttl(self, resp_server):
+        """Проверяет передачу срока хранения значения серверу"""
+        backend = RespResultCacheBackend(resp_server.url)
+        backend.set("a", b"1", ttl=0.05)
+
+        assert backend.get("a") == b"1"
+        time.sleep(0.1)
+        assert backend.get("a") is None
+        backend.close()
+
+    def test_auth_and_db(self):
+        """Проверяет авторизацию и выбор базы данных при соединении"""
+        server = FakeRespServer(PASSWORD)
+        backend = RespResultCacheBackend(server.url)
+        backend.set("a", b"1")
+
+        assert backend.get("a") == b"1"
+        assert server.commands == ["AUTH", "SELECT", "SET", "GET"]
+        assert (2, b"a") in server.values
+        backend.close()
+        server.stop()
+
+    def test_server_error(self):
+        """Проверяет ошибку, возвращенную сервером"""
+        server = FakeRespServer(PASSWORD)
+        host, port = server.server_address
+        backend = RespResultCacheBackend(f"redis://:wrong@{host}:{port}")
+
+        with pytest.raises(RespServerError) as error:
+            backend.get("a")
+        assert str(error.value) == ErrMsgTmpl.RESULT_CACHE_SERVER_ERROR.format(
+            "WRONGPASS invalid"
+        )
+        backend.close()
+        server.stop()
+
+    def test_reconnect(self, resp_server):
+        """Проверяет повторное соединение после ошибки соединения"""
+        backend = RespResultCacheBackend(resp_server.url)
+        backend.set("a", b"1")
+        resp_server.drop = True
+
+        with pytest.raises(ConnectionError):
+            backend.get("a")
+        assert backend.get("a") == b"1"
+        backend.close()
+
+    @pytest.mark.parametrize(
+        "url", ["http://localhost", "redis://", "redis://localhost/db", "redis://h:x"]
+    )
+    def test_invalid_url(self, url):
+        """Проверяет ошибку при некорректном адресе сервера"""
+        with pytest.raises(ValueError) as error:
+            RespResultCacheBackend(url)
+        assert str(error.value) == ErrMsgTmpl.INVALID_RESULT_CACHE_URL.format(url)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestRespResultCacheBackend"])
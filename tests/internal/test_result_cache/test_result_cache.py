@@ -0,0 +1,190 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from src.internal.algorithm_collection import AlgorithmCollection
+from src.internal.constants import (
+    DEFAULT_DEFINITION_FILE_NAME,
+    DEFAULT_FUNCTION_FILE_NAME,
+)
+from src.internal.data_dimension.compact_array import CompactArray, CompactArrayBuilder
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.execution.algorithm_scheduler import AlgorithmScheduler
+from src.internal.result_cache.memory_result_cache_backend import (
+    MemoryResultCacheBackend,
+)
+from src.internal.result_cache.result_cache import ResultCache, get_values_digest
+from src.internal.result_cache.result_cache_backend import ResultCacheBackend
+from src.internal.schemas.data_element_schema import DataElementSchema
+from tests import FIB_DEF, FIB_NAME
+
+RESULT = [DataElementSchema(name="result", value=55)]
+
+
+class FailingBackend(ResultCacheBackend):
+    """Хранилище, недоступное для чтения и записи"""
+
+    def get(self, key: str) -> bytes | None:
+        raise ConnectionError("unavailable")
+
+    def set(self, key: str, value: bytes, ttl: float = 0) -> None:
+        raise ConnectionError("unavailable")
+
+
+def compact(
+    value: list,
+    data_type: DataTypeEnum = DataTypeEnum.INT,
+    data_shape: DataShapeEnum = DataShapeEnum.LIST,
+) -> object:
+    """Собирает список или матрицу в CompactArray"""
+    builder = CompactArrayBuilder(data_type, data_shape)
+    if data_shape == DataShapeEnum.LIST:
+        builder.extend(value)
+        return builder.build()
+    for row in value:
+        builder.extend(row)
+        builder.end_row()
+    return builder.build()
+
+
+class TestResultCache:
+    """Тесты для класса ResultCache и функции get_values_digest."""
+
+    def test_digest(self):
+        """Проверяет хеш значений входных данных"""
+        digest = get_values_digest({"a": 1, "b": [1.5, True]})
+
+        assert digest == get_values_digest({"b": [1.5, True], "a": 1})
+        assert digest != get_values_digest({"a": 1.0, "b": [1.5, True]})
+        assert digest != get_values_digest({"a": 1, "b": [1.5, 1]})
+        assert get_values_digest({"a": compact([1, 2])}) == get_values_digest(
+            {"a": compact([1, 2])}
+        )
+        assert get_values_digest({"a": compact([1, 2])}) != get_values_digest(
+            {"a": compact([1, 3])}
+        )
+        assert get_values_digest({"a": b"bytes"}) is None
+
+    @pytest.mark.parametrize(
+        "value, data_type, data_shape",
+        [
+            ([1, 2], DataTypeEnum.INT, DataShapeEnum.LIST),
+            ([0.5, 1.0], DataTypeEnum.FLOAT, DataShapeEnum.LIST),
+            ([True, False], DataTypeEnum.BOOL, DataShapeEnum.LIST),
+            ([[1, 2], [], [3]], DataTypeEnum.INT, DataShapeEnum.MATRIX),
+            ([[0.5], [1.5, 2.0]], DataTypeEnum.FLOAT, DataShapeEnum.MATRIX),
+        ],
+    )
+    def test_digest_compact(self, value, data_type, data_shape):
+        """Проверяет, что хеш значения в CompactArray совпадает с хешем того же
+        значения в списке"""
+        assert isinstance(compact(value, data_type, data_shape), CompactArray)
+        assert get_values_digest(
+            {"a": compact(value, data_type, data_shape)}
+        ) == get_values_digest({"a": value})
+
+    def test_get_put(self):
+        """Проверяет сохранение и получение результата"""
+        cache = ResultCache(MemoryResultCacheBackend(), namespace="v1")
+        key = cache.get_key(FIB_NAME, "abc", {"n": 10})
+
+        assert key.startswith(f"algoscalc:v1:{FIB_NAME}:abc:")
+        assert key != cache.get_key(FIB_NAME, "abd", {"n": 10})
+        assert cache.get(key) is None
+        cache.put(key, RESULT)
+        assert cache.get(key) == RESULT
+
+    def test_serialization(self):
+        """Проверяет, что результат хранится в формате JSON, а данные
+        хранилища, не соответствующие схеме, не возвращаются"""
+        backend = MemoryResultCacheBackend()
+        cache = ResultCache(backend)
+        result = [
+            DataElementSchema(name="a", value=[1.0, float("inf"), -float("inf")]),
+            DataElementSchema(name="b", value=[[1, 2], [3]]),
+            DataElementSchema(name="c", value=True),
+            DataElementSchema(name="d", value="text"),
+        ]
+        cache.put("key", result)
+
+        assert backend.get("key").startswith(b'[{"name":"a","value":[1.0,Infinity')
+        assert cache.get("key") == result
+        cache.put("nan", [DataElementSchema(name="a", value=float("nan"))])
+        assert cache.get("nan")[0].value != cache.get("nan")[0].value
+        backend.set("bad", b"\x80\x05N.")
+        assert cache.get("bad") is None
+        backend.set("bad", b'[{"value": 1}]')
+        assert cache.get("bad") is None
+
+    def test_max_item_size(self):
+        """Проверяет, что результаты большого размера не кэшируются"""
+        cache = ResultCache(MemoryResultCacheBackend(), max_item_size=10)
+        key = cache.get_key(FIB_NAME, "abc", {"n": 10})
+        cache.put(key, RESULT)
+
+        assert cache.get(key) is None
+
+    def test_backend_error(self):
+        """Проверяет, что ошибки хранилища не прерывают работу кэша"""
+        cache = ResultCache(FailingBackend())
+        key = cache.get_key(FIB_NAME, "abc", {"n": 10})
+        cache.put(key, RESULT)
+
+        assert cache.get(key) is None
+
+    def test_scheduler(self, tmp_path, fib_algo_dir):
+        """Проверяет, что планировщик возвращает результат из кэша без
+        выполнения алгоритма"""
+        backend = MemoryResultCacheBackend()
+        scheduler = AlgorithmScheduler(
+            AlgorithmCollection(str(tmp_path)), result_cache=ResultCache(backend)
+        )
+        values = {"n": 10}
+
+        first = asyncio.run(scheduler.execute(FIB_NAME, values))
+        second = asyncio.run(scheduler.execute(FIB_NAME, values))
+
+        assert first == second == RESULT
+        assert len(backend) == 1
+        assert scheduler.metrics.get_counter("result_cache.misses") == 1
+        assert scheduler.metrics.get_counter("result_cache.hits") == 1
+        assert scheduler.profile.snapshot()[FIB_NAME][1]["count"] == 1
+        scheduler.shutdown()
+
+    def test_scheduler_algorithm_changed(self, tmp_path, fib_algo_dir):
+        """Проверяет, что после изменения кода алгоритма результат не берется
+        из кэша, а результаты недетерминированных алгоритмов не кэшируются"""
+        backend = MemoryResultCacheBackend()
+        algorithms = AlgorithmCollection(str(tmp_path))
+        scheduler = AlgorithmScheduler(algorithms, result_cache=ResultCache(backend))
+        values = {"n": 10}
+        asyncio.run(scheduler.execute(FIB_NAME, values))
+
+        func_file = os.path.join(fib_algo_dir, DEFAULT_FUNCTION_FILE_NAME)
+        with open(func_file, "a", encoding="utf-8") as file:
+            file.write("\n# changed\n")
+        algorithms.reload()
+        asyncio.run(scheduler.execute(FIB_NAME, values))
+
+        assert len(backend) == 2
+        assert scheduler.metrics.get_counter("result_cache.misses") == 2
+
+        def_file = os.path.join(fib_algo_dir, DEFAULT_DEFINITION_FILE_NAME)
+        with open(def_file, "w", encoding="utf-8") as file:
+            json.dump(FIB_DEF | {"deterministic": False}, file)
+        algorithms.reload()
+        first = asyncio.run(scheduler.execute(FIB_NAME, values))
+        second = asyncio.run(scheduler.execute(FIB_NAME, values))
+
+        assert first == second == RESULT
+        assert len(backend) == 2
+        assert scheduler.metrics.get_counter("result_cache.misses") == 2
+        assert scheduler.metrics.get_counter("result_cache.hits") == 0
+        scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestResultCache"])
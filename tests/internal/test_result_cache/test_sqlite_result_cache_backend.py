@@ -0,0 +1,141 @@
+import multiprocessing
+
+import pytest
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.result_cache import sqlite_result_cache_backend
+from src.internal.result_cache.sqlite_result_cache_backend import (
+    SqliteResultCacheBackend,
+)
+
+
+@pytest.fixture()
+def cache_path(tmp_path):
+    """Возвращает путь к файлу базы данных кэша"""
+    return str(tmp_path / "result_cache.sqlite3")
+
+
+def set_value(backend: SqliteResultCacheBackend, key: str, value: bytes) -> None:
+    """Сохраняет значение в рабочем процессе"""
+    backend.set(key, value)
+
+
+class TestSqliteResultCacheBackend:
+    """Тесты для класса SqliteResultCacheBackend."""
+
+    def test_get_set(self, cache_path):
+        """Проверяет сохранение, замену и получение значений"""
+        backend = SqliteResultCacheBackend(cache_path)
+        backend.set("a", b"1")
+        backend.set("a", b"2")
+
+        assert backend.get("a") == b"2"
+        assert backend.get("b") is None
+        assert len(backend) == 1
+        backend.close()
+
+    def test_eviction(self, cache_path, monkeypatch):
+        """Проверяет вытеснение давно не использованных значений"""
+        now = [100.0]
+        monkeypatch.setattr(sqlite_result_cache_backend.time, "time", lambda: now[0])
+        backend = SqliteResultCacheBackend(
+            cache_path, max_size=2, touch_interval=0, eviction_interval=1
+        )
+        for key in ["a", "b", "a", "c"]:
+            now[0] += 1
+            if backend.get(key) is None:
+                backend.set(key, key.encode())
+
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a") == b"a"
+        assert backend.get("c") == b"c"
+        backend.close()
+
+    def test_eviction_batch(self, cache_path):
+        """Проверяет вытеснение лишних значений пачкой после заданного
+        количества сохранений"""
+        backend = SqliteResultCacheBackend(cache_path, max_size=2, eviction_interval=3)
+        for key in ["a", "b", "c"]:
+            backend.set(key, key.encode())
+
+        assert len(backend) == 2
+        backend.set("d", b"d")
+        backend.set("e", b"e")
+        assert len(backend) == 4
+        backend.set("f", b"f")
+        assert len(backend) == 2
+        backend.close()
+
+    def test_touch_interval(self, cache_path, monkeypatch):
+        """Проверяет, что время использования значения обновляется при чтении
+        не чаще заданного интервала"""
+        now = [100.0]
+        monkeypatch.setattr(sqlite_result_cache_backend.time, "time", lambda: now[0])
+        backend = SqliteResultCacheBackend(
+            cache_path, max_size=2, touch_interval=10, eviction_interval=1
+        )
+        for moment, key in [(100.0, "a"), (101.0, "b")]:
+            now[0] = moment
+            backend.set(key, key.encode())
+        now[0] = 105.0
+        backend.get("a")
+        now[0] = 106.0
+        backend.set("c", b"c")
+
+        assert backend.get("a") is None
+        now[0] = 120.0
+        backend.get("b")
+        now[0] = 121.0
+        backend.set("d", b"d")
+        assert backend.get("c") is None
+        assert backend.get("b") == b"b"
+        backend.close()
+
+    @pytest.mark.parametrize(
+        "kwargs, name, error_type",
+        [
+            ({"max_size": 0}, "max_size", ValueError),
+            ({"eviction_interval": 0}, "eviction_interval", ValueError),
+            ({"eviction_interval": "1"}, "eviction_interval", TypeError),
+        ],
+    )
+    def test_wrong_params(self, cache_path, kwargs, name, error_type):
+        """Проверяет ошибку при неправильных параметрах хранилища"""
+        with pytest.raises(error_type) as error:
+            SqliteResultCacheBackend(cache_path, **kwargs)
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format(name)
+
+    def test_ttl(self, cache_path, monkeypatch):
+        """Проверяет истечение срока хранения значения"""
+        now = [100.0]
+        monkeypatch.setattr(sqlite_result_cache_backend.time, "time", lambda: now[0])
+        backend = SqliteResultCacheBackend(cache_path)
+        backend.set("a", b"1", ttl=10)
+
+        assert backend.get("a") == b"1"
+        now[0] = 110.0
+        assert backend.get("a") is None
+        assert len(backend) == 0
+        backend.close()
+
+    def test_shared(self, cache_path):
+        """Проверяет, что значения, сохраненные в другом процессе, доступны
+        через общий файл"""
+        backend = SqliteResultCacheBackend(cache_path)
+        backend.set("a", b"1")
+        context = multiprocessing.get_context("fork")
+        process = context.Process(target=set_value, args=(backend, "b", b"2"))
+        process.start()
+        process.join()
+
+        assert process.exitcode == 0
+        assert backend.get("b") == b"2"
+        other = SqliteResultCacheBackend(cache_path)
+        assert other.get("a") == b"1"
+        other.close()
+        backend.close()
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestSqliteResultCacheBackend"])
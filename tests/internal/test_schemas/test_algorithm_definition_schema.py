@@ -34,6 +34,36 @@ class TestAlgorithmDefinitionSchema(TestDefinitionSchema):
         assert algo_definition.description == DESCRIPTION
         assert algo_definition.parameters == params
         assert algo_definition.outputs == outputs
+        assert algo_definition.limits is None
+
+    def test_limits(self, create_scalar_int_data_definition):
+        """Проверка создания объекта с ограничениями ресурсов"""
+        algo_definition = AlgorithmDefinitionSchema(
+            name=NAME,
+            title=TITLE,
+            description=DESCRIPTION,
+            parameters=[create_scalar_int_data_definition(name="p")],
+            outputs=[create_scalar_int_data_definition(name="o")],
+            limits={"memory_limit": 64, "cpu_limit": 2, "timeout": 10},
+        )
+        assert algo_definition.limits.memory_limit == 64
+        assert algo_definition.limits.cpu_limit == 2
+        assert algo_definition.limits.timeout == 10
+
+    @pytest.mark.parametrize(
+        "limits", [{"memory_limit": 0}, {"cpu_limit": -1}, {"timeout": 0}]
+    )
+    def test_invalid_limits(self, create_scalar_int_data_definition, limits):
+        """Проверка ошибки при неположительных значениях ограничений ресурсов"""
+        with pytest.raises(ValueError):
+            AlgorithmDefinitionSchema(
+                name=NAME,
+                title=TITLE,
+                description=DESCRIPTION,
+                parameters=[create_scalar_int_data_definition(name="p")],
+                outputs=[create_scalar_int_data_definition(name="o")],
+                limits=limits,
+            )
 
     def test_valid_entity_multiple_params(self, create_scalar_int_data_definition):
         """Проверка создания объекта с несколькими выходными данными"""
@@ -495,6 +495,96 @@ class TestDataDefinitionSchema(TestDefinitionSchema):
             1, 0, DataTypeEnum.STRING
         )
 
+    def test_size_limits(self):
+        """Проверка создания объекта с ограничениями размера"""
+        data_definition = DataDefinitionSchema(
+            name=NAME,
+            title=TITLE,
+            description=DESCRIPTION,
+            data_type=DataTypeEnum.STRING,
+            data_shape=DataShapeEnum.MATRIX,
+            default_value=[["a", "b"]],
+            max_rows=10,
+            max_cols=2,
+            max_str_len=1,
+        )
+        assert data_definition.max_rows == 10
+        assert data_definition.max_cols == 2
+        assert data_definition.max_str_len == 1
+        assert data_definition.max_length is None
+
+    @pytest.mark.parametrize(
+        "data_shape, data_type, name",
+        [
+            (DataShapeEnum.SCALAR, DataTypeEnum.INT, "max_length"),
+            (DataShapeEnum.LIST, DataTypeEnum.INT, "max_rows"),
+            (DataShapeEnum.LIST, DataTypeEnum.INT, "max_cols"),
+            (DataShapeEnum.LIST, DataTypeEnum.INT, "max_str_len"),
+        ],
+    )
+    def test_inapplicable_size_limit(self, data_shape, data_type, name):
+        """Проверка создания объекта с ограничением размера, не применимым к
+        типу или размерности данных"""
+        default_value = 1 if data_shape == DataShapeEnum.SCALAR else [1]
+        with pytest.raises(ValidationError) as ctx:
+            DataDefinitionSchema(
+                name=NAME,
+                title=TITLE,
+                description=DESCRIPTION,
+                data_type=data_type,
+                data_shape=data_shape,
+                default_value=default_value,
+                **{name: 1},
+            )
+        assert ctx.value.errors()[0][
+            ErrorItemEnum.MSG
+        ] == "Value error, " + ErrMsgTmpl.INAPPLICABLE_SIZE_LIMIT.format(
+            name, data_type, data_shape
+        )
+
+    @pytest.mark.parametrize(
+        "data_shape, data_type, default_value",
+        [
+            (DataShapeEnum.SCALAR, DataTypeEnum.INT, 1),
+            (DataShapeEnum.LIST, DataTypeEnum.STRING, ["a"]),
+        ],
+    )
+    def test_inapplicable_compact(self, data_shape, data_type, default_value):
+        """Проверка создания объекта с признаком compact, не применимым к
+        типу или размерности данных"""
+        with pytest.raises(ValidationError) as ctx:
+            DataDefinitionSchema(
+                name=NAME,
+                title=TITLE,
+                description=DESCRIPTION,
+                data_type=data_type,
+                data_shape=data_shape,
+                default_value=default_value,
+                compact=True,
+            )
+        assert ctx.value.errors()[0][
+            ErrorItemEnum.MSG
+        ] == "Value error, " + ErrMsgTmpl.INAPPLICABLE_COMPACT.format(
+            data_type, data_shape
+        )
+
+    def test_default_value_too_large(self):
+        """Проверка создания объекта со значением по умолчанию, превышающим
+        ограничение размера"""
+        with pytest.raises(ValidationError) as ctx:
+            DataDefinitionSchema(
+                name=NAME,
+                title=TITLE,
+                description=DESCRIPTION,
+                data_type=DataTypeEnum.INT,
+                data_shape=DataShapeEnum.LIST,
+                default_value=[1, 2],
+                max_length=1,
+            )
+        assert ctx.value.errors()[0][
+            ErrorItemEnum.MSG
+        ] == "Value error, " + ErrMsgTmpl.TOO_LONG_LIST.format(2, 1)
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestDataDefinitionSchema"])
@@ -0,0 +1,108 @@
+import builtins
+import importlib
+import json
+import sys
+
+import pytest
+
+from src.internal.startup_profiler import StartupProfiler
+from src.internal.startup_stage_enum import StartupStageEnum
+
+
+@pytest.fixture()
+def profiler():
+    """Создает профилировщик запуска и останавливает его после теста"""
+    startup_profiler = StartupProfiler()
+    yield startup_profiler
+    startup_profiler.stop()
+
+
+class TestStartupProfiler:
+    """Тесты для класса StartupProfiler."""
+
+    def test_disabled(self, profiler):
+        """Проверяет, что остановленный профилировщик не записывает интервалы"""
+        with profiler.span(StartupStageEnum.APP):
+            pass
+
+        assert not profiler.enabled
+        assert profiler.get_trace()["traceEvents"] == []
+        assert profiler.get_summary() == {}
+
+    def test_span(self, profiler):
+        """Проверяет запись интервала в формате Chrome Trace Event"""
+        profiler.start()
+        with profiler.span(StartupStageEnum.DEFINITION, "fibonacci"):
+            pass
+        profiler.stop()
+        [event] = profiler.get_trace()["traceEvents"]
+
+        assert event["name"] == "fibonacci"
+        assert event["cat"] == StartupStageEnum.DEFINITION
+        assert event["ph"] == "X"
+        assert event["ts"] >= 0
+        assert event["dur"] >= 0
+        assert profiler.get_summary() == {
+            StartupStageEnum.DEFINITION: event["dur"] / 1e6
+        }
+
+    def test_nested_summary(self, profiler):
+        """Проверяет, что вложенные интервалы того же этапа не учитываются в
+        итогах повторно"""
+        profiler.start()
+        with profiler.span(StartupStageEnum.APP, "outer"):
+            with profiler.span(StartupStageEnum.APP, "inner"):
+                pass
+            with profiler.span(StartupStageEnum.TESTS, "tests"):
+                pass
+        profiler.stop()
+        events = {event["name"]: event for event in profiler.get_trace()["traceEvents"]}
+        summary = profiler.get_summary()
+
+        assert summary[StartupStageEnum.APP] == events["outer"]["dur"] / 1e6
+        assert summary[StartupStageEnum.TESTS] == events["tests"]["dur"] / 1e6
+
+    def test_import(self, profiler, tmp_path, monkeypatch):
+        """Проверяет измерение времени импорта модулей"""
+        (tmp_path / "startup_outer.py").write_text("import startup_inner\n")
+        (tmp_path / "startup_inner.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        original_import = builtins.__import__
+
+        profiler.start()
+        try:
+            importlib.invalidate_caches()
+            exec("import startup_outer")
+            exec("import startup_outer")
+        finally:
+            profiler.stop()
+            sys.modules.pop("startup_outer", None)
+            sys.modules.pop("startup_inner", None)
+        events = profiler.get_trace()["traceEvents"]
+
+        assert builtins.__import__ is original_import
+        assert [event["name"] for event in events] == [
+            "startup_inner",
+            "startup_outer",
+        ]
+        assert all(event["cat"] == StartupStageEnum.IMPORT for event in events)
+        assert profiler.get_summary()[StartupStageEnum.IMPORT] == (
+            events[1]["dur"] / 1e6
+        )
+
+    def test_write(self, profiler, tmp_path):
+        """Проверяет сохранение отчета в файл"""
+        path = tmp_path / "trace.json"
+        profiler.start()
+        with profiler.span(StartupStageEnum.APP):
+            pass
+        profiler.stop()
+        profiler.write(str(path))
+        trace = json.loads(path.read_text())
+
+        assert trace["traceEvents"][0]["name"] == StartupStageEnum.APP
+        assert StartupStageEnum.APP in trace["otherData"]["summary"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestStartupProfiler"])
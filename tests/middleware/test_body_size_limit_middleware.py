@@ -0,0 +1,66 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.middleware.body_size_limit_middleware import BodySizeLimitMiddleware
+
+MAX_SIZE = 10
+
+
+async def echo(request):
+    return JSONResponse({"size": len(await request.body())})
+
+
+@pytest.fixture()
+def client():
+    """Создает клиента для приложения с ограничением размера тела запроса"""
+    app = Starlette(routes=[Route("/echo", echo, methods=["POST"])])
+    app.add_middleware(BodySizeLimitMiddleware, max_size=MAX_SIZE)
+    return TestClient(app)
+
+
+def chunks(size: int):
+    """Возвращает тело запроса частями без заголовка Content-Length"""
+    for _ in range(size):
+        yield b"x"
+
+
+class TestBodySizeLimitMiddleware:
+    """Тесты для класса BodySizeLimitMiddleware."""
+
+    def test_allowed(self, client):
+        """Проверяет запрос с телом допустимого размера"""
+        response = client.post("/echo", content=b"x" * MAX_SIZE)
+
+        assert response.json() == {"size": MAX_SIZE}
+
+    def test_content_length(self, client):
+        """Проверяет отклонение запроса по заголовку Content-Length"""
+        response = client.post("/echo", content=b"x" * (MAX_SIZE + 1))
+
+        assert response.status_code == 413
+        assert response.json() == {
+            "detail": ErrMsgTmpl.REQUEST_TOO_LARGE.format(MAX_SIZE)
+        }
+
+    def test_chunked(self, client):
+        """Проверяет отклонение запроса, переданного частями"""
+        allowed = client.post("/echo", content=chunks(MAX_SIZE))
+        response = client.post("/echo", content=chunks(MAX_SIZE + 1))
+
+        assert allowed.json() == {"size": MAX_SIZE}
+        assert response.status_code == 413
+
+    def test_non_positive_size(self):
+        """Проверяет ошибку указания неположительного размера"""
+        with pytest.raises(ValueError) as error:
+            BodySizeLimitMiddleware(None, max_size=0)
+
+        assert str(error.value) == ErrMsgTmpl.NON_POSITIVE_PARAM.format("max_size")
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestBodySizeLimitMiddleware"])
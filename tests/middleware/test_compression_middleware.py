@@ -0,0 +1,218 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from src.internal.constants import COMPRESSION_THREAD_SIZE
+from src.internal.metrics import MetricsRegistry
+from src.middleware import compression_middleware
+from src.middleware.compression_enum import CompressionEnum
+from src.middleware.compression_middleware import (
+    CompressionMiddleware,
+    negotiate_encoding,
+)
+from src.middleware.compressors import is_available
+
+MIN_SIZE = 100
+STREAMING_SIZE = 200_000
+SMALL_BODY = b"x" * (MIN_SIZE - 1)
+LARGE_BODY = b"0123456789" * 1000
+HUGE_BODY = b"0123456789" * 50_000
+STREAM_PARTS = [b"part-%d;" % idx * 50 for idx in range(5)]
+
+
+async def small(request):
+    return Response(SMALL_BODY, media_type="application/json")
+
+
+async def large(request):
+    return Response(LARGE_BODY, media_type="application/json")
+
+
+async def huge(request):
+    return Response(HUGE_BODY, media_type="application/json")
+
+
+async def stream(request):
+    async def parts():
+        for part in STREAM_PARTS:
+            yield part
+
+    return StreamingResponse(parts(), media_type="application/x-ndjson")
+
+
+async def events(request):
+    return Response(LARGE_BODY, media_type="text/event-stream")
+
+
+async def encoded(request):
+    return Response(LARGE_BODY, headers={"Content-Encoding": "identity"})
+
+
+async def tagged(request):
+    return Response(LARGE_BODY, headers={"ETag": '"abc"', "Vary": "Accept"})
+
+
+async def empty(request):
+    return Response(status_code=204)
+
+
+def create_client(metrics: MetricsRegistry, **kwargs) -> TestClient:
+    """Создает клиента для приложения со сжатием ответов"""
+    app = Starlette(
+        routes=[
+            Route(f"/{endpoint.__name__}", endpoint)
+            for endpoint in (small, large, huge, stream, events, encoded, tagged, empty)
+        ]
+    )
+    app.add_middleware(
+        CompressionMiddleware,
+        metrics=metrics,
+        minimum_size=MIN_SIZE,
+        streaming_size=STREAMING_SIZE,
+        **kwargs,
+    )
+    return TestClient(app)
+
+
+@pytest.fixture()
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture()
+def client(metrics) -> TestClient:
+    return create_client(metrics)
+
+
+class TestNegotiateEncoding:
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("", None),
+            ("identity", None),
+            ("gzip", CompressionEnum.GZIP),
+            ("GZIP, deflate", CompressionEnum.GZIP),
+            ("gzip, br", CompressionEnum.BR),
+            ("gzip;q=1.0, br;q=0.5", CompressionEnum.GZIP),
+            ("br;q=0, gzip;q=0.1", CompressionEnum.GZIP),
+            ("*", CompressionEnum.BR),
+            ("*, br;q=0", CompressionEnum.ZSTD),
+            ("gzip;q=0", None),
+            ("gzip;q=abc", None),
+        ],
+    )
+    def test_negotiate(self, accept_encoding, expected):
+        encodings = [CompressionEnum.BR, CompressionEnum.ZSTD, CompressionEnum.GZIP]
+        assert negotiate_encoding(accept_encoding, encodings) == expected
+
+
+class TestCompressionMiddleware:
+    def test_small_body_not_compressed(self, client):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert response.content == SMALL_BODY
+
+    def test_no_accept_encoding(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.content == LARGE_BODY
+
+    def test_large_body_compressed(self, client, metrics):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(LARGE_BODY)
+        assert response.content == LARGE_BODY
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"]["compression.gzip.responses"] == 1
+        assert snapshot["counters"]["compression.gzip.original_bytes"] == len(
+            LARGE_BODY
+        )
+        assert snapshot["observations"]["compression.gzip.ratio"]["max"] < 1
+        assert snapshot["observations"]["compression.gzip.cpu_time"]["count"] == 1
+
+    def test_huge_body_streamed(self, client, metrics):
+        with client.stream("GET", "/huge", headers={"Accept-Encoding": "gzip"}) as r:
+            assert r.headers["content-encoding"] == "gzip"
+            assert "content-length" not in r.headers
+            assert b"".join(r.iter_bytes()) == HUGE_BODY
+        counters = metrics.snapshot()["counters"]
+        assert counters["compression.gzip.original_bytes"] == len(HUGE_BODY)
+
+    def test_streaming_response_compressed(self, client, metrics):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.content == b"".join(STREAM_PARTS)
+        assert metrics.get_counter("compression.gzip.responses") == 1
+
+    @pytest.mark.parametrize(
+        "path, body", [("/large", LARGE_BODY), ("/huge", HUGE_BODY)]
+    )
+    def test_thread_offload(self, client, monkeypatch, path, body):
+        sizes = []
+        run_in_threadpool = compression_middleware.run_in_threadpool
+
+        async def record(func, data, *args):
+            sizes.append(len(data))
+            return await run_in_threadpool(func, data, *args)
+
+        monkeypatch.setattr(compression_middleware, "run_in_threadpool", record)
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert response.content == body
+        assert bool(sizes) == (len(body) >= COMPRESSION_THREAD_SIZE)
+        assert sum(sizes) == (len(body) if sizes else 0)
+
+    @pytest.mark.parametrize("path", ["/events", "/encoded", "/empty"])
+    def test_not_compressible(self, client, metrics, path):
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert response.headers.get("content-encoding") in (None, "identity")
+        assert metrics.get_counter("compression.gzip.responses") == 0
+
+    def test_etag_weakened_and_vary_appended(self, client):
+        response = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["etag"] == 'W/"abc"'
+        assert response.headers["vary"] == "Accept, Accept-Encoding"
+
+    @pytest.mark.parametrize("encoding", [CompressionEnum.BR, CompressionEnum.ZSTD])
+    def test_optional_encodings(self, metrics, encoding):
+        if not is_available(encoding):
+            pytest.skip(f"{encoding} is not installed")
+        client = create_client(
+            metrics, encodings=[encoding, CompressionEnum.GZIP], levels={encoding: 5}
+        )
+        response = client.get(
+            "/large", headers={"Accept-Encoding": f"gzip, {encoding}"}
+        )
+        assert response.headers["content-encoding"] == encoding
+        assert metrics.get_counter(f"compression.{encoding}.responses") == 1
+
+    def test_unavailable_encodings_skipped(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.middleware.compression_middleware.is_available",
+            lambda encoding: encoding == CompressionEnum.GZIP,
+        )
+        middleware = CompressionMiddleware(
+            None, encodings=[CompressionEnum.BR, CompressionEnum.GZIP]
+        )
+        assert middleware.encodings == [CompressionEnum.GZIP]
+
+    @pytest.mark.parametrize(
+        "kwargs, error",
+        [
+            ({"minimum_size": -1}, ValueError),
+            ({"minimum_size": "1"}, TypeError),
+            ({"streaming_size": 0}, ValueError),
+            ({"levels": {CompressionEnum.GZIP: 10}}, ValueError),
+        ],
+    )
+    def test_init_raises(self, kwargs, error):
+        with pytest.raises(error):
+            CompressionMiddleware(None, **kwargs)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCompressionMiddleware"])
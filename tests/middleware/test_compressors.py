@@ -0,0 +1,87 @@
+import zlib
+
+import pytest
+
+from src.middleware import compressors
+from src.middleware.compression_enum import CompressionEnum
+from src.middleware.compressors import create_compressor, is_available, validate_level
+
+DATA = b'{"name":"result","value":[1,1,2,3,5,8,13,21]}' * 2000
+
+
+def decompress(encoding: CompressionEnum, data: bytes) -> bytes:
+    """Распаковывает данные, сжатые указанным способом."""
+    if encoding == CompressionEnum.BR:
+        return pytest.importorskip("brotli").decompress(data)
+    if encoding == CompressionEnum.ZSTD:
+        zstandard = pytest.importorskip("zstandard")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+def skip_unavailable(encoding: CompressionEnum) -> None:
+    """Пропускает тест для способа сжатия без установленного пакета."""
+    if not is_available(encoding):
+        pytest.skip(f"{encoding} is not installed")
+
+
+class TestCompressors:
+    @pytest.mark.parametrize("encoding", list(CompressionEnum))
+    def test_compress_finish(self, encoding):
+        skip_unavailable(encoding)
+        compressor = create_compressor(encoding, 5)
+        compressed = compressor.compress(DATA) + compressor.finish()
+        assert len(compressed) < len(DATA)
+        assert decompress(encoding, compressed) == DATA
+
+    @pytest.mark.parametrize("encoding", list(CompressionEnum))
+    def test_flush_makes_parts_decodable(self, encoding):
+        skip_unavailable(encoding)
+        compressor = create_compressor(encoding, 5)
+        first = compressor.compress(DATA[:1000]) + compressor.flush()
+        if encoding == CompressionEnum.GZIP:
+            prefix = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(first)
+            assert prefix == DATA[:1000]
+        rest = compressor.compress(DATA[1000:]) + compressor.finish()
+        assert decompress(encoding, first + rest) == DATA
+
+    def test_gzip_always_available(self):
+        assert is_available(CompressionEnum.GZIP)
+
+    def test_unavailable_package(self, monkeypatch):
+        monkeypatch.setattr(compressors, "brotli", None)
+        monkeypatch.setattr(compressors, "zstandard", None)
+        assert not is_available(CompressionEnum.BR)
+        assert not is_available(CompressionEnum.ZSTD)
+
+    @pytest.mark.parametrize(
+        "encoding, level",
+        [
+            (CompressionEnum.GZIP, 0),
+            (CompressionEnum.GZIP, 9),
+            (CompressionEnum.BR, 11),
+            (CompressionEnum.ZSTD, 1),
+            (CompressionEnum.ZSTD, 22),
+        ],
+    )
+    def test_validate_level(self, encoding, level):
+        validate_level(encoding, level)
+
+    @pytest.mark.parametrize(
+        "encoding, level",
+        [
+            (CompressionEnum.GZIP, -1),
+            (CompressionEnum.GZIP, 10),
+            (CompressionEnum.BR, 12),
+            (CompressionEnum.ZSTD, 0),
+            (CompressionEnum.GZIP, 1.5),
+            (CompressionEnum.GZIP, True),
+        ],
+    )
+    def test_validate_level_raises(self, encoding, level):
+        with pytest.raises(ValueError):
+            validate_level(encoding, level)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCompressors"])
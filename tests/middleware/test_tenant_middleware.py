@@ -0,0 +1,103 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocketDisconnect
+
+from src.internal.constants import TENANT_HEADER, TENANTS_ENDPOINT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.middleware.tenant_middleware import TenantMiddleware
+
+TENANT = "course-a"
+
+
+async def tenant(request):
+    return JSONResponse(
+        {
+            "tenant": request.state.tenant,
+            "url": str(request.url_for("tenant")),
+        }
+    )
+
+
+async def session(websocket):
+    await websocket.accept()
+    await websocket.send_json({"tenant": websocket.state.tenant})
+    await websocket.close()
+
+
+@pytest.fixture()
+def client():
+    """Создает клиента для приложения с выбором арендатора"""
+    app = Starlette(
+        routes=[
+            Route("/api/tenant", tenant, name="tenant"),
+            WebSocketRoute("/ws/session", session),
+        ]
+    )
+    app.add_middleware(TenantMiddleware, tenants=[TENANT])
+    return TestClient(app)
+
+
+class TestTenantMiddleware:
+    """Тесты для класса TenantMiddleware."""
+
+    def test_default(self, client):
+        """Проверяет запрос без арендатора"""
+        response = client.get("/api/tenant")
+
+        assert response.json() == {
+            "tenant": None,
+            "url": "http://testserver/api/tenant",
+        }
+
+    def test_prefix(self, client):
+        """Проверяет выбор арендатора по префиксу пути"""
+        response = client.get(f"{TENANTS_ENDPOINT}/{TENANT}/api/tenant")
+
+        assert response.json() == {
+            "tenant": TENANT,
+            "url": f"http://testserver{TENANTS_ENDPOINT}/{TENANT}/api/tenant",
+        }
+
+    def test_header(self, client):
+        """Проверяет выбор арендатора по заголовку"""
+        response = client.get("/api/tenant", headers={TENANT_HEADER: TENANT})
+
+        assert response.json()["tenant"] == TENANT
+
+    @pytest.mark.parametrize(
+        "path, headers",
+        [
+            (f"{TENANTS_ENDPOINT}/unknown/api/tenant", {}),
+            ("/api/tenant", {TENANT_HEADER: "unknown"}),
+        ],
+    )
+    def test_unknown(self, client, path, headers):
+        """Проверяет ответ 404 для неизвестного арендатора"""
+        response = client.get(path, headers=headers)
+
+        assert response.status_code == 404
+        assert response.json() == {
+            "detail": ErrMsgTmpl.TENANT_NOT_EXISTS.format("unknown")
+        }
+
+    def test_websocket(self, client):
+        """Проверяет выбор арендатора для сессии WebSocket"""
+        with client.websocket_connect(
+            f"{TENANTS_ENDPOINT}/{TENANT}/ws/session"
+        ) as websocket:
+            assert websocket.receive_json() == {"tenant": TENANT}
+
+    def test_websocket_unknown(self, client):
+        """Проверяет закрытие сессии WebSocket неизвестного арендатора"""
+        with pytest.raises(WebSocketDisconnect) as error:
+            with client.websocket_connect(f"{TENANTS_ENDPOINT}/unknown/ws/session"):
+                pass
+
+        assert error.value.code == 1008
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestTenantMiddleware"])
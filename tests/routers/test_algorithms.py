@@ -1,13 +1,51 @@
 import json
 
 import pytest
+from fastapi.testclient import TestClient
 
-from src.internal.constants import ALGORITHMS_ENDPOINT
+from src.config import Settings
+from src.internal.constants import (
+    ALGORITHMS_ENDPOINT,
+    CATALOG_CACHE_CONTROL,
+    PRIORITY_HEADER,
+)
 from src.internal.schemas.algorithm_definition_schema import AlgorithmDefinitionSchema
 from src.internal.schemas.data_element_schema import DataElementsSchema
 from src.internal.schemas.definition_schema import DefinitionSchema
+from src.main import create_app
+from src.routers import codecs
+from src.routers.codecs import decode, encode
+from src.routers.media_type_enum import MediaTypeEnum
 from src.routers.schemas import AlgorithmsPageSchema
-from tests import BOOL_DEF, BOOL_NAME, FIB_DEF, SUM_DEF, SUM_NAME
+from tests import (
+    BOOL_DEF,
+    BOOL_NAME,
+    BUSY_DEF,
+    BUSY_FUNC,
+    BUSY_NAME,
+    FIB_DEF,
+    LENGTH_DEF,
+    LENGTH_FUNC,
+    LENGTH_NAME,
+    MOCK_TESTS,
+    PROGRESS_DEF,
+    PROGRESS_FUNC,
+    PROGRESS_NAME,
+    SHIFT_DEF,
+    SHIFT_FUNC,
+    SHIFT_NAME,
+    SUM_DEF,
+    SUM_NAME,
+)
+
+
+def parse_events(text: str) -> list[tuple[str, object]]:
+    """Разбирает поток событий Server-Sent Events"""
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
 
 
 class TestAlgorithms:
@@ -33,6 +71,55 @@ class TestAlgorithms:
         assert page.size == 1
         assert page.total == 3
 
+    def test_get_algorithms_etag(self, client):
+        response = client.get(ALGORITHMS_ENDPOINT)
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == CATALOG_CACHE_CONTROL
+
+        response = client.get(ALGORITHMS_ENDPOINT, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_get_algorithms_etag_other_page(self, client):
+        response = client.get(ALGORITHMS_ENDPOINT)
+        etag = response.headers["etag"]
+
+        response = client.get(
+            ALGORITHMS_ENDPOINT,
+            params={"page": 2, "size": 1},
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_get_algorithms_compressed_etag(self, client, tmp_path):
+        plain_etag = client.get(ALGORITHMS_ENDPOINT).headers["etag"]
+        settings = Settings(
+            ALGORITHMS_CATALOG_PATH=str(tmp_path),
+            USE_LOGGER=False,
+            COMPRESSION_MIN_SIZE=0,
+        )
+        compressed_client = TestClient(create_app(settings))
+        headers = {"Accept-Encoding": "gzip"}
+
+        response = compressed_client.get(ALGORITHMS_ENDPOINT, headers=headers)
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == f"W/{plain_etag}"
+
+        headers["If-None-Match"] = response.headers["etag"]
+        response = compressed_client.get(ALGORITHMS_ENDPOINT, headers=headers)
+        assert response.status_code == 304
+
+    def test_get_algorithms_etag_after_reload(self, client, algo_dir):
+        etag = client.get(ALGORITHMS_ENDPOINT).headers["etag"]
+        algo_dir(BUSY_NAME, BUSY_DEF, BUSY_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+
+        response = client.get(ALGORITHMS_ENDPOINT, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 4
+
     def test_get_algorithm(self, client):
         response = client.get(f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}")
         assert response.status_code == 200
@@ -61,6 +148,25 @@ class TestAlgorithms:
         assert DataElementsSchema.model_validate(response.json())
         assert response.json() == [{"name": "y", "value": True}]
 
+    def test_get_algorithm_result_priority(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            data=parameters,
+            headers={PRIORITY_HEADER: "high"},
+        )
+        assert response.status_code == 200
+        assert response.json() == [{"name": "result", "value": 3}]
+
+    def test_get_algorithm_result_invalid_priority(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            data=parameters,
+            headers={PRIORITY_HEADER: "urgent"},
+        )
+        assert response.status_code == 422
+
     def test_get_not_existed_algorithm_result(self, client):
         parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
         response = client.post(
@@ -100,6 +206,221 @@ class TestAlgorithms:
         )
         assert response.status_code == 400
 
+    @pytest.mark.parametrize("media_type", [MediaTypeEnum.MSGPACK, MediaTypeEnum.CBOR])
+    def test_get_algorithm_result_binary(self, client, media_type):
+        parameters = [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=encode(parameters, media_type),
+            headers={"Content-Type": media_type, "Accept": media_type},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == media_type
+        assert decode(response.content, media_type) == [{"name": "result", "value": 3}]
+
+    @pytest.mark.parametrize(
+        "matrix", [[[1, 2], [3, 4]], [[1.5, 2.0], [3.5, 4.0]], [[1.5, 2], [3, 4.5]]]
+    )
+    def test_get_algorithm_result_json_binary_same(self, client, algo_dir, matrix):
+        algo_dir(SHIFT_NAME, SHIFT_DEF, SHIFT_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+        url = f"{ALGORITHMS_ENDPOINT}/{SHIFT_NAME}/results"
+        parameters = [{"name": "matrix", "value": matrix}]
+        json_response = client.post(url, content=json.dumps(parameters))
+        binary_response = client.post(
+            url,
+            content=encode(parameters, MediaTypeEnum.MSGPACK),
+            headers={"Content-Type": MediaTypeEnum.MSGPACK},
+        )
+        assert json_response.status_code == binary_response.status_code == 200
+        assert json_response.content == binary_response.content
+        expected = [[item - 1 for item in row] for row in matrix]
+        assert (
+            json_response.content
+            == json.dumps(
+                [{"name": "result", "value": expected}], separators=(",", ":")
+            ).encode()
+        )
+
+    def test_get_algorithm_result_binary_request_json_response(self, client):
+        parameters = [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=encode(parameters, MediaTypeEnum.MSGPACK),
+            headers={"Content-Type": "application/x-msgpack"},
+        )
+        assert response.status_code == 200
+        assert response.json() == [{"name": "result", "value": 3}]
+
+    def test_get_algorithm_result_invalid_binary(self, client):
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=b"\xc1",
+            headers={"Content-Type": MediaTypeEnum.MSGPACK},
+        )
+        assert response.status_code == 422
+
+    def test_get_algorithm_result_invalid_binary_params(self, client):
+        parameters = [{"invalid_key": "a", "value": 1}]
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=encode(parameters, MediaTypeEnum.CBOR),
+            headers={"Content-Type": MediaTypeEnum.CBOR},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", 0, "name"]
+
+    def test_get_algorithm_result_unsupported_media_type(self, client):
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=b"a=1&b=2",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        assert response.status_code == 415
+
+    def test_get_algorithm_result_unavailable_media_type(self, client, monkeypatch):
+        monkeypatch.setattr(codecs, "cbor2", None)
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=b"\x80",
+            headers={"Content-Type": MediaTypeEnum.CBOR},
+        )
+        assert response.status_code == 415
+
+    def test_get_algorithm_result_not_acceptable(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            data=parameters,
+            headers={"Accept": "text/html"},
+        )
+        assert response.status_code == 406
+
+    def test_get_algorithm_result_unrepresentable(self, client):
+        parameters = [{"name": "a", "value": 2**70}, {"name": "b", "value": 1}]
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results",
+            content=encode(parameters, MediaTypeEnum.CBOR),
+            headers={
+                "Content-Type": MediaTypeEnum.CBOR,
+                "Accept": MediaTypeEnum.MSGPACK,
+            },
+        )
+        assert response.status_code == 406
+
+    @pytest.mark.parametrize("media_type", [MediaTypeEnum.JSON, MediaTypeEnum.MSGPACK])
+    def test_get_algorithm_result_input_too_large(self, client, algo_dir, media_type):
+        algo_dir(LENGTH_NAME, LENGTH_DEF, LENGTH_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+        url = f"{ALGORITHMS_ENDPOINT}/{LENGTH_NAME}/results"
+
+        def post(items):
+            parameters = [{"name": "items", "value": items}]
+            if media_type == MediaTypeEnum.JSON:
+                content = json.dumps(parameters)
+            else:
+                content = encode(parameters, media_type)
+            return client.post(
+                url, content=content, headers={"Content-Type": media_type}
+            )
+
+        assert post([1, 2, 3]).status_code == 200
+        response = post([1, 2, 3, 4])
+        assert response.status_code == 413
+        assert "items" in response.json()["detail"]
+
+    @pytest.mark.parametrize(
+        "items, status_code", [([1, 2, 3], 200), ([1, "2", 3], 400)]
+    )
+    def test_get_algorithm_result_chunked(self, client, algo_dir, items, status_code):
+        algo_dir(LENGTH_NAME, LENGTH_DEF, LENGTH_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+        parameters = json.dumps([{"name": "items", "value": items}]).encode()
+
+        def chunks():
+            for start in range(0, len(parameters), 4):
+                yield parameters[start : start + 4]
+
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{LENGTH_NAME}/results", content=chunks()
+        )
+        assert response.status_code == status_code
+        if status_code == 200:
+            assert response.json() == [{"name": "result", "value": len(items)}]
+
+    def test_stream_input_too_large(self, client, algo_dir):
+        algo_dir(LENGTH_NAME, LENGTH_DEF, LENGTH_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{LENGTH_NAME}/results/stream",
+            params={"parameters": json.dumps([{"name": "items", "value": [0] * 4}])},
+        )
+        assert response.status_code == 413
+
+    def test_get_algorithm_result_body_too_large(self, tmp_path, fib_algo_dir):
+        test_settings = Settings(
+            ALGORITHMS_CATALOG_PATH=str(tmp_path),
+            USE_LOGGER=False,
+            MAX_REQUEST_BODY_SIZE=64,
+        )
+        client = TestClient(create_app(test_settings))
+        parameters = json.dumps([{"name": "n", "value": 1}] + [{}] * 20)
+        response = client.post(
+            f"{ALGORITHMS_ENDPOINT}/{FIB_DEF['name']}/results", content=parameters
+        )
+        assert response.status_code == 413
+
+    def test_stream_algorithm_result(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results/stream",
+            params={"parameters": parameters},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert parse_events(response.text) == [
+            ("result", [{"name": "result", "value": 3}])
+        ]
+
+    def test_stream_algorithm_progress(self, client, algo_dir):
+        algo_dir(PROGRESS_NAME, PROGRESS_DEF, PROGRESS_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{PROGRESS_NAME}/results/stream",
+            params={"parameters": json.dumps([{"name": "n", "value": 30}])},
+        )
+        events = parse_events(response.text)
+        assert events[0] == ("progress", {"fraction": 0.0, "message": "step 0"})
+        assert 2 < len(events) < 31
+        assert {name for name, _ in events[:-1]} == {"progress"}
+        assert events[-1] == ("result", [{"name": "result", "value": 30}])
+
+    def test_stream_algorithm_error(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}])
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results/stream",
+            params={"parameters": parameters},
+        )
+        [(event, data)] = parse_events(response.text)
+        assert event == "error"
+        assert data["status"] == 400
+
+    def test_stream_not_existed_algorithm(self, client):
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/not_existed/results/stream",
+            params={"parameters": "[]"},
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("parameters", [None, "not json", '[{"name": "a"}]'])
+    def test_stream_invalid_parameters(self, client, parameters):
+        params = {} if parameters is None else {"parameters": parameters}
+        response = client.get(
+            f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results/stream", params=params
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "query"
+
 
 if __name__ == "__main__":
     pytest.main(["-k", "TestAlgorithms"])
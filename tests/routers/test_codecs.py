@@ -0,0 +1,86 @@
+import math
+
+import pytest
+
+from src.routers import codecs
+from src.routers.codecs import (
+    decode,
+    encode,
+    is_available,
+    negotiate_media_type,
+    parse_media_type,
+)
+from src.routers.media_type_enum import MediaTypeEnum
+
+BINARY_MEDIA_TYPES = [MediaTypeEnum.MSGPACK, MediaTypeEnum.CBOR]
+
+
+class TestCodecs:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("application/json", MediaTypeEnum.JSON),
+            ("application/json; charset=utf-8", MediaTypeEnum.JSON),
+            ("application/problem+json", MediaTypeEnum.JSON),
+            ("Application/MsgPack", MediaTypeEnum.MSGPACK),
+            ("application/x-msgpack", MediaTypeEnum.MSGPACK),
+            ("application/cbor", MediaTypeEnum.CBOR),
+            ("text/plain", None),
+        ],
+    )
+    def test_parse_media_type(self, value, expected):
+        assert parse_media_type(value) == expected
+
+    @pytest.mark.parametrize(
+        "accept, expected",
+        [
+            (None, MediaTypeEnum.JSON),
+            ("*/*", MediaTypeEnum.JSON),
+            ("application/msgpack", MediaTypeEnum.MSGPACK),
+            ("application/cbor, application/msgpack", MediaTypeEnum.CBOR),
+            ("application/cbor;q=0.5, application/msgpack", MediaTypeEnum.MSGPACK),
+            ("text/html, application/json;q=0.9", MediaTypeEnum.JSON),
+            ("application/msgpack;q=0, */*;q=0.1", MediaTypeEnum.JSON),
+            ("text/html", None),
+        ],
+    )
+    def test_negotiate_media_type(self, accept, expected):
+        assert negotiate_media_type(accept) == expected
+
+    def test_negotiate_unavailable_media_type(self, monkeypatch):
+        monkeypatch.setattr(codecs, "msgpack", None)
+        assert not is_available(MediaTypeEnum.MSGPACK)
+        assert negotiate_media_type("application/msgpack") is None
+        assert (
+            negotiate_media_type("application/msgpack, application/json;q=0.5")
+            == MediaTypeEnum.JSON
+        )
+
+    @pytest.mark.parametrize("media_type", BINARY_MEDIA_TYPES)
+    def test_encode_decode(self, media_type):
+        content = [
+            {"name": "matrix", "value": [[1.5, None], [-2.0, 3.0]]},
+            {"name": "flags", "value": [True, False]},
+            {"name": "text", "value": "строка"},
+        ]
+        assert decode(encode(content, media_type), media_type) == content
+
+    @pytest.mark.parametrize("media_type", BINARY_MEDIA_TYPES)
+    def test_encode_not_finite(self, media_type):
+        value = decode(encode([math.inf, math.nan], media_type), media_type)
+        assert value[0] == math.inf
+        assert math.isnan(value[1])
+
+    @pytest.mark.parametrize("media_type", BINARY_MEDIA_TYPES)
+    def test_decode_invalid(self, media_type):
+        with pytest.raises(ValueError):
+            decode(b"\xc1\xff", media_type)
+
+    def test_encode_big_int(self):
+        assert decode(encode(2**70, MediaTypeEnum.CBOR), MediaTypeEnum.CBOR) == 2**70
+        with pytest.raises(ValueError):
+            encode(2**70, MediaTypeEnum.MSGPACK)
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestCodecs"])
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from src.routers.disconnect import run_until_disconnected
+
+
+class FakeRequest:
+    """Запрос, клиент которого разрывает соединение через заданное время."""
+
+    def __init__(self, disconnect_after: float):
+        self.disconnect_after = disconnect_after
+
+    async def receive(self):
+        await asyncio.sleep(self.disconnect_after)
+        return {"type": "http.disconnect"}
+
+
+class TestDisconnect:
+    def test_result_before_disconnect(self):
+        async def run():
+            return await run_until_disconnected(FakeRequest(10), asyncio.sleep(0, 1))
+
+        assert asyncio.run(run()) == (False, 1)
+
+    def test_disconnect_cancels_awaitable(self):
+        cancelled = []
+
+        async def long_operation():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def run():
+            return await run_until_disconnected(FakeRequest(0.05), long_operation())
+
+        assert asyncio.run(run()) == (True, None)
+        assert cancelled == [True]
+
+    def test_exception_propagated(self):
+        async def failing():
+            raise ValueError("error")
+
+        async def run():
+            return await run_until_disconnected(FakeRequest(10), failing())
+
+        with pytest.raises(ValueError):
+            asyncio.run(run())
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestDisconnect"])
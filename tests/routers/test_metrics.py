@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.config import Settings
+from src.internal.constants import ALGORITHMS_ENDPOINT, METRICS_ENDPOINT
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.main import create_app
+from src.routers.schemas import MetricsSchema
+from tests import FIB_NAME, SUM_NAME
+
+
+class TestMetrics:
+    def test_get_metrics(self, client):
+        response = client.get(METRICS_ENDPOINT)
+        assert response.status_code == 200
+        assert MetricsSchema.model_validate(response.json())
+
+    def test_get_metrics_after_execution(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        client.post(f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results", data=parameters)
+        response = client.get(METRICS_ENDPOINT)
+        assert response.status_code == 200
+        assert response.json()["counters"].get("scheduler.cancelled", 0) == 0
+
+    def test_get_runtimes(self, client):
+        parameters = json.dumps([{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+        client.post(f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results", data=parameters)
+        response = client.get(f"{METRICS_ENDPOINT}/runtimes")
+        assert response.status_code == 200
+        assert response.json()[SUM_NAME]["2"]["count"] == 1
+
+    def test_shared_result_cache(self, tmp_path, fib_algo_dir):
+        """Проверяет, что результат, сохраненный в кэше одним процессом
+        приложения, возвращается другим процессом с тем же файлом кэша"""
+        test_settings = Settings(
+            ALGORITHMS_CATALOG_PATH=str(tmp_path),
+            USE_LOGGER=False,
+            RESULT_CACHE_BACKEND="sqlite",
+            RESULT_CACHE_PATH=str(tmp_path / "result_cache.sqlite3"),
+        )
+        parameters = json.dumps([{"name": "n", "value": 10}])
+        url = f"{ALGORITHMS_ENDPOINT}/{FIB_NAME}/results"
+        counters = []
+        for _ in range(2):
+            with TestClient(create_app(test_settings)) as client:
+                response = client.post(url, data=parameters)
+                assert response.status_code == 200
+                assert response.json() == [{"name": "result", "value": 55}]
+                counters.append(client.get(METRICS_ENDPOINT).json()["counters"])
+
+        assert counters[0]["result_cache.misses"] == 1
+        assert "result_cache.hits" not in counters[0]
+        assert counters[1]["result_cache.hits"] == 1
+        assert "result_cache.misses" not in counters[1]
+
+    def test_result_cache_path_required(self, tmp_path, fib_algo_dir):
+        """Проверяет ошибку, если для кэша в файле SQLite не задан путь"""
+        test_settings = Settings(
+            ALGORITHMS_CATALOG_PATH=str(tmp_path),
+            USE_LOGGER=False,
+            RESULT_CACHE_BACKEND="sqlite",
+        )
+
+        with pytest.raises(ValueError) as error:
+            create_app(test_settings)
+        assert str(error.value) == ErrMsgTmpl.RESULT_CACHE_SETTING_REQUIRED.format(
+            "sqlite", "RESULT_CACHE_PATH"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestMetrics"])
@@ -0,0 +1,305 @@
+import json
+import time
+
+import pytest
+
+from src.internal.data_dimension.compact_array import CompactArray
+from src.internal.data_dimension.data_shape_enum import DataShapeEnum
+from src.internal.data_dimension.data_type_enum import DataTypeEnum
+from src.internal.errors import ErrorMessageEnum as ErrMsg
+from src.internal.errors import ErrorMessageTemplateEnum as ErrMsgTmpl
+from src.internal.errors.exceptions import (
+    AlgorithmInputTooLargeError,
+    AlgorithmTypeError,
+)
+from src.internal.schemas.data_definition_schema import DataDefinitionSchema
+from src.internal.schemas.data_element_schema import DataElementSchema
+from src.routers.parameters_parser import ParametersParser
+
+
+def get_definition(name, data_type, data_shape, default_value, **limits):
+    """Возвращает описание элемента входных данных"""
+    return DataDefinitionSchema(
+        name=name,
+        title=name,
+        description=name,
+        data_type=data_type,
+        data_shape=data_shape,
+        default_value=default_value,
+        **limits,
+    )
+
+
+PARAMETERS = [
+    get_definition("n", DataTypeEnum.INT, DataShapeEnum.SCALAR, 1),
+    get_definition("items", DataTypeEnum.FLOAT, DataShapeEnum.LIST, [1.5]),
+    get_definition("words", DataTypeEnum.STRING, DataShapeEnum.LIST, ["a"]),
+    get_definition("matrix", DataTypeEnum.INT, DataShapeEnum.MATRIX, [[1]]),
+    get_definition("table", DataTypeEnum.STRING, DataShapeEnum.MATRIX, [["a"]]),
+]
+LIMITED = [
+    get_definition("items", DataTypeEnum.INT, DataShapeEnum.LIST, [1], max_length=3),
+    get_definition(
+        "matrix",
+        DataTypeEnum.INT,
+        DataShapeEnum.MATRIX,
+        [[1]],
+        max_rows=2,
+        max_cols=2,
+    ),
+    get_definition(
+        "words", DataTypeEnum.STRING, DataShapeEnum.LIST, ["a"], max_str_len=3
+    ),
+]
+CONTENT = [
+    {"name": "n", "value": 10},
+    {"name": "items", "value": [1, 2.5, -3e2, 0]},
+    {"name": "words", "value": ["a,b", 'c"]', "[{", "\\", "юникод", ""]},
+    {"name": "matrix", "value": [[1, 2, 3], [4, 5, 6], []]},
+    {"name": "table", "value": [["x", "y, z"], ["]"]]},
+    {"name": "other", "value": {"a": [1, "]"], "b": None}},
+]
+
+
+def parse(parameters, text, chunk_size=None):
+    """Разбирает текст JSON частями указанного размера"""
+    data = text.encode() if isinstance(text, str) else text
+    parser = ParametersParser(parameters)
+    size = chunk_size or len(data) or 1
+    for start in range(0, len(data), size):
+        parser.feed(data[start : start + size])
+    return parser.close()
+
+
+def dump(content):
+    """Возвращает элементы входных данных в виде словарей"""
+    elements = []
+    for item in content:
+        if isinstance(item, DataElementSchema):
+            value = item.value
+            if isinstance(value, CompactArray):
+                value = value.tolist()
+            item = {"name": item.name, "value": value}
+        elements.append(item)
+    return elements
+
+
+class TestParametersParser:
+    """Тесты для класса ParametersParser."""
+
+    @pytest.mark.parametrize("chunk_size", [None, 1, 2, 3, 7, 64])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_parse(self, chunk_size, indent):
+        """Проверяет, что результат разбора по частям совпадает с json.loads"""
+        text = json.dumps(CONTENT, indent=indent, ensure_ascii=False)
+
+        content = parse(PARAMETERS, text, chunk_size)
+
+        assert dump(content) == json.loads(text)
+
+    def test_streamed_elements(self):
+        """Проверяет, что значения списков и матриц, указанные после имени
+        элемента, проверяются при разборе, а остальные возвращаются для
+        проверки схемой"""
+        text = json.dumps(
+            [
+                {"name": "n", "value": 1},
+                {"name": "matrix", "value": [[1]]},
+                {"value": [1.5], "name": "items"},
+                {"name": "items", "value": None},
+            ]
+        )
+
+        content = parse(PARAMETERS, text, 5)
+
+        assert [isinstance(item, DataElementSchema) for item in content] == [
+            False,
+            True,
+            False,
+            False,
+        ]
+
+    def test_compact_values(self):
+        """Проверяет, что числовые списки и матрицы собираются в CompactArray,
+        а значения, которые нельзя хранить компактно, - в списки"""
+        text = json.dumps(
+            [
+                {"name": "items", "value": [1.0, 2.5]},
+                {"name": "matrix", "value": [[1, 2], [], [3]]},
+                {"name": "words", "value": ["a"]},
+            ]
+        )
+
+        content = parse(PARAMETERS, text, 3)
+
+        assert isinstance(content[0].value, CompactArray)
+        assert content[0].value.tolist() == [1.0, 2.5]
+        assert isinstance(content[1].value, CompactArray)
+        assert content[1].value.tolist() == [[1, 2], [], [3]]
+        assert content[2].value == ["a"]
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("items", [1.5, None, 2]),
+            ("items", [1.5, 2**60]),
+            ("items", [1, 2.5]),
+            ("matrix", [[1, 2], [3, 2**70]]),
+            ("matrix", [[1], [None]]),
+        ],
+    )
+    def test_not_compact_values(self, name, value):
+        """Проверяет сборку в списки значений, которые нельзя хранить
+        компактно"""
+        text = json.dumps([{"name": name, "value": value}])
+
+        content = parse(PARAMETERS, text, 4)
+
+        assert content[0].value == value
+        assert json.dumps(content[0].value) == json.dumps(value)
+
+    @pytest.mark.parametrize("text", ["[]", " [ ] ", "\ufeff[]"])
+    def test_empty(self, text):
+        """Проверяет разбор пустого списка элементов"""
+        assert parse(PARAMETERS, text, 1) == []
+
+    @pytest.mark.parametrize(
+        "text, pos",
+        [
+            ("", 0),
+            ("[", 1),
+            ('[{"name": "n", "value": 1}', 26),
+            ('[{"name": "n", "value": 1}] 1', 28),
+            ('[{"name": "n" "value": 1}]', 14),
+            ('[{"name": "n", "value": }]', 24),
+            ('[{"name": "items", "value": [1, 2,]}]', 34),
+            ('[{"name": "items", "value": [1,, 2]}]', 31),
+            ('[{"name": "items", "value": [1 2]}]', 31),
+            ('[{"name": "items", "value": [1, 2}]', 33),
+            ('[{"name": "words", "value": ["a", "b]}]', 34),
+            ('[{"name": "other", "value": [1, 2}]', 33),
+            ('[{name: "n"}]', 2),
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [None, 1])
+    def test_invalid_json(self, text, pos, chunk_size):
+        """Проверяет ошибку разбора некорректного JSON"""
+        with pytest.raises(json.JSONDecodeError) as error:
+            parse(PARAMETERS, text, chunk_size)
+
+        assert error.value.pos == pos
+
+    @pytest.mark.parametrize(
+        "name, value, message",
+        [
+            (
+                "items",
+                [1, 2, "3"],
+                ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(2, DataTypeEnum.FLOAT),
+            ),
+            (
+                "items",
+                [1, [2]],
+                ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(1, DataTypeEnum.FLOAT),
+            ),
+            (
+                "items",
+                [1, True],
+                ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(1, DataTypeEnum.FLOAT),
+            ),
+            (
+                "words",
+                ["a", 1],
+                ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(1, DataTypeEnum.STRING),
+            ),
+            (
+                "words",
+                ["a", ["b"]],
+                ErrMsgTmpl.MISMATCH_LIST_VALUE_TYPE.format(1, DataTypeEnum.STRING),
+            ),
+            (
+                "matrix",
+                [[1], [2, 3.5]],
+                ErrMsgTmpl.MISMATCH_MATRIX_VALUE_TYPE.format(1, 1, DataTypeEnum.INT),
+            ),
+            ("matrix", [[1], 2], ErrMsgTmpl.NOT_LIST_ROW.format(1)),
+            ("matrix", [], ErrMsg.NOT_MATRIX_VALUE),
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [None, 1])
+    def test_type_error(self, name, value, message, chunk_size):
+        """Проверяет ошибку несоответствия значения типу данных"""
+        text = json.dumps([{"name": name, "value": value}])
+
+        with pytest.raises(AlgorithmTypeError) as error:
+            parse(PARAMETERS, text, chunk_size)
+
+        assert error.value.message == message
+
+    @pytest.mark.parametrize(
+        "name, value, message",
+        [
+            ("items", [1, 2, 3, 4], ErrMsgTmpl.TOO_LONG_LIST.format(4, 3)),
+            ("matrix", [[1], [2], [3]], ErrMsgTmpl.TOO_MANY_ROWS.format(3, 2)),
+            ("matrix", [[1], [2, 3, 4]], ErrMsgTmpl.TOO_MANY_COLS.format(1, 3, 2)),
+            ("words", ["abc", "abcd"], ErrMsgTmpl.TOO_LONG_STRING.format(4, 3)),
+        ],
+    )
+    @pytest.mark.parametrize("order", ["name", "value"])
+    def test_too_large(self, name, value, message, order):
+        """Проверяет ошибку превышения ограничений размера при разборе по
+        частям и при разборе значения целиком"""
+        element = {"name": name, "value": value}
+        if order == "value":
+            element = {"value": value, "name": name}
+        elif name == "words":
+            # Строка, полученная не полностью, отклоняется до ее окончания
+            message = ErrMsgTmpl.TOO_LONG_STRING_PART.format(4, 3)
+
+        with pytest.raises(AlgorithmInputTooLargeError) as error:
+            parse(LIMITED, json.dumps([element]), 1)
+
+        assert error.value.message == ErrMsgTmpl.INPUT_TOO_LARGE.format(name, message)
+
+    @pytest.mark.parametrize(
+        "element",
+        [
+            {"name": "words", "value": ["a", "{long}", "b"]},
+            {"name": "table", "value": [["{long}"]]},
+            {"name": "other", "value": "{long}"},
+            {"name": "other", "value": {"a": ["{long}", 1]}},
+        ],
+    )
+    def test_long_string(self, element):
+        """Проверяет, что длинная строка, полученная частями, разбирается за
+        линейное время"""
+        long = 'x\\y"z' * 700_000
+        text = json.dumps([element]).replace('"{long}"', json.dumps(long))
+
+        started = time.perf_counter()
+        content = parse(PARAMETERS, text, 64 * 1024)
+
+        assert time.perf_counter() - started < 2
+        assert dump(content) == json.loads(text)
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+    def test_long_string_limit(self, chunk_size):
+        """Проверяет, что длина строки проверяется до ее окончания с учетом
+        экранированных символов и суррогатных пар"""
+        text = json.dumps([{"name": "words", "value": ["\u00e9\U0001f600\n"]}])
+
+        content = parse(LIMITED, text, chunk_size)
+
+        assert dump(content) == json.loads(text)
+        text = json.dumps([{"name": "words", "value": ["abcd" * 1_000_000]}])
+        with pytest.raises(AlgorithmInputTooLargeError):
+            parse(LIMITED, text, chunk_size if chunk_size > 1 else 64)
+
+    def test_invalid_encoding(self):
+        """Проверяет ошибку для тела не в кодировке UTF-8"""
+        with pytest.raises(UnicodeDecodeError):
+            parse(PARAMETERS, b'[{"name": "\xff"}]')
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestParametersParser"])
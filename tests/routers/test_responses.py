@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.internal.catalog_cache import CatalogPage
+from src.internal.constants import CATALOG_CACHE_CONTROL
+from src.internal.schemas.data_element_schema import DataElementSchema
+from src.routers.responses import (
+    AlgorithmResultResponse,
+    etag_matches,
+    get_catalog_page_response,
+)
+
+
+class TestAlgorithmResultResponse:
+    @pytest.mark.parametrize(
+        "value",
+        [1, 1.5, "value", True, [1, 2, 3], [[1.0, 2.0], None]],
+    )
+    def test_render(self, value):
+        response = AlgorithmResultResponse([DataElementSchema(name="y", value=value)])
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == [{"name": "y", "value": value}]
+
+    def test_render_several_outputs(self):
+        outputs = [
+            DataElementSchema(name="a", value=1),
+            DataElementSchema(name="b", value=[[True], [False]]),
+        ]
+        response = AlgorithmResultResponse(outputs)
+        assert (
+            response.body
+            == b'[{"name":"a","value":1},{"name":"b","value":[[true],[false]]}]'
+        )
+
+    def test_render_not_finite(self):
+        outputs = [DataElementSchema(name="y", value=[float("nan"), float("inf")])]
+        response = AlgorithmResultResponse(outputs)
+        assert json.loads(response.body) == [{"name": "y", "value": [None, None]}]
+
+
+class TestCatalogPageResponse:
+    @pytest.mark.parametrize(
+        "if_none_match, expected",
+        [
+            (None, False),
+            ("", False),
+            ("*", True),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"xyz", "abc"', True),
+            ('"xyz"', False),
+            ("abc", False),
+        ],
+    )
+    def test_etag_matches(self, if_none_match, expected):
+        assert etag_matches(if_none_match, '"abc"') is expected
+
+    def test_render(self):
+        catalog_page = CatalogPage(b'{"items":[]}')
+        response = get_catalog_page_response(catalog_page)
+        assert response.status_code == 200
+        assert response.body == catalog_page.body
+        assert response.headers["etag"] == catalog_page.etag
+        assert response.headers["cache-control"] == CATALOG_CACHE_CONTROL
+
+    def test_not_modified(self):
+        catalog_page = CatalogPage(b'{"items":[]}')
+        response = get_catalog_page_response(catalog_page, catalog_page.etag)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == catalog_page.etag
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestAlgorithmResultResponse"])
@@ -0,0 +1,49 @@
+import pytest
+
+from src.internal.constants import SEARCH_ENDPOINT
+from src.routers.schemas import SearchPageSchema
+from tests import BOOL_NAME, FIB_NAME, SUM_NAME
+
+
+class TestSearch:
+    def test_search_algorithms(self, client):
+        response = client.get(SEARCH_ENDPOINT, params={"q": "сумма"})
+        assert response.status_code == 200
+        page = SearchPageSchema.model_validate(response.json())
+        assert [item.name for item in page.items] == [SUM_NAME]
+        assert page.total == 1
+
+    def test_search_algorithms_filter(self, client):
+        response = client.get(SEARCH_ENDPOINT, params={"data_type": "INT"})
+        assert response.status_code == 200
+        page = SearchPageSchema.model_validate(response.json())
+        assert [item.name for item in page.items] == [FIB_NAME, SUM_NAME]
+        assert page.facets.data_type == {"INT": 2}
+
+    def test_search_algorithms_cursor(self, client):
+        response = client.get(SEARCH_ENDPOINT, params={"size": 2})
+        page = SearchPageSchema.model_validate(response.json())
+        assert [item.name for item in page.items] == [BOOL_NAME, FIB_NAME]
+
+        response = client.get(
+            SEARCH_ENDPOINT, params={"size": 2, "cursor": page.next_cursor}
+        )
+        page = SearchPageSchema.model_validate(response.json())
+        assert [item.name for item in page.items] == [SUM_NAME]
+        assert page.next_cursor is None
+
+    def test_search_algorithms_invalid_cursor(self, client):
+        response = client.get(SEARCH_ENDPOINT, params={"cursor": "!"})
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"data_type": "COMPLEX"}, {"sort": "description"}, {"size": 0}],
+    )
+    def test_search_algorithms_invalid_params(self, client, params):
+        response = client.get(SEARCH_ENDPOINT, params=params)
+        assert response.status_code == 422
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestSearch"])
@@ -0,0 +1,78 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from src.internal.constants import WS_ALGORITHMS_ENDPOINT
+from tests import BUSY_DEF, BUSY_FUNC, BUSY_NAME, MOCK_TESTS, SUM_NAME
+
+SUM_PARAMETERS = [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+SUM_RESULT = [{"name": "result", "value": 3}]
+
+
+class TestSessions:
+    def test_session_result(self, client):
+        with client.websocket_connect(f"{WS_ALGORITHMS_ENDPOINT}/{SUM_NAME}") as ws:
+            ws.send_json({"id": 1, "parameters": SUM_PARAMETERS})
+            assert ws.receive_json() == {
+                "type": "result",
+                "id": 1,
+                "result": SUM_RESULT,
+            }
+
+            ws.send_json(SUM_PARAMETERS)
+            assert ws.receive_json() == {
+                "type": "result",
+                "id": None,
+                "result": SUM_RESULT,
+            }
+        assert client.app.state.metrics.get_counter("websocket.sessions") == 1
+
+    def test_session_not_existed_algorithm(self, client):
+        with client.websocket_connect(f"{WS_ALGORITHMS_ENDPOINT}/not_existed") as ws:
+            message = ws.receive_json()
+            assert message["type"] == "error"
+            assert message["status"] == 404
+            with pytest.raises(WebSocketDisconnect) as ex:
+                ws.receive_json()
+            assert ex.value.code == 1008
+
+    @pytest.mark.parametrize(
+        "text",
+        ["not json", '{"id": 2}', '[{"name": "a"}]', '{"id": 2, "parameters": 1}'],
+    )
+    def test_session_invalid_message(self, client, text):
+        with client.websocket_connect(f"{WS_ALGORITHMS_ENDPOINT}/{SUM_NAME}") as ws:
+            ws.send_text(text)
+            message = ws.receive_json()
+            assert message["type"] == "error"
+            assert message["status"] == 422
+
+            ws.send_json({"id": 3, "parameters": SUM_PARAMETERS})
+            assert ws.receive_json()["id"] == 3
+
+    def test_session_algorithm_error(self, client):
+        with client.websocket_connect(f"{WS_ALGORITHMS_ENDPOINT}/{SUM_NAME}") as ws:
+            ws.send_json({"id": 1, "parameters": [{"name": "a", "value": 1}]})
+            message = ws.receive_json()
+            assert message["type"] == "error"
+            assert message["id"] == 1
+            assert message["status"] == 400
+
+    def test_session_supersedes_running(self, client, algo_dir):
+        algo_dir(BUSY_NAME, BUSY_DEF, BUSY_FUNC, MOCK_TESTS)
+        client.app.state.algorithms.reload()
+        with client.websocket_connect(f"{WS_ALGORITHMS_ENDPOINT}/{BUSY_NAME}") as ws:
+            ws.send_json({"id": 1, "parameters": [{"name": "n", "value": 10**10}]})
+            ws.send_json({"id": 2, "parameters": [{"name": "n", "value": 5}]})
+            messages = [ws.receive_json(), ws.receive_json()]
+        assert {"type": "superseded", "id": 1} in messages
+        assert {
+            "type": "result",
+            "id": 2,
+            "result": [{"name": "result", "value": 5}],
+        } in messages
+        metrics = client.app.state.metrics
+        assert metrics.get_counter("websocket.superseded") == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestSessions"])
@@ -0,0 +1,145 @@
+import json
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from src.config import Settings, TenantSettings
+from src.internal.constants import (
+    ALGORITHMS_ENDPOINT,
+    DEFAULT_DEFINITION_FILE_NAME,
+    DEFAULT_FUNCTION_FILE_NAME,
+    DEFAULT_TENANT,
+    DEFAULT_TEST_FILE_NAME,
+    SEARCH_ENDPOINT,
+    TENANT_HEADER,
+    TENANTS_ENDPOINT,
+    WS_ALGORITHMS_ENDPOINT,
+)
+from src.main import create_app
+from src.routers.schemas import AlgorithmsPageSchema
+from tests import (
+    BOOL_DEF,
+    BOOL_FUNC,
+    BOOL_NAME,
+    FIB_NAME,
+    MOCK_TESTS,
+    SUM_DEF,
+    SUM_FUNC,
+    SUM_NAME,
+)
+
+TENANT = "course-a"
+SUM_PARAMETERS = [{"name": "a", "value": 1}, {"name": "b", "value": 2}]
+
+
+@pytest.fixture()
+def tenant_client(tmp_path, tmp_path_factory, algo_dir, fib_algo_dir):
+    """Создает клиента для приложения с каталогом по умолчанию и каталогом
+    арендатора, содержащим такой же алгоритм вычисления чисел Фибоначчи"""
+    algo_dir(BOOL_NAME, BOOL_DEF, BOOL_FUNC, MOCK_TESTS)
+    catalog_path = tmp_path_factory.mktemp("tenant")
+    shutil.copytree(fib_algo_dir, catalog_path / FIB_NAME)
+    sum_path = catalog_path / SUM_NAME
+    sum_path.mkdir()
+    (sum_path / "__init__.py").write_text(" ")
+    (sum_path / DEFAULT_DEFINITION_FILE_NAME).write_text(json.dumps(SUM_DEF))
+    (sum_path / DEFAULT_FUNCTION_FILE_NAME).write_text(SUM_FUNC)
+    (sum_path / DEFAULT_TEST_FILE_NAME).write_text(MOCK_TESTS)
+    test_settings = Settings(
+        EXECUTE_TIMEOUT=0,
+        ALGORITHMS_CATALOG_PATH=str(tmp_path),
+        USE_LOGGER=False,
+        TENANTS={
+            TENANT: TenantSettings(
+                CATALOG_PATH=str(catalog_path), FAST_LANE_WORKERS=1, SLOW_LANE_WORKERS=3
+            )
+        },
+    )
+    return TestClient(create_app(test_settings))
+
+
+def get_names(response) -> list[str]:
+    """Возвращает имена алгоритмов страницы каталога"""
+    page = AlgorithmsPageSchema.model_validate(response.json())
+    return sorted(item.name for item in page.items)
+
+
+class TestTenants:
+    """Тесты для выполнения запросов с каталогами арендаторов."""
+
+    def test_catalogs(self, tenant_client):
+        """Проверяет, что каталог выбирается по префиксу пути и заголовку"""
+        default = tenant_client.get(ALGORITHMS_ENDPOINT + "/")
+        prefixed = tenant_client.get(
+            f"{TENANTS_ENDPOINT}/{TENANT}{ALGORITHMS_ENDPOINT}/"
+        )
+        header = tenant_client.get(
+            ALGORITHMS_ENDPOINT + "/", headers={TENANT_HEADER: TENANT}
+        )
+
+        assert get_names(default) == [BOOL_NAME, FIB_NAME]
+        assert get_names(prefixed) == [FIB_NAME, SUM_NAME]
+        assert get_names(header) == [FIB_NAME, SUM_NAME]
+
+    def test_execute(self, tenant_client):
+        """Проверяет выполнение алгоритма арендатора"""
+        url = f"{TENANTS_ENDPOINT}/{TENANT}{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results"
+
+        response = tenant_client.post(url, json=SUM_PARAMETERS)
+
+        assert response.status_code == 200
+        assert response.json() == [{"name": "result", "value": 3}]
+        assert (
+            tenant_client.post(
+                f"{ALGORITHMS_ENDPOINT}/{SUM_NAME}/results", json=SUM_PARAMETERS
+            ).status_code
+            == 404
+        )
+
+    def test_search(self, tenant_client):
+        """Проверяет поиск в каталоге арендатора"""
+        response = tenant_client.get(
+            SEARCH_ENDPOINT, params={"q": "сумма"}, headers={TENANT_HEADER: TENANT}
+        )
+
+        assert [item["name"] for item in response.json()["items"]] == [SUM_NAME]
+
+    def test_session(self, tenant_client):
+        """Проверяет сессию WebSocket с алгоритмом арендатора"""
+        url = f"{TENANTS_ENDPOINT}/{TENANT}{WS_ALGORITHMS_ENDPOINT}/{SUM_NAME}"
+        with tenant_client.websocket_connect(url) as ws:
+            ws.send_json({"id": 1, "parameters": SUM_PARAMETERS})
+            assert ws.receive_json()["result"] == [{"name": "result", "value": 3}]
+
+    def test_unknown_tenant(self, tenant_client):
+        """Проверяет ответ 404 для неизвестного арендатора"""
+        response = tenant_client.get(
+            f"{TENANTS_ENDPOINT}/unknown{ALGORITHMS_ENDPOINT}/"
+        )
+
+        assert response.status_code == 404
+
+    def test_shared_algorithms(self, tenant_client):
+        """Проверяет, что одинаковые алгоритмы каталогов загружаются один раз,
+        а ограничения параллельности у арендаторов свои"""
+        tenants = tenant_client.app.state.tenants
+        default = tenants[DEFAULT_TENANT]
+        tenant = tenants[TENANT]
+
+        assert default.algorithms.get_algorithm_definition(
+            FIB_NAME
+        ) is tenant.algorithms.get_algorithm_definition(FIB_NAME)
+        assert tenant.scheduler is not default.scheduler
+        assert tenant.scheduler.fast_lane.workers == 1
+        assert tenant.scheduler.slow_lane.workers == 3
+
+    def test_invalid_tenant_name(self):
+        """Проверяет ошибку для недопустимого имени арендатора"""
+        with pytest.raises(ValidationError):
+            Settings(TENANTS={"course/a": TenantSettings(CATALOG_PATH="catalog")})
+
+
+if __name__ == "__main__":
+    pytest.main(["-k", "TestTenants"])